@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark the per-query overhead of DuckDB access through `Database`.
+
+Runs the same small queries two ways on a scratch database:
+  - before: one native DuckDB connection per query, with `LOAD spatial`
+    (what a NullPool engine did for every `fetch_all` / `execute_sql`)
+  - after: `Database`, whose queries run on cursors of the shared connection
+
+Only tiny queries are used, so the timings are dominated by connection setup.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+import duckdb
+
+from niamoto.common.database import Database
+from niamoto.common.duckdb_connections import get_duckdb_manager
+
+QUERY = "SELECT COUNT(*) FROM bench WHERE value > 10"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark DuckDB query overhead in niamoto.common.database"
+    )
+    parser.add_argument(
+        "--iterations", type=int, default=200, help="Queries per measurement"
+    )
+    parser.add_argument(
+        "--rows", type=int, default=10_000, help="Rows in the scratch table"
+    )
+    return parser.parse_args()
+
+
+def measure(run_query: Callable[[], object], iterations: int) -> List[float]:
+    """Return the duration of each query, in milliseconds."""
+    durations = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        run_query()
+        durations.append((time.perf_counter() - start) * 1000)
+    return durations
+
+
+def report(label: str, durations: List[float]) -> None:
+    ordered = sorted(durations)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(
+        f"  {label:<8} mean {statistics.mean(durations):7.3f} ms"
+        f"  median {statistics.median(durations):7.3f} ms"
+        f"  p95 {p95:7.3f} ms"
+    )
+
+
+def main() -> int:
+    args = parse_args()
+    workdir = Path(tempfile.mkdtemp(prefix="niamoto-bench-db-"))
+    db_path = str(workdir / "bench.duckdb")
+
+    setup = duckdb.connect(db_path)
+    setup.execute(
+        f"CREATE TABLE bench AS SELECT range AS value FROM range({args.rows})"
+    )
+    setup.close()
+
+    def query_with_fresh_connection():
+        connection = duckdb.connect(db_path)
+        try:
+            try:
+                connection.execute("LOAD spatial")
+            except duckdb.Error:
+                pass
+            return connection.execute(QUERY).fetchall()
+        finally:
+            connection.close()
+
+    before = measure(query_with_fresh_connection, args.iterations)
+
+    manager = get_duckdb_manager()
+    opened = manager.connections_opened
+    db = Database(db_path, optimize=False)
+    try:
+        after = measure(lambda: db.fetch_all(QUERY), args.iterations)
+    finally:
+        db.close()
+
+    print(f"DuckDB query overhead ({args.iterations} queries, {args.rows} rows)")
+    report("before", before)
+    report("after", after)
+    print(
+        f"  speedup  x{statistics.mean(before) / statistics.mean(after):.1f}"
+        f"  (native connections opened: {manager.connections_opened - opened})"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
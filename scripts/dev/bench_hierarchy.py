@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark nested-set numbering in `HierarchyBuilder.add_nested_sets`.
+
+Builds a synthetic taxonomy (families > genera > species > infra) and numbers
+it two ways:
+  - before: the former implementation, a parent map built with `iterrows`
+    and a recursive traversal writing each bound with `DataFrame.at`
+  - after: `HierarchyBuilder.add_nested_sets`, an iterative traversal over
+    integer parent positions
+
+Both results are compared, then the parent linking and stable id steps of
+`build_from_dataset` are timed on the same tree.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from niamoto.core.imports.config_models import HierarchyLevel
+from niamoto.core.imports.hierarchy_builder import HierarchyBuilder
+
+LEVELS = ["family", "genus", "species", "infra"]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark nested sets in niamoto.core.imports.hierarchy_builder"
+    )
+    parser.add_argument(
+        "--nodes", type=int, default=1_000_000, help="Approximate number of nodes"
+    )
+    parser.add_argument(
+        "--skip-before",
+        action="store_true",
+        help="Only time the current implementation",
+    )
+    return parser.parse_args()
+
+
+def synthetic_hierarchy(nodes: int) -> pd.DataFrame:
+    """Return a four-level tree of about ``nodes`` rows, ordered like an extraction."""
+    # 1 + 8 + 8*8 + 8*8*8 nodes under each family
+    families = max(1, nodes // 585)
+    paths = [f"F{i}" for i in range(families)]
+    frames = []
+    for level, rank in enumerate(LEVELS):
+        frames.append(
+            pd.DataFrame({"level": level, "rank_name": rank, "full_path": paths})
+        )
+        paths = [f"{path}|{rank[0]}{j}" for path in paths for j in range(8)]
+    df = pd.concat(frames, ignore_index=True)
+    df["rank_value"] = df["full_path"].str.rpartition("|")[2]
+    return df.sort_values(["level", "full_path"], ignore_index=True)
+
+
+def legacy_add_nested_sets(df: pd.DataFrame) -> pd.DataFrame:
+    """Former recursive implementation, kept for comparison."""
+    df = df.assign(
+        lft=pd.Series([None] * len(df), index=df.index),
+        rght=pd.Series([None] * len(df), index=df.index),
+    )
+    children_map = {}
+    for idx, row in df.iterrows():
+        parent = row["parent_id"]
+        if pd.isna(parent):
+            parent = None
+        children_map.setdefault(parent, []).append(idx)
+
+    counter = [1]
+
+    def traverse(node_idx):
+        df.at[node_idx, "lft"] = counter[0]
+        counter[0] += 1
+        node_id = df.at[node_idx, "id"]
+        if node_id in children_map:
+            for child_idx in sorted(children_map[node_id]):
+                traverse(child_idx)
+        df.at[node_idx, "rght"] = counter[0]
+        counter[0] += 1
+
+    for root_idx in sorted(df[df["parent_id"].isna()].index):
+        traverse(root_idx)
+
+    return df.assign(lft=df["lft"].astype("Int64"), rght=df["rght"].astype("Int64"))
+
+
+def timed(label: str, func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    print(f"  {label:<28} {time.perf_counter() - start:8.2f} s")
+    return result
+
+
+def main() -> int:
+    args = parse_args()
+    builder = HierarchyBuilder(db=None)
+    levels = [HierarchyLevel(name=rank, column=rank) for rank in LEVELS]
+
+    tree = synthetic_hierarchy(args.nodes)
+    print(f"Hierarchy of {len(tree):,} nodes")
+
+    tree = timed(
+        "parent relationships", builder._build_parent_relationships, tree, levels
+    )
+    timed("integrity validation", builder._validate_hierarchy_integrity, tree, levels)
+    tree = timed("stable ids (hash)", builder._assign_stable_ids, tree, "hash")
+
+    after = timed("nested sets (after)", builder.add_nested_sets, tree)
+    if args.skip_before:
+        return 0
+
+    recursion_limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(recursion_limit, 10_000))
+    try:
+        before = timed("nested sets (before)", legacy_add_nested_sets, tree)
+    finally:
+        sys.setrecursionlimit(recursion_limit)
+
+    same = np.array_equal(before["lft"], after["lft"]) and np.array_equal(
+        before["rght"], after["rght"]
+    )
+    print(f"  identical bounds: {same}")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
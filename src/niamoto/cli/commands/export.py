@@ -55,12 +55,26 @@ from ..utils.metrics import MetricsCollector
     is_flag=True,
     help="Show what would be exported without actually running the export.",
 )
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of worker processes used to render detail pages.",
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Keep the previous export and only rewrite pages whose inputs changed.",
+)
 @error_handler(log=True, raise_error=True)
 def export_command(
     target: Optional[str],
     group: Optional[str],
     list: bool,
     dry_run: bool,
+    workers: int,
+    incremental: bool,
 ) -> None:
     """
     Export Niamoto data according to configurations in export.yml.
@@ -83,6 +97,14 @@ def export_command(
     # Export only taxon data from web_pages target
     niamoto export --target web_pages --group taxon
 
+    \b
+    # Render detail pages on 8 processes
+    niamoto export --workers 8
+
+    \b
+    # Only rewrite pages whose data, templates or config changed
+    niamoto export --incremental
+
     \b
     # List all available export targets
     niamoto export --list
@@ -128,6 +150,8 @@ def export_command(
         results = service.run_export(
             target_name=target,
             group_filter=group,
+            workers=workers,
+            incremental=incremental,
         )
 
         # Create and display metrics
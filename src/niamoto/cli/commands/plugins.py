@@ -77,7 +77,7 @@ def plugins(type: Optional[str], format: str, verbose: bool) -> None:
 
         # The registry stores plugins by type
         for plugin_type in PluginType:
-            type_plugins = PluginRegistry._plugins.get(plugin_type, {})
+            type_plugins = PluginRegistry.get_plugins_by_type(plugin_type)
             for name, plugin_class in type_plugins.items():
                 all_plugins[name] = {"type": plugin_type, "class": plugin_class}
 
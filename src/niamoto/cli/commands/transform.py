@@ -42,10 +42,27 @@ from ..utils.metrics import MetricsCollector
     is_flag=True,
     help="Show detailed processing information.",
 )
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of worker processes used to compute entities in parallel.",
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Only recompute entities whose data or widget configuration changed.",
+)
 @click.pass_context
 @error_handler(log=True, raise_error=True)
 def transform_commands(
-    ctx: click.Context, group: Optional[str], data: Optional[str], verbose: bool
+    ctx: click.Context,
+    group: Optional[str],
+    data: Optional[str],
+    verbose: bool,
+    workers: int,
+    incremental: bool,
 ) -> None:
     """
     Transform and aggregate data according to transform.yml configuration.
@@ -57,14 +74,25 @@ def transform_commands(
     Use the --group option to process only a specific group of transforms.
     Use the --data option to use a custom data file.
     Use --verbose for detailed processing information.
+    Use --workers to compute entities across several processes.
+    Use --incremental to skip entities whose inputs did not change.
 
     Examples:
         niamoto transform  # Process all groups
         niamoto transform --group taxon  # Process only taxonomy data
         niamoto transform --data my_data.csv  # Use custom data file
+        niamoto transform --workers 8  # Compute entities on 8 processes
+        niamoto transform --incremental  # Recompute only changed entities
     """
     if ctx.invoked_subcommand is None:
-        ctx.invoke(process_transformations, group=group, data=data, verbose=verbose)
+        ctx.invoke(
+            process_transformations,
+            group=group,
+            data=data,
+            verbose=verbose,
+            workers=workers,
+            incremental=incremental,
+        )
 
 
 @transform_commands.command(name="list")
@@ -120,12 +148,26 @@ def list_configurations() -> None:
     default=True,
     help="Recreate tables instead of updating them.",
 )
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of worker processes used to compute entities in parallel.",
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Only recompute entities whose data or widget configuration changed.",
+)
 @error_handler(log=True, raise_error=True)
 def process_transformations(
     group: Optional[str],
     data: Optional[str],
     verbose: bool,
     recreate_table: bool,
+    workers: int = 1,
+    incremental: bool = False,
 ) -> None:
     """
     Run data transformations based on configuration.
@@ -170,6 +212,8 @@ def process_transformations(
             group_by=group,
             csv_file=data,
             recreate_table=recreate_table,
+            workers=workers,
+            incremental=incremental,
         )
 
         # Create and display metrics
@@ -234,6 +234,15 @@ class MetricsCollector:
                         pass
 
                 metrics.add_metric(f"{target_name}_files", files)
+                # Incremental exports report the pages left untouched or removed
+                if target_results.get("pages_skipped"):
+                    metrics.add_metric(
+                        f"{target_name}_unchanged", target_results["pages_skipped"]
+                    )
+                if target_results.get("pages_removed"):
+                    metrics.add_metric(
+                        f"{target_name}_removed", target_results["pages_removed"]
+                    )
                 if errors == 0:
                     successful_targets += 1
                 else:
@@ -475,14 +484,25 @@ class MetricsFormatter:
                 if target_name not in target_metrics:
                     target_metrics[target_name] = {}
                 target_metrics[target_name]["errors"] = value
+            elif key.endswith("_unchanged"):
+                target_name = key[: -len("_unchanged")]
+                target_metrics.setdefault(target_name, {})["unchanged"] = value
+            elif key.endswith("_removed"):
+                target_name = key[: -len("_removed")]
+                target_metrics.setdefault(target_name, {})["removed"] = value
 
         for target_name, target_data in target_metrics.items():
             files = target_data.get("files", 0)
             errors = target_data.get("errors", 0)
             # Remove status icon to avoid orphan checkmarks
             error_text = f" ({errors} errors)" if errors > 0 else ""
+            incremental_text = "".join(
+                f", {MetricsFormatter.format_number(target_data[key])} {key}"
+                for key in ("unchanged", "removed")
+                if target_data.get(key)
+            )
             lines.append(
-                f"   • {target_name}: {MetricsFormatter.format_number(files)} files generated{error_text}"
+                f"   • {target_name}: {MetricsFormatter.format_number(files)} files generated{incremental_text}{error_text}"
             )
 
         # Total
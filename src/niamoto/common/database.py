@@ -5,19 +5,26 @@ The Database class offers methods to establish a connection, get new sessions,
 add instances to the database, and close sessions.
 """
 
-from collections import defaultdict
 from contextlib import contextmanager
+import json
 from pathlib import Path
 from threading import local
-from threading import Lock
-from typing import TypeVar, Any, Iterator, Optional, List, Dict, Set, ClassVar
+from typing import TypeVar, Any, Iterator, Optional, List, Dict, Set
 import warnings
+import weakref
 import time
-from sqlalchemy import create_engine, event, exc, text, inspect
+import duckdb
+import pandas as pd
+from sqlalchemy import create_engine, exc, text, inspect
 from sqlalchemy.pool import NullPool
 from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.orm import scoped_session, sessionmaker, Session
 
+from niamoto.common.duckdb_connections import (
+    duckdb_creator,
+    get_duckdb_manager,
+    normalize_duckdb_path,
+)
 from niamoto.common.exceptions import (
     DatabaseError,
     DatabaseConnectionError,
@@ -47,17 +54,95 @@ warnings.filterwarnings(
 
 T = TypeVar("T")
 
+DEFAULT_RECORD_BATCH_SIZE = 10_000
+# Rows per DuckDB vector; native chunks are fetched in whole vectors
+_DUCKDB_VECTOR_SIZE = 2048
+
+
+def _import_pyarrow() -> Any:
+    """Import pyarrow, which only the Arrow fetch methods need."""
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise DatabaseError(
+            message="pyarrow is required for Arrow results; install it with 'pip install pyarrow'",
+            details={"error": str(e)},
+        ) from e
+    return pyarrow
+
+
+def _normalize_native_frame(
+    frame: pd.DataFrame, description: Any, *, nullable_as_object: bool = False
+) -> pd.DataFrame:
+    """Give a DuckDB ``.df()`` frame the dtypes ``pd.read_sql`` would produce.
+
+    DuckDB returns nullable integers and booleans as pandas extension dtypes,
+    JSON as text, dates as timestamps, lists as arrays, blobs as bytearrays
+    and missing nested values as ``pd.NA``. Callers were written against
+    ``pd.read_sql`` frames, so these columns are converted back; everything
+    else is kept as is. With ``nullable_as_object``, integer and boolean
+    columns holding NULLs become object columns of Python values and None
+    (as in SQLAlchemy rows) instead of floats.
+    """
+    for position, column in enumerate(description or ()):
+        type_name = str(column[1]).upper()
+        series = frame.iloc[:, position]
+        dtype = series.dtype
+
+        if type_name == "JSON":
+            converted = [
+                json.loads(value) if isinstance(value, str) else None
+                for value in series
+            ]
+        elif type_name == "DATE":
+            converted = [None if pd.isna(value) else value.date() for value in series]
+        elif type_name in ("BLOB", "BYTEA"):
+            converted = [
+                bytes(value) if isinstance(value, (bytearray, memoryview)) else None
+                for value in series
+            ]
+        elif type_name.endswith("]"):
+            converted = [
+                value.tolist() if hasattr(value, "tolist") else None for value in series
+            ]
+        elif isinstance(dtype, pd.BooleanDtype):
+            converted = (
+                series.astype(object).where(series.notna(), None)
+                if series.hasnans
+                else series.astype(bool)
+            )
+        elif pd.api.types.is_extension_array_dtype(
+            dtype
+        ) and pd.api.types.is_integer_dtype(dtype):
+            if series.hasnans and nullable_as_object:
+                converted = series.astype(object).where(series.notna(), None)
+            else:
+                converted = series.astype("float64" if series.hasnans else "int64")
+        elif pd.api.types.is_object_dtype(dtype) and series.hasnans:
+            # Structs and maps: missing values are pd.NA instead of None
+            converted = series.where(series.notna(), None)
+        else:
+            continue
+
+        if isinstance(converted, list):
+            converted = pd.Series(converted, index=frame.index, dtype=object)
+        frame.isetitem(position, converted)
+    return frame
+
 
 class Database:
     """
     A class that provides a connection to a database and offers methods
     to interact with it.
-    """
 
-    _duckdb_mode_counts: ClassVar[Dict[str, Dict[bool, int]]] = defaultdict(
-        lambda: {True: 0, False: 0}
-    )
-    _duckdb_mode_lock: ClassVar[Lock] = Lock()
+    DuckDB connections are drawn from a process-wide manager
+    (see :mod:`niamoto.common.duckdb_connections`): every wrapper of the same
+    file shares one native connection and gets a cursor per SQLAlchemy
+    connection. The native connection holds DuckDB's file lock; it is closed
+    when the last wrapper with queries ends its session (``close_db_session``)
+    and by ``release_file_lock`` before worker processes open the file;
+    ``read_only_access`` shares the file with read-only workers.
+    """
 
     @error_handler(log=True, raise_error=True)
     def __init__(
@@ -102,20 +187,14 @@ class Database:
                     self.connection_string = f"sqlite:///{db_path}"
                     self.engine = create_engine(self.connection_string, echo=False)
                 else:
-                    # For DuckDB, use connect_args to set access_mode
-                    # Always use NullPool for DuckDB to avoid lock issues
+                    # DuckDB connections are cursors of a native connection
+                    # shared by the process, so NullPool only hands them out
                     self.connection_string = f"duckdb:///{db_path}"
                     effective_read_only = self._resolve_duckdb_read_only_mode(
                         db_path, read_only
                     )
                     self.read_only = effective_read_only
-                    engine_kwargs: Dict[str, Any] = {
-                        "echo": False,
-                        "poolclass": NullPool,
-                    }
                     if effective_read_only:
-                        # Pass access_mode as connect_args for DuckDB
-                        engine_kwargs["connect_args"] = {"read_only": True}
                         logger.info(f"Opening DuckDB in read-only mode: {db_path}")
                     elif read_only:
                         logger.info(
@@ -123,16 +202,7 @@ class Database:
                             "for process-local consistency: %s",
                             db_path,
                         )
-                    self.engine = create_engine(self.connection_string, **engine_kwargs)
-                    self._register_duckdb_mode(db_path, self.read_only)
-                    self._suppress_duckdb_mode_release = False
-                    self._wrap_engine_dispose(db_path, self.read_only)
-
-                    # Register event listener to load spatial extension on every connection
-                    # This is necessary because NullPool creates new connections each time
-                    event.listen(
-                        self.engine, "connect", Database._load_duckdb_spatial_extension
-                    )
+                    self.engine = self._create_duckdb_engine(db_path, self.read_only)
                     self._ensure_duckdb_read_mode_is_compatible(db_path)
 
             connection_str = str(self.connection_string)
@@ -198,7 +268,24 @@ class Database:
 
     @classmethod
     def _normalize_duckdb_path(cls, db_path: str) -> str:
-        return str(Path(db_path).expanduser().resolve())
+        return normalize_duckdb_path(db_path)
+
+    def _create_duckdb_engine(self, db_path: str, read_only: bool) -> Engine:
+        """Create an engine whose connections come from the shared manager."""
+
+        # Identifies this wrapper's session in the connection manager
+        self._duckdb_session = getattr(self, "_duckdb_session", None) or object()
+        engine = create_engine(
+            self.connection_string,
+            echo=False,
+            poolclass=NullPool,
+            creator=duckdb_creator(db_path, read_only, self._duckdb_session),
+        )
+        self.engine = engine
+        self._register_duckdb_mode(db_path, read_only)
+        self._suppress_duckdb_mode_release = False
+        self._wrap_engine_dispose(db_path, read_only, self._duckdb_session)
+        return engine
 
     @classmethod
     def _is_duckdb_configuration_conflict(cls, error: Exception) -> bool:
@@ -235,17 +322,7 @@ class Database:
             )
             self.engine.dispose()
             self.read_only = False
-            self.engine = create_engine(
-                self.connection_string,
-                echo=False,
-                poolclass=NullPool,
-            )
-            self._register_duckdb_mode(db_path, self.read_only)
-            self._suppress_duckdb_mode_release = False
-            self._wrap_engine_dispose(db_path, self.read_only)
-            event.listen(
-                self.engine, "connect", Database._load_duckdb_spatial_extension
-            )
+            self._create_duckdb_engine(db_path, self.read_only)
             with self.engine.connect():
                 pass
 
@@ -261,49 +338,51 @@ class Database:
         connection errors.
         """
 
-        normalized = cls._normalize_duckdb_path(db_path)
-        with cls._duckdb_mode_lock:
-            active_modes = cls._duckdb_mode_counts[normalized]
-            if requested and active_modes[False] > 0:
-                return False
-        return requested
+        return get_duckdb_manager().resolve_mode(db_path, requested)
 
     @classmethod
     def _register_duckdb_mode(cls, db_path: str, read_only: bool) -> None:
-        normalized = cls._normalize_duckdb_path(db_path)
-        with cls._duckdb_mode_lock:
-            cls._duckdb_mode_counts[normalized][read_only] += 1
+        get_duckdb_manager().register(db_path, read_only)
 
     @classmethod
-    def _release_duckdb_mode(cls, db_path: str, read_only: bool) -> None:
-        normalized = cls._normalize_duckdb_path(db_path)
-        with cls._duckdb_mode_lock:
-            active_modes = cls._duckdb_mode_counts.get(normalized)
-            if not active_modes:
-                return
-            active_modes[read_only] = max(0, active_modes[read_only] - 1)
-            if active_modes[True] == 0 and active_modes[False] == 0:
-                cls._duckdb_mode_counts.pop(normalized, None)
-
-    def _wrap_engine_dispose(self, db_path: str, read_only: bool) -> None:
+    def _release_duckdb_mode(
+        cls, db_path: str, read_only: bool, owner: Optional[object] = None
+    ) -> None:
+        """Release the wrapper; the last one closes the shared connection."""
+        get_duckdb_manager().release(db_path, read_only, owner)
+
+    def _wrap_engine_dispose(
+        self, db_path: str, read_only: bool, owner: Optional[object] = None
+    ) -> None:
         """Release process-local DuckDB mode bookkeeping when the engine is disposed."""
 
         original_dispose = self.engine.dispose
         released = False
+        # A weak reference keeps the engine from holding the wrapper alive,
+        # so a dropped wrapper releases the shared connection right away
+        database_ref = weakref.ref(self)
 
         def tracked_dispose(*args, **kwargs):
             nonlocal released
             try:
                 return original_dispose(*args, **kwargs)
             finally:
-                if not released and not self._suppress_duckdb_mode_release:
-                    self._release_duckdb_mode(db_path, read_only)
+                database = database_ref()
+                suppressed = (
+                    database is not None and database._suppress_duckdb_mode_release
+                )
+                if not released and not suppressed:
+                    Database._release_duckdb_mode(db_path, read_only, owner)
                     released = True
 
         self.engine.dispose = tracked_dispose
 
     def _dispose_duckdb_pool_for_refresh(self) -> None:
-        """Dispose DuckDB pool connections without ending this Database lifecycle."""
+        """Dispose DuckDB pool connections without ending this Database lifecycle.
+
+        The shared native connection stays open: its cursors always see the
+        latest committed data of the database.
+        """
 
         self._suppress_duckdb_mode_release = True
         try:
@@ -311,6 +390,41 @@ class Database:
         finally:
             self._suppress_duckdb_mode_release = False
 
+    def release_file_lock(self) -> None:
+        """Close this process's native DuckDB connection to the file.
+
+        An open DuckDB connection locks the file for other processes, even
+        read-only ones. Call this before starting worker processes that open
+        the database; the next query of any wrapper reconnects.
+        """
+        if not getattr(self, "is_duckdb", False) or not self._owns_engine:
+            return
+        self.disable_connection_reuse()
+        self.session.remove()
+        get_duckdb_manager().close(self.db_path)
+
+    @contextmanager
+    def read_only_access(self) -> Iterator[None]:
+        """Use the DuckDB file read-only in this process within the block.
+
+        Read-only connections only take DuckDB's shared file lock, so worker
+        processes can open the file read-only while this process keeps
+        querying it. Writes fail until the block exits.
+        """
+        if not getattr(self, "is_duckdb", False) or not self._owns_engine:
+            yield
+            return
+        self.disable_connection_reuse()
+        self.session.remove()
+        read_only = self.read_only
+        get_duckdb_manager().hold_read_only(self.db_path)
+        self.read_only = True
+        try:
+            yield
+        finally:
+            self.read_only = read_only
+            get_duckdb_manager().release_read_only(self.db_path)
+
     def enable_connection_reuse(self) -> None:
         """Enable per-thread connection reuse for hot read/write loops."""
 
@@ -397,26 +511,6 @@ class Database:
             else:
                 logger.warning(f"DuckDB initialization warning: {e}")
 
-    @staticmethod
-    def _load_duckdb_spatial_extension(dbapi_connection, connection_record) -> None:
-        """Event listener to load spatial extension on each new DuckDB connection.
-
-        This is called automatically by SQLAlchemy's event system when a new
-        connection is created. With NullPool, every connect() creates a fresh
-        connection, so we must load the extension each time.
-
-        Args:
-            dbapi_connection: The raw DBAPI connection (duckdb.Connection)
-            connection_record: SQLAlchemy connection record (unused)
-        """
-        try:
-            cursor = dbapi_connection.cursor()
-            cursor.execute("LOAD spatial")
-            cursor.close()
-        except Exception as e:
-            # Log but don't fail - some operations don't need spatial
-            logger.debug(f"Could not load spatial extension: {e}")
-
     def _create_missing_indexes(self) -> None:
         """
         Automatically create indexes on foreign key columns that don't have them.
@@ -830,10 +924,15 @@ class Database:
     def close_db_session(self) -> None:
         """
         Close the database session.
+
+        For DuckDB, this ends the wrapper's session: the shared connection is
+        closed when no other wrapper has one, which releases the file lock.
         """
         try:
             self.disable_connection_reuse()
             self.session.remove()
+            if self.is_duckdb and getattr(self, "_owns_engine", False):
+                get_duckdb_manager().end_session(self.db_path, self._duckdb_session)
         except exc.SQLAlchemyError as e:
             raise DatabaseError(
                 message="Failed to close database session", details={"error": str(e)}
@@ -1120,6 +1219,125 @@ class Database:
                 details={"query": query, "params": params, "error": str(e)},
             )
 
+    @contextmanager
+    def _native_duckdb_result(
+        self, query: str, params: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Any]:
+        """Run ``query`` on the native DuckDB cursor and yield that cursor.
+
+        Named ``:param`` placeholders are compiled by SQLAlchemy into DuckDB's
+        positional ones, so the query text is the same as for ``fetch_all``.
+        """
+        compiled = text(query).compile(dialect=self.engine.dialect)
+        values = [(params or {}).get(name) for name in compiled.positiontup or ()]
+        try:
+            with self.connection() as connection:
+                dbapi_connection = connection.connection.dbapi_connection
+                yield dbapi_connection.execute(str(compiled), values or None)
+        except (exc.SQLAlchemyError, duckdb.Error) as e:
+            logger.error(
+                f"Database error executing native query '{query}' with params {params}: {e}"
+            )
+            raise DatabaseQueryError(
+                query=query,
+                message="Native query execution failed",
+                details={"params": params, "error": str(e)},
+            ) from e
+
+    def fetch_df(
+        self, query: str, params: Optional[Dict[str, Any]] = None
+    ) -> pd.DataFrame:
+        """Executes a raw SQL query and returns the results as a DataFrame.
+
+        On DuckDB the frame is built from the native cursor's columnar result
+        instead of row objects; column dtypes follow ``pd.read_sql``.
+        """
+        if not self.is_duckdb:
+            try:
+                with self.connection() as connection:
+                    return pd.read_sql(text(query), connection, params=params or {})
+            except exc.SQLAlchemyError as e:
+                raise DatabaseQueryError(
+                    query=query,
+                    message="Failed to execute fetch_df query",
+                    details={"params": params, "error": str(e)},
+                ) from e
+
+        with self._native_duckdb_result(query, params) as cursor:
+            description = cursor.description
+            frame = cursor.df()
+        return _normalize_native_frame(frame, description)
+
+    def fetch_arrow(self, query: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """Executes a raw SQL query and returns the results as a ``pyarrow.Table``.
+
+        Requires the optional ``pyarrow`` package.
+        """
+        pa = _import_pyarrow()
+        if not self.is_duckdb:
+            return pa.Table.from_pandas(
+                self.fetch_df(query, params), preserve_index=False
+            )
+
+        with self._native_duckdb_result(query, params) as cursor:
+            return cursor.fetch_arrow_table()
+
+    def iter_record_batches(
+        self,
+        query: str,
+        params: Optional[Dict[str, Any]] = None,
+        batch_size: int = DEFAULT_RECORD_BATCH_SIZE,
+    ) -> Iterator[Any]:
+        """Yield the results of a raw SQL query as ``pyarrow.RecordBatch`` chunks.
+
+        On DuckDB the batches are streamed from the cursor, so the full result
+        is never materialized. Requires the optional ``pyarrow`` package.
+        """
+        pa = _import_pyarrow()
+        if not self.is_duckdb:
+            table = pa.Table.from_pandas(
+                self.fetch_df(query, params), preserve_index=False
+            )
+            yield from table.to_batches(max_chunksize=batch_size)
+            return
+
+        with self._native_duckdb_result(query, params) as cursor:
+            yield from cursor.fetch_record_batch(batch_size)
+
+    def iter_records(
+        self,
+        query: str,
+        params: Optional[Dict[str, Any]] = None,
+        batch_size: int = DEFAULT_RECORD_BATCH_SIZE,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield the rows of a raw SQL query as dictionaries, fetched in batches.
+
+        On DuckDB each batch is fetched as a columnar chunk and converted to
+        dictionaries at once, instead of row by row through SQLAlchemy. NULLs
+        are None and integers stay integers, as with ``fetch_all``.
+        """
+        if not self.is_duckdb:
+            with self.connection() as connection:
+                result = connection.execute(text(query), params or {})
+                columns = list(result.keys())
+                while rows := result.fetchmany(batch_size):
+                    for row in rows:
+                        yield dict(zip(columns, row))
+            return
+
+        vectors_per_chunk = max(1, batch_size // _DUCKDB_VECTOR_SIZE)
+        with self._native_duckdb_result(query, params) as cursor:
+            description = cursor.description
+            while True:
+                frame = cursor.fetch_df_chunk(vectors_per_chunk)
+                if frame.empty:
+                    break
+                frame = _normalize_native_frame(
+                    frame, description, nullable_as_object=True
+                )
+                frame = frame.astype(object).where(frame.notna(), None)
+                yield from frame.to_dict("records")
+
     def execute_query(self, query: str, params: dict = None) -> Any:
         """Executes a given SQL query using the current session."""
         try:
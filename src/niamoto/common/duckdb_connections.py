@@ -0,0 +1,257 @@
+"""
+Process-wide manager of native DuckDB connections.
+
+Opening a DuckDB file parses its catalog and, for Niamoto, loads the spatial
+extension. With one SQLAlchemy connection per query this setup was paid on
+every ``fetch_all`` or ``execute_sql``. The manager keeps one native
+connection per database file and hands out cursors from it: a cursor is a
+lightweight connection to the same database instance, so it sees the same
+data and the extensions already loaded, and each thread gets its own.
+
+The manager also tracks how many ``Database`` wrappers use each file and in
+which mode. DuckDB rejects a second configuration for a file already open in
+the process, so once a writable wrapper exists, read-only requests share the
+writable connection.
+
+An open native connection holds DuckDB's file lock, which keeps other
+processes, even read-only ones, out of the file. The connection is therefore
+closed when the last wrapper is released, when the last wrapper that ran
+queries ends its session, and before worker processes open the file
+(``close``). The next query opens it again. While a read-only hold is open
+(``hold_read_only``), the process only opens the file read-only, so it can
+share it with read-only worker processes.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Hashable, Optional, Set
+
+import duckdb
+from duckdb_engine import ConnectionWrapper
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_duckdb_path(db_path: str) -> str:
+    """Return the key used for ``db_path``: its absolute, resolved path."""
+    return str(Path(db_path).expanduser().resolve())
+
+
+def database_file_fingerprint(db_path: Path) -> tuple[int, ...]:
+    """Return the mtime and size of the database and of its WAL file.
+
+    It changes whenever a connection, of this process or another one, writes
+    to the database, and when the file is deleted or recreated.
+    """
+    parts: list[int] = []
+    for path in (db_path, db_path.with_name(db_path.name + ".wal")):
+        try:
+            stat = path.stat()
+        except OSError:
+            parts.extend((0, 0))
+            continue
+        parts.extend((stat.st_mtime_ns, stat.st_size))
+    return tuple(parts)
+
+
+@dataclass
+class _SharedDatabase:
+    """Native connection and wrapper counts of one database file."""
+
+    mode_counts: Dict[bool, int] = field(default_factory=lambda: {True: 0, False: 0})
+    # Wrappers that ran queries since their session last ended
+    sessions: Set[Hashable] = field(default_factory=set)
+    # Open read-only requests: every connection is opened read-only meanwhile
+    read_only_holds: int = 0
+    connection: Optional[duckdb.DuckDBPyConnection] = None
+    read_only: bool = False
+    pid: int = 0
+
+
+class DuckDBConnectionManager:
+    """Share one native DuckDB connection per database file in a process."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._databases: Dict[str, _SharedDatabase] = {}
+        self.connections_opened = 0
+
+    def resolve_mode(self, db_path: str, requested_read_only: bool) -> bool:
+        """Return the mode a new wrapper must use for ``db_path``.
+
+        Read-only requests fall back to writable mode while a writable
+        wrapper is registered for the same file.
+        """
+        key = normalize_duckdb_path(db_path)
+        with self._lock:
+            shared = self._databases.get(key)
+            if requested_read_only and shared and shared.mode_counts[False] > 0:
+                return False
+        return requested_read_only
+
+    def active_modes(self, db_path: str) -> Dict[bool, int]:
+        """Return the number of registered wrappers per mode for ``db_path``."""
+        key = normalize_duckdb_path(db_path)
+        with self._lock:
+            shared = self._databases.get(key)
+            return dict(shared.mode_counts) if shared else {True: 0, False: 0}
+
+    def register(self, db_path: str, read_only: bool) -> None:
+        """Record a wrapper using ``db_path`` in the given mode."""
+        key = normalize_duckdb_path(db_path)
+        with self._lock:
+            shared = self._databases.setdefault(key, _SharedDatabase())
+            shared.mode_counts[read_only] += 1
+
+    def release(
+        self, db_path: str, read_only: bool, owner: Optional[Hashable] = None
+    ) -> None:
+        """Forget a wrapper and end its session.
+
+        The last wrapper, or the last one with a session, closes the native
+        connection.
+        """
+        key = normalize_duckdb_path(db_path)
+        with self._lock:
+            shared = self._databases.get(key)
+            if shared is None:
+                return
+            shared.mode_counts[read_only] = max(0, shared.mode_counts[read_only] - 1)
+            shared.sessions.discard(owner)
+            if shared.mode_counts[True] == 0 and shared.mode_counts[False] == 0:
+                self._databases.pop(key, None)
+                self._close(shared)
+            elif not shared.sessions:
+                self._close(shared)
+
+    def end_session(self, db_path: str, owner: Hashable) -> None:
+        """End the session of a wrapper done with its queries.
+
+        When no other wrapper of the file has a session, the native
+        connection is closed, so the file lock is released even if idle
+        wrappers are only garbage collected later. The next query opens
+        the connection again.
+        """
+        key = normalize_duckdb_path(db_path)
+        with self._lock:
+            shared = self._databases.get(key)
+            if shared is None:
+                return
+            shared.sessions.discard(owner)
+            if not shared.sessions:
+                self._close(shared)
+
+    def close(self, db_path: str) -> None:
+        """Close the native connection of ``db_path`` and end every session.
+
+        Releases the file lock so other processes can open the file, e.g.
+        before starting worker processes. Wrappers stay registered; their
+        next query opens the connection again.
+        """
+        key = normalize_duckdb_path(db_path)
+        with self._lock:
+            shared = self._databases.get(key)
+            if shared is not None:
+                shared.sessions.clear()
+                self._close(shared)
+
+    def hold_read_only(self, db_path: str) -> None:
+        """Open ``db_path`` read-only in this process until the hold is released.
+
+        A writable native connection is closed; the next query opens a
+        read-only one, which only takes DuckDB's shared lock. Writes fail
+        until ``release_read_only``.
+        """
+        key = normalize_duckdb_path(db_path)
+        with self._lock:
+            shared = self._databases.setdefault(key, _SharedDatabase())
+            shared.read_only_holds += 1
+            if shared.connection is not None and not shared.read_only:
+                self._close(shared)
+
+    def release_read_only(self, db_path: str) -> None:
+        """Release a ``hold_read_only``; writers reopen the file writable."""
+        key = normalize_duckdb_path(db_path)
+        with self._lock:
+            shared = self._databases.get(key)
+            if shared is not None:
+                shared.read_only_holds = max(0, shared.read_only_holds - 1)
+
+    def connect(
+        self, db_path: str, read_only: bool, owner: Optional[Hashable] = None
+    ) -> ConnectionWrapper:
+        """Return a DBAPI connection (a cursor of the shared connection)."""
+        key = normalize_duckdb_path(db_path)
+        with self._lock:
+            shared = self._databases.get(key)
+            if shared is None:
+                # Wrapper already released: a private connection, closed
+                # with the SQLAlchemy connection, keeps no lock behind
+                return ConnectionWrapper(self._open(db_path, read_only))
+            if owner is not None:
+                shared.sessions.add(owner)
+            read_only = read_only or shared.read_only_holds > 0
+            if shared.connection is not None and shared.pid != os.getpid():
+                # Inherited through fork: unusable in this process
+                shared.connection = None
+            if shared.connection is not None and shared.read_only and not read_only:
+                # A writer needs the file in writable mode
+                self._close(shared)
+            if shared.connection is None:
+                shared.connection = self._open(db_path, read_only)
+                shared.read_only = read_only
+                shared.pid = os.getpid()
+            return ConnectionWrapper(shared.connection.cursor())
+
+    def close_all(self) -> None:
+        """Close every native connection, e.g. before the process exits."""
+        with self._lock:
+            for shared in self._databases.values():
+                self._close(shared)
+
+    def _open(self, db_path: str, read_only: bool) -> duckdb.DuckDBPyConnection:
+        connection = duckdb.connect(db_path, read_only=read_only)
+        self.connections_opened += 1
+        try:
+            connection.execute("LOAD spatial")
+        except Exception as e:
+            # Some operations don't need spatial
+            logger.debug(f"Could not load spatial extension: {e}")
+        return connection
+
+    @staticmethod
+    def _close(shared: _SharedDatabase) -> None:
+        connection, shared.connection = shared.connection, None
+        if connection is None or shared.pid != os.getpid():
+            return
+        try:
+            connection.close()
+        except Exception as e:
+            logger.debug(f"DuckDB connection already closed: {e}")
+
+
+_manager = DuckDBConnectionManager()
+
+
+def get_duckdb_manager() -> DuckDBConnectionManager:
+    """Return the connection manager shared by every ``Database``."""
+    return _manager
+
+
+def duckdb_creator(
+    db_path: str, read_only: bool, owner: Optional[Hashable] = None
+) -> Any:
+    """Return a SQLAlchemy ``creator`` drawing connections from the manager.
+
+    ``owner`` identifies the wrapper whose session the connections belong to.
+    """
+
+    def create() -> ConnectionWrapper:
+        return _manager.connect(db_path, read_only, owner)
+
+    return create
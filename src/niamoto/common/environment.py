@@ -149,6 +149,9 @@ class Environment:
                         message="Failed to remove database file",
                         details={"error": str(e)},
                     )
+                from niamoto.core.imports.registry import clear_registry_cache
+
+                clear_registry_cache(db_path)
 
             # Clear web exports directory
             web_dir = self.config.get_export_config.get("web")
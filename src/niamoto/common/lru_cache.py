@@ -0,0 +1,108 @@
+"""Thread-safe least-recently-used cache shared by Niamoto's process caches.
+
+Hierarchy indexes, spatial memberships, column profiles and vector layers
+are cached per process and shared between threads. ``LRUCache`` holds the
+logic they have in common: a lock, an ordered mapping moved on every hit,
+and eviction of the least recently used entries once the cache holds more
+than ``max_entries`` entries, or more than ``max_weight`` when entries are
+weighed (e.g. by their size in bytes).
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """Mapping bounded by a number of entries or a total weight."""
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_weight: Optional[int] = None,
+        weigh: Optional[Callable[[V], int]] = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_weight = max_weight
+        self._weigh = weigh
+        self._entries: OrderedDict[K, Tuple[V, int]] = OrderedDict()
+        self._weight = 0
+        self._lock = threading.RLock()
+
+    @property
+    def weight(self) -> int:
+        """Total weight of the cached entries."""
+        return self._weight
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> Optional[V]:
+        """Return the value of ``key`` and mark it as recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: K, value: V) -> bool:
+        """Cache ``value`` under ``key``, evicting the oldest entries.
+
+        Returns False, without caching it, for a value heavier than the
+        whole cache.
+        """
+        weight = self._weigh(value) if self._weigh is not None else 0
+        if self.max_weight is not None and weight > self.max_weight:
+            return False
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = (value, weight)
+            self._weight += weight
+            while self._entries and (
+                (self.max_entries is not None and len(self._entries) > self.max_entries)
+                or (self.max_weight is not None and self._weight > self.max_weight)
+            ):
+                _, (_, evicted_weight) = self._entries.popitem(last=False)
+                self._weight -= evicted_weight
+        return True
+
+    def get_or_build(self, key: K, build: Callable[[], V]) -> V:
+        """Return the value of ``key``, building and caching it if missing.
+
+        ``build`` runs outside the lock, so two threads may both build a
+        missing value; the last one is kept.
+        """
+        value = self.get(key)
+        if value is None:
+            value = build()
+            self.put(key, value)
+        return value
+
+    def keys(self) -> List[K]:
+        """Return the cached keys, least recently used first."""
+        with self._lock:
+            return list(self._entries)
+
+    def pop(self, key: K) -> Optional[V]:
+        """Remove ``key`` and return its value, if cached."""
+        with self._lock:
+            return self._pop(key)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._weight = 0
+
+    def _pop(self, key: K) -> Optional[V]:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+        self._weight -= entry[1]
+        return entry[0]
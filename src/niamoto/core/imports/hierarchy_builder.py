@@ -13,6 +13,7 @@ from __future__ import annotations
 import hashlib
 from typing import List
 
+import numpy as np
 import pandas as pd
 
 from niamoto.common.database import Database
@@ -302,20 +303,14 @@ class HierarchyBuilder:
         if not external_id_col:
             return df
 
-        # For each external ID value, find the maximum level where it appears
-        external_max_level = (
-            df[df[external_id_col].notna()].groupby(external_id_col)["level"].max()
-        )
-
-        # Create a mapping: (external_id, level) -> keep or remove
-        def should_keep_external_id(row):
-            if pd.isna(row[external_id_col]):
-                return None
-            max_level = external_max_level.get(row[external_id_col])
-            # Only keep external_id on the deepest level for this ID
-            return row[external_id_col] if row["level"] == max_level else None
+        # Only keep each external ID on the deepest level where it appears
+        external_ids = df[external_id_col]
+        max_level = df["level"].groupby(external_ids).transform("max")
+        keep = external_ids.notna() & (df["level"] == max_level)
 
-        return df.assign(**{external_id_col: df.apply(should_keep_external_id, axis=1)})
+        return df.assign(
+            **{external_id_col: external_ids.astype(object).where(keep, None)}
+        )
 
     def _build_parent_relationships(
         self, df: pd.DataFrame, levels: List[HierarchyLevel]
@@ -330,16 +325,20 @@ class HierarchyBuilder:
             DataFrame with parent_id column added
         """
         # Create parent path (all but last level)
-        parent_path = df["full_path"].apply(
-            lambda p: "|".join(p.split("|")[:-1]) if "|" in p else None
+        full_path = df["full_path"]
+        parent_path = (
+            full_path.str.rpartition("|")[0]
+            .where(full_path.str.contains("|", regex=False), None)
+            .astype(object)
         )
 
         # First pass: assign temporary IDs
         temp_ids = pd.Series(range(len(df)), index=df.index, dtype="Int64")
-        path_to_id = dict(zip(df["full_path"], temp_ids))
+        path_to_id = pd.Series(temp_ids.to_numpy(), index=full_path.to_numpy())
+        path_to_id = path_to_id[~path_to_id.index.duplicated(keep="last")]
 
         # Second pass: resolve parent_id
-        parent_id = parent_path.apply(lambda p: path_to_id.get(p) if p else None)
+        parent_id = parent_path.map(path_to_id).astype("Int64")
 
         return df.assign(parent_path=parent_path, temp_id=temp_ids, parent_id=parent_id)
 
@@ -359,66 +358,67 @@ class HierarchyBuilder:
         Raises:
             DataValidationError: If hierarchy rules are violated
         """
+        known_paths = set(df["full_path"])
+
         # Check for hierarchy gaps (e.g., species present but genus missing)
         for idx in range(len(levels) - 1):
             current_level = levels[idx]
             next_level = levels[idx + 1]
 
-            # Find rows where current level is empty but next level is filled
-            # This is detected by checking if the path contains the expected parent
-            gaps = df[
+            # Rows of the next level, except fill_unknown placeholders
+            rows = df[
                 (df["level"] == idx + 1)
                 & (df["rank_value"].notna())
-                & (
-                    df["rank_value"] != f"Unknown {next_level.name}"
-                )  # Ignore fill_unknown cases
+                & (df["rank_value"] != f"Unknown {next_level.name}")
             ]
+            if rows.empty:
+                continue
+
+            paths = rows["full_path"]
+            expected_length = idx + 2  # idx+1 parent parts + 1 current
+            path_lengths = paths.str.count(r"\|") + 1
+            parent_paths = paths.str.rpartition("|")[0]
+
+            # A path of the wrong length is invalid; otherwise the parent must
+            # exist, unless it has an "Unknown" part (fill_unknown strategy)
+            bad_length = (path_lengths != expected_length).to_numpy()
+            missing_parent = (
+                ~parent_paths.str.contains("Unknown", regex=False)
+                & ~parent_paths.isin(known_paths)
+            ).to_numpy()
+            failures = np.flatnonzero(bad_length | missing_parent)
+            if not len(failures):
+                continue
+
+            position = failures[0]
+            row = rows.iloc[position]
+            if bad_length[position]:
+                raise DataValidationError(
+                    message=f"Invalid hierarchy path at level {idx + 1}",
+                    validation_errors=[
+                        {
+                            "level": idx + 1,
+                            "full_path": row["full_path"],
+                            "expected_length": expected_length,
+                            "actual_length": int(path_lengths.iloc[position]),
+                        }
+                    ],
+                )
 
-            # For each row at next level, check if parent level exists in path
-            for _, row in gaps.iterrows():
-                path_parts = row["full_path"].split("|")
-                expected_length = idx + 2  # idx+1 parent parts + 1 current
-
-                if len(path_parts) != expected_length:
-                    # Path length mismatch - invalid hierarchy
-                    raise DataValidationError(
-                        message=f"Invalid hierarchy path at level {idx + 1}",
-                        validation_errors=[
-                            {
-                                "level": idx + 1,
-                                "full_path": row["full_path"],
-                                "expected_length": expected_length,
-                                "actual_length": len(path_parts),
-                            }
-                        ],
-                    )
-
-                # Check if any parent part is "Unknown"
-                has_unknown_parent = any("Unknown" in part for part in path_parts[:-1])
-                if has_unknown_parent:
-                    # fill_unknown strategy is legitimate
-                    continue
-
-                # Check if parent exists in DataFrame
-                parent_path = "|".join(path_parts[:-1])
-                parent_exists = (df["full_path"] == parent_path).any()
-
-                if not parent_exists:
-                    # Parent is missing - this is a real gap
-                    raise DataValidationError(
-                        message=f"Hierarchy gap detected: {next_level.name} '{row['rank_value']}' "
-                        f"exists without valid {current_level.name} parent",
-                        validation_errors=[
-                            {
-                                "level": idx + 1,
-                                "rank_name": next_level.name,
-                                "rank_value": row["rank_value"],
-                                "full_path": row["full_path"],
-                                "parent_path": parent_path,
-                                "missing_parent": current_level.name,
-                            }
-                        ],
-                    )
+            raise DataValidationError(
+                message=f"Hierarchy gap detected: {next_level.name} '{row['rank_value']}' "
+                f"exists without valid {current_level.name} parent",
+                validation_errors=[
+                    {
+                        "level": idx + 1,
+                        "rank_name": next_level.name,
+                        "rank_value": row["rank_value"],
+                        "full_path": row["full_path"],
+                        "parent_path": parent_paths.iloc[position],
+                        "missing_parent": current_level.name,
+                    }
+                ],
+            )
 
     def _assign_stable_ids(self, df: pd.DataFrame, strategy: str) -> pd.DataFrame:
         """Generate deterministic IDs.
@@ -497,22 +497,16 @@ class HierarchyBuilder:
         else:
             raise ValueError(f"Unsupported ID strategy: {strategy}")
 
+        ids = _to_nullable_int_series(new_ids, column_name="id")
+
         # Map full paths to newly generated IDs (skip missing values)
-        id_lookup = {
-            path: int(value)
-            for path, value in zip(df["full_path"], new_ids)
-            if value is not None and not pd.isna(value)
-        }
-
-        parent_ids = [
-            id_lookup.get(parent_path) if parent_path else None
-            for parent_path in df["parent_path"]
-        ]
+        id_lookup = pd.Series(ids.to_numpy(), index=df["full_path"].to_numpy())
+        id_lookup = id_lookup[id_lookup.notna()]
+        id_lookup = id_lookup[~id_lookup.index.duplicated(keep="last")]
 
-        df = df.assign(
-            id=_to_nullable_int_series(new_ids, column_name="id"),
-            parent_id=_to_nullable_int_series(parent_ids, column_name="parent_id"),
-        )
+        parent_ids = df["parent_path"].map(id_lookup).astype("Int64")
+
+        df = df.assign(id=ids.array, parent_id=parent_ids)
 
         # Normalise other *_id columns to avoid float coercion (e.g. taxons_id)
         for col in df.columns:
@@ -543,60 +537,73 @@ class HierarchyBuilder:
             DataFrame with lft, rght columns added
 
         Algorithm:
-            Modified Preorder Tree Traversal
-            1. Start at root (parent_id=None), counter=1
-            2. Set lft=counter, increment
-            3. Recursively visit children
-            4. Set rght=counter, increment
+            Modified Preorder Tree Traversal, iterative
+            1. Encode each parent_id as the row position of the parent
+            2. Group children by parent, keeping row order (sorted by
+               level and full_path for extracted hierarchies)
+            3. Walk the forest depth-first with a single stack, roots first,
+               numbering each node on entry (lft) and exit (rght)
+            Nodes whose parent is missing from the DataFrame are left
+            without bounds.
         """
         if len(df) == 0:
             return df
 
-        # Initialize lft/rght columns
-        df = df.assign(
-            lft=pd.Series([None] * len(df), index=df.index),
-            rght=pd.Series([None] * len(df), index=df.index),
+        # Parents are looked up among the first row of each id
+        ids = pd.Index(df["id"])
+        first_rows = ~ids.duplicated()
+        parent_ids = df["parent_id"]
+        found = ids[first_rows].get_indexer(parent_ids)
+        parent_positions = np.where(found >= 0, np.flatnonzero(first_rows)[found], -1)
+        parent_positions[parent_ids.isna().to_numpy()] = -1
+
+        lft, rght = _nested_set_bounds(
+            parent_positions, np.flatnonzero(parent_ids.isna().to_numpy())
         )
+        visited = lft > 0
 
-        # Build parent->children mapping
-        children_map = {}
-        for idx, row in df.iterrows():
-            parent = row["parent_id"]
-            if pd.isna(parent):
-                parent = None
-            if parent not in children_map:
-                children_map[parent] = []
-            children_map[parent].append(idx)
-
-        # Recursive tree traversal
-        counter = [1]  # Use list to allow modification in nested function
-
-        def traverse(node_idx):
-            """Recursively assign lft/rght values."""
-            # Set lft value
-            df.at[node_idx, "lft"] = counter[0]
-            counter[0] += 1
-
-            # Traverse children
-            node_id = df.at[node_idx, "id"]
-            if node_id in children_map:
-                for child_idx in sorted(children_map[node_id]):
-                    traverse(child_idx)
-
-            # Set rght value
-            df.at[node_idx, "rght"] = counter[0]
-            counter[0] += 1
-
-        # Start traversal from root nodes (parent_id=None)
-        root_indices = df[df["parent_id"].isna()].index
-        for root_idx in sorted(root_indices):
-            traverse(root_idx)
-
-        # Convert to nullable ints with a single assign to avoid chained-assignment
-        # warnings under pandas Copy-on-Write.
-        df = df.assign(
-            lft=df["lft"].astype("Int64"),
-            rght=df["rght"].astype("Int64"),
+        return df.assign(
+            lft=pd.arrays.IntegerArray(lft, ~visited),
+            rght=pd.arrays.IntegerArray(rght, ~visited),
         )
 
-        return df
+
+def _nested_set_bounds(
+    parent_positions: np.ndarray, roots: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Number the nodes of a forest in depth-first order.
+
+    Args:
+        parent_positions: Row position of each node's parent, -1 for none
+        roots: Row positions of the roots, in traversal order
+
+    Returns:
+        lft and rght arrays, 0 for nodes not reachable from a root
+    """
+    count = len(parent_positions)
+    has_parent = parent_positions >= 0
+
+    # Children of each node, contiguous and in row order (stable sort)
+    children = np.flatnonzero(has_parent)
+    children = children[np.argsort(parent_positions[children], kind="stable")]
+    child_counts = np.bincount(parent_positions[children], minlength=count)
+    offsets = np.concatenate(([0], np.cumsum(child_counts))).tolist()
+    children = children.tolist()
+
+    lft = [0] * count
+    rght = [0] * count
+    counter = 1
+    # Exits are pushed as ~position, i.e. negative numbers
+    stack = roots[::-1].tolist()
+    while stack:
+        node = stack.pop()
+        if node < 0:
+            rght[~node] = counter
+            counter += 1
+            continue
+        lft[node] = counter
+        counter += 1
+        stack.append(~node)
+        stack.extend(reversed(children[offsets[node] : offsets[node + 1]]))
+
+    return np.array(lft, dtype=np.int64), np.array(rght, dtype=np.int64)
@@ -1,15 +1,31 @@
-"""Entity Registry storing metadata about imported entities."""
+"""Entity Registry storing metadata about imported entities.
+
+Lookups are cached per database file and shared by every ``EntityRegistry``
+of the process, so the transform and export loops, which build a registry
+for each loader and transformer, do not query the metadata table for every
+entity. Each database has a version that ``register_entity`` and ``remove``
+bump, dropping its cached entries.
+
+The cache of a database file also records the file's fingerprint (mtime and
+size of the file and of its write-ahead log). When it changes, because
+another connection or process wrote to the database or the file was
+recreated, the cached entries are dropped and the version bumped.
+"""
 
 from __future__ import annotations
 
 import json
+import threading
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
 from collections.abc import Mapping, Sequence
 
 from pydantic import BaseModel, Field
 
 from niamoto.common.database import Database
+from niamoto.common.duckdb_connections import database_file_fingerprint
 from niamoto.common.exceptions import DatabaseQueryError
 
 
@@ -29,6 +45,89 @@ class EntityMetadata(BaseModel):
     config: Dict[str, Any] = Field(default_factory=dict)
 
 
+@dataclass
+class _CachedRegistry:
+    """Entity metadata cached for one database at a given version."""
+
+    version: int = 0
+    tables_ensured: bool = False
+    # State of the database file the entries were read from
+    fingerprint: Optional[tuple[int, ...]] = None
+    # None marks names known to be missing
+    entities: Dict[str, Optional[EntityMetadata]] = field(default_factory=dict)
+    listings: Dict[Optional[EntityKind], List[EntityMetadata]] = field(
+        default_factory=dict
+    )
+
+
+_MISSING = object()
+_REGISTRY_CACHE_LOCK = threading.Lock()
+_REGISTRY_CACHE: Dict[str, _CachedRegistry] = {}
+
+
+def _registry_cache_key(db_path: Any) -> Optional[str]:
+    """Return the cache key of a database, or None when it cannot be shared."""
+    if isinstance(db_path, Path):
+        db_path = str(db_path)
+    if not isinstance(db_path, str) or not db_path or ":memory:" in db_path:
+        return None
+    if "://" in db_path:
+        return db_path
+    return str(Path(db_path).expanduser().resolve())
+
+
+def clear_registry_cache(db_path: Optional[Union[str, Path]] = None) -> None:
+    """Drop cached entity metadata, for one database or all of them.
+
+    Needed when the metadata table was changed outside ``EntityRegistry``,
+    e.g. by another process or by deleting the database file.
+    """
+    with _REGISTRY_CACHE_LOCK:
+        if db_path is None:
+            keys = list(_REGISTRY_CACHE)
+        else:
+            keys = [_registry_cache_key(db_path)]
+        for key in keys:
+            cached = _REGISTRY_CACHE.get(key)
+            if cached is not None:
+                _REGISTRY_CACHE[key] = _CachedRegistry(version=cached.version + 1)
+
+
+def _file_fingerprint(key: str) -> Optional[tuple[int, ...]]:
+    """Return the fingerprint of a database file, None for a database URL."""
+    if "://" in key:
+        return None
+    return database_file_fingerprint(Path(key))
+
+
+def _current_registry(key: str) -> _CachedRegistry:
+    """Return the cache of ``key``, reset if the database file changed.
+
+    Must be called with ``_REGISTRY_CACHE_LOCK`` held.
+    """
+    fingerprint = _file_fingerprint(key)
+    cached = _REGISTRY_CACHE.get(key)
+    if cached is None:
+        cached = _REGISTRY_CACHE[key] = _CachedRegistry(fingerprint=fingerprint)
+    elif cached.fingerprint != fingerprint:
+        cached = _REGISTRY_CACHE[key] = _CachedRegistry(
+            version=cached.version + 1, fingerprint=fingerprint
+        )
+    return cached
+
+
+def _bump_registry_version(key: str) -> None:
+    """Drop the cached entities of ``key`` after its metadata changed."""
+    with _REGISTRY_CACHE_LOCK:
+        cached = _REGISTRY_CACHE.get(key) or _CachedRegistry()
+        # The fingerprint taken after our own write keeps the tables flag
+        _REGISTRY_CACHE[key] = _CachedRegistry(
+            version=cached.version + 1,
+            tables_ensured=cached.tables_ensured,
+            fingerprint=_file_fingerprint(key),
+        )
+
+
 class EntityRegistry:
     """Persisted index of entities available in the import pipeline."""
 
@@ -36,8 +135,28 @@ class EntityRegistry:
 
     def __init__(self, db: Database) -> None:
         self.db = db
+        self._cache_key = _registry_cache_key(getattr(db, "db_path", None))
+        self._uncached_version = 0
         self._ensure_tables()
 
+    @property
+    def version(self) -> int:
+        """Version of the entity metadata, bumped by every registry change."""
+        if self._cache_key is None:
+            return self._uncached_version
+        with _REGISTRY_CACHE_LOCK:
+            return _current_registry(self._cache_key).version
+
+    @property
+    def cache_token(self) -> Optional[tuple[str, int]]:
+        """Key for data derived from the entities, None when not shareable.
+
+        It changes whenever the registry does, e.g. after a re-import.
+        """
+        if self._cache_key is None:
+            return None
+        return self._cache_key, self.version
+
     # ------------------------------------------------------------------
     # public API
     # ------------------------------------------------------------------
@@ -65,10 +184,21 @@ class EntityRegistry:
                 "config": payload,
             },
         )
+        self._bump_version()
 
     def get(self, name: str) -> EntityMetadata:
         """Return metadata for an entity name."""
 
+        version, cached = self._cached_entity(name)
+        if cached is None:
+            raise DatabaseQueryError(
+                query="registry_lookup",
+                message="Entity not found",
+                details={"name": name},
+            )
+        if cached is not _MISSING:
+            return cached.model_copy(deep=True)
+
         sql = f"""
             SELECT name, kind, table_name, config
             FROM {self.ENTITIES_TABLE}
@@ -77,17 +207,28 @@ class EntityRegistry:
         row = self.db.execute_sql(sql, {"name": name}, fetch=True)
 
         if row is None:
+            self._store_entity(version, name, None)
             raise DatabaseQueryError(
                 query="registry_lookup",
                 message="Entity not found",
                 details={"name": name},
             )
 
-        return self._row_to_metadata(row)
+        metadata = self._row_to_metadata(row)
+        self._store_entity(version, name, metadata.model_copy(deep=True))
+        return metadata
 
     def list_entities(self, kind: Optional[EntityKind] = None) -> List[EntityMetadata]:
         """Return all registered entities optionally filtered by kind."""
 
+        version = self.version
+        if self._cache_key is not None:
+            with _REGISTRY_CACHE_LOCK:
+                cached = _current_registry(self._cache_key)
+                listing = cached.listings.get(kind)
+            if listing is not None:
+                return [metadata.model_copy(deep=True) for metadata in listing]
+
         sql = f"SELECT name, kind, table_name, config FROM {self.ENTITIES_TABLE}"
         params: Dict[str, Any] = {}
         if kind is not None:
@@ -98,10 +239,15 @@ class EntityRegistry:
             rows = self.db.execute_sql(sql, params, fetch_all=True)
         except DatabaseQueryError:
             return []
-        if not rows:
-            return []
-
-        return [self._row_to_metadata(row) for row in rows]
+        entities = [self._row_to_metadata(row) for row in rows or []]
+        if self._cache_key is not None:
+            with _REGISTRY_CACHE_LOCK:
+                cached = _REGISTRY_CACHE.get(self._cache_key)
+                if cached is not None and cached.version == version:
+                    cached.listings[kind] = [
+                        metadata.model_copy(deep=True) for metadata in entities
+                    ]
+        return entities
 
     def remove(self, name: str) -> None:
         """Delete an entity."""
@@ -110,6 +256,7 @@ class EntityRegistry:
             f"DELETE FROM {self.ENTITIES_TABLE} WHERE name = :name",
             {"name": name},
         )
+        self._bump_version()
 
     # ------------------------------------------------------------------
     # internals
@@ -127,7 +274,46 @@ class EntityRegistry:
         """
         if getattr(self.db, "read_only", False):
             return
+        if self._cache_key is None:
+            self.db.execute_sql(create_entities)
+            return
+
+        with _REGISTRY_CACHE_LOCK:
+            if _current_registry(self._cache_key).tables_ensured:
+                return
         self.db.execute_sql(create_entities)
+        with _REGISTRY_CACHE_LOCK:
+            # Checked after the CREATE, so the flag survives the change it made
+            _current_registry(self._cache_key).tables_ensured = True
+
+    def _bump_version(self) -> None:
+        if self._cache_key is None:
+            self._uncached_version += 1
+        else:
+            _bump_registry_version(self._cache_key)
+
+    def _cached_entity(self, name: str) -> tuple[int, Any]:
+        """Return the cache version and the cached entry of ``name``.
+
+        The entry is ``_MISSING`` when not cached and None for an entity known
+        not to exist.
+        """
+        if self._cache_key is None:
+            return self._uncached_version, _MISSING
+        with _REGISTRY_CACHE_LOCK:
+            cached = _current_registry(self._cache_key)
+            return cached.version, cached.entities.get(name, _MISSING)
+
+    def _store_entity(
+        self, version: int, name: str, metadata: Optional[EntityMetadata]
+    ) -> None:
+        """Cache a lookup unless the registry changed while it ran."""
+        if self._cache_key is None:
+            return
+        with _REGISTRY_CACHE_LOCK:
+            cached = _REGISTRY_CACHE.get(self._cache_key)
+            if cached is not None and cached.version == version:
+                cached.entities[name] = metadata
 
     def _row_to_metadata(self, row: Any) -> EntityMetadata:
         """Normalize database row structures into entity metadata."""
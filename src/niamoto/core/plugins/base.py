@@ -13,7 +13,17 @@ from abc import ABC, abstractmethod
 from enum import Enum
 import html
 import re
-from typing import Any, AsyncIterator, Optional, List, Dict, TYPE_CHECKING
+from typing import (
+    Any,
+    AsyncIterator,
+    Iterator,
+    Optional,
+    List,
+    Dict,
+    Sequence,
+    Tuple,
+    TYPE_CHECKING,
+)
 
 # Import pandas for type hinting in LoaderPlugin, but avoid runtime dependency if possible
 # Or use 'Any' if pandas might not always be present where this base is imported.
@@ -112,6 +122,28 @@ class LoaderPlugin(Plugin, ABC):
         """
         raise NotImplementedError
 
+    def load_partitions(
+        self, group_ids: Sequence[Any], config: Dict[str, Any]
+    ) -> Iterator[Tuple[Any, pd.DataFrame]]:
+        """
+        Load data for many groups and yield it one group at a time.
+
+        The transform loop consumes this stream instead of calling
+        ``load_data`` once per entity. Loaders that can fetch every group with
+        a single scan override it; the default implementation falls back to
+        one ``load_data`` call per group so existing loaders keep working.
+
+        Args:
+            group_ids: Group identifiers to load, in processing order.
+            config: Same configuration mapping as passed to ``load_data``.
+
+        Yields:
+            ``(group_id, DataFrame)`` pairs, exactly one per requested id and
+            in the order of ``group_ids``.
+        """
+        for group_id in group_ids:
+            yield group_id, self.load_data(group_id, config)
+
 
 class TransformerPlugin(Plugin, ABC):
     """Abstract base class for data transformer plugins."""
@@ -123,6 +155,11 @@ class TransformerPlugin(Plugin, ABC):
     # Example: {"bins": "list", "counts": "list", "percentages": "list"}
     output_structure: Optional[Dict[str, str]] = None
 
+    # The transform service reuses one instance for every entity of a widget.
+    # Plugins keeping per-entity state between transform calls set this to
+    # False to get a new instance for each entity.
+    reentrant: bool = True
+
     @abstractmethod
     def transform(self, data: Any, params: "BaseModel") -> Any:
         """
@@ -192,6 +229,11 @@ class WidgetPlugin(Plugin, ABC):
     # Example: [{"bins": "list", "counts": "list"}, {"categories": "list", "values": "list"}]
     compatible_structures: Optional[List[Dict[str, str]]] = None
 
+    # Whether render() may query the database the widget is created with.
+    # Incremental exports re-render the pages of these widgets whenever the
+    # database file changed; widgets rendering only their data set False.
+    reads_database: bool = True
+
     def get_dependencies(self) -> List[str]:
         """
         Declare any external JS or CSS files required by this widget.
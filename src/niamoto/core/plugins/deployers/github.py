@@ -2,10 +2,12 @@
 
 import asyncio
 import base64
+import hashlib
 import logging
 import os
 import shutil
 import tempfile
+from collections import deque
 from pathlib import Path
 from typing import AsyncIterator
 from urllib.parse import quote
@@ -19,14 +21,34 @@ from .models import DeployConfig
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://api.github.com"
+# New or changed files the API fallback uploads in one deploy; unchanged files
+# already on the branch are reused and do not count.
 GITHUB_API_SAFE_FILE_LIMIT = 400
 GITHUB_API_WRITE_DELAY_SECONDS = 1.0
+GITHUB_API_UPLOAD_CONCURRENCY = 4
+BLOB_MODE = "100644"
+EMPTY_BLOB_SHA = hashlib.sha1(b"blob 0\0").hexdigest()
 DEFAULT_GIT_AUTHOR_NAME = "Niamoto Deploy"
 DEFAULT_GIT_AUTHOR_EMAIL = "deploy@niamoto.local"
 PROTECTED_DEPLOY_BRANCHES = frozenset({"main", "master", "trunk", "develop", "dev"})
 DEDICATED_PAGES_BRANCHES = frozenset({"gh-pages"})
 
 
+def _git_blob_sha(path: str) -> str:
+    """Compute the git blob SHA-1 of a file, as GitHub names its content."""
+    h = hashlib.sha1()
+    h.update(f"blob {os.path.getsize(path)}\0".encode("ascii"))
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _git_blob_shas(paths: list[str]) -> list[str]:
+    """Compute the git blob SHA-1 of each file (run off the event loop)."""
+    return [_git_blob_sha(path) for path in paths]
+
+
 @register("github")
 class GitHubDeployer(DeployerPlugin):
     """Deploy static sites to GitHub Pages.
@@ -105,16 +127,6 @@ class GitHubDeployer(DeployerPlugin):
                 yield line
             return
 
-        if total > GITHUB_API_SAFE_FILE_LIMIT:
-            yield self.sse_error(
-                "Git is not available on this system, and the GitHub API fallback "
-                f"is limited to about {GITHUB_API_SAFE_FILE_LIMIT} files to avoid "
-                "GitHub content-creation rate limits. Install Git or use another "
-                "deployment platform for this site."
-            )
-            yield self.sse_done()
-            return
-
         yield self.sse_log("Git not found; using the slower GitHub API fallback.")
         async for line in self._deploy_with_api(
             config=config,
@@ -308,76 +320,92 @@ class GitHubDeployer(DeployerPlugin):
         parent_sha: str,
         file_paths: list[tuple[str, str]],
     ) -> AsyncIterator[str]:
-        """Upload files through an already configured GitHub API client."""
-        _ = branch
-        yield self.sse_log(f"Branch '{branch}' ready (tip: {parent_sha[:8]})")
+        """Upload changed files through an already configured GitHub API client.
 
-        tree_entries: list[dict] = []
-        total = len(file_paths)
+        Blob SHA-1s are computed locally and compared with the branch tree, so
+        only blobs GitHub does not have yet are uploaded, and the new tree
+        only lists the paths that changed on top of the current one.
+        """
+        yield self.sse_log(f"Branch '{branch}' ready (tip: {parent_sha[:8]})")
 
-        for index, (rel_path, abs_path) in enumerate(file_paths, start=1):
-            try:
-                with open(abs_path, "rb") as f:
-                    content_b64 = base64.b64encode(f.read()).decode("ascii")
+        try:
+            blob_shas = await asyncio.to_thread(
+                _git_blob_shas, [abs_path for _rel_path, abs_path in file_paths]
+            )
+        except OSError as exc:
+            yield self.sse_error(f"Upload failed: {exc}")
+            yield self.sse_done()
+            return
+        local_files: dict[str, tuple[str, str | None]] = {
+            rel_path.replace("\\", "/"): (blob_sha, abs_path)
+            for (rel_path, abs_path), blob_sha in zip(file_paths, blob_shas)
+        }
+        local_files.setdefault(".nojekyll", (EMPTY_BLOB_SHA, None))
 
-                resp = await client.post(
-                    f"/repos/{owner}/{repo}/git/blobs",
-                    json={"content": content_b64, "encoding": "base64"},
-                )
-                resp.raise_for_status()
-                blob_sha = resp.json()["sha"]
-            except httpx.HTTPStatusError as exc:
-                detail = exc.response.text[:200] or str(exc)
-                yield self.sse_error(f"Upload failed: {rel_path}: {detail}")
-                yield self.sse_done()
-                return
-            except OSError as exc:
-                yield self.sse_error(f"Upload failed: {rel_path}: {exc}")
-                yield self.sse_done()
-                return
+        base_tree_sha, remote_files = await self._get_branch_tree(
+            client, owner, repo, parent_sha
+        )
+        remote_blobs = {sha for sha, _mode in remote_files.values()}
+        missing: dict[str, tuple[str, str | None]] = {}
+        for rel_path, (blob_sha, abs_path) in local_files.items():
+            if blob_sha not in remote_blobs:
+                missing.setdefault(blob_sha, (rel_path, abs_path))
 
-            tree_entries.append(
-                {
-                    "path": rel_path.replace("\\", "/"),
-                    "mode": "100644",
-                    "type": "blob",
-                    "sha": blob_sha,
-                }
+        if len(missing) > GITHUB_API_SAFE_FILE_LIMIT:
+            yield self.sse_error(
+                f"{len(missing)} files are new or changed, but the GitHub API "
+                f"fallback uploads at most about {GITHUB_API_SAFE_FILE_LIMIT} files "
+                "per deploy to avoid GitHub content-creation rate limits. Install "
+                "Git or use another deployment platform for this site."
             )
+            yield self.sse_done()
+            return
 
-            if index % 20 == 0 or index == total:
-                yield self.sse_log(f"Uploading files: {index}/{total}")
+        reused = sum(1 for sha, _path in local_files.values() if sha in remote_blobs)
+        yield self.sse_log(
+            f"{len(missing)} files to upload, {reused} unchanged on GitHub"
+        )
 
-            if index < total:
-                await asyncio.sleep(GITHUB_API_WRITE_DELAY_SECONDS)
+        uploaded: dict[str, str] = {}
+        async for line in self._upload_missing_blobs(
+            client, owner, repo, missing, uploaded
+        ):
+            yield line
+        if len(uploaded) < len(missing):
+            yield self.sse_done()
+            return
 
-        if not any(entry["path"] == ".nojekyll" for entry in tree_entries):
-            try:
-                resp = await client.post(
-                    f"/repos/{owner}/{repo}/git/blobs",
-                    json={"content": "", "encoding": "utf-8"},
-                )
-                resp.raise_for_status()
-                tree_entries.append(
-                    {
-                        "path": ".nojekyll",
-                        "mode": "100644",
-                        "type": "blob",
-                        "sha": resp.json()["sha"],
-                    }
-                )
-            except httpx.HTTPStatusError as exc:
-                yield self.sse_error(
-                    f"Failed to prepare .nojekyll: {exc.response.text[:200]}"
+        tree_entries: list[dict] = []
+        for rel_path, (blob_sha, _abs_path) in local_files.items():
+            blob_sha = uploaded.get(blob_sha, blob_sha)
+            if base_tree_sha and remote_files.get(rel_path) == (blob_sha, BLOB_MODE):
+                continue
+            tree_entries.append(
+                {"path": rel_path, "mode": BLOB_MODE, "type": "blob", "sha": blob_sha}
+            )
+        if base_tree_sha:
+            # Files removed from the export are deleted from the base tree
+            tree_entries.extend(
+                {"path": rel_path, "mode": mode, "type": "blob", "sha": None}
+                for rel_path, (_sha, mode) in remote_files.items()
+                if rel_path not in local_files
+            )
+            if not tree_entries:
+                yield self.sse_success(
+                    f"GitHub Pages already up to date ({parent_sha[:8]})"
                 )
+                yield self.sse_url(self._get_pages_url(owner, repo))
                 yield self.sse_done()
                 return
 
-        yield self.sse_log("Creating file tree...")
+        yield self.sse_log(f"Creating file tree ({len(tree_entries)} changes)...")
+        tree_payload: dict = {"tree": tree_entries}
+        if base_tree_sha:
+            tree_payload["base_tree"] = base_tree_sha
         try:
             tree_resp = await client.post(
                 f"/repos/{owner}/{repo}/git/trees",
-                json={"tree": tree_entries},
+                json=tree_payload,
             )
             tree_resp.raise_for_status()
             tree_sha = tree_resp.json()["sha"]
@@ -419,6 +447,132 @@ class GitHubDeployer(DeployerPlugin):
         yield self.sse_url(self._get_pages_url(owner, repo))
         yield self.sse_done()
 
+    @staticmethod
+    async def _get_branch_tree(
+        client: httpx.AsyncClient, owner: str, repo: str, commit_sha: str
+    ) -> tuple[str | None, dict[str, tuple[str, str]]]:
+        """Return the tree SHA of a commit and its blobs by path.
+
+        The tree SHA is None when the tree could not be read entirely; the
+        deploy then writes a full tree instead of changes on top of it.
+        """
+        commit_resp = await client.get(
+            f"/repos/{owner}/{repo}/git/commits/{commit_sha}"
+        )
+        if commit_resp.status_code != 200:
+            return None, {}
+        tree_sha = commit_resp.json()["tree"]["sha"]
+
+        tree_resp = await client.get(
+            f"/repos/{owner}/{repo}/git/trees/{tree_sha}?recursive=1"
+        )
+        if tree_resp.status_code != 200:
+            return None, {}
+        tree_data = tree_resp.json()
+        blobs = {
+            entry["path"]: (entry["sha"], entry["mode"])
+            for entry in tree_data.get("tree", [])
+            if entry.get("type") == "blob"
+        }
+        if tree_data.get("truncated"):
+            return None, blobs
+        return tree_sha, blobs
+
+    async def _upload_missing_blobs(
+        self,
+        client: httpx.AsyncClient,
+        owner: str,
+        repo: str,
+        missing: dict[str, tuple[str, str | None]],
+        uploaded: dict[str, str],
+    ) -> AsyncIterator[str]:
+        """Create the missing blobs with a bounded number of concurrent uploads.
+
+        ``uploaded`` maps local blob SHAs to the ones GitHub returned. The
+        workers share one rate limit: uploads start at most once every
+        ``GITHUB_API_WRITE_DELAY_SECONDS`` in total, and concurrency only
+        overlaps uploads that take longer than that.
+        """
+        total = len(missing)
+        if total == 0:
+            return
+
+        pending = deque(missing.items())
+        results: asyncio.Queue = asyncio.Queue()
+        write_slot = asyncio.Lock()
+        next_write = 0.0
+
+        async def wait_for_write_slot() -> None:
+            nonlocal next_write
+            async with write_slot:
+                loop = asyncio.get_running_loop()
+                delay = next_write - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                next_write = loop.time() + GITHUB_API_WRITE_DELAY_SECONDS
+
+        async def worker() -> None:
+            while pending:
+                blob_sha, (rel_path, abs_path) = pending.popleft()
+                await wait_for_write_slot()
+                await results.put(
+                    (
+                        blob_sha,
+                        await self._create_blob(
+                            client, owner, repo, rel_path, abs_path
+                        ),
+                    )
+                )
+
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(min(GITHUB_API_UPLOAD_CONCURRENCY, total))
+        ]
+        try:
+            for index in range(1, total + 1):
+                blob_sha, (created_sha, error) = await results.get()
+                if error is not None:
+                    yield self.sse_error(error)
+                    return
+                if created_sha != blob_sha:
+                    logger.warning(
+                        "GitHub returned blob %s for local blob %s",
+                        created_sha,
+                        blob_sha,
+                    )
+                uploaded[blob_sha] = created_sha
+                if index % 20 == 0 or index == total:
+                    yield self.sse_log(f"Uploading files: {index}/{total}")
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    @staticmethod
+    async def _create_blob(
+        client: httpx.AsyncClient,
+        owner: str,
+        repo: str,
+        rel_path: str,
+        abs_path: str | None,
+    ) -> tuple[str | None, str | None]:
+        """Upload one blob; returns (blob_sha, None) or (None, error_message)."""
+        try:
+            if abs_path is None:
+                payload = {"content": "", "encoding": "utf-8"}
+            else:
+                with open(abs_path, "rb") as f:
+                    content_b64 = base64.b64encode(f.read()).decode("ascii")
+                payload = {"content": content_b64, "encoding": "base64"}
+            resp = await client.post(f"/repos/{owner}/{repo}/git/blobs", json=payload)
+            resp.raise_for_status()
+            return resp.json()["sha"], None
+        except httpx.HTTPStatusError as exc:
+            detail = exc.response.text[:200] or str(exc)
+            return None, f"Upload failed: {rel_path}: {detail}"
+        except (httpx.HTTPError, OSError) as exc:
+            return None, f"Upload failed: {rel_path}: {exc}"
+
     async def unpublish(self, config: DeployConfig) -> AsyncIterator[str]:
         """Remove GitHub Pages by deleting the deployment branch."""
         token = CredentialService.get("github", "token")
@@ -1,11 +1,14 @@
-"""Netlify deployer plugin using ZIP upload API."""
+"""Netlify deployer plugin using file digest deploys, with ZIP upload fallback."""
 
 import asyncio
+import hashlib
 import io
 import logging
 import os
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from typing import AsyncIterator
+from urllib.parse import quote
 
 import httpx
 
@@ -16,11 +19,47 @@ from niamoto.core.services.credential import CredentialService
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://api.netlify.com"
+NETLIFY_UPLOAD_CONCURRENCY = 8
+HASH_CHUNK_SIZE = 1024 * 1024
+UPLOAD_CHUNK_SIZE = 64 * 1024
+DEPLOY_MODES = ("digest", "zip")
+
+
+def _hash_file(path: str) -> str:
+    """Compute the SHA-1 digest Netlify uses to identify a file's content."""
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _hash_files(paths: list[str]) -> list[str]:
+    """Hash files on a thread pool; hashlib releases the GIL on large chunks."""
+    workers = min(8, os.cpu_count() or 1, max(1, len(paths)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_hash_file, paths))
+
+
+async def _iter_file(path: str) -> AsyncIterator[bytes]:
+    """Stream a file from disk in chunks, for request bodies.
+
+    Chunks are read on a worker thread so disk reads do not block the
+    event loop while other uploads are in flight.
+    """
+    with open(path, "rb") as f:
+        while chunk := await asyncio.to_thread(f.read, UPLOAD_CHUNK_SIZE):
+            yield chunk
 
 
 @register("netlify")
 class NetlifyDeployer(DeployerPlugin):
-    """Deploy static sites to Netlify via ZIP upload."""
+    """Deploy static sites to Netlify.
+
+    By default a deploy submits the SHA-1 digest of every file and uploads
+    only the files Netlify does not already have. ``deploy_mode: zip`` (or a
+    rejected digest manifest) uploads the whole site as one ZIP archive.
+    """
 
     platform = "netlify"
 
@@ -68,9 +107,9 @@ class NetlifyDeployer(DeployerPlugin):
 
         Flow:
         1. Authenticate and get site_id
-        2. Create ZIP archive of exports directory
-        3. Upload ZIP to Netlify deploy endpoint
-        4. Poll deploy status until ready or error
+        2. Submit the file digests, then upload the files Netlify requires
+           (or create and upload a ZIP archive of the exports directory)
+        3. Poll deploy status until ready or error
         """
         errors = self.validate_exports(config)
         if errors:
@@ -95,52 +134,47 @@ class NetlifyDeployer(DeployerPlugin):
             yield self.sse_done()
             return
 
-        exports_dir = config.exports_dir
-        yield self.sse_log(f"Deploying to Netlify site {site_id}")
-
-        # --- Create ZIP archive ---
-        yield self.sse_log("Creating ZIP archive...")
-        try:
-            zip_buffer = self._create_zip(exports_dir)
-        except Exception as exc:
-            yield self.sse_error(f"Failed to create ZIP archive: {exc}")
+        deploy_mode = str(config.extra.get("deploy_mode") or "digest")
+        if deploy_mode not in DEPLOY_MODES:
+            yield self.sse_error(
+                f"Unknown Netlify deploy_mode '{deploy_mode}'. "
+                f"Expected one of: {', '.join(DEPLOY_MODES)}."
+            )
             yield self.sse_done()
             return
 
-        zip_bytes = zip_buffer.getvalue()
-        size_mb = len(zip_bytes) / (1024 * 1024)
-        yield self.sse_log(f"ZIP archive ready ({size_mb:.1f} MiB)")
-
-        # --- Upload ZIP ---
-        yield self.sse_log("Uploading to Netlify...")
+        exports_dir = config.exports_dir
+        yield self.sse_log(f"Deploying to Netlify site {site_id}")
 
         async with httpx.AsyncClient(
             base_url=BASE_URL,
             headers={"Authorization": f"Bearer {token}"},
             timeout=120.0,
         ) as client:
-            try:
-                resp = await client.post(
-                    f"/api/v1/sites/{site_id}/deploys",
-                    content=zip_bytes,
-                    headers={"Content-Type": "application/zip"},
-                )
-                resp.raise_for_status()
-                deploy_data = resp.json()
-                deploy_id = deploy_data["id"]
-            except httpx.HTTPStatusError as exc:
-                yield self.sse_error(
-                    f"Upload failed (HTTP {exc.response.status_code}): "
-                    f"{exc.response.text[:200]}"
-                )
-                yield self.sse_done()
-                return
-            except Exception as exc:
-                yield self.sse_error(f"Upload failed: {exc}")
-                yield self.sse_done()
-                return
-
-            yield self.sse_log(f"Deploy created: {deploy_id}")
+            deploy_id = None
+            if deploy_mode == "digest":
+                result: dict = {}
+                async for line in self._deploy_digests(
+                    client, site_id, exports_dir, result
+                ):
+                    yield line
+                if result.get("failed"):
+                    yield self.sse_done()
+                    return
+                deploy_id = result.get("deploy_id")
+
+            if deploy_id is None:
+                result = {}
+                async for line in self._deploy_zip(
+                    client, site_id, exports_dir, result
+                ):
+                    yield line
+                deploy_id = result.get("deploy_id")
+                if deploy_id is None:
+                    yield self.sse_done()
+                    return
+
+                yield self.sse_log(f"Deploy created: {deploy_id}")
 
             # --- Poll status ---
             yield self.sse_log("Processing deployment...")
@@ -165,6 +199,170 @@ class NetlifyDeployer(DeployerPlugin):
 
             yield self.sse_done()
 
+    async def _deploy_digests(
+        self,
+        client: httpx.AsyncClient,
+        site_id: str,
+        exports_dir,
+        result: dict,
+    ) -> AsyncIterator[str]:
+        """Create a deploy from file digests and upload the required files.
+
+        Sets ``result["deploy_id"]`` once every required file is uploaded,
+        or ``result["failed"]`` after reporting an error. When Netlify
+        rejects the manifest, neither is set and the caller uploads a ZIP.
+        """
+        yield self.sse_log("Computing file digests...")
+        try:
+            file_paths = self._collect_files(exports_dir)
+            digests = await asyncio.to_thread(
+                _hash_files, [abs_path for _rel_path, abs_path in file_paths]
+            )
+        except OSError as exc:
+            yield self.sse_error(f"Failed to read export files: {exc}")
+            result["failed"] = True
+            return
+
+        manifest = {
+            "/" + rel_path: digest
+            for (rel_path, _abs_path), digest in zip(file_paths, digests)
+        }
+        # Several paths can share a digest; Netlify asks for each digest once
+        path_by_digest: dict[str, tuple[str, str]] = {}
+        for (rel_path, abs_path), digest in zip(file_paths, digests):
+            path_by_digest.setdefault(digest, (rel_path, abs_path))
+        yield self.sse_log(f"Manifest ready: {len(manifest)} files")
+
+        try:
+            resp = await client.post(
+                f"/api/v1/sites/{site_id}/deploys", json={"files": manifest}
+            )
+            resp.raise_for_status()
+            deploy_data = resp.json()
+            deploy_id = deploy_data["id"]
+        except httpx.HTTPStatusError as exc:
+            yield self.sse_log(
+                f"Digest deploy rejected (HTTP {exc.response.status_code}); "
+                "falling back to ZIP upload."
+            )
+            return
+        except httpx.HTTPError as exc:
+            yield self.sse_error(f"Upload failed: {exc}")
+            result["failed"] = True
+            return
+
+        yield self.sse_log(f"Deploy created: {deploy_id}")
+        required = [digest for digest in deploy_data.get("required") or [] if digest]
+        unknown = [digest for digest in required if digest not in path_by_digest]
+        if unknown:
+            yield self.sse_error(f"Netlify requested unknown file digest {unknown[0]}")
+            result["failed"] = True
+            return
+
+        total = len(required)
+        if total == 0:
+            yield self.sse_log("All files already on Netlify, skipping upload")
+        else:
+            yield self.sse_log(
+                f"Uploading {total} of {len(path_by_digest)} distinct files..."
+            )
+
+        semaphore = asyncio.Semaphore(NETLIFY_UPLOAD_CONCURRENCY)
+
+        async def upload(digest: str) -> str | None:
+            rel_path, abs_path = path_by_digest[digest]
+            async with semaphore:
+                return await self._upload_file(client, deploy_id, rel_path, abs_path)
+
+        tasks = [asyncio.create_task(upload(digest)) for digest in required]
+        try:
+            for index, next_done in enumerate(asyncio.as_completed(tasks), start=1):
+                error = await next_done
+                if error is not None:
+                    yield self.sse_error(error)
+                    result["failed"] = True
+                    return
+                if index % 50 == 0 or index == total:
+                    yield self.sse_log(f"Uploading files: {index}/{total}")
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        result["deploy_id"] = deploy_id
+
+    @staticmethod
+    async def _upload_file(
+        client: httpx.AsyncClient, deploy_id: str, rel_path: str, abs_path: str
+    ) -> str | None:
+        """Stream one file to a digest deploy; returns an error message on failure."""
+        try:
+            resp = await client.put(
+                f"/api/v1/deploys/{deploy_id}/files/{quote(rel_path)}",
+                content=_iter_file(abs_path),
+                headers={
+                    "Content-Type": "application/octet-stream",
+                    "Content-Length": str(os.path.getsize(abs_path)),
+                },
+            )
+            resp.raise_for_status()
+        except httpx.HTTPStatusError as exc:
+            return (
+                f"Upload failed for {rel_path} (HTTP {exc.response.status_code}): "
+                f"{exc.response.text[:200]}"
+            )
+        except (httpx.HTTPError, OSError) as exc:
+            return f"Upload failed for {rel_path}: {exc}"
+        return None
+
+    async def _deploy_zip(
+        self,
+        client: httpx.AsyncClient,
+        site_id: str,
+        exports_dir,
+        result: dict,
+    ) -> AsyncIterator[str]:
+        """Upload the whole site as a ZIP archive; sets ``result["deploy_id"]``."""
+        yield self.sse_log("Creating ZIP archive...")
+        try:
+            zip_buffer = self._create_zip(exports_dir)
+        except Exception as exc:
+            yield self.sse_error(f"Failed to create ZIP archive: {exc}")
+            return
+
+        zip_bytes = zip_buffer.getvalue()
+        size_mb = len(zip_bytes) / (1024 * 1024)
+        yield self.sse_log(f"ZIP archive ready ({size_mb:.1f} MiB)")
+
+        yield self.sse_log("Uploading to Netlify...")
+        try:
+            resp = await client.post(
+                f"/api/v1/sites/{site_id}/deploys",
+                content=zip_bytes,
+                headers={"Content-Type": "application/zip"},
+            )
+            resp.raise_for_status()
+            result["deploy_id"] = resp.json()["id"]
+        except httpx.HTTPStatusError as exc:
+            yield self.sse_error(
+                f"Upload failed (HTTP {exc.response.status_code}): "
+                f"{exc.response.text[:200]}"
+            )
+        except Exception as exc:
+            yield self.sse_error(f"Upload failed: {exc}")
+
+    @staticmethod
+    def _collect_files(exports_dir) -> list[tuple[str, str]]:
+        """Return export files as (relative POSIX path, absolute path) pairs."""
+        file_paths: list[tuple[str, str]] = []
+        for root, _dirs, files in os.walk(exports_dir):
+            for fname in files:
+                abs_path = os.path.join(root, fname)
+                rel_path = os.path.relpath(abs_path, exports_dir).replace("\\", "/")
+                file_paths.append((rel_path, abs_path))
+        file_paths.sort()
+        return file_paths
+
     @staticmethod
     def _create_zip(exports_dir) -> io.BytesIO:
         """Create an in-memory ZIP archive of the exports directory."""
@@ -2,14 +2,35 @@
 Niamoto exporter plugins.
 
 This module contains all exporter plugins for generating various output formats.
+Exporter classes are imported on first access.
 """
 
-from .html_page_exporter import HtmlPageExporter
-from .json_api_exporter import JsonApiExporter
-from .index_generator import IndexGeneratorPlugin
+import importlib
+from typing import Any
+
+# Public name -> (submodule, class name)
+_EXPORTS = {
+    "HtmlPageExporter": (".html_page_exporter", "HtmlPageExporter"),
+    "JsonApiExporter": (".json_api_exporter", "JsonApiExporter"),
+    "IndexGeneratorPlugin": (".index_generator", "IndexGeneratorPlugin"),
+}
 
 __all__ = [
     "HtmlPageExporter",
     "JsonApiExporter",
     "IndexGeneratorPlugin",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attribute = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -8,15 +8,22 @@ This exporter generates a compliant Darwin Core Archive containing:
 - meta.xml: Structure description of the archive
 - eml.xml: Ecological Metadata Language file with dataset metadata
 - dwc-archive.zip: Complete archive ready for GBIF and other biodiversity portals
+
+Occurrences are streamed: the set of Darwin Core terms is resolved first,
+from the transformer mapping when possible, then each record is written to
+the CSV file and the archive as soon as it is produced.
 """
 
 import csv
 import gzip
+import io
+import itertools
 import logging
 import zipfile
+from contextlib import ExitStack
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
 from xml.etree import ElementTree as ET
 from xml.dom import minidom
 
@@ -67,6 +74,17 @@ def _resolve_group_table_identifier(repository: Database, group_name: str) -> st
     return _quote_table_identifier(repository, group_name)
 
 
+class _TeeWriter:
+    """Forward text written by the CSV writer to several file handles."""
+
+    def __init__(self, handles: List[Any]):
+        self.handles = handles
+
+    def write(self, text: str) -> None:
+        for handle in self.handles:
+            handle.write(text)
+
+
 class DatasetMetadata(BaseModel):
     """Metadata for the Darwin Core Archive dataset."""
 
@@ -140,6 +158,7 @@ class DwcArchiveExporter(ExporterPlugin):
             "total_occurrences": 0,
             "total_taxa": 0,
         }
+        self._transformers: Dict[str, Any] = {}
 
     def export(
         self,
@@ -166,35 +185,38 @@ class DwcArchiveExporter(ExporterPlugin):
             output_dir = Path(params.output_dir)
             output_dir.mkdir(parents=True, exist_ok=True)
 
-            # Process groups and collect all occurrences
-            all_occurrences = []
-            dwc_terms = set()
-
             groups_to_process = target_config.groups or []
             if group_filter:
                 groups_to_process = [
                     g for g in groups_to_process if g.group_by == group_filter
                 ]
 
-            if CLI_CONTEXT and ProgressManager:
-                progress_manager = ProgressManager()
-                with progress_manager.progress_context() as pm:
-                    all_occurrences, dwc_terms = (
-                        self._collect_occurrences_with_progress(
-                            groups_to_process, repository, pm
-                        )
+            with ExitStack() as stack:
+                progress_manager = None
+                if CLI_CONTEXT and ProgressManager:
+                    progress_manager = stack.enter_context(
+                        ProgressManager().progress_context()
                     )
-            else:
-                all_occurrences, dwc_terms = self._collect_occurrences(
-                    groups_to_process, repository
-                )
-
-            if not all_occurrences:
-                logger.warning("No occurrences found to export")
-                return
 
-            # Generate archive files
-            self._generate_archive(all_occurrences, dwc_terms, output_dir, params)
+                # First pass: the columns of the archive
+                dwc_terms = self._resolve_dwc_terms(
+                    groups_to_process, repository, progress_manager
+                )
+                occurrences = self._iter_occurrences(
+                    groups_to_process, repository, progress_manager
+                )
+                first_occurrence = next(occurrences, None) if dwc_terms else None
+                if first_occurrence is None:
+                    logger.warning("No occurrences found to export")
+                    return
+
+                # Second pass: stream the records into the archive
+                self._generate_archive(
+                    itertools.chain([first_occurrence], occurrences),
+                    dwc_terms,
+                    output_dir,
+                    params,
+                )
 
             logger.info(
                 f"Darwin Core Archive generated: {output_dir / params.archive_name}"
@@ -207,56 +229,20 @@ class DwcArchiveExporter(ExporterPlugin):
             self.stats["end_time"] = datetime.now()
             logger.info(f"Export stats: {self.stats}")
 
-    def _collect_occurrences(
+    def _iter_occurrences(
         self,
         groups: List[Any],
         repository: Database,
-    ) -> tuple[List[Dict[str, Any]], set]:
-        """Collect all occurrences from all groups."""
-        all_occurrences = []
-        dwc_terms = set()
-
-        for group_config in groups:
-            # Handle both dict and object formats
-            group_name = (
-                group_config.get("group_by")
-                if isinstance(group_config, dict)
-                else group_config.group_by
-            )
-            logger.info(f"Processing group: {group_name}")
+        progress_manager: Optional["ProgressManager"] = None,
+        label: str = "Collecting DwC occurrences from",
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield the occurrences of every group, one transformed item at a time.
 
-            # Get data for this group
-            group_data = self._fetch_group_data(repository, group_name)
-
-            if not group_data:
-                logger.warning(f"No data found for group: {group_name}")
-                continue
-
-            self.stats["total_taxa"] += len(group_data)
-
-            # Process each item with transformer
-            for item in group_data:
-                occurrences = self._apply_transformer(item, group_config)
-
-                if occurrences and isinstance(occurrences, list):
-                    all_occurrences.extend(occurrences)
-
-                    # Collect all DwC terms used
-                    for occ in occurrences:
-                        dwc_terms.update(occ.keys())
-
-        self.stats["total_occurrences"] = len(all_occurrences)
-        return all_occurrences, dwc_terms
-
-    def _collect_occurrences_with_progress(
-        self,
-        groups: List[Any],
-        repository: Database,
-        progress_manager: "ProgressManager",
-    ) -> tuple[List[Dict[str, Any]], set]:
-        """Collect all occurrences with progress tracking."""
-        all_occurrences = []
-        dwc_terms = set()
+        Only the rows of the current group table and the occurrences of the
+        current item are held in memory.
+        """
+        self.stats["total_taxa"] = 0
+        self.stats["total_occurrences"] = 0
 
         for group_config in groups:
             # Handle both dict and object formats
@@ -272,42 +258,97 @@ class DwcArchiveExporter(ExporterPlugin):
 
             if not group_data:
                 logger.warning(f"No data found for group: {group_name}")
-                progress_manager.add_warning(f"No data found for group: {group_name}")
+                if progress_manager:
+                    progress_manager.add_warning(
+                        f"No data found for group: {group_name}"
+                    )
                 continue
 
             self.stats["total_taxa"] += len(group_data)
 
-            # Add progress task
             task_name = f"dwc_{group_name}"
-            progress_manager.add_task(
-                task_name,
-                f"Collecting DwC occurrences from {group_name}",
-                total=len(group_data),
-            )
+            if progress_manager:
+                progress_manager.add_task(
+                    task_name, f"{label} {group_name}", total=len(group_data)
+                )
 
-            # Process each item with transformer
+            group_occurrences = 0
             for item in group_data:
                 try:
                     occurrences = self._apply_transformer(item, group_config)
-
-                    if occurrences and isinstance(occurrences, list):
-                        all_occurrences.extend(occurrences)
-
-                        # Collect all DwC terms used
-                        for occ in occurrences:
-                            dwc_terms.update(occ.keys())
                 except Exception as e:
                     logger.error(f"Error processing item: {str(e)}")
-                    progress_manager.add_error(f"Error processing item: {str(e)}")
+                    if progress_manager:
+                        progress_manager.add_error(f"Error processing item: {str(e)}")
+                    occurrences = []
 
-                progress_manager.update_task(task_name, advance=1)
+                if occurrences and isinstance(occurrences, list):
+                    group_occurrences += len(occurrences)
+                    self.stats["total_occurrences"] += len(occurrences)
+                    yield from occurrences
 
-            progress_manager.complete_task(
-                task_name, f"Collected {len(all_occurrences)} occurrences"
-            )
+                if progress_manager:
+                    progress_manager.update_task(task_name, advance=1)
 
-        self.stats["total_occurrences"] = len(all_occurrences)
-        return all_occurrences, dwc_terms
+            if progress_manager:
+                progress_manager.complete_task(
+                    task_name, f"Collected {group_occurrences} occurrences"
+                )
+
+    def _resolve_dwc_terms(
+        self,
+        groups: List[Any],
+        repository: Database,
+        progress_manager: Optional["ProgressManager"] = None,
+    ) -> Set[str]:
+        """Return the Darwin Core terms written as archive columns.
+
+        The built-in DwC transformer only emits the terms of its mapping, so
+        they are read from the configuration. Other transformers are run once
+        to collect the terms they actually produce.
+        """
+        dwc_terms: Set[str] = set()
+        unmapped_groups = []
+        for group_config in groups:
+            mapping_terms = self._mapping_terms(group_config)
+            if mapping_terms is None:
+                unmapped_groups.append(group_config)
+            else:
+                dwc_terms.update(mapping_terms)
+
+        if unmapped_groups:
+            for occurrence in self._iter_occurrences(
+                unmapped_groups,
+                repository,
+                progress_manager,
+                label="Scanning DwC terms from",
+            ):
+                dwc_terms.update(occurrence.keys())
+        return dwc_terms
+
+    @staticmethod
+    def _mapping_terms(group_config: Any) -> Optional[Set[str]]:
+        """Return the terms mapped by a ``niamoto_to_dwc_occurrence`` group."""
+        if isinstance(group_config, dict):
+            transformer_plugin = group_config.get("transformer_plugin")
+            transformer_params = group_config.get("transformer_params")
+        else:
+            transformer_plugin = getattr(group_config, "transformer_plugin", None)
+            transformer_params = getattr(group_config, "transformer_params", None)
+
+        if transformer_plugin != "niamoto_to_dwc_occurrence":
+            return None
+        if isinstance(transformer_params, BaseModel):
+            transformer_params = transformer_params.model_dump()
+        if not isinstance(transformer_params, dict):
+            return None
+        # Accept both {"mapping": ...} and {"params": {"mapping": ...}}
+        if isinstance(transformer_params.get("params"), dict):
+            transformer_params = transformer_params["params"]
+        mapping = transformer_params.get("mapping")
+        if not isinstance(mapping, dict) or not mapping:
+            return None
+        return set(mapping)
 
     def _fetch_group_data(
         self, repository: Database, group_name: str
@@ -375,17 +416,19 @@ class DwcArchiveExporter(ExporterPlugin):
                 logger.warning("No transformer plugin configured")
                 return []
 
-            # Get the transformer plugin
-            transformer_class = PluginRegistry.get_plugin(
-                transformer_plugin, PluginType.TRANSFORMER
-            )
+            # Reuse one transformer instance per plugin
+            transformer = self._transformers.get(transformer_plugin)
+            if transformer is None:
+                transformer_class = PluginRegistry.get_plugin(
+                    transformer_plugin, PluginType.TRANSFORMER
+                )
 
-            if not transformer_class:
-                logger.error(f"Transformer plugin '{transformer_plugin}' not found")
-                return []
+                if not transformer_class:
+                    logger.error(f"Transformer plugin '{transformer_plugin}' not found")
+                    return []
 
-            # Instantiate and configure the transformer
-            transformer = transformer_class(self.db)
+                transformer = transformer_class(self.db)
+                self._transformers[transformer_plugin] = transformer
 
             # Apply transformation
             result = transformer.transform(item, transformer_params)
@@ -398,22 +441,23 @@ class DwcArchiveExporter(ExporterPlugin):
 
     def _generate_archive(
         self,
-        occurrences: List[Dict[str, Any]],
-        dwc_terms: set,
+        occurrences: Iterable[Dict[str, Any]],
+        dwc_terms: Set[str],
         output_dir: Path,
         params: DwcArchiveExporterParams,
-    ) -> None:
-        """Generate the complete Darwin Core Archive."""
+    ) -> int:
+        """Generate the complete Darwin Core Archive.
+
+        Returns:
+            Number of occurrence records written
+        """
         # Sort terms for consistent column order
         sorted_terms = sorted(dwc_terms)
 
-        # Generate CSV file
         csv_filename = "occurrence.csv"
         if params.compress_csv:
             csv_filename += ".gz"
-
         csv_path = output_dir / csv_filename
-        self._generate_occurrence_csv(occurrences, sorted_terms, csv_path, params)
 
         # Generate meta.xml
         meta_path = output_dir / "meta.xml"
@@ -423,9 +467,16 @@ class DwcArchiveExporter(ExporterPlugin):
         eml_path = output_dir / "eml.xml"
         self._generate_eml_xml(eml_path, params.metadata)
 
-        # Create ZIP archive
+        # Create the ZIP archive, then stream the records into it
         archive_path = _safe_archive_path(output_dir, params.archive_name)
-        self._create_zip_archive(archive_path, [csv_path, meta_path, eml_path])
+        self._create_zip_archive(archive_path, [meta_path, eml_path])
+        with zipfile.ZipFile(archive_path, "a", zipfile.ZIP_DEFLATED) as zipf:
+            count = self._generate_occurrence_csv(
+                occurrences, sorted_terms, csv_path, params, archive=zipf
+            )
+
+        self.stats["total_occurrences"] = count
+        return count
 
     def generate_archive_from_occurrences(
         self,
@@ -441,7 +492,6 @@ class DwcArchiveExporter(ExporterPlugin):
             return []
 
         self.stats["start_time"] = datetime.now()
-        self.stats["total_occurrences"] = len(occurrences)
         self._generate_archive(occurrences, dwc_terms, output_dir, params)
         self.stats["end_time"] = datetime.now()
 
@@ -455,22 +505,42 @@ class DwcArchiveExporter(ExporterPlugin):
 
     def _generate_occurrence_csv(
         self,
-        occurrences: List[Dict[str, Any]],
+        occurrences: Iterable[Dict[str, Any]],
         terms: List[str],
         output_path: Path,
         params: DwcArchiveExporterParams,
-    ) -> None:
-        """Generate occurrence.csv file."""
+        archive: Optional[zipfile.ZipFile] = None,
+    ) -> int:
+        """Generate occurrence.csv, also streamed into ``archive`` when given.
+
+        Returns:
+            Number of occurrence records written
+        """
         logger.info(f"Generating occurrence CSV: {output_path}")
 
-        if params.compress_csv:
-            file_handle = gzip.open(output_path, "wt", encoding=params.encoding)
-        else:
-            file_handle = open(output_path, "w", encoding=params.encoding, newline="")
+        count = 0
+        with ExitStack() as stack:
+            if params.compress_csv:
+                handles = [gzip.open(output_path, "wt", encoding=params.encoding)]
+            else:
+                handles = [open(output_path, "w", encoding=params.encoding, newline="")]
+            stack.callback(handles[0].close)
+
+            if archive is not None:
+                member = stack.enter_context(
+                    archive.open(output_path.name, "w", force_zip64=True)
+                )
+                if params.compress_csv:
+                    handles.append(gzip.open(member, "wt", encoding=params.encoding))
+                else:
+                    handles.append(
+                        io.TextIOWrapper(member, encoding=params.encoding, newline="")
+                    )
+                # Flush the text layer before the ZIP member is closed
+                stack.callback(handles[1].close)
 
-        try:
             writer = csv.DictWriter(
-                file_handle,
+                _TeeWriter(handles),
                 fieldnames=terms,
                 delimiter=params.delimiter,
                 extrasaction="ignore",
@@ -484,11 +554,10 @@ class DwcArchiveExporter(ExporterPlugin):
                     k: str(v) if v is not None else "" for k, v in occurrence.items()
                 }
                 writer.writerow(row)
+                count += 1
 
-        finally:
-            file_handle.close()
-
-        logger.info(f"Generated {len(occurrences)} occurrence records")
+        logger.info(f"Generated {count} occurrence records")
+        return count
 
     def _generate_meta_xml(
         self,
@@ -0,0 +1,189 @@
+"""Manifest of the files written by an export, keyed by a hash of their inputs.
+
+Exporters record each generated page with a hash of everything it was
+rendered from. On an incremental run, a page whose inputs hash is unchanged
+and whose file still exists is not rendered again, and the files recorded by
+a previous run but not produced by the current one are removed. Pages that
+fail to render keep the file and entry of the previous run.
+
+Pages are not re-read for the database queries made while rendering them.
+Widgets that may query the database (``WidgetPlugin.reads_database``) add a
+fingerprint of the database file to their page inputs instead, so their
+pages are rendered again after any write to the database.
+
+Entries are grouped in sections (one per exported group and language), so a
+run restricted to one group leaves the entries of the other groups alone.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from jinja2 import Environment, TemplateNotFound
+
+from niamoto.common.duckdb_connections import database_file_fingerprint
+from niamoto.core.plugins.exporters.path_utils import safe_output_path
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = ".niamoto-export-manifest.json"
+MANIFEST_VERSION = 1
+
+
+def hash_content(value: Any) -> str:
+    """Return a stable hash of a JSON-like value."""
+
+    payload = json.dumps(value, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def hash_templates(jinja_env: Environment) -> str:
+    """Return a hash of the source of every template visible to ``jinja_env``.
+
+    Detail templates extend layouts and include partials, so the whole set of
+    templates is hashed rather than the detail template alone.
+    """
+
+    digest = hashlib.sha256()
+    try:
+        names = sorted(jinja_env.list_templates())
+    except TypeError:
+        # Loaders that cannot list their templates: never reuse pages.
+        return hash_content(id(jinja_env))
+    for name in names:
+        try:
+            source, _, _ = jinja_env.loader.get_source(jinja_env, name)
+        except TemplateNotFound:
+            continue
+        digest.update(name.encode("utf-8"))
+        digest.update(source.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def hash_database_file(db_path: Any) -> str:
+    """Return a hash of the fingerprint of a database file.
+
+    Stands for the database content in the inputs of pages rendered by
+    widgets that query it: any write to the file changes the hash, so those
+    pages are rendered again. Databases that are not a file hash to "".
+    """
+
+    if not isinstance(db_path, (str, Path)):
+        return ""
+    return hash_content(database_file_fingerprint(Path(db_path)))
+
+
+class ExportManifest:
+    """Track the inputs hash of each file written under an export directory."""
+
+    def __init__(
+        self, root: Path, previous: Optional[Dict[str, Dict[str, str]]] = None
+    ) -> None:
+        self.root = root
+        self.previous: Dict[str, Dict[str, str]] = previous or {}
+        self.current: Dict[str, Dict[str, str]] = {}
+
+    @property
+    def path(self) -> Path:
+        return self.root / MANIFEST_FILENAME
+
+    @classmethod
+    def load(cls, root: Path) -> "ExportManifest":
+        """Read the manifest of ``root``. A missing or unreadable one is empty."""
+
+        manifest_path = root / MANIFEST_FILENAME
+        previous: Dict[str, Dict[str, str]] = {}
+        if manifest_path.exists():
+            try:
+                data = json.loads(manifest_path.read_text(encoding="utf-8"))
+                if data.get("version") == MANIFEST_VERSION:
+                    previous = data.get("sections", {})
+            except (OSError, ValueError, AttributeError) as e:
+                # A corrupted manifest only forces a full render
+                logger.warning(f"Ignoring unreadable export manifest: {e}")
+        return cls(root, previous)
+
+    def begin_section(self, section: str) -> None:
+        """Mark ``section`` as produced by this run, even if it ends up empty."""
+
+        self.current.setdefault(section, {})
+
+    def _key(self, path: Path) -> str:
+        return path.relative_to(self.root).as_posix()
+
+    def is_current(self, section: str, path: Path, input_hash: str) -> bool:
+        """Return whether ``path`` was written from the same inputs and still exists."""
+
+        previous_hash = self.previous.get(section, {}).get(self._key(path))
+        return previous_hash == input_hash and path.exists()
+
+    def record(self, section: str, path: Path, input_hash: str) -> None:
+        """Record that ``path`` now holds the output of ``input_hash``."""
+
+        self.current.setdefault(section, {})[self._key(path)] = input_hash
+
+    def keep_previous(self, section: str, path: Path) -> None:
+        """Keep the file a previous run wrote at ``path``.
+
+        Used when this run failed to write it again, so that an error does
+        not remove a published page.
+        """
+
+        key = self._key(path)
+        previous_hash = self.previous.get(section, {}).get(key)
+        if previous_hash is not None:
+            self.current.setdefault(section, {}).setdefault(key, previous_hash)
+
+    def keep_previous_section(self, section: str) -> None:
+        """Keep every file of ``section`` that this run did not write again."""
+
+        entries = self.current.setdefault(section, {})
+        for key, previous_hash in self.previous.get(section, {}).items():
+            entries.setdefault(key, previous_hash)
+
+    def remove_stale(self, keep_unvisited: bool = False) -> int:
+        """Delete the files of previous runs that this run did not produce.
+
+        Args:
+            keep_unvisited: Carry over the sections this run did not produce
+                (groups outside a filtered run) instead of treating them as
+                removed
+
+        Returns:
+            Number of files deleted
+        """
+
+        produced = {key for entries in self.current.values() for key in entries}
+        removed = 0
+        for section, entries in self.previous.items():
+            if section not in self.current and keep_unvisited:
+                self.current[section] = dict(entries)
+                continue
+            for key in entries:
+                if key in produced:
+                    continue
+                try:
+                    stale_path = safe_output_path(self.root, key)
+                except ValueError:
+                    logger.warning(f"Ignoring manifest entry outside the export: {key}")
+                    continue
+                try:
+                    stale_path.unlink()
+                    removed += 1
+                except FileNotFoundError:
+                    continue
+                except OSError as e:
+                    logger.warning(f"Could not remove stale file {stale_path}: {e}")
+        return removed
+
+    def save(self) -> None:
+        """Write the entries recorded by this run."""
+
+        payload = {"version": MANIFEST_VERSION, "sections": self.current}
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, sort_keys=True, separators=(",", ":"))
@@ -13,12 +13,16 @@ within the detail pages.
 """
 
 import logging
+import multiprocessing
 import re
 import shutil
 import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
 import pandas as pd
 from pathlib import Path
-from typing import Any, Dict, List, Set, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Set, Optional, Tuple
 import importlib.resources
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape, ChoiceLoader
@@ -33,8 +37,15 @@ from niamoto.common.utils.emoji import emoji
 from niamoto.common.i18n import I18nResolver
 from niamoto.common.table_resolver import resolve_entity_table, resolve_reference_table
 from niamoto.core.plugins.base import ExporterPlugin, PluginType, WidgetPlugin, register
+from niamoto.core.plugins.exporters.export_manifest import (
+    ExportManifest,
+    hash_content,
+    hash_database_file,
+    hash_templates,
+)
 from niamoto.core.plugins.exporters.path_utils import safe_output_path
 from niamoto.core.plugins.loaders._sql_identifier import quote_identifier
+from niamoto.core.plugins.plugin_loader import PluginLoader
 from niamoto.core.plugins.models import (
     TargetConfig,
     HtmlExporterParams,
@@ -47,6 +58,99 @@ from niamoto.core.plugins.registry import PluginRegistry
 logger = logging.getLogger(__name__)
 
 
+def _make_relative_url(url, depth=0):
+    """Creates proper relative URLs based on page depth."""
+    if not isinstance(url, str):
+        return url  # Return as is if not a string
+
+    # Keep absolute URLs and anchors as is
+    if url.startswith(("http://", "https://", "#", "mailto:", "javascript:")):
+        return url
+
+    # Handle root-relative URLs
+    if url.startswith("/"):
+        # Convert to relative based on depth
+        # depth=0 means root level, depth=1 means one folder deep, etc.
+        if depth == 0:
+            return url[1:]  # Remove leading slash for root level
+        else:
+            return "../" * depth + url[1:]
+
+    # Map project files/ to assets/files/ in the output
+    clean = url.lstrip("/")
+    if clean.startswith("files/"):
+        clean = "assets/" + clean
+        if depth == 0:
+            return clean
+        return "../" * depth + clean
+
+    # Already relative URL
+    return url
+
+
+def _create_jinja_environment(user_template_dir: Path) -> Environment:
+    """Create the Jinja environment used to render HTML pages.
+
+    User templates take precedence over the default Niamoto templates.
+    """
+    try:
+        # Find the path to the default templates within the niamoto package
+        default_template_path = (
+            importlib.resources.files("niamoto.publish") / "templates"
+        )
+    except (ImportError, ModuleNotFoundError):
+        logger.error(
+            "Could not locate default Niamoto templates. Ensure 'niamoto.publish' package is correctly installed."
+        )
+        raise ProcessError("Default template path not found.")
+
+    # User templates first, then the defaults
+    choice_loader = ChoiceLoader(
+        [
+            FileSystemLoader(str(user_template_dir)),
+            FileSystemLoader(str(default_template_path)),
+        ]
+    )
+    jinja_env = Environment(
+        loader=choice_loader, autoescape=select_autoescape(["html", "xml"])
+    )
+    jinja_env.filters["relative_url"] = _make_relative_url
+    return jinja_env
+
+
+# Detail pages sent to a worker process per task.
+_DETAIL_CHUNK_SIZE = 200
+
+# Per-process state used by detail page worker processes.
+_worker_exporter: Optional["HtmlPageExporter"] = None
+_worker_jinja_env: Optional[Environment] = None
+
+
+def _init_detail_worker(
+    db_path: str, user_template_dir: str, project_path: str
+) -> None:
+    """Initialize the exporter, plugins and Jinja environment of one worker."""
+
+    global _worker_exporter, _worker_jinja_env
+    PluginLoader().load_plugins_with_cascade(Path(project_path))
+    # Opening the database connects read-only, which DuckDB allows because
+    # the parent also uses the file read-only while the pool runs
+    _worker_exporter = HtmlPageExporter(Database(db_path, read_only=True))
+    _worker_jinja_env = _create_jinja_environment(Path(user_template_dir))
+
+
+def _render_detail_chunk(
+    render_context: Dict[str, Any], items: List[Tuple[Any, Dict[str, Any]]]
+) -> List[Dict[str, Any]]:
+    """Render a chunk of detail pages inside a worker process."""
+
+    if _worker_exporter is None or _worker_jinja_env is None:
+        raise ProcessError("Detail page worker used before initialization")
+    return _worker_exporter._render_detail_items(
+        _worker_jinja_env, render_context, items
+    )
+
+
 def _resolve_project_path(path_value: str) -> Path:
     """Resolve exporter paths relative to NIAMOTO_HOME when needed."""
     path = Path(path_value)
@@ -124,6 +228,9 @@ class HtmlPageExporter(ExporterPlugin):
     # Define the parameter schema for this exporter
     param_schema = HtmlExporterParams
 
+    # Detail rows fetched per query when rendering detail pages
+    DETAIL_FETCH_BATCH_SIZE = 2000
+
     def __init__(self, db: Database, registry=None):
         """Initialize the exporter with database connection."""
         super().__init__(db, registry)
@@ -138,6 +245,7 @@ class HtmlPageExporter(ExporterPlugin):
         self._reference_table_cache: Dict[str, str] = {}
         self._table_columns_cache: Dict[str, Tuple[str, ...]] = {}
         self._group_table_cache: Dict[Tuple[str, Optional[str]], Tuple[str, str]] = {}
+        self._detail_pool_workers = 1
 
         # Initialize statistics tracking
         self.stats: Dict[str, Any] = {
@@ -147,8 +255,17 @@ class HtmlPageExporter(ExporterPlugin):
             "total_files_generated": 0,
             "errors_count": 0,
             "output_path": None,
+            "pages_rendered": 0,
+            "pages_skipped": 0,
+            "pages_removed": 0,
         }
 
+        # Manifest of detail pages and their inputs (set during export)
+        self._manifest: Optional[ExportManifest] = None
+        self._incremental = False
+        self._templates_hash = ""
+        self._database_hash = ""
+
         # I18n resolver (initialized during export)
         self._i18n_resolver: Optional[I18nResolver] = None
         self._current_lang: Optional[str] = None
@@ -442,6 +559,8 @@ class HtmlPageExporter(ExporterPlugin):
         target_config: TargetConfig,
         repository: Database,
         group_filter: Optional[str] = None,
+        workers: int = 1,
+        incremental: bool = False,
     ) -> None:
         """
         Executes the HTML export process.
@@ -454,6 +573,10 @@ class HtmlPageExporter(ExporterPlugin):
             target_config: The validated configuration for this HTML export target.
             repository: The Database instance to fetch data from.
             group_filter: Optional filter to apply to the groups.
+            workers: Number of worker processes rendering detail pages. Detail
+                pages are rendered in the current process when 1.
+            incremental: Keep the previous output and only render the detail
+                pages whose inputs changed since the last export.
         """
         logger.info(f"Starting HTML page export for target: '{target_config.name}'")
 
@@ -462,8 +585,13 @@ class HtmlPageExporter(ExporterPlugin):
 
         self.stats["start_time"] = datetime.now()
 
+        detail_pool: Optional[ProcessPoolExecutor] = None
+        read_only_scope = ExitStack()
         try:
-            self.db.enable_connection_reuse()
+            if workers <= 1:
+                # Worker processes cannot open the DuckDB file while the parent
+                # keeps a connection open, so reuse is only enabled sequentially
+                self.db.enable_connection_reuse()
             # 1. Validate and parse specific HTML exporter parameters
             try:
                 html_params = HtmlExporterParams.model_validate(target_config.params)
@@ -496,9 +624,8 @@ class HtmlPageExporter(ExporterPlugin):
 
             # --- Modified Directory Clearing Logic ---
             output_dir_was_owned = (output_dir / ".niamoto-html-export").exists()
-            if (
-                group_filter is None
-            ):  # Only clear the whole directory if exporting everything
+            # Only clear the whole directory if exporting everything
+            if group_filter is None and not incremental:
                 if output_dir.exists() and any(output_dir.iterdir()):
                     output_dir = _ensure_safe_html_output_dir_for_clear(output_dir)
                     try:
@@ -525,67 +652,18 @@ class HtmlPageExporter(ExporterPlugin):
             # --- End Modified Logic ---
 
             # 2. Setup Jinja2 environment with ChoiceLoader
-            try:
-                # Find the path to the default templates within the niamoto package
-                default_template_path = (
-                    importlib.resources.files("niamoto.publish") / "templates"
-                )
-            except (ImportError, ModuleNotFoundError):
-                logger.error(
-                    "Could not locate default Niamoto templates. Ensure 'niamoto.publish' package is correctly installed."
-                )
-                raise ProcessError("Default template path not found.")
-
-            # Create loaders
-            user_loader = FileSystemLoader(
-                str(user_template_dir)
-            )  # User templates first
-            default_loader = FileSystemLoader(str(default_template_path))
-
-            # Create ChoiceLoader
-            choice_loader = ChoiceLoader([user_loader, default_loader])
-
-            jinja_env = Environment(
-                loader=choice_loader, autoescape=select_autoescape(["html", "xml"])
+            jinja_env = _create_jinja_environment(user_template_dir)
+
+            # Detail pages are recorded with a hash of their inputs
+            self._manifest = ExportManifest.load(output_dir)
+            self._incremental = incremental
+            self._templates_hash = hash_templates(jinja_env)
+            self._database_hash = hash_database_file(
+                getattr(repository, "db_path", None)
             )
 
-            # --- Add relative_url filter ---
-            def make_relative_url(url, depth=0):
-                """Creates proper relative URLs based on page depth."""
-                if not isinstance(url, str):
-                    return url  # Return as is if not a string
-
-                # Keep absolute URLs and anchors as is
-                if url.startswith(
-                    ("http://", "https://", "#", "mailto:", "javascript:")
-                ):
-                    return url
-
-                # Handle root-relative URLs
-                if url.startswith("/"):
-                    # Convert to relative based on depth
-                    # depth=0 means root level, depth=1 means one folder deep, etc.
-                    if depth == 0:
-                        return url[1:]  # Remove leading slash for root level
-                    else:
-                        return "../" * depth + url[1:]
-
-                # Map project files/ to assets/files/ in the output
-                clean = url.lstrip("/")
-                if clean.startswith("files/"):
-                    clean = "assets/" + clean
-                    if depth == 0:
-                        return clean
-                    return "../" * depth + clean
-
-                # Already relative URL
-                return url
-
-            jinja_env.filters["relative_url"] = make_relative_url
-            # ---------------------------------
-
             logger.debug(
-                f"Jinja environment set up with user dir '{user_template_dir}' and default dir '{default_template_path}'"
+                f"Jinja environment set up with user dir '{user_template_dir}'"
             )
 
             # Log available templates for debugging
@@ -602,7 +680,15 @@ class HtmlPageExporter(ExporterPlugin):
             # 4. Copy static assets (default and user-specified) - once at root level
             self._copy_static_assets(html_params, output_dir)
 
-            # 5. Generate content for each language
+            # 5. Start the detail page worker pool when requested
+            if workers > 1:
+                read_only_scope.enter_context(repository.read_only_access())
+                detail_pool = self._start_detail_pool(
+                    workers, repository, user_template_dir
+                )
+            group_kwargs = {"detail_pool": detail_pool} if detail_pool else {}
+
+            # 6. Generate content for each language
             if multi_lang_enabled:
                 logger.info(f"Multi-language export enabled for languages: {languages}")
 
@@ -642,6 +728,7 @@ class HtmlPageExporter(ExporterPlugin):
                         lang=lang,
                         languages=languages,
                         language_switcher=language_switcher,
+                        **group_kwargs,
                     )
 
                 # Generate root redirect page
@@ -668,8 +755,20 @@ class HtmlPageExporter(ExporterPlugin):
                     repository,
                     group_filter,
                     export_root_was_owned=output_dir_was_owned,
+                    **group_kwargs,
                 )
 
+            # 7. Remove the detail pages this run no longer produces
+            self.stats["pages_removed"] = self._manifest.remove_stale(
+                keep_unvisited=group_filter is not None
+            )
+            self._manifest.save()
+            logger.info(
+                f"Detail pages: {self.stats['pages_rendered']} rendered, "
+                f"{self.stats['pages_skipped']} unchanged, "
+                f"{self.stats['pages_removed']} removed"
+            )
+
             # Mark completion time
             self.stats["end_time"] = datetime.now()
 
@@ -704,6 +803,9 @@ class HtmlPageExporter(ExporterPlugin):
                 f"HTML export failed unexpectedly for {target_config.name}"
             ) from e
         finally:
+            if detail_pool is not None:
+                detail_pool.shutdown(cancel_futures=True)
+            read_only_scope.close()
             self.db.disable_connection_reuse()
 
     def _copy_static_assets(
@@ -1404,6 +1506,7 @@ class HtmlPageExporter(ExporterPlugin):
         lang: Optional[str] = None,
         languages: Optional[List[str]] = None,
         language_switcher: bool = False,
+        detail_pool: Optional[ProcessPoolExecutor] = None,
     ) -> None:
         """
         Processes each data group to generate index and detail pages.
@@ -1418,6 +1521,7 @@ class HtmlPageExporter(ExporterPlugin):
             lang: Current language code (for multi-language mode)
             languages: List of all supported languages
             language_switcher: Whether to enable language switcher
+            detail_pool: Optional worker pool rendering the detail pages
         """
         logger.info(f"Processing {len(groups)} data groups...")
         if not groups:
@@ -1448,9 +1552,8 @@ class HtmlPageExporter(ExporterPlugin):
 
             # Clear group directory only if filter matches or no filter is set
             try:
-                if (
-                    group_filter == group_by_key
-                ):  # Only clear if this specific group is targeted
+                # Only clear if this specific group is targeted
+                if group_filter == group_by_key and not self._incremental:
                     if group_output_dir.exists() and any(group_output_dir.iterdir()):
                         if not export_root_was_owned:
                             _ensure_safe_html_output_dir_for_clear(group_output_dir)
@@ -1462,6 +1565,7 @@ class HtmlPageExporter(ExporterPlugin):
                 # Always ensure the group directory exists (might have been cleared or never existed)
                 group_output_dir.mkdir(parents=True, exist_ok=True)
                 (group_output_dir / ".niamoto-html-export").touch(exist_ok=True)
+                manifest_section = self._manifest_section(group_output_dir)
 
             except OSError as e:
                 logger.error(
@@ -1649,7 +1753,7 @@ class HtmlPageExporter(ExporterPlugin):
                     )
                     sorted_widgets = sorted(
                         enumerate(group_config.widgets),
-                        key=lambda x: (x[1].layout.order if x[1].layout else x[0]),
+                        key=lambda x: x[1].layout.order if x[1].layout else x[0],
                     )
                     detail_context_base = self._build_detail_context_base(
                         group_config=group_config,
@@ -1663,6 +1767,8 @@ class HtmlPageExporter(ExporterPlugin):
                         language_switcher=language_switcher,
                     )
 
+                    # Items listed in the index, keyed by normalized ID
+                    pending_items: Dict[str, Any] = {}
                     for item_summary in index_data:
                         item_id = item_summary.get(id_column)
                         if item_id is None:
@@ -1671,24 +1777,44 @@ class HtmlPageExporter(ExporterPlugin):
                             )
                             group_progress.update(detail_task, advance=1)
                             continue
+                        item_key = self._item_key(item_id)
+                        if item_key in pending_items:
+                            group_progress.update(detail_task, advance=1)
+                            continue
+                        pending_items[item_key] = item_id
 
-                        result = self._render_detail_page_task(
-                            repository=repository,
-                            detail_table_name=detail_table_name,
-                            detail_id_column=detail_id_column,
-                            item_id=item_id,
-                            group_by_key=group_by_key,
-                            id_column=id_column,
-                            group_config=group_config,
-                            detail_template=detail_template,
-                            output_dir=output_dir,
-                            group_output_dir=group_output_dir,
-                            sorted_widgets=sorted_widgets,
-                            widget_plugin_classes=widget_plugin_classes,
-                            detail_context_base=detail_context_base,
-                        )
-                        self._apply_detail_page_result(result)
+                    # Hash of the inputs shared by every page of the group
+                    reads_database = any(
+                        getattr(plugin_class, "reads_database", True)
+                        for plugin_class in widget_plugin_classes.values()
+                    )
+                    page_hash = hash_content(
+                        {
+                            "templates": self._templates_hash,
+                            "database": (
+                                self._database_hash if reads_database else None
+                            ),
+                            "group": group_config.model_dump(mode="json"),
+                            "context": {
+                                key: value
+                                for key, value in detail_context_base.items()
+                                if key != "group_config"
+                            },
+                        }
+                    )
+                    pending_hashes: Dict[str, str] = {}
 
+                    def record_result(result: Dict[str, Any]) -> None:
+                        self._apply_detail_page_result(result)
+                        input_hash = pending_hashes.pop(
+                            result.get("output_path", ""), None
+                        )
+                        if input_hash and result.get("status") == "success":
+                            self._manifest.record(
+                                manifest_section,
+                                Path(result["output_path"]),
+                                input_hash,
+                            )
                         current_duration = time.time() - start_time
                         group_progress.update(
                             detail_task,
@@ -1696,6 +1822,104 @@ class HtmlPageExporter(ExporterPlugin):
                             description=f"[green]Generating {group_by_key} detail pages • {current_duration:.1f}s[/green]",
                         )
 
+                    render_context = {
+                        "group_config": group_config,
+                        "group_by_key": group_by_key,
+                        "id_column": id_column,
+                        "template_name": detail_template_name,
+                        "output_dir": output_dir,
+                        "group_output_dir": group_output_dir,
+                        "detail_context_base": detail_context_base,
+                    }
+                    in_flight: deque = deque()
+
+                    # Stream the detail table in ID order, one chunk at a time,
+                    # and decode the widget JSON columns once per chunk
+                    source_columns = self._widget_source_columns(sorted_widgets)
+                    for detail_rows in self._iter_item_detail_batches(
+                        repository, detail_table_name, detail_id_column
+                    ):
+                        matched: List[Tuple[Any, Dict[str, Any]]] = []
+                        for item_data in detail_rows:
+                            item_id = pending_items.pop(
+                                self._item_key(item_data.get(detail_id_column)), None
+                            )
+                            if item_id is not None:
+                                # Rows not listed in the index are ignored
+                                matched.append((item_id, item_data))
+                        if manifest_section is not None:
+                            changed = self._skip_unchanged_detail_pages(
+                                matched,
+                                section=manifest_section,
+                                page_hash=page_hash,
+                                pending_hashes=pending_hashes,
+                                group_config=group_config,
+                                group_by_key=group_by_key,
+                                output_dir=output_dir,
+                                group_output_dir=group_output_dir,
+                            )
+                            if len(changed) < len(matched):
+                                group_progress.update(
+                                    detail_task, advance=len(matched) - len(changed)
+                                )
+                            matched = changed
+
+                        if detail_pool is not None:
+                            for start in range(0, len(matched), _DETAIL_CHUNK_SIZE):
+                                # Bound the pages queued in memory
+                                while len(in_flight) >= self._detail_pool_workers * 2:
+                                    for result in in_flight.popleft().result():
+                                        record_result(result)
+                                in_flight.append(
+                                    detail_pool.submit(
+                                        _render_detail_chunk,
+                                        render_context,
+                                        matched[start : start + _DETAIL_CHUNK_SIZE],
+                                    )
+                                )
+                        else:
+                            decoded_rows = self._decode_widget_sources(
+                                [item_data for _, item_data in matched], source_columns
+                            )
+                            for (item_id, item_data), decoded_sources in zip(
+                                matched, decoded_rows
+                            ):
+                                record_result(
+                                    self._render_detail_page_task(
+                                        item_data=item_data,
+                                        decoded_sources=decoded_sources,
+                                        item_id=item_id,
+                                        group_by_key=group_by_key,
+                                        id_column=id_column,
+                                        group_config=group_config,
+                                        detail_template=detail_template,
+                                        output_dir=output_dir,
+                                        group_output_dir=group_output_dir,
+                                        sorted_widgets=sorted_widgets,
+                                        widget_plugin_classes=widget_plugin_classes,
+                                        detail_context_base=detail_context_base,
+                                        repository=repository,
+                                    )
+                                )
+                        if not pending_items:
+                            break
+
+                    while in_flight:
+                        for result in in_flight.popleft().result():
+                            record_result(result)
+
+                    # Pages that failed to render keep their previous file
+                    for output_path in pending_hashes:
+                        self._manifest.keep_previous(
+                            manifest_section, Path(output_path)
+                        )
+
+                    for item_id in pending_items.values():
+                        logger.warning(
+                            f"Data not found for {detail_id_column} {item_id} in table '{detail_table_name}'. Skipping detail page."
+                        )
+                        group_progress.update(detail_task, advance=1)
+
                     # Update task description to show completion after all items processed
                     duration = time.time() - start_time
                     group_progress.update(
@@ -1711,6 +1935,9 @@ class HtmlPageExporter(ExporterPlugin):
                     f"Failed processing detail pages for group '{group_by_key}': {detail_group_err}",
                     exc_info=True,
                 )
+                # The pages of the previous run stay published
+                if manifest_section is not None:
+                    self._manifest.keep_previous_section(manifest_section)
                 # Continue processing the next group if detail page generation fails for this one
                 continue
 
@@ -1861,8 +2088,14 @@ class HtmlPageExporter(ExporterPlugin):
         group_by_key: str,
         sorted_widgets: List[Tuple[int, WidgetConfig]],
         widget_plugin_classes: Dict[str, type[WidgetPlugin]],
+        decoded_sources: Optional[Dict[str, Any]] = None,
     ) -> Tuple[Dict[str, str], Set[str]]:
-        """Render all widgets for a single detail page item."""
+        """Render all widgets for a single detail page item.
+
+        ``decoded_sources`` holds widget data columns already decoded from
+        JSON (see ``_decode_widget_sources``); other sources are read from
+        ``item_data`` and decoded here.
+        """
         rendered_widgets: Dict[str, str] = {}
         widget_dependencies: Set[str] = set()
 
@@ -1920,6 +2153,12 @@ class HtmlPageExporter(ExporterPlugin):
                         logger.error(
                             f"Failed to inject current_item_id for hierarchical nav: {err}"
                         )
+                elif decoded_sources and widget_config.data_source in decoded_sources:
+                    final_widget_data = self._to_widget_data(
+                        decoded_sources[widget_config.data_source],
+                        widget_config.data_source,
+                        widget_config.plugin,
+                    )
                 else:
                     data_source_key = widget_config.data_source
                     raw_widget_data = self._get_nested_data(item_data, data_source_key)
@@ -1937,16 +2176,11 @@ class HtmlPageExporter(ExporterPlugin):
                     final_widget_data = raw_widget_data
                     if isinstance(raw_widget_data, str):
                         try:
-                            parsed_data = json.loads(raw_widget_data)
-                            final_widget_data = parsed_data
-                            if isinstance(parsed_data, list) and parsed_data:
-                                try:
-                                    final_widget_data = pd.DataFrame(parsed_data)
-                                except Exception as df_err:
-                                    logger.warning(
-                                        f"Could not convert parsed data from '{data_source_key}' to DataFrame for '{widget_config.plugin}'. Passing parsed list/dict. Error: {df_err}",
-                                        exc_info=False,
-                                    )
+                            final_widget_data = self._to_widget_data(
+                                json.loads(raw_widget_data),
+                                data_source_key,
+                                widget_config.plugin,
+                            )
                         except json.JSONDecodeError:
                             logger.warning(
                                 f"Data source '{data_source_key}' for '{widget_config.plugin}' in {group_by_key} ID {item_id} "
@@ -1985,12 +2219,111 @@ class HtmlPageExporter(ExporterPlugin):
 
         return rendered_widgets, widget_dependencies
 
+    @staticmethod
+    def _to_widget_data(parsed_data: Any, data_source_key: str, plugin: str) -> Any:
+        """Turn decoded JSON into widget input (non-empty lists become DataFrames)."""
+        if isinstance(parsed_data, list) and parsed_data:
+            try:
+                return pd.DataFrame(parsed_data)
+            except Exception as df_err:
+                logger.warning(
+                    f"Could not convert parsed data from '{data_source_key}' to DataFrame for '{plugin}'. Passing parsed list/dict. Error: {df_err}",
+                    exc_info=False,
+                )
+        return parsed_data
+
+    @staticmethod
+    def _widget_source_columns(
+        sorted_widgets: List[Tuple[int, WidgetConfig]],
+    ) -> Set[str]:
+        """Return the detail columns read directly by widgets."""
+        return {
+            widget_config.data_source
+            for _, widget_config in sorted_widgets
+            if widget_config.plugin != "hierarchical_nav_widget"
+            and widget_config.data_source
+        }
+
+    @staticmethod
+    def _decode_widget_sources(
+        rows: List[Dict[str, Any]], source_columns: Set[str]
+    ) -> List[Dict[str, Any]]:
+        """Decode the JSON widget columns of a chunk of detail rows.
+
+        Returns one dict per row with the successfully decoded columns. Values
+        that are not JSON strings are left to ``_render_widgets_for_item``.
+        """
+        decoded_rows: List[Dict[str, Any]] = []
+        for row in rows:
+            decoded: Dict[str, Any] = {}
+            for column in source_columns:
+                value = row.get(column)
+                if isinstance(value, str):
+                    try:
+                        decoded[column] = json.loads(value)
+                    except json.JSONDecodeError:
+                        pass
+            decoded_rows.append(decoded)
+        return decoded_rows
+
+    @staticmethod
+    def _item_key(item_id: Any) -> str:
+        """Normalize an item ID so index and detail IDs compare equal."""
+        if isinstance(item_id, float) and item_id.is_integer():
+            item_id = int(item_id)
+        return str(item_id)
+
+    def _iter_item_detail_batches(
+        self,
+        repository: Database,
+        table_name: str,
+        id_column: str,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield the rows of a detail table in chunks, paginated by ID.
+
+        Each chunk is one keyset query (``WHERE id > :last_id ORDER BY id``),
+        which replaces a query per detail page.
+        """
+        batch_size = batch_size or self.DETAIL_FETCH_BATCH_SIZE
+        quoted_table_name = quote_identifier(table_name, "detail table name")
+        quoted_id_column = quote_identifier(id_column, "detail id column")
+        last_id = None
+        while True:
+            condition = (
+                f"{quoted_id_column} IS NOT NULL"
+                if last_id is None
+                else f"{quoted_id_column} > :last_id"
+            )
+            query = (
+                f"SELECT * FROM {quoted_table_name} WHERE {condition} "
+                f"ORDER BY {quoted_id_column} LIMIT {int(batch_size)}"
+            )
+            try:
+                rows = repository.fetch_all(query, {"last_id": last_id})
+            except Exception as e:
+                logger.error(
+                    f"Database error fetching detail data from '{table_name}': {e}",
+                    exc_info=True,
+                )
+                return
+            if not rows:
+                return
+
+            rows = [dict(row) for row in rows]
+            yield rows
+            if len(rows) < batch_size:
+                return
+            next_id = rows[-1].get(id_column)
+            if next_id is None or next_id == last_id:
+                return
+            last_id = next_id
+
     def _render_detail_page_task(
         self,
         *,
         repository: Database,
-        detail_table_name: str,
-        detail_id_column: str,
+        item_data: Dict[str, Any],
         item_id: Any,
         group_by_key: str,
         id_column: str,
@@ -2001,15 +2334,10 @@ class HtmlPageExporter(ExporterPlugin):
         sorted_widgets: List[Tuple[int, WidgetConfig]],
         widget_plugin_classes: Dict[str, type[WidgetPlugin]],
         detail_context_base: Dict[str, Any],
+        decoded_sources: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """Render one detail page and return a small result payload."""
         try:
-            item_data = self._get_item_detail_data(
-                repository,
-                detail_table_name,
-                detail_id_column,
-                item_id,
-            )
             if not item_data:
                 return {"status": "skipped", "item_id": item_id}
 
@@ -2020,6 +2348,7 @@ class HtmlPageExporter(ExporterPlugin):
                 group_by_key=group_by_key,
                 sorted_widgets=sorted_widgets,
                 widget_plugin_classes=widget_plugin_classes,
+                decoded_sources=decoded_sources,
             )
 
             detail_context = {
@@ -2055,11 +2384,124 @@ class HtmlPageExporter(ExporterPlugin):
                 "error": str(item_render_err),
             }
 
+    def _start_detail_pool(
+        self, workers: int, repository: Database, user_template_dir: Path
+    ) -> ProcessPoolExecutor:
+        """Start the worker processes rendering detail pages.
+
+        Workers open the database read-only, which DuckDB refuses while any
+        process holds the file for writing: the caller keeps ``repository``
+        in ``read_only_access`` until the pool is shut down.
+        """
+        logger.info(f"Rendering detail pages with {workers} worker processes")
+        self._detail_pool_workers = workers
+        # Spawned workers do not inherit the parent's DuckDB handles
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_detail_worker,
+            initargs=(
+                repository.db_path,
+                str(user_template_dir),
+                str(Config.get_niamoto_home()),
+            ),
+        )
+
+    def _render_detail_items(
+        self,
+        jinja_env: Environment,
+        render_context: Dict[str, Any],
+        items: List[Tuple[Any, Dict[str, Any]]],
+    ) -> List[Dict[str, Any]]:
+        """Render a chunk of detail pages, as done by pool workers."""
+        group_config = render_context["group_config"]
+        detail_template = jinja_env.get_template(render_context["template_name"])
+        sorted_widgets = sorted(
+            enumerate(group_config.widgets),
+            key=lambda x: x[1].layout.order if x[1].layout else x[0],
+        )
+        widget_plugin_classes = self._resolve_widget_plugin_classes(
+            group_config, PluginRegistry()
+        )
+        decoded_rows = self._decode_widget_sources(
+            [item_data for _, item_data in items],
+            self._widget_source_columns(sorted_widgets),
+        )
+        return [
+            self._render_detail_page_task(
+                repository=self.db,
+                item_data=item_data,
+                decoded_sources=decoded_sources,
+                item_id=item_id,
+                group_by_key=render_context["group_by_key"],
+                id_column=render_context["id_column"],
+                group_config=group_config,
+                detail_template=detail_template,
+                output_dir=render_context["output_dir"],
+                group_output_dir=render_context["group_output_dir"],
+                sorted_widgets=sorted_widgets,
+                widget_plugin_classes=widget_plugin_classes,
+                detail_context_base=render_context["detail_context_base"],
+            )
+            for (item_id, item_data), decoded_sources in zip(items, decoded_rows)
+        ]
+
+    def _manifest_section(self, group_output_dir: Path) -> Optional[str]:
+        """Return the manifest section of a group directory, if tracked."""
+        if self._manifest is None:
+            return None
+        try:
+            section = group_output_dir.relative_to(self._manifest.root).as_posix()
+        except ValueError:
+            return None
+        self._manifest.begin_section(section)
+        return section
+
+    def _skip_unchanged_detail_pages(
+        self,
+        matched: List[Tuple[Any, Dict[str, Any]]],
+        *,
+        section: str,
+        page_hash: str,
+        pending_hashes: Dict[str, str],
+        group_config: GroupConfigWeb,
+        group_by_key: str,
+        output_dir: Path,
+        group_output_dir: Path,
+    ) -> List[Tuple[Any, Dict[str, Any]]]:
+        """Return the items whose page must be rendered.
+
+        Pages already written from the same row and group inputs are kept in
+        the manifest and skipped on incremental runs. The inputs hash of the
+        other pages is stored in ``pending_hashes``, keyed by output path, and
+        recorded once the page is written.
+        """
+        changed = []
+        for item_id, item_data in matched:
+            output_path = self._resolve_detail_output_path(
+                group_config=group_config,
+                group_by_key=group_by_key,
+                item_id=item_id,
+                output_dir=output_dir,
+                group_output_dir=group_output_dir,
+            )
+            input_hash = hash_content([page_hash, item_data])
+            if self._incremental and self._manifest.is_current(
+                section, output_path, input_hash
+            ):
+                self._manifest.record(section, output_path, input_hash)
+                self.stats["pages_skipped"] += 1
+                continue
+            pending_hashes[str(output_path)] = input_hash
+            changed.append((item_id, item_data))
+        return changed
+
     def _apply_detail_page_result(self, result: Dict[str, Any]) -> None:
         """Apply one detail-page result to exporter stats."""
         status = result.get("status")
         if status == "success":
             self.stats["total_files_generated"] += 1
+            self.stats["pages_rendered"] += 1
         elif status == "error":
             self.stats["errors_count"] += 1
 
@@ -2428,14 +2870,19 @@ class HtmlPageExporter(ExporterPlugin):
             # Construct and execute the query
             quoted_table_name = quote_identifier(table_name, "index table name")
             quoted_order_by_col = quote_identifier(order_by_col, "index order column")
+            # Items without an ID cannot get a page; excluding them also keeps
+            # the ID column integral in the DataFrame
+            quoted_id_column = quote_identifier(id_column, "index column")
             query = (
                 f"SELECT {select_cols_str} FROM {quoted_table_name} "
+                f"WHERE {quoted_id_column} IS NOT NULL "
                 f"ORDER BY {quoted_order_by_col}"
             )
             logger.debug(f"Executing index query: {query}")
 
-            results = repository.fetch_all(query)
-            return results if results else []
+            frame = repository.fetch_df(query)
+            frame = frame.astype(object).where(frame.notna(), None)
+            return frame.to_dict("records")
 
         except Exception as e:
             logger.error(
@@ -2444,36 +2891,6 @@ class HtmlPageExporter(ExporterPlugin):
             )
             return None  # Return None on any error during the process
 
-    def _get_item_detail_data(
-        self, repository: Database, table_name: str, id_column: str, item_id: Any
-    ) -> Optional[Dict[str, Any]]:
-        """Fetches the full data row for a single item detail page. Returns None on DB error or not found."""
-        quoted_table_name = quote_identifier(table_name, "detail table name")
-        quoted_id_column = quote_identifier(id_column, "detail id column")
-        query = f"SELECT * FROM {quoted_table_name} WHERE {quoted_id_column} = :item_id"
-        params = {"item_id": item_id}
-        logger.debug(f"Executing detail query: {query} with params {params}")
-        try:
-            result = repository.fetch_one(query, params)
-            if not result:
-                logger.warning(
-                    f"Data not found for {id_column} {item_id} in table '{table_name}'. Skipping detail page."
-                )
-                return None
-
-            # Convert RowMapping to a mutable dictionary
-            item_data = dict(result)
-
-            # Return the fetched data directly as a dictionary
-            # The widget processing logic will handle accessing specific keys (data_sources)
-            return item_data
-        except Exception as e:
-            logger.error(
-                f"Database error fetching detail data for {id_column} {item_id} from '{table_name}': {e}",
-                exc_info=True,
-            )
-            return None
-
     def _generate_traditional_index(
         self,
         group_config,
@@ -37,6 +37,10 @@ from niamoto.common.database import Database
 from niamoto.common.exceptions import ConfigurationError, ProcessError
 from niamoto.common.utils.emoji import emoji
 from niamoto.core.plugins.base import ExporterPlugin, PluginType, register
+from niamoto.core.plugins.exporters.export_manifest import (
+    ExportManifest,
+    hash_content,
+)
 from niamoto.core.plugins.exporters.path_utils import safe_output_path
 from niamoto.core.plugins.models import TargetConfig, BasePluginParams
 from niamoto.core.plugins.registry import PluginRegistry
@@ -218,12 +222,18 @@ class JsonApiExporter(ExporterPlugin):
         self.errors: List[Dict[str, Any]] = []
         self._json_options_cache: Dict[str, JsonOptions] = {}
         self._transformer_cache: Dict[str, tuple[Any, Any]] = {}
+        self._group_hash_cache: Dict[str, str] = {}
+        self._manifest: Optional[ExportManifest] = None
+        self._incremental = False
         self.stats: Dict[str, Any] = {
             "start_time": None,
             "end_time": None,
             "groups_processed": {},
             "total_files_generated": 0,
             "errors_count": 0,
+            "pages_rendered": 0,
+            "pages_skipped": 0,
+            "pages_removed": 0,
         }
 
     def _make_group_cache_key(self, group_config: GroupConfig) -> str:
@@ -307,6 +317,7 @@ class JsonApiExporter(ExporterPlugin):
         target_config: TargetConfig,
         repository: Database,
         group_filter: Optional[str] = None,
+        incremental: bool = False,
     ) -> None:
         """
         Execute the JSON API export process.
@@ -315,6 +326,8 @@ class JsonApiExporter(ExporterPlugin):
             target_config: The validated configuration for this export target
             repository: The Database instance to fetch data from
             group_filter: Optional filter to process only specific groups
+            incremental: Only rewrite the detail files whose inputs changed
+                since the last export
         """
         logger.info(f"Starting JSON API export for target: '{target_config.name}'")
         self.stats["start_time"] = datetime.now()
@@ -332,6 +345,12 @@ class JsonApiExporter(ExporterPlugin):
                     g for g in groups_to_process if g.group_by == group_filter
                 ]
 
+            # Detail files are recorded with a hash of their inputs
+            self._manifest = ExportManifest.load(output_dir)
+            self._incremental = incremental
+            for group_config in groups_to_process:
+                self._manifest.begin_section(group_config.group_by)
+
             if CLI_CONTEXT and ProgressManager:
                 # Use unified progress manager when in CLI context
                 progress_manager = ProgressManager()
@@ -355,6 +374,12 @@ class JsonApiExporter(ExporterPlugin):
                             group_config, params, repository, output_dir, progress
                         )
 
+            # Remove the detail files this run no longer produces
+            self.stats["pages_removed"] = self._manifest.remove_stale(
+                keep_unvisited=group_filter is not None
+            )
+            self._manifest.save()
+
             # Generate metadata if requested
             if params.metadata.generate:
                 self.stats["end_time"] = datetime.now()
@@ -604,49 +629,81 @@ class JsonApiExporter(ExporterPlugin):
                 f"Item in group {group_name} has no '{group_name}_id' or 'id' field"
             )
 
-        # Apply transformer if configured
-        if (
+        file_path = safe_output_path(
+            output_dir,
+            params.detail_output_pattern.format(group=group_name, id=item_id),
+        )
+        written_path = Path(f"{file_path}.gz") if json_options.compress else file_path
+        uses_transformer = bool(
             hasattr(group_config, "transformer_plugin")
             and group_config.transformer_plugin
-        ):
-            output_data = self._apply_transformer(item, group_config)
-        else:
-            # Map data if needed
-            if group_config.detail and not group_config.detail.pass_through:
-                output_data = mapper.map_detail_data(item)
+        )
+
+        input_hash = None
+        if self._manifest is not None:
+            input_hash = hash_content(
+                [self._group_input_hash(group_config, params, json_options), item]
+            )
+            # Transformers may read other tables, so their output is rebuilt
+            if (
+                self._incremental
+                and not uses_transformer
+                and self._manifest.is_current(group_name, written_path, input_hash)
+            ):
+                self._manifest.record(group_name, written_path, input_hash)
+                self.stats["pages_skipped"] += 1
+                return True
+
+        try:
+            # Apply transformer if configured
+            if uses_transformer:
+                output_data = self._apply_transformer(item, group_config)
             else:
-                output_data = item
+                # Map data if needed
+                if group_config.detail and not group_config.detail.pass_through:
+                    output_data = mapper.map_detail_data(item)
+                else:
+                    output_data = item
 
-        # For transformer output that's a list (like DwC occurrences),
-        # we still write it as the detail file content
-        if isinstance(output_data, list):
+            # For transformer output that's a list (like DwC occurrences),
+            # we still write it as the detail file content.
             # Skip empty lists (e.g., taxons with no occurrences)
-            if not output_data:
+            if isinstance(output_data, list) and not output_data:
                 logger.debug(f"Skipping empty output for {group_name} {item_id}")
                 return False
 
-            # Generate file path for the item
-            file_path = safe_output_path(
-                output_dir,
-                params.detail_output_pattern.format(group=group_name, id=item_id),
-            )
             file_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Write the list as the file content
             self._write_json_file(file_path, output_data, json_options)
-            self.stats["total_files_generated"] += 1
-            return True
-        else:
-            # Normal single item output
-            file_path = safe_output_path(
-                output_dir,
-                params.detail_output_pattern.format(group=group_name, id=item_id),
-            )
-            file_path.parent.mkdir(parents=True, exist_ok=True)
+        except Exception:
+            # The file of the previous run stays published
+            if self._manifest is not None:
+                self._manifest.keep_previous(group_name, written_path)
+            raise
+        self.stats["total_files_generated"] += 1
+        self.stats["pages_rendered"] += 1
+        if input_hash is not None:
+            self._manifest.record(group_name, written_path, input_hash)
+        return True
 
-            self._write_json_file(file_path, output_data, json_options)
-            self.stats["total_files_generated"] += 1
-            return True
+    def _group_input_hash(
+        self,
+        group_config: GroupConfig,
+        params: JsonApiExporterParams,
+        json_options: JsonOptions,
+    ) -> str:
+        """Hash the configuration shared by every detail file of a group."""
+        cache_key = self._make_group_cache_key(group_config)
+        cached = self._group_hash_cache.get(cache_key)
+        if cached is None:
+            cached = hash_content(
+                {
+                    "group": cache_key,
+                    "params": params.model_dump(mode="json"),
+                    "json_options": json_options.model_dump(mode="json"),
+                }
+            )
+            self._group_hash_cache[cache_key] = cached
+        return cached
 
     def _apply_transformer(
         self, item: Dict[str, Any], group_config: GroupConfig
@@ -0,0 +1,318 @@
+"""Persistent cache of JSON responses for the API enrichers.
+
+Enriching a reference asks GBIF, Tropicos, COL, BHL or iNaturalist for every
+taxon, and every restart of the CLI or the desktop app used to ask again for
+taxa already enriched. ``HttpResponseCache`` keeps the JSON body of successful
+GET requests in a SQLite file of the project (``.niamoto/http_cache.sqlite``),
+one namespace per source host.
+
+An entry is served without any request until its TTL expires. An expired
+entry with an ``ETag`` or ``Last-Modified`` validator is revalidated with a
+conditional request: a ``304 Not Modified`` extends it without downloading the
+body again. The file is kept under ``max_bytes`` by evicting the least
+recently used entries.
+
+SQLite rather than DuckDB: the file is written by one row at a time from
+several threads and possibly by a CLI run next to the desktop app, which
+SQLite's WAL journal handles without holding an exclusive file lock.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+from urllib.parse import urlsplit
+
+import requests
+
+from ._http_client import get_http_client
+
+logger = logging.getLogger(__name__)
+
+HTTP_CACHE_FILENAME = "http_cache.sqlite"
+DEFAULT_HTTP_CACHE_TTL = 7 * 24 * 3600.0
+DEFAULT_HTTP_CACHE_MAX_BYTES = 256 * 1024 * 1024
+# Eviction goes below the bound so that it does not run on every write
+_EVICTION_TARGET_RATIO = 0.9
+
+_CACHES_LOCK = threading.Lock()
+_CACHES: Dict[str, "HttpResponseCache"] = {}
+
+
+@dataclass
+class CachedResponse:
+    """A stored response body with its validators."""
+
+    body: Any
+    etag: Optional[str]
+    last_modified: Optional[str]
+    expires_at: float
+
+    @property
+    def is_fresh(self) -> bool:
+        return self.expires_at > time.time()
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Headers revalidating this entry with the server."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def request_namespace(url: str) -> str:
+    """Return the namespace of a request: the host of its URL."""
+    return urlsplit(url).netloc.lower() or "default"
+
+
+def request_cache_key(*parts: Any) -> str:
+    """Hash the parts of a request into a fixed-size key.
+
+    Parts are serialized like ``_stable_cache_key``; hashing keeps API keys
+    sent as query parameters out of the cache file.
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class HttpResponseCache:
+    """SQLite store of JSON responses with TTL, revalidation and LRU eviction."""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        ttl: float = DEFAULT_HTTP_CACHE_TTL,
+        max_bytes: int = DEFAULT_HTTP_CACHE_MAX_BYTES,
+        namespace_ttls: Optional[Dict[str, float]] = None,
+    ) -> None:
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.namespace_ttls = dict(namespace_ttls or {})
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            str(self.path), timeout=30, check_same_thread=False
+        )
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    body TEXT NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    stored_at REAL NOT NULL,
+                    expires_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    size INTEGER NOT NULL,
+                    PRIMARY KEY (namespace, key)
+                )
+                """
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed_at "
+                "ON responses (accessed_at)"
+            )
+
+    def ttl_for(self, namespace: str) -> float:
+        return self.namespace_ttls.get(namespace, self.ttl)
+
+    def get(self, namespace: str, key: str) -> Optional[CachedResponse]:
+        """Return the entry stored under ``key``, fresh or not."""
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT body, etag, last_modified, expires_at FROM responses "
+                "WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(
+                "UPDATE responses SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                (time.time(), namespace, key),
+            )
+        try:
+            body = json.loads(row[0])
+        except ValueError:
+            return None
+        return CachedResponse(
+            body=body, etag=row[1], last_modified=row[2], expires_at=row[3]
+        )
+
+    def put(
+        self,
+        namespace: str,
+        key: str,
+        body: Any,
+        *,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """Store a response body, then evict old entries if the file is full."""
+        payload = json.dumps(body, ensure_ascii=False, separators=(",", ":"))
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(namespace, key, body, etag, last_modified, stored_at, "
+                "expires_at, accessed_at, size) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    namespace,
+                    key,
+                    payload,
+                    etag,
+                    last_modified,
+                    now,
+                    now + self.ttl_for(namespace),
+                    now,
+                    len(payload.encode("utf-8")),
+                ),
+            )
+            self._evict()
+
+    def refresh(self, namespace: str, key: str) -> None:
+        """Start a new TTL for an entry the server reported as not modified."""
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE responses SET expires_at = ?, accessed_at = ? "
+                "WHERE namespace = ? AND key = ?",
+                (now + self.ttl_for(namespace), now, namespace, key),
+            )
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        """Drop every entry, or those of one namespace."""
+        with self._lock, self._connection:
+            if namespace is None:
+                self._connection.execute("DELETE FROM responses")
+            else:
+                self._connection.execute(
+                    "DELETE FROM responses WHERE namespace = ?", (namespace,)
+                )
+
+    def total_size(self) -> int:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return int(row[0])
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries while the cache exceeds its bound."""
+        total = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        excess = total - int(self.max_bytes * _EVICTION_TARGET_RATIO)
+        rows = self._connection.execute(
+            "SELECT namespace, key, size FROM responses ORDER BY accessed_at"
+        )
+        evicted = []
+        for namespace, key, size in rows:
+            if excess <= 0:
+                break
+            evicted.append((namespace, key))
+            excess -= size
+        self._connection.executemany(
+            "DELETE FROM responses WHERE namespace = ? AND key = ?", evicted
+        )
+        logger.debug(f"Evicted {len(evicted)} cached API responses")
+
+    def get_json(
+        self,
+        url: str,
+        params: Any = None,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        vary: Any = None,
+        request: Optional[Callable[..., requests.Response]] = None,
+        on_network: Optional[Callable[[], None]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Return the JSON body of a GET request, from the cache when possible.
+
+        ``request`` performs the call, the shared client's ``get`` by
+        default, and receives ``kwargs``. ``vary`` adds to the cache key what
+        else changes the response, such as credentials. ``on_network`` is called before
+        each request that actually goes to the server. Errors are raised as
+        by ``raise_for_status`` and are never cached.
+        """
+        namespace = request_namespace(url)
+        key = request_cache_key("GET", url, params, headers, vary)
+        cached = self.get(namespace, key)
+        if cached is not None and cached.is_fresh:
+            return cached.body
+
+        request_headers = dict(headers or {})
+        if cached is not None:
+            request_headers.update(cached.conditional_headers())
+        if on_network is not None:
+            on_network()
+        request = request or get_http_client().get
+        response = request(url, params=params, headers=request_headers, **kwargs)
+        if cached is not None and response.status_code == 304:
+            self.refresh(namespace, key)
+            return cached.body
+
+        response.raise_for_status()
+        data = response.json()
+        cache_control = response.headers.get("Cache-Control", "").lower()
+        if "no-store" not in cache_control:
+            self.put(
+                namespace,
+                key,
+                data,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+        return data
+
+
+def get_http_cache(project_dir: Union[str, Path]) -> HttpResponseCache:
+    """Return the cache of a project, shared by every enricher of the process."""
+    path = Path(project_dir).expanduser().resolve() / ".niamoto" / HTTP_CACHE_FILENAME
+    with _CACHES_LOCK:
+        cache = _CACHES.get(str(path))
+        if cache is None:
+            cache = HttpResponseCache(path)
+            _CACHES[str(path)] = cache
+        return cache
+
+
+def default_http_cache() -> Optional[HttpResponseCache]:
+    """Return the cache of the project named by ``NIAMOTO_HOME``, if any."""
+    niamoto_home = os.environ.get("NIAMOTO_HOME")
+    if not niamoto_home or not os.path.isdir(niamoto_home):
+        return None
+    try:
+        return get_http_cache(niamoto_home)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(f"API response cache unavailable in {niamoto_home}: {e}")
+        return None
+
+
+def clear_http_caches() -> None:
+    """Close and forget the caches opened by ``get_http_cache``."""
+    with _CACHES_LOCK:
+        for cache in _CACHES.values():
+            cache.close()
+        _CACHES.clear()
@@ -0,0 +1,110 @@
+"""Shared HTTP client of the API enricher plugins.
+
+Enrichers used to call ``requests.get`` for every entity, which opens a new
+connection, with its TLS handshake, per request. ``EnricherHttpClient`` wraps
+one ``requests.Session`` for the whole process:
+
+- connections are pooled and kept alive per host;
+- connection errors and ``429``/``5xx`` answers to GET requests are retried
+  with exponential backoff, honouring ``Retry-After``;
+- at most ``max_per_host`` requests run at the same time against one host,
+  whatever the number of enrichment workers.
+
+The session stores no cookie: cookies configured for a source are sent with
+each of its requests only.
+"""
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Dict, Iterator, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_MAX_PER_HOST = 4
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+_CLIENT_LOCK = threading.Lock()
+_CLIENT: Optional["EnricherHttpClient"] = None
+
+
+class EnricherHttpClient:
+    """Pooled session with retries and a concurrency limit per host."""
+
+    def __init__(
+        self,
+        *,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        max_per_host: int = DEFAULT_MAX_PER_HOST,
+        retries: int = DEFAULT_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+    ) -> None:
+        self.max_per_host = max_per_host
+        self.session = requests.Session()
+        self.session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        adapter = HTTPAdapter(
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(
+                total=retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=RETRY_STATUS_CODES,
+                allowed_methods=frozenset({"GET", "HEAD"}),
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._slots_lock = threading.Lock()
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+
+    @contextmanager
+    def _host_slot(self, url: str) -> Iterator[None]:
+        host = urlsplit(url).netloc.lower()
+        with self._slots_lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self.max_per_host)
+                self._host_slots[host] = slot
+        with slot:
+            yield
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request once a slot of the target host is free."""
+        with self._host_slot(url):
+            return self.session.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+def get_http_client() -> EnricherHttpClient:
+    """Return the client shared by every enricher of the process."""
+    global _CLIENT
+    with _CLIENT_LOCK:
+        if _CLIENT is None:
+            _CLIENT = EnricherHttpClient()
+        return _CLIENT
+
+
+def close_http_client() -> None:
+    """Close the shared client; the next ``get_http_client`` opens a new one."""
+    global _CLIENT
+    with _CLIENT_LOCK:
+        client, _CLIENT = _CLIENT, None
+    if client is not None:
+        client.close()
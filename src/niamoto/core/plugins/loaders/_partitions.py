@@ -0,0 +1,62 @@
+"""Helpers for slicing one sorted loader scan into per-group partitions."""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Helper column added to bulk loader queries to carry the sort key. It is
+# removed before any partition is yielded to transformers.
+PARTITION_KEY_COLUMN = "_niamoto_partition_key"
+
+
+def split_partition_key(frame: pd.DataFrame) -> Tuple[pd.DataFrame, np.ndarray]:
+    """Detach the partition key column from a frame sorted by that key."""
+
+    keys = frame[PARTITION_KEY_COLUMN].to_numpy()
+    return frame.drop(columns=[PARTITION_KEY_COLUMN]), keys
+
+
+def partition_key_range(group_ids: Sequence[Any]) -> Optional[Tuple[Any, Any]]:
+    """Return the smallest and largest group id, to bound a bulk scan.
+
+    A worker handling a chunk of entities then only reads the rows of that
+    chunk's id range. None when there are no ids or they cannot be ordered,
+    in which case the scan is not bounded.
+    """
+
+    try:
+        return min(group_ids), max(group_ids)
+    except (TypeError, ValueError):
+        return None
+
+
+def iter_sorted_partitions(
+    frame: pd.DataFrame,
+    keys: np.ndarray,
+    bounds: Iterable[Tuple[Any, Any, Any]],
+) -> Iterator[Tuple[Any, pd.DataFrame]]:
+    """Yield ``(group_id, slice)`` pairs for inclusive ``[low, high]`` key ranges.
+
+    ``frame`` must be sorted by ``keys``. Each range is located with a binary
+    search and returned as a positional slice of ``frame``, so overlapping
+    ranges (nested-set ancestors) share the same underlying rows. A ``None``
+    bound yields an empty frame with the original columns.
+    """
+
+    empty = frame.iloc[0:0]
+    for group_id, low, high in bounds:
+        if low is None or high is None or not len(keys):
+            yield group_id, empty
+            continue
+        try:
+            start = int(np.searchsorted(keys, low, side="left"))
+            stop = int(np.searchsorted(keys, high, side="right"))
+        except TypeError:
+            # Key types are not comparable (e.g. text ids against numeric
+            # bounds): nothing in the scan can match this group.
+            yield group_id, empty
+            continue
+        yield group_id, frame.iloc[start:stop] if stop > start else empty
@@ -0,0 +1,116 @@
+"""Shape membership of the rows of a table, for spatial containment loads.
+
+``spatial_containment`` used to run ``ST_Contains`` against the whole data
+table once per shape, without any spatial index. ``SpatialMembership`` is
+computed once instead: the rows' geometries go into a shapely ``STRtree``
+and a single bulk query returns every (shape, row) pair where the shape
+contains the row. Loading a shape then only selects the row ids recorded
+for it.
+
+Memberships are shared by the loaders of a process through
+``get_spatial_membership``. Each one carries the row counts of both tables,
+the entity registry version and the database file fingerprint it was built
+from, and is rebuilt when they change.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+import shapely
+
+from niamoto.common.lru_cache import LRUCache
+
+_MEMBERSHIP_CACHE_MAX_ENTRIES = 8
+_MEMBERSHIP_CACHE: LRUCache[Hashable, "SpatialMembership"] = LRUCache(
+    max_entries=_MEMBERSHIP_CACHE_MAX_ENTRIES
+)
+
+
+@dataclass
+class SpatialMembership:
+    """Row ids of a data table grouped by the shape containing them."""
+
+    shape_ids: pd.Index
+    # Row ids sorted by shape position; rows of shape i are in
+    # row_ids[bounds[i]:bounds[i + 1]]
+    row_ids: np.ndarray
+    bounds: np.ndarray
+    signature: Hashable = None
+
+    @classmethod
+    def build(
+        cls,
+        shape_ids: Sequence[Any],
+        shape_wkts: Sequence[Optional[str]],
+        row_ids: Sequence[int],
+        row_wkts: Sequence[Optional[str]],
+        signature: Hashable = None,
+    ) -> "SpatialMembership":
+        """Match rows to the shapes that contain them with one tree query.
+
+        Geometries are WKT strings; missing or invalid ones match nothing.
+        """
+        shapes = _from_wkt(shape_wkts)
+        rows = _from_wkt(row_wkts)
+        shape_positions, row_positions = shapely.STRtree(rows).query(
+            shapes, predicate="contains"
+        )
+
+        all_row_ids = np.asarray(row_ids, dtype=np.int64)
+        matched_row_ids = all_row_ids[row_positions]
+        order = np.lexsort((matched_row_ids, shape_positions))
+        bounds = np.searchsorted(
+            shape_positions[order], np.arange(len(shapes) + 1), side="left"
+        )
+        return cls(
+            shape_ids=pd.Index(shape_ids),
+            row_ids=matched_row_ids[order],
+            bounds=bounds,
+            signature=signature,
+        )
+
+    def rows_of(self, shape_id: Any) -> np.ndarray:
+        """Return the sorted row ids contained in ``shape_id``, if any."""
+        positions = self.shape_ids.get_indexer([shape_id])
+        if positions[0] < 0:
+            return self.row_ids[:0]
+        position = positions[0]
+        return self.row_ids[self.bounds[position] : self.bounds[position + 1]]
+
+
+def _from_wkt(wkts: Sequence[Optional[str]]) -> np.ndarray:
+    """Parse WKT strings; missing values and invalid strings give None."""
+    values = pd.Series(wkts, dtype=object)
+    values = values.where(values.notna(), None)
+    return shapely.from_wkt(values.to_numpy(), on_invalid="ignore")
+
+
+def get_spatial_membership(
+    cache_key: Optional[Hashable],
+    signature: Hashable,
+    build: Callable[[], SpatialMembership],
+) -> SpatialMembership:
+    """Return the membership cached under ``cache_key``, building it if needed.
+
+    A cached membership whose signature differs from ``signature`` is
+    rebuilt. A None key builds a membership that is not shared.
+    """
+    if cache_key is None:
+        return build()
+
+    membership = _MEMBERSHIP_CACHE.get(cache_key)
+    if membership is not None and membership.signature == signature:
+        return membership
+
+    membership = build()
+    _MEMBERSHIP_CACHE.put(cache_key, membership)
+    return membership
+
+
+def clear_spatial_membership_cache() -> None:
+    """Drop every cached membership."""
+    _MEMBERSHIP_CACHE.clear()
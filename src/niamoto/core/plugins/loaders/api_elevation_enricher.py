@@ -6,12 +6,12 @@ import json
 import time
 from typing import Any, Dict, List, Literal, Optional
 
-import requests
 from pydantic import ConfigDict, Field, model_validator
 
 from niamoto.core.plugins.base import LoaderPlugin, PluginType, register
 from niamoto.core.plugins.models import BasePluginParams, PluginConfig
 
+from ._http_client import get_http_client
 from ._spatial_enrichment import (
     mean,
     point_to_latlon_dict,
@@ -21,6 +21,8 @@ from ._spatial_enrichment import (
 )
 
 OPEN_METEO_ELEVATION_ENDPOINT = "https://api.open-meteo.com/v1/elevation"
+# Coordinates accepted by one Open-Meteo elevation request
+OPEN_METEO_MAX_POINTS = 100
 
 
 def _stable_cache_key(*parts: Any) -> str:
@@ -74,6 +76,8 @@ class ApiElevationEnricher(LoaderPlugin):
 
     config_model = ApiElevationEnricherConfig
     _cache: Dict[str, Dict[str, Any]] = {}
+    # Entities per ``load_data_batch`` call
+    batch_size = 50
 
     def __init__(self, db=None, registry=None):
         super().__init__(db, registry)
@@ -100,23 +104,9 @@ class ApiElevationEnricher(LoaderPlugin):
         if geometry is None:
             raise ValueError("No geometry found for elevation enrichment")
 
-        cache_key = _stable_cache_key(
-            "api_elevation_enricher",
-            geometry.wkt,
-            geometry_field,
-            params.model_dump(
-                mode="json",
-                exclude={"cache_results", "rate_limit"},
-            ),
-        )
+        cache_key = self._cache_key(geometry, geometry_field, params)
         if params.cache_results and cache_key in self._cache:
-            cached = self._cache[cache_key]
-            return {
-                **entity_data,
-                "api_enrichment": cached["mapped"],
-                "api_response_processed": cached["processed"],
-                "api_response_raw": cached["raw"],
-            }
+            return self._result(entity_data, self._cache[cache_key])
 
         try:
             if geometry.geom_type == "Point":
@@ -132,23 +122,136 @@ class ApiElevationEnricher(LoaderPlugin):
                     geometry_field=geometry_field,
                 )
 
+            payload = {"mapped": summary, "processed": processed, "raw": raw}
             if params.cache_results:
-                self._cache[cache_key] = {
-                    "mapped": summary,
-                    "processed": processed,
-                    "raw": raw,
-                }
-
-            return {
-                **entity_data,
-                "api_enrichment": summary,
-                "api_response_processed": processed,
-                "api_response_raw": raw,
-            }
+                self._cache[cache_key] = payload
+            return self._result(entity_data, payload)
         finally:
             if params.rate_limit > 0:
                 time.sleep(1.0 / params.rate_limit)
 
+    def load_data_batch(
+        self, entities: List[Dict[str, Any]], config: Dict[str, Any]
+    ) -> List[Any]:
+        """Load elevation data for many entities with few requests.
+
+        The points of every entity (one per plot, the samples of each shape)
+        are sent together, ``OPEN_METEO_MAX_POINTS`` per request. Returns one
+        result per entity, or the exception that prevented it.
+        """
+
+        params = self.validate_config(config).params
+        results: List[Any] = [None] * len(entities)
+        pending = []
+        for position, entity_data in enumerate(entities):
+            try:
+                geometry_field, geometry = resolve_geometry_from_row(
+                    entity_data,
+                    preferred_fields=[params.geometry_field, params.query_field],
+                )
+                if geometry is None:
+                    raise ValueError("No geometry found for elevation enrichment")
+                cache_key = self._cache_key(geometry, geometry_field, params)
+                if params.cache_results and cache_key in self._cache:
+                    results[position] = self._result(
+                        entity_data, self._cache[cache_key]
+                    )
+                    continue
+                points = self._request_points(geometry, params)
+            except Exception as e:
+                results[position] = e
+                continue
+            pending.append((position, geometry_field, geometry, cache_key, points))
+
+        all_points = [point for *_, points in pending for point in points]
+        elevations: List[Optional[float]] = []
+        responses: List[Any] = []
+        for start in range(0, len(all_points), OPEN_METEO_MAX_POINTS):
+            chunk = all_points[start : start + OPEN_METEO_MAX_POINTS]
+            try:
+                values, raw_response = self._request_openmeteo(chunk, params)
+                if len(values) != len(chunk):
+                    raise ValueError("Elevation API returned an unexpected value count")
+            except Exception as e:
+                values, raw_response = [None] * len(chunk), e
+            elevations.extend(values)
+            responses.extend([raw_response] * len(chunk))
+            if params.rate_limit > 0 and start + len(chunk) < len(all_points):
+                time.sleep(1.0 / params.rate_limit)
+
+        offset = 0
+        for position, geometry_field, geometry, cache_key, points in pending:
+            values = elevations[offset : offset + len(points)]
+            error = next(
+                (
+                    response
+                    for response in responses[offset : offset + len(points)]
+                    if isinstance(response, Exception)
+                ),
+                None,
+            )
+            offset += len(points)
+            if error is not None:
+                results[position] = error
+                continue
+            raw_response = {"elevation": values}
+            try:
+                if geometry.geom_type == "Point":
+                    summary, processed, raw = self._point_summary(
+                        geometry, geometry_field, points, values, raw_response
+                    )
+                else:
+                    summary, processed, raw = self._shape_summary(
+                        geometry, geometry_field, params, points, values, raw_response
+                    )
+            except Exception as e:
+                results[position] = e
+                continue
+            payload = {"mapped": summary, "processed": processed, "raw": raw}
+            if params.cache_results:
+                self._cache[cache_key] = payload
+            results[position] = self._result(entities[position], payload)
+        return results
+
+    @staticmethod
+    def _cache_key(
+        geometry, geometry_field: Optional[str], params: ApiElevationEnricherParams
+    ) -> str:
+        return _stable_cache_key(
+            "api_elevation_enricher",
+            geometry.wkt,
+            geometry_field,
+            params.model_dump(
+                mode="json",
+                exclude={"cache_results", "rate_limit"},
+            ),
+        )
+
+    @staticmethod
+    def _result(entity_data: Dict[str, Any], payload: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            **entity_data,
+            "api_enrichment": payload["mapped"],
+            "api_response_processed": payload["processed"],
+            "api_response_raw": payload["raw"],
+        }
+
+    def _request_points(
+        self, geometry, params: ApiElevationEnricherParams
+    ) -> List[Dict[str, float]]:
+        """Return the locations whose elevation summarizes ``geometry``."""
+
+        if geometry.geom_type == "Point":
+            return [point_to_latlon_dict(geometry)]
+        sample_points = sample_geometry_points(
+            geometry,
+            sample_count=params.sample_count,
+            sample_mode=params.sample_mode,
+        )
+        if not sample_points:
+            raise ValueError("Unable to sample the geometry for elevation enrichment")
+        return [point_to_latlon_dict(point) for point in sample_points]
+
     def _load_point_elevation(
         self,
         *,
@@ -158,9 +261,21 @@ class ApiElevationEnricher(LoaderPlugin):
     ) -> tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
         """Build the plot-style point summary."""
 
-        location = point_to_latlon_dict(geometry)
-        request_payload = [location]
+        request_payload = self._request_points(geometry, params)
         elevations, raw_response = self._request_openmeteo(request_payload, params)
+        return self._point_summary(
+            geometry, geometry_field, request_payload, elevations, raw_response
+        )
+
+    def _point_summary(
+        self,
+        geometry,
+        geometry_field: Optional[str],
+        request_payload: List[Dict[str, float]],
+        elevations: List[Optional[float]],
+        raw_response: Dict[str, Any],
+    ) -> tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+        location = request_payload[0]
         if not elevations:
             raise ValueError("Elevation API returned no value for this location")
 
@@ -204,16 +319,21 @@ class ApiElevationEnricher(LoaderPlugin):
     ) -> tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
         """Build the sampled shape elevation summary."""
 
-        sample_points = sample_geometry_points(
-            geometry,
-            sample_count=params.sample_count,
-            sample_mode=params.sample_mode,
+        request_points = self._request_points(geometry, params)
+        elevations, raw_response = self._request_openmeteo(request_points, params)
+        return self._shape_summary(
+            geometry, geometry_field, params, request_points, elevations, raw_response
         )
-        if not sample_points:
-            raise ValueError("Unable to sample the geometry for elevation enrichment")
 
-        request_points = [point_to_latlon_dict(point) for point in sample_points]
-        elevations, raw_response = self._request_openmeteo(request_points, params)
+    def _shape_summary(
+        self,
+        geometry,
+        geometry_field: Optional[str],
+        params: ApiElevationEnricherParams,
+        request_points: List[Dict[str, float]],
+        elevations: List[Optional[float]],
+        raw_response: Dict[str, Any],
+    ) -> tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
         numeric_values = [value for value in elevations if value is not None]
         if not numeric_values:
             raise ValueError("Elevation API returned no values for sampled geometry")
@@ -221,7 +341,7 @@ class ApiElevationEnricher(LoaderPlugin):
         geometry_summary = summarize_geometry(
             geometry,
             sample_mode=params.sample_mode,
-            sample_count=len(sample_points),
+            sample_count=len(request_points),
             include_bbox_summary=params.include_bbox_summary,
         )
         elevation_summary = {
@@ -234,7 +354,7 @@ class ApiElevationEnricher(LoaderPlugin):
         sampling = {
             "strategy": params.sample_mode,
             "sample_mode": params.sample_mode,
-            "sample_count": len(sample_points),
+            "sample_count": len(request_points),
         }
 
         summary = {
@@ -282,7 +402,7 @@ class ApiElevationEnricher(LoaderPlugin):
 
         latitudes = ",".join(str(point["latitude"]) for point in points)
         longitudes = ",".join(str(point["longitude"]) for point in points)
-        response = requests.get(
+        response = get_http_client().get(
             params.api_url,
             params={
                 **(params.query_params or {}),
@@ -6,12 +6,12 @@ import json
 import time
 from typing import Any, Dict, List, Literal, Optional
 
-import requests
 from pydantic import ConfigDict, Field, model_validator
 
 from niamoto.core.plugins.base import LoaderPlugin, PluginType, register
 from niamoto.core.plugins.models import BasePluginParams, PluginConfig
 
+from ._http_client import get_http_client
 from ._spatial_enrichment import (
     point_to_latlon_dict,
     resolve_geometry_from_row,
@@ -305,7 +305,7 @@ class ApiSpatialEnricher(LoaderPlugin):
     ) -> Dict[str, Any]:
         """Reverse geocode a point into subdivision data."""
 
-        response = requests.get(
+        response = get_http_client().get(
             params.api_url or GEONAMES_SUBDIVISION_ENDPOINT,
             params={
                 **(params.query_params or {}),
@@ -330,7 +330,7 @@ class ApiSpatialEnricher(LoaderPlugin):
     ) -> Dict[str, Any]:
         """Retrieve the closest named place for a point."""
 
-        response = requests.get(
+        response = get_http_client().get(
             self._nearby_endpoint(params.api_url),
             params={
                 **(params.query_params or {}),
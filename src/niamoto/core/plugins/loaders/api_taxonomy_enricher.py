@@ -5,6 +5,7 @@ Plugin for enriching taxonomy data with information from external APIs.
 import logging
 import json
 import os
+import threading
 import time
 from typing import Any, Dict, List, Literal, Optional
 from urllib.parse import quote_plus
@@ -15,6 +16,11 @@ from pydantic import Field, model_validator, ConfigDict
 from niamoto.common.utils.emoji import emoji
 from niamoto.core.plugins.models import PluginConfig, BasePluginParams
 from niamoto.core.plugins.base import LoaderPlugin, PluginType, register
+from niamoto.core.plugins.loaders._http_cache import (
+    HttpResponseCache,
+    default_http_cache,
+)
+from niamoto.core.plugins.loaders._http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +35,7 @@ BHL_API_ENDPOINT = "https://www.biodiversitylibrary.org/api3"
 INAT_TAXA_ENDPOINT = "https://api.inaturalist.org/v1/taxa"
 INAT_OBSERVATIONS_ENDPOINT = "https://api.inaturalist.org/v1/observations"
 GN_VERIFIER_ENDPOINT = "https://resolver.globalnames.org/api/v1/verifications"
+NAME_VERIFIER_PROFILES = {"gbif_rich", "tropicos_rich", "col_rich"}
 GN_DEFAULT_SOURCE_IDS_BY_PROFILE = {
     "gbif_rich": 11,
     "tropicos_rich": 165,
@@ -331,10 +338,22 @@ class ApiTaxonomyEnricher(LoaderPlugin):
     config_model = ApiTaxonomyEnricherConfig
     _cache = {}  # Simple in-memory cache
     _oauth_tokens = {}  # Cache for OAuth tokens
+    # Rows per ``prepare_batch`` call, i.e. names per bulk verification
+    batch_size = 50
 
-    def __init__(self, db=None, registry=None):
+    def __init__(
+        self,
+        db=None,
+        registry=None,
+        http_cache: Optional[HttpResponseCache] = None,
+    ):
         super().__init__(db, registry)
         self.log_messages = []  # Liste pour stocker les messages de log
+        # Persistent API responses, defaults to the NIAMOTO_HOME project
+        self.http_cache = http_cache if http_cache is not None else default_http_cache()
+        self._request_state = threading.local()
+        # Verifier answers fetched in bulk, by (name, data source)
+        self._name_verifications: Dict[tuple, Dict[str, Any]] = {}
 
     def validate_config(self, config: Dict[str, Any]) -> ApiTaxonomyEnricherConfig:
         """Validate plugin configuration."""
@@ -345,6 +364,47 @@ class ApiTaxonomyEnricher(LoaderPlugin):
             config = {"plugin": "api_taxonomy_enricher", "params": params}
         return self.config_model(**config)
 
+    def prepare_batch(self, rows: List[Dict[str, Any]], config: Dict[str, Any]) -> None:
+        """Verify the names of the next rows in one request.
+
+        The ``load_data`` calls that follow on these rows use the answers
+        instead of verifying each name. Answers of the previous batch are
+        dropped.
+        """
+        self._name_verifications.clear()
+        params = self.validate_config(config).params
+        if params.profile in NAME_VERIFIER_PROFILES and params.use_name_verifier:
+            names = [
+                self._coerce_string(row.get(params.query_field))
+                for row in rows
+                if row.get(params.query_field)
+            ]
+            try:
+                self._verify_names_in_bulk(list(dict.fromkeys(names)), params)
+            except Exception as e:
+                # Each name is then verified by its own request
+                logger.warning(f"Bulk name verification failed: {e}")
+
+    def load_data_batch(
+        self, rows: List[Dict[str, Any]], config: Dict[str, Any]
+    ) -> List[Any]:
+        """Enrich several taxa, verifying their names in one request first.
+
+        Returns one ``load_data`` result per row, or the exception it raised.
+        """
+        self.prepare_batch(rows, config)
+        results: List[Any] = []
+        try:
+            for row in rows:
+                try:
+                    results.append(self.load_data(row, config))
+                except Exception as e:
+                    results.append(e)
+        finally:
+            # Answers of rows served from the result cache are never used
+            self._name_verifications.clear()
+        return results
+
     def load_data(
         self, taxon_data: Dict[str, Any], config: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -403,6 +463,12 @@ class ApiTaxonomyEnricher(LoaderPlugin):
                 )
             return result
 
+        # Responses are read from the project cache only when results may be cached
+        self._request_state.http_cache = (
+            self.http_cache if params.cache_results else None
+        )
+        self._request_state.network_requests = 0
+
         # Prepare API request
         url = params.api_url
         api_params = params.query_params.copy()
@@ -421,9 +487,7 @@ class ApiTaxonomyEnricher(LoaderPlugin):
             name_resolution_summary: Dict[str, Any] = {}
             name_resolution_raw: Dict[str, Any] | None = None
 
-            if params.profile in {"gbif_rich", "tropicos_rich", "col_rich"} and (
-                params.use_name_verifier
-            ):
+            if params.profile in NAME_VERIFIER_PROFILES and (params.use_name_verifier):
                 (
                     resolved_query_value,
                     name_resolution_summary,
@@ -535,20 +599,14 @@ class ApiTaxonomyEnricher(LoaderPlugin):
             logger.debug(f"Requesting API data for {query_value} from {url}")
             # Ne pas ajouter de message pour la récupération, seulement pour le succès final
 
-            # Use session if we have cookies
-            if cookies:
-                session = requests.Session()
-                session.cookies.update(cookies)
-                response = session.get(
-                    url, params=api_params, headers=headers, auth=auth, timeout=20
-                )
-            else:
-                response = requests.get(
-                    url, params=api_params, headers=headers, auth=auth, timeout=20
-                )
-
-            response.raise_for_status()
-            data = response.json()
+            data = self._get_json(
+                url,
+                api_params,
+                headers=headers,
+                auth=auth,
+                cookies=cookies,
+                timeout=20,
+            )
 
             # Process the response
             api_data = self._process_api_response(data)
@@ -617,12 +675,10 @@ class ApiTaxonomyEnricher(LoaderPlugin):
             )
             return taxon_data
         finally:
-            # Respect rate limit regardless of outcome
-            if params.rate_limit > 0:
+            # Respect rate limit regardless of outcome, unless every response
+            # came from the cache
+            if params.rate_limit > 0 and self._network_requests():
                 time.sleep(1.0 / params.rate_limit)
-            else:
-                # Avoid division by zero if rate_limit is 0 or negative
-                pass
 
     def _setup_api_key_auth(
         self,
@@ -706,7 +762,7 @@ class ApiTaxonomyEnricher(LoaderPlugin):
                 token_data["scope"] = scope
 
             # Make token request
-            response = requests.post(token_url, data=token_data, timeout=20)
+            response = get_http_client().post(token_url, data=token_data, timeout=20)
             response.raise_for_status()
 
             # Parse response
@@ -1967,6 +2023,37 @@ class ApiTaxonomyEnricher(LoaderPlugin):
         text = str(value).strip()
         return text
 
+    def _verify_names_in_bulk(
+        self, names: List[str], params: ApiTaxonomyEnricherParams
+    ) -> None:
+        """Verify many names with one Global Names request.
+
+        Each answer is kept in the shape of a single-name verification, for
+        the next ``_resolve_name_with_verifier`` call on that name.
+        """
+
+        if not names:
+            return
+        preferred_source_id = self._name_verifier_source_id(params)
+        payload: Dict[str, Any] = {"nameStrings": names}
+        if preferred_source_id is not None:
+            payload["dataSources"] = [preferred_source_id]
+
+        self._count_network_request()
+        response = get_http_client().post(
+            GN_VERIFIER_ENDPOINT, json=payload, timeout=30
+        )
+        response.raise_for_status()
+        raw = response.json()
+        items = raw.get("names") if isinstance(raw, dict) else raw
+        if not isinstance(items, list) or len(items) != len(names):
+            raise ValueError("Unexpected bulk verification response")
+        for name, item in zip(names, items):
+            if isinstance(item, dict):
+                self._name_verifications[(name, preferred_source_id)] = {
+                    "names": [item]
+                }
+
     def _resolve_name_with_verifier(
         self, query_value: str, params: ApiTaxonomyEnricherParams
     ) -> tuple[str, Dict[str, Any], Optional[Dict[str, Any]]]:
@@ -1994,7 +2081,9 @@ class ApiTaxonomyEnricher(LoaderPlugin):
             request_params["data_sources"] = str(preferred_source_id)
 
         try:
-            raw = self._request_json(
+            raw = self._name_verifications.get(
+                (submitted_name, preferred_source_id)
+            ) or self._request_json(
                 f"{GN_VERIFIER_ENDPOINT}/{quote_plus(submitted_name)}",
                 request_params or None,
             )
@@ -3580,12 +3669,57 @@ class ApiTaxonomyEnricher(LoaderPlugin):
 
         return []
 
+    def _get_json(
+        self,
+        url: str,
+        params: Any | None = None,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        auth: Any = None,
+        cookies: Optional[Dict[str, str]] = None,
+        timeout: float = 15,
+    ) -> Any:
+        """Perform a JSON GET request, through the response cache when enabled."""
+
+        request = get_http_client().get
+        http_cache = getattr(self._request_state, "http_cache", None)
+        if http_cache is None:
+            self._count_network_request()
+            response = request(
+                url,
+                params=params,
+                headers=headers,
+                auth=auth,
+                cookies=cookies or None,
+                timeout=timeout,
+            )
+            response.raise_for_status()
+            return response.json()
+
+        return http_cache.get_json(
+            url,
+            params,
+            headers=headers,
+            vary=[auth, cookies] if auth or cookies else None,
+            request=request,
+            on_network=self._count_network_request,
+            auth=auth,
+            cookies=cookies or None,
+            timeout=timeout,
+        )
+
+    def _count_network_request(self) -> None:
+        state = self._request_state
+        state.network_requests = getattr(state, "network_requests", 0) + 1
+
+    def _network_requests(self) -> int:
+        """Number of requests sent to a server by the current ``load_data``."""
+        return getattr(self._request_state, "network_requests", 0)
+
     def _request_json(self, url: str, params: Any | None = None) -> Dict[str, Any]:
         """Perform a JSON GET request with a small timeout."""
 
-        response = requests.get(url, params=params, timeout=15)
-        response.raise_for_status()
-        data = response.json()
+        data = self._get_json(url, params, timeout=15)
         if isinstance(data, dict):
             return data
         if isinstance(data, list):
@@ -3793,27 +3927,15 @@ class ApiTaxonomyEnricher(LoaderPlugin):
                 # Make the request
                 logger.debug(f"Chained request to: {url}")
 
-                if cookies:
-                    session = requests.Session()
-                    session.cookies.update(cookies)
-                    response = session.get(
-                        url,
-                        params=endpoint_params,
-                        headers=headers,
-                        auth=auth,
-                        timeout=20,
-                    )
-                else:
-                    response = requests.get(
-                        url,
-                        params=endpoint_params,
-                        headers=headers,
-                        auth=auth,
-                        timeout=20,
-                    )
-
-                response.raise_for_status()
-                chain_data = response.json()
+                network_requests = self._network_requests()
+                chain_data = self._get_json(
+                    url,
+                    endpoint_params,
+                    headers=headers,
+                    auth=auth,
+                    cookies=cookies,
+                    timeout=20,
+                )
 
                 # Process the response according to mapping
                 mapping = endpoint_config.get("mapping", {})
@@ -3826,7 +3948,9 @@ class ApiTaxonomyEnricher(LoaderPlugin):
                 )
 
                 # Respect rate limit
-                if params.rate_limit > 0:
+                if params.rate_limit > 0 and (
+                    self._network_requests() > network_requests
+                ):
                     time.sleep(1.0 / params.rate_limit)
 
             except Exception as e:
@@ -2,7 +2,7 @@
 Plugin for loading data using direct references between tables.
 """
 
-from typing import Dict, Any, Literal, Optional
+from typing import Dict, Any, Iterator, Literal, Optional, Sequence, Tuple
 from pydantic import Field, ConfigDict
 
 import pandas as pd
@@ -12,6 +12,12 @@ from niamoto.core.plugins.models import PluginConfig, BasePluginParams
 from niamoto.core.plugins.base import LoaderPlugin, PluginType, register
 from niamoto.common.exceptions import DatabaseError, DatabaseQueryError
 from niamoto.core.imports.registry import EntityRegistry
+from niamoto.core.plugins.loaders._partitions import (
+    PARTITION_KEY_COLUMN,
+    iter_sorted_partitions,
+    partition_key_range,
+    split_partition_key,
+)
 from niamoto.core.plugins.loaders._sql_identifier import quote_identifier
 
 
@@ -204,6 +210,88 @@ class DirectReferenceLoader(LoaderPlugin):
         except Exception as e:
             raise DatabaseError(f"Error executing query: {str(e)}") from e
 
+    def load_partitions(
+        self, group_ids: Sequence[Any], config: Dict[str, Any]
+    ) -> Iterator[Tuple[Any, pd.DataFrame]]:
+        """Load the rows of many groups with one query sorted by group id.
+
+        The data table is joined once to the reference table, restricted to
+        the range of the requested ids and ordered by the reference id, then
+        sliced per group. Without ``ref_key`` the join
+        uses the reference id field, which selects the same rows as the
+        per-group ``key = :id`` filter of :meth:`load_data`.
+        """
+        validated_config = self.validate_config(config)
+        params = validated_config.params
+
+        main_table = params.data
+        ref_table = params.grouping
+        key_field = params.key
+
+        if not main_table:
+            raise ValueError(f"No main table specified in config: {config}")
+        if not ref_table:
+            raise ValueError(f"No reference table specified in config: {config}")
+
+        physical_main = self._resolve_table_name(main_table)
+        physical_ref = self._resolve_table_name(ref_table)
+
+        if not self._check_table_exists(physical_main):
+            raise DatabaseError(f"Main table '{physical_main}' does not exist")
+        if not self._check_table_exists(physical_ref):
+            raise DatabaseError(f"Reference table '{physical_ref}' does not exist")
+
+        columns = self._get_table_columns(physical_main)
+        if key_field not in columns:
+            raise DatabaseError(
+                f"Key field '{key_field}' not found in table '{physical_main}'"
+            )
+
+        ref_id_field = "id"
+        logical_grouping = getattr(params, "logical_grouping", None) or ref_table
+        try:
+            metadata = self.registry.get(logical_grouping)
+            ref_id_field = metadata.config.get("schema", {}).get("id_field", "id")
+        except (DatabaseQueryError, AttributeError, KeyError):
+            pass
+
+        try:
+            quoted_main = quote_identifier(physical_main, "main table name")
+            quoted_ref = quote_identifier(physical_ref, "reference table name")
+            quoted_key = quote_identifier(key_field, "foreign key field")
+            quoted_ref_id_field = quote_identifier(ref_id_field, "reference id field")
+            quoted_join_field = (
+                quote_identifier(params.ref_key, "reference key field")
+                if params.ref_key
+                else quoted_ref_id_field
+            )
+
+            key_range = partition_key_range(group_ids)
+            range_filter = (
+                f"WHERE r.{quoted_ref_id_field} BETWEEN :low AND :high"
+                if key_range
+                else ""
+            )
+            query = text(f"""
+                SELECT r.{quoted_ref_id_field} AS {PARTITION_KEY_COLUMN}, m.*
+                FROM {quoted_main} m
+                JOIN {quoted_ref} r ON m.{quoted_key} = r.{quoted_join_field}
+                {range_filter}
+                ORDER BY r.{quoted_ref_id_field}
+            """)
+            query_params = (
+                {"low": key_range[0], "high": key_range[1]} if key_range else {}
+            )
+            with self.db.connection() as conn:
+                frame = pd.read_sql(query, conn, params=query_params)
+        except Exception as e:
+            raise DatabaseError(f"Error executing query: {str(e)}") from e
+
+        frame, keys = split_partition_key(frame)
+        yield from iter_sorted_partitions(
+            frame, keys, ((group_id, group_id, group_id) for group_id in group_ids)
+        )
+
     def _resolve_table_name(self, logical_name: str) -> str:
         try:
             metadata = self.registry.get(logical_name)
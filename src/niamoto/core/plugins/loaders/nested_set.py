@@ -1,4 +1,4 @@
-from typing import Dict, Any, Literal
+from typing import Dict, Any, Iterator, Literal, Sequence, Tuple
 from pydantic import Field, field_validator, ConfigDict
 from sqlalchemy import text
 import pandas as pd
@@ -6,6 +6,11 @@ import pandas as pd
 from niamoto.core.plugins.models import PluginConfig, BasePluginParams
 from niamoto.core.plugins.base import LoaderPlugin, PluginType, register
 from niamoto.core.imports.registry import EntityRegistry
+from niamoto.core.plugins.loaders._partitions import (
+    PARTITION_KEY_COLUMN,
+    iter_sorted_partitions,
+    split_partition_key,
+)
 from niamoto.core.plugins.loaders._sql_identifier import quote_identifier
 
 
@@ -144,21 +149,37 @@ class NestedSetLoader(LoaderPlugin):
             config = {"plugin": "nested_set", "params": params}
         return self.config_model(**config)
 
-    def load_data(self, group_id: int, config: Dict[str, Any]) -> pd.DataFrame:
+    def _query_identifiers(self, config: Dict[str, Any]) -> Dict[str, str]:
+        """Return the quoted table and column names used by loader queries."""
         validated_config = self.validate_config(config)
         fields = validated_config.params.fields
 
         # Resolve entity names to physical table names via EntityRegistry
-        grouping_table = quote_identifier(
-            self._resolve_table_name(config["grouping"]), "grouping table name"
-        )
-        data_table = quote_identifier(
-            self._resolve_table_name(config["data"]), "data table name"
-        )
-        left_field = quote_identifier(fields["left"], "left field")
-        right_field = quote_identifier(fields["right"], "right field")
-        key_field = quote_identifier(validated_config.params.key, "foreign key field")
-        ref_key = quote_identifier(validated_config.params.ref_key, "reference key")
+        return {
+            "grouping_table": quote_identifier(
+                self._resolve_table_name(config["grouping"]), "grouping table name"
+            ),
+            "data_table": quote_identifier(
+                self._resolve_table_name(config["data"]), "data table name"
+            ),
+            "left_field": quote_identifier(fields["left"], "left field"),
+            "right_field": quote_identifier(fields["right"], "right field"),
+            "key_field": quote_identifier(
+                validated_config.params.key, "foreign key field"
+            ),
+            "ref_key": quote_identifier(
+                validated_config.params.ref_key, "reference key"
+            ),
+        }
+
+    def load_data(self, group_id: int, config: Dict[str, Any]) -> pd.DataFrame:
+        identifiers = self._query_identifiers(config)
+        grouping_table = identifiers["grouping_table"]
+        data_table = identifiers["data_table"]
+        left_field = identifiers["left_field"]
+        right_field = identifiers["right_field"]
+        key_field = identifiers["key_field"]
+        ref_key = identifiers["ref_key"]
 
         # Get the left and right values for the target node
         node_query = text(f"""
@@ -169,17 +190,74 @@ class NestedSetLoader(LoaderPlugin):
 
         with self.db.connection() as conn:
             node = conn.execute(node_query, {"id": group_id}).fetchone()
-            if not node:
-                return pd.DataFrame()
-
-            # Get all records that belong to the target node's hierarchy
-            # Use ref_key to specify which field in the reference table to match against
-            query = text(f"""
-                SELECT m.*
-                FROM {data_table} m
-                JOIN {grouping_table} ref ON m.{key_field} = ref.{ref_key}
-                WHERE ref.{left_field} >= :left
-                AND ref.{right_field} <= :right
-            """)
-
-            return pd.read_sql(query, conn, params={"left": node[0], "right": node[1]})
+        if not node:
+            return pd.DataFrame()
+
+        # Get all records that belong to the target node's hierarchy
+        # Use ref_key to specify which field in the reference table to match against
+        query = f"""
+            SELECT m.*
+            FROM {data_table} m
+            JOIN {grouping_table} ref ON m.{key_field} = ref.{ref_key}
+            WHERE ref.{left_field} >= :left
+            AND ref.{right_field} <= :right
+        """
+
+        return self.db.fetch_df(query, {"left": node[0], "right": node[1]})
+
+    def load_partitions(
+        self, group_ids: Sequence[Any], config: Dict[str, Any]
+    ) -> Iterator[Tuple[Any, pd.DataFrame]]:
+        """Load the subtree data of many nodes with a single sorted scan.
+
+        The data rows of the requested subtrees are read once, ordered by the
+        ``left`` bound of the node they are attached to. In a nested set, a
+        node's subtree is exactly the nodes whose ``left`` value lies within
+        ``[left, right]`` of that node, so each group is a contiguous slice of
+        the scan located by binary search. Ancestors share rows with their
+        descendants instead of rescanning the table for every taxon.
+        """
+        identifiers = self._query_identifiers(config)
+        grouping_table = identifiers["grouping_table"]
+        data_table = identifiers["data_table"]
+        left_field = identifiers["left_field"]
+        right_field = identifiers["right_field"]
+        key_field = identifiers["key_field"]
+        ref_key = identifiers["ref_key"]
+
+        nodes_query = text(f"""
+            SELECT id, {left_field}, {right_field}
+            FROM {grouping_table}
+        """)
+        scan_query = f"""
+            SELECT ref.{left_field} AS {PARTITION_KEY_COLUMN}, m.*
+            FROM {data_table} m
+            JOIN {grouping_table} ref ON m.{key_field} = ref.{ref_key}
+            WHERE ref.{left_field} >= :low
+            AND ref.{left_field} <= :high
+            ORDER BY ref.{left_field}
+        """
+
+        with self.db.connection() as conn:
+            bounds = {row[0]: (row[1], row[2]) for row in conn.execute(nodes_query)}
+        requested = [
+            bounds[group_id]
+            for group_id in group_ids
+            if group_id in bounds and None not in bounds[group_id]
+        ]
+        # Only scan the span covered by the requested nodes, so a worker
+        # handling a chunk of entities does not read the whole table.
+        frame = self.db.fetch_df(
+            scan_query,
+            {
+                "low": min((left for left, _ in requested), default=0),
+                "high": max((right for _, right in requested), default=-1),
+            },
+        )
+
+        frame, keys = split_partition_key(frame)
+        yield from iter_sorted_partitions(
+            frame,
+            keys,
+            ((group_id, *bounds.get(group_id, (None, None))) for group_id in group_ids),
+        )
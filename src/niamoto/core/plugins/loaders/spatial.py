@@ -1,11 +1,23 @@
-from typing import Dict, Any, Literal
+from pathlib import Path
+from typing import Dict, Any, Iterator, Literal, Sequence, Tuple
 from pydantic import field_validator, Field, ConfigDict
 
+import numpy as np
 import pandas as pd
+from sqlalchemy import text
 
+from niamoto.common.duckdb_connections import database_file_fingerprint
 from niamoto.core.plugins.models import PluginConfig, BasePluginParams
 from niamoto.core.plugins.base import LoaderPlugin, PluginType, register
 from niamoto.core.imports.registry import EntityRegistry
+from niamoto.core.plugins.loaders._partitions import (
+    PARTITION_KEY_COLUMN,
+    split_partition_key,
+)
+from niamoto.core.plugins.loaders._spatial_membership import (
+    SpatialMembership,
+    get_spatial_membership,
+)
 from niamoto.core.plugins.loaders._sql_identifier import quote_identifier
 
 
@@ -48,7 +60,11 @@ class SpatialConfig(PluginConfig):
 
 @register("spatial_containment", PluginType.LOADER)
 class SpatialLoader(LoaderPlugin):
-    """Loader using spatial queries"""
+    """Loader using spatial queries
+
+    Rows are matched to shapes once, by a ``SpatialMembership`` built with a
+    single spatial index query; loading a shape then selects its rows by id.
+    """
 
     config_model = SpatialConfig
 
@@ -61,6 +77,8 @@ class SpatialLoader(LoaderPlugin):
         """
         super().__init__(db)
         self.registry = registry or EntityRegistry(db)
+        # Memberships checked against the tables during this loader's run
+        self._memberships: Dict[Tuple[str, str, str], SpatialMembership] = {}
 
     def _resolve_table_name(self, logical_name: str) -> str:
         """Resolve logical entity name to physical table name via EntityRegistry.
@@ -89,8 +107,46 @@ class SpatialLoader(LoaderPlugin):
         return self.config_model(**config)
 
     def load_data(self, group_id: int, config: Dict[str, Any]) -> pd.DataFrame:
-        validated_config = self.validate_config(config)
-        params = validated_config.params
+        reference_table, main_table, geometry_field = self._resolve_tables(config)
+        membership = self._get_membership(reference_table, main_table, geometry_field)
+
+        query = text(f"""
+            SELECT m.*
+            FROM {main_table} m
+            WHERE m.rowid IN (SELECT UNNEST(CAST(:row_ids AS BIGINT[])))
+        """)
+        row_ids = membership.rows_of(group_id).tolist()
+        with self.db.connection() as conn:
+            return pd.read_sql(query, conn, params={"row_ids": row_ids})
+
+    def load_partitions(
+        self, group_ids: Sequence[Any], config: Dict[str, Any]
+    ) -> Iterator[Tuple[Any, pd.DataFrame]]:
+        """Load the rows of every shape with one scan of the data table."""
+        reference_table, main_table, geometry_field = self._resolve_tables(config)
+        membership = self._get_membership(reference_table, main_table, geometry_field)
+
+        query = text(f"""
+            SELECT m.rowid AS {PARTITION_KEY_COLUMN}, m.*
+            FROM {main_table} m
+            WHERE m.rowid IN (SELECT UNNEST(CAST(:row_ids AS BIGINT[])))
+        """)
+        row_ids = np.unique(membership.row_ids).tolist()
+        with self.db.connection() as conn:
+            frame = pd.read_sql(query, conn, params={"row_ids": row_ids})
+
+        frame, keys = split_partition_key(frame)
+        key_index = pd.Index(keys)
+        for group_id in group_ids:
+            positions = key_index.get_indexer(membership.rows_of(group_id))
+            yield (
+                group_id,
+                frame.take(np.sort(positions[positions >= 0])).reset_index(drop=True),
+            )
+
+    def _resolve_tables(self, config: Dict[str, Any]) -> Tuple[str, str, str]:
+        """Return the quoted reference table, data table and geometry field."""
+        params = self.validate_config(config).params
 
         # Resolve entity names to physical table names via EntityRegistry
         reference_table = quote_identifier(
@@ -101,31 +157,65 @@ class SpatialLoader(LoaderPlugin):
             self._resolve_table_name(config["main"]), "main table name"
         )
         geometry_field = quote_identifier(params.geometry_field, "geometry field")
-
-        # Get shape geometry
-        shape_query = f"""
-            SELECT {geometry_field}
-            FROM {reference_table}
-            WHERE id = :id
-        """
-        shape_geom = self.db.execute(shape_query, {"id": group_id}).scalar()
-
-        # Get contained data
-        query = f"""
-            SELECT m.*
-            FROM {main_table} m
-            WHERE ST_Contains(
-                ST_GeomFromText(:shape_geom),
-                m.{geometry_field}
-            )
+        return reference_table, main_table, geometry_field
+
+    def _get_membership(
+        self, reference_table: str, main_table: str, geometry_field: str
+    ) -> SpatialMembership:
+        """Return the shape membership of the data rows, built at most once.
+
+        Row counts of both tables are read once per loader; with the registry
+        version and the fingerprint of the database file they tell whether a
+        membership cached by another loader is still valid. Rows are matched
+        by rowid, which an update or a re-import may reassign: any write to
+        the file changes its fingerprint.
         """
-
-        # Use text() wrapped query with engine directly to avoid pandas warning
-        from sqlalchemy import text
+        tables = (reference_table, main_table, geometry_field)
+        membership = self._memberships.get(tables)
+        if membership is not None:
+            return membership
 
         with self.db.connection() as conn:
-            return pd.read_sql(
-                text(query),
-                conn,
-                params={"shape_geom": shape_geom},
+            counts = conn.execute(
+                text(
+                    f"SELECT (SELECT COUNT(*) FROM {reference_table}), "
+                    f"(SELECT COUNT(*) FROM {main_table})"
+                )
+            ).fetchone()
+        token = getattr(self.registry, "cache_token", None)
+        token = token if isinstance(token, tuple) else None
+        fingerprint = (
+            database_file_fingerprint(Path(token[0]))
+            if token is not None and "://" not in token[0]
+            else None
+        )
+        signature = (tuple(counts), token, fingerprint)
+        cache_key = None if token is None else (token[0], *tables)
+
+        def build() -> SpatialMembership:
+            with self.db.connection() as conn:
+                shapes = pd.read_sql(
+                    text(
+                        f"SELECT id, CAST({geometry_field} AS VARCHAR) AS wkt "
+                        f"FROM {reference_table}"
+                    ),
+                    conn,
+                )
+                rows = pd.read_sql(
+                    text(
+                        f"SELECT rowid AS row_id, CAST({geometry_field} AS VARCHAR) "
+                        f"AS wkt FROM {main_table}"
+                    ),
+                    conn,
+                )
+            return SpatialMembership.build(
+                shapes["id"],
+                shapes["wkt"],
+                rows["row_id"],
+                rows["wkt"],
+                signature=signature,
             )
+
+        membership = get_spatial_membership(cache_key, signature, build)
+        self._memberships[tables] = membership
+        return membership
@@ -2,7 +2,7 @@
 Plugin for loading statistics from various sources.
 """
 
-from typing import Dict, Any, Literal, Optional
+from typing import Dict, Any, Iterator, Literal, Optional, Sequence, Tuple
 import pandas as pd
 from sqlalchemy import text
 import os
@@ -13,6 +13,12 @@ from niamoto.common.exceptions import DataLoadError
 from niamoto.core.plugins.models import PluginConfig, BasePluginParams
 from niamoto.core.plugins.base import LoaderPlugin, PluginType, register
 from pydantic import ConfigDict, Field
+from niamoto.core.plugins.loaders._partitions import (
+    PARTITION_KEY_COLUMN,
+    iter_sorted_partitions,
+    partition_key_range,
+    split_partition_key,
+)
 from niamoto.core.plugins.loaders._sql_identifier import quote_identifier
 
 
@@ -210,12 +216,10 @@ class StatsLoader(LoaderPlugin):
         filtered_data = data[data[match_field] == actual_id]
         return filtered_data
 
-    def _load_from_database(
-        self, config: Dict[str, Any], source_config: Dict[str, Any], group_id: int
-    ) -> pd.DataFrame:
-        """Load data from the database."""
-        validated_config = self.validate_config(config)
-        params = validated_config.params
+    def _quote_database_table(
+        self, config: Dict[str, Any], source_config: Dict[str, Any]
+    ) -> str:
+        """Return the quoted data table name of a database-backed source."""
         table_name = source_config.get("table") or source_config.get("name")
         if not table_name and isinstance(config.get("data"), str):
             table_name = config["data"]
@@ -224,8 +228,15 @@ class StatsLoader(LoaderPlugin):
                 "Missing database table name",
                 details={"source": config.get("data")},
             )
+        return quote_identifier(str(table_name), "data table name")
 
-        quoted_data = quote_identifier(str(table_name), "data table name")
+    def _load_from_database(
+        self, config: Dict[str, Any], source_config: Dict[str, Any], group_id: int
+    ) -> pd.DataFrame:
+        """Load data from the database."""
+        validated_config = self.validate_config(config)
+        params = validated_config.params
+        quoted_data = self._quote_database_table(config, source_config)
         quoted_grouping = quote_identifier(config["grouping"], "grouping table name")
         quoted_key = quote_identifier(params.key, "foreign key field")
 
@@ -240,6 +251,102 @@ class StatsLoader(LoaderPlugin):
         with self.db.connection() as conn:
             return pd.read_sql(text(query), conn, params={"group_id": group_id})
 
+    def _resolve_source_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the typed source configuration (csv or database) for ``data``."""
+        source = config.get("data")
+
+        # Determine source type and configuration
+        if isinstance(source, dict):
+            # Explicit configuration with type/path
+            source_config = source
+        elif isinstance(source, str):
+            # Auto-detect type based on string content
+            if source.endswith((".csv", ".CSV")):
+                # It's a CSV file path
+                source_config = {"type": "csv", "path": source}
+            elif "/" in source or "\\" in source:
+                # Looks like a file path, assume CSV
+                source_config = {"type": "csv", "path": source}
+            else:
+                # Check if it's a reference to imports.yml
+                imports_config = self.imports_config.get(source)
+                if imports_config:
+                    source_config = imports_config
+                elif self.imports_config:
+                    raise DataLoadError(
+                        "Source configuration not found",
+                        details={
+                            "source": source,
+                            "available_sources": sorted(self.imports_config),
+                        },
+                    )
+                else:
+                    # Assume it's a database table name
+                    source_config = {"type": "database", "table": source}
+        else:
+            raise DataLoadError(
+                "Invalid data source configuration",
+                details={"source": source, "type": type(source).__name__},
+            )
+        return source_config
+
+    def load_partitions(
+        self, group_ids: Sequence[Any], config: Dict[str, Any]
+    ) -> Iterator[Tuple[Any, pd.DataFrame]]:
+        """Load database statistics for many groups with one sorted query.
+
+        The query only reads the range of the requested group ids.
+
+        CSV sources keep the per-group path of :meth:`load_data`.
+        """
+        try:
+            validated_config = self.validate_config(config)
+            source_config = self._resolve_source_config(config)
+            if source_config.get("type") == "csv":
+                partitions = None
+            else:
+                quoted_data = self._quote_database_table(config, source_config)
+                quoted_grouping = quote_identifier(
+                    config["grouping"], "grouping table name"
+                )
+                quoted_key = quote_identifier(
+                    validated_config.params.key, "foreign key field"
+                )
+                key_range = partition_key_range(group_ids)
+                range_filter = (
+                    "WHERE ref.id BETWEEN :low AND :high" if key_range else ""
+                )
+                query = f"""
+                    SELECT ref.id AS {PARTITION_KEY_COLUMN}, m.*
+                    FROM {quoted_data} m
+                    JOIN {quoted_grouping} ref ON m.{quoted_key} = ref.id
+                    {range_filter}
+                    ORDER BY ref.id
+                """
+                query_params = (
+                    {"low": key_range[0], "high": key_range[1]} if key_range else {}
+                )
+                with self.db.connection() as conn:
+                    partitions = split_partition_key(
+                        pd.read_sql(text(query), conn, params=query_params)
+                    )
+        except Exception as e:
+            self.logger.exception(f"Failed to load statistics partitions: {e}")
+            original_details = getattr(e, "details", None)
+            raise DataLoadError(
+                "Failed to load statistics data",
+                details=original_details if isinstance(original_details, dict) else {},
+            ) from e
+
+        if partitions is None:
+            yield from super().load_partitions(group_ids, config)
+            return
+
+        frame, keys = partitions
+        yield from iter_sorted_partitions(
+            frame, keys, ((group_id, group_id, group_id) for group_id in group_ids)
+        )
+
     def load_data(self, group_id: int, config: Dict[str, Any]) -> pd.DataFrame:
         """
         Load statistics data for a specific group.
@@ -261,41 +368,7 @@ class StatsLoader(LoaderPlugin):
             self.validate_config(config)
 
             # Get source configuration
-            source = config.get("data")
-
-            # Determine source type and configuration
-            if isinstance(source, dict):
-                # Explicit configuration with type/path
-                source_config = source
-            elif isinstance(source, str):
-                # Auto-detect type based on string content
-                if source.endswith((".csv", ".CSV")):
-                    # It's a CSV file path
-                    source_config = {"type": "csv", "path": source}
-                elif "/" in source or "\\" in source:
-                    # Looks like a file path, assume CSV
-                    source_config = {"type": "csv", "path": source}
-                else:
-                    # Check if it's a reference to imports.yml
-                    imports_config = self.imports_config.get(source)
-                    if imports_config:
-                        source_config = imports_config
-                    elif self.imports_config:
-                        raise DataLoadError(
-                            "Source configuration not found",
-                            details={
-                                "source": source,
-                                "available_sources": sorted(self.imports_config),
-                            },
-                        )
-                    else:
-                        # Assume it's a database table name
-                        source_config = {"type": "database", "table": source}
-            else:
-                raise DataLoadError(
-                    "Invalid data source configuration",
-                    details={"source": source, "type": type(source).__name__},
-                )
+            source_config = self._resolve_source_config(config)
 
             # Choose loading method based on source type
             if source_config.get("type") == "csv":
@@ -5,7 +5,8 @@ This module provides dynamic plugin loading capabilities for both core and proje
 plugins. It handles:
 
 - Dynamic loading and unloading of plugins
-- Plugin discovery and registration
+- Plugin discovery and registration, deferring imports through a cached
+  plugin manifest
 - Module path resolution and import management
 - Hot reloading of plugins during development
 - Plugin dependency management
@@ -30,7 +31,8 @@ from dataclasses import dataclass
 from niamoto.common.utils.emoji import emoji
 from .base import PluginType
 from .exceptions import PluginLoadError
-from .registry import PluginRegistry
+from .plugin_manifest import ManifestPlugin, PluginManifest
+from .registry import LazyPlugin, PluginRegistry
 from niamoto.common.resource_paths import ResourcePaths, ResourceLocation
 
 logger = logging.getLogger(__name__)
@@ -42,11 +44,13 @@ class PluginInfo:
     """Information about a loaded plugin including its scope and priority"""
 
     name: str
-    plugin_class: type
+    plugin_class: Optional[type]  # None until a lazy plugin is imported
     scope: str  # "project", "user", "system"
     path: Path
     priority: int
     module_name: str
+    plugin_type: Optional[PluginType] = None
+    config_model: Optional[str] = None  # "module:QualName"
 
 
 # List of core plugin modules to load automatically
@@ -74,6 +78,13 @@ def is_plugin_class(obj):
         return False
 
 
+def _plugin_module(plugin) -> str:
+    """Return the module of a registered plugin class or lazy placeholder."""
+    if isinstance(plugin, LazyPlugin):
+        return plugin.module_name
+    return plugin.__module__
+
+
 class PluginLoader:
     """
     Loader for Niamoto plugins, handling both core and third-party plugins.
@@ -187,6 +198,10 @@ class PluginLoader:
         """
         Discover all plugins in a specific location.
 
+        Files unchanged since they were recorded in the location's plugin
+        manifest are not executed: their plugins are registered lazily and
+        imported on first use. Other files are executed and recorded.
+
         Args:
             location: ResourceLocation to scan
 
@@ -194,6 +209,8 @@ class PluginLoader:
             Dictionary mapping plugin names to PluginInfo
         """
         plugins = {}
+        manifest = PluginManifest.for_location(location)
+        seen_files: Set[Path] = set()
 
         try:
             # Scan for .py files recursively
@@ -210,6 +227,30 @@ class PluginLoader:
 
                 # Try to extract plugin class
                 try:
+                    stat = file.stat()
+                    seen_files.add(file)
+                    cached_plugins = manifest.lookup(file, stat, module_name)
+                    if cached_plugins is not None and module_name not in sys.modules:
+                        for entry in cached_plugins:
+                            PluginRegistry.register_lazy_plugin(
+                                entry.name,
+                                entry.plugin_type,
+                                module_name,
+                                file,
+                                entry.class_name,
+                            )
+                            plugins[entry.name] = PluginInfo(
+                                name=entry.name,
+                                plugin_class=None,
+                                scope=location.scope,
+                                path=file,
+                                priority=location.priority,
+                                module_name=module_name,
+                                plugin_type=entry.plugin_type,
+                                config_model=entry.config_model,
+                            )
+                        continue
+
                     # Quick inspection to find plugin classes. Reuse already imported
                     # modules so collection-time imports keep the same class objects.
                     if module_name in sys.modules:
@@ -228,6 +269,7 @@ class PluginLoader:
                             raise
 
                     # Find plugin classes in this module
+                    manifest_entries = []
                     for name, obj in inspect.getmembers(module):
                         if (
                             inspect.isclass(obj)
@@ -237,6 +279,8 @@ class PluginLoader:
                             plugin_name = getattr(obj, "name", file.stem)
                             PluginRegistry.register_plugin(plugin_name, obj, obj.type)
 
+                            manifest_entry = ManifestPlugin.from_class(plugin_name, obj)
+                            manifest_entries.append(manifest_entry)
                             plugins[plugin_name] = PluginInfo(
                                 name=plugin_name,
                                 plugin_class=obj,
@@ -244,7 +288,10 @@ class PluginLoader:
                                 path=file,
                                 priority=location.priority,
                                 module_name=module_name,
+                                plugin_type=obj.type,
+                                config_model=manifest_entry.config_model,
                             )
+                    manifest.record(file, stat, module_name, manifest_entries)
 
                 except Exception as e:
                     # Check if this is a registration conflict (plugin already registered)
@@ -263,6 +310,9 @@ class PluginLoader:
 
         except Exception as e:
             logger.error(f"Error discovering plugins in {location.path}: {str(e)}")
+        else:
+            manifest.prune(location.path, seen_files)
+        manifest.save()
 
         return plugins
 
@@ -453,7 +503,9 @@ class PluginLoader:
                     "path": str(plugin_info.path),
                     "priority": plugin_info.priority,
                     "module": plugin_info.module_name,
-                    "type": plugin_info.plugin_class.type.value,
+                    "type": (
+                        plugin_info.plugin_type or plugin_info.plugin_class.type
+                    ).value,
                     "is_overriding": is_overriding,
                     "overridden_scopes": overridden_scopes,
                 }
@@ -557,12 +609,10 @@ class PluginLoader:
     ) -> list[tuple[str, type, PluginType]]:
         """Return registered plugin classes that came from a module."""
         registered: list[tuple[str, type, PluginType]] = []
-        all_plugins = PluginRegistry.list_plugins()
-        for plugin_type, _plugins in all_plugins.items():
-            plugin_type_enum = PluginType(plugin_type)
-            plugins_by_type = PluginRegistry.get_plugins_by_type(plugin_type_enum)
+        for plugin_type_enum in PluginType:
+            plugins_by_type = PluginRegistry._plugins[plugin_type_enum].copy()
             for plugin_name, plugin_class in plugins_by_type.items():
-                if plugin_class.__module__ == module_name:
+                if _plugin_module(plugin_class) == module_name:
                     registered.append((plugin_name, plugin_class, plugin_type_enum))
         return registered
 
@@ -573,24 +623,18 @@ class PluginLoader:
         Args:
             module_name: Name of the module
         """
-        # Get all registered plugins
-        all_plugins = PluginRegistry.list_plugins()
-
         # For each plugin type
-        for plugin_type, plugins in all_plugins.items():
-            # Convert string to PluginType enum
-            plugin_type_enum = PluginType(plugin_type)
-
-            # Get all plugins for this type
-            plugins_by_type = PluginRegistry.get_plugins_by_type(plugin_type_enum)
+        for plugin_type_enum in PluginType:
+            # Get all plugins for this type, without importing lazy ones
+            plugins_by_type = PluginRegistry._plugins[plugin_type_enum].copy()
 
             # Check each plugin to see if it belongs to this module
-            for plugin_name, plugin_class in list(plugins_by_type.items()):
-                if plugin_class.__module__ == module_name:
+            for plugin_name, plugin_class in plugins_by_type.items():
+                if _plugin_module(plugin_class) == module_name:
                     # Unregister this plugin
                     PluginRegistry.remove_plugin(plugin_name, plugin_type_enum)
                     logger.debug(
-                        f"Unregistered plugin {plugin_name} of type {plugin_type}"
+                        f"Unregistered plugin {plugin_name} of type {plugin_type_enum.value}"
                     )
 
     def unload_plugin(self, module_name: str) -> None:
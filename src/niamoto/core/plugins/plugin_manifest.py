@@ -0,0 +1,162 @@
+"""
+Cached manifest of the plugins defined by plugin files.
+
+Discovering plugins used to execute every plugin file at startup, which
+imports plotly, geopandas, rasterio... before any plugin is needed. The
+manifest records, for each plugin file, its modification time, size, module
+name and the plugins it defines (name, type, class and config model). Files
+that did not change since are not executed: their plugins are registered as
+lazy plugins, imported by ``PluginRegistry.get_plugin`` on first use.
+
+Manifests are JSON files in a ``.niamoto`` directory: the project's for
+project plugins, the user's home one for user and built-in plugins.
+"""
+
+import json
+import logging
+import os
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from niamoto.common.resource_paths import ResourceLocation, ResourcePaths
+from .base import PluginType
+
+logger = logging.getLogger(__name__)
+
+PLUGIN_MANIFEST_FILENAME = "plugin_manifest.json"
+PLUGIN_MANIFEST_VERSION = 1
+
+
+@dataclass(frozen=True)
+class ManifestPlugin:
+    """A plugin class recorded in the manifest."""
+
+    name: str
+    plugin_type: PluginType
+    class_name: str
+    # "module:QualName" of the config model, if the class declares one
+    config_model: Optional[str] = None
+
+    @classmethod
+    def from_class(cls, name: str, plugin_class: type) -> "ManifestPlugin":
+        config_model = getattr(plugin_class, "config_model", None)
+        return cls(
+            name=name,
+            plugin_type=plugin_class.type,
+            class_name=plugin_class.__name__,
+            config_model=(
+                f"{config_model.__module__}:{config_model.__qualname__}"
+                if isinstance(config_model, type)
+                else None
+            ),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "type": self.plugin_type.value,
+            "class": self.class_name,
+            "config_model": self.config_model,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ManifestPlugin":
+        return cls(
+            name=data["name"],
+            plugin_type=PluginType(data["type"]),
+            class_name=data["class"],
+            config_model=data.get("config_model"),
+        )
+
+
+class PluginManifest:
+    """Plugins of each plugin file, keyed by file path, with their mtime."""
+
+    def __init__(self, path: Path, files: Optional[Dict[str, Any]] = None):
+        self.path = path
+        self._files: Dict[str, Any] = files or {}
+        self._dirty = False
+
+    @staticmethod
+    def path_for_location(location: ResourceLocation) -> Path:
+        """Return the manifest file caching the plugins of ``location``."""
+        if location.scope == ResourcePaths.SCOPE_PROJECT:
+            return location.path.parent / ".niamoto" / PLUGIN_MANIFEST_FILENAME
+        return Path.home() / ".niamoto" / PLUGIN_MANIFEST_FILENAME
+
+    @classmethod
+    def for_location(cls, location: ResourceLocation) -> "PluginManifest":
+        return cls.load(cls.path_for_location(location))
+
+    @classmethod
+    def load(cls, path: Path) -> "PluginManifest":
+        """Read a manifest; a missing, unreadable or outdated one is empty."""
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cls(path)
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != PLUGIN_MANIFEST_VERSION
+            or not isinstance(data.get("files"), dict)
+        ):
+            return cls(path)
+        return cls(path, data["files"])
+
+    def lookup(
+        self, file: Path, stat: os.stat_result, module_name: str
+    ) -> Optional[List[ManifestPlugin]]:
+        """Return the plugins recorded for ``file`` if it did not change."""
+        entry = self._files.get(str(file))
+        if (
+            not isinstance(entry, dict)
+            or entry.get("mtime_ns") != stat.st_mtime_ns
+            or entry.get("size") != stat.st_size
+            or entry.get("module") != module_name
+        ):
+            return None
+        try:
+            return [ManifestPlugin.from_dict(plugin) for plugin in entry["plugins"]]
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def record(
+        self,
+        file: Path,
+        stat: os.stat_result,
+        module_name: str,
+        plugins: List[ManifestPlugin],
+    ) -> None:
+        """Record the plugins a file defined when it was executed."""
+        self._files[str(file)] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "module": module_name,
+            "plugins": [plugin.to_dict() for plugin in plugins],
+        }
+        self._dirty = True
+
+    def prune(self, root: Path, seen: Set[Path]) -> None:
+        """Forget the files under ``root`` that were not found by discovery."""
+        kept = {str(file) for file in seen}
+        for key in list(self._files):
+            if key not in kept and Path(key).is_relative_to(root):
+                del self._files[key]
+                self._dirty = True
+
+    def save(self) -> None:
+        """Write the manifest if it changed; failures only cost a rescan."""
+        if not self._dirty:
+            return
+        payload = {"version": PLUGIN_MANIFEST_VERSION, "files": self._files}
+        tmp_path = self.path.with_name(f".{self.path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(payload, indent=1), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            tmp_path.unlink(missing_ok=True)
+            logger.debug(f"Could not write plugin manifest {self.path}: {str(e)}")
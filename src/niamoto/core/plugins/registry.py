@@ -8,25 +8,83 @@ It provides functionality for:
 - Type-safe plugin retrieval
 - Plugin metadata storage and access
 - Plugin type categorization
+- Lazy plugins, whose module is imported on first retrieval
 
 The registry is implemented as a singleton class that maintains separate
 registries for different plugin types, ensuring type safety and proper
 organization of the plugin ecosystem.
 """
 
-from typing import Dict, Type, Optional, Any
+import importlib.util
+import logging
+import sys
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Dict, Type, Optional, Any, Union
 from .base import Plugin, PluginType
 from .exceptions import PluginRegistrationError, PluginNotFoundError
 
+logger = logging.getLogger(__name__)
+
+# Serializes lazy imports so no thread sees a half-executed plugin module
+_LAZY_IMPORT_LOCK = threading.RLock()
+
+
+@dataclass(frozen=True)
+class LazyPlugin:
+    """Registry placeholder for a plugin whose module is not imported yet."""
+
+    name: str
+    plugin_type: PluginType
+    module_name: str
+    path: Path
+    class_name: str
+
+    @property
+    def plugin_id(self) -> str:
+        return f"{self.module_name}.{self.class_name}"
+
+
+def _plugin_id(plugin: Union[Type[Plugin], LazyPlugin]) -> str:
+    """Return the import path identifying a plugin class or placeholder."""
+    if isinstance(plugin, LazyPlugin):
+        return plugin.plugin_id
+    return f"{plugin.__module__}.{plugin.__name__}"
+
+
+def _import_plugin_module(module_name: str, path: Path) -> ModuleType:
+    """Import a plugin file under ``module_name``, reusing a loaded module."""
+    module = sys.modules.get(module_name)
+    if module is not None:
+        return module
+
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot create a module spec for {path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except Exception:
+        sys.modules.pop(module_name, None)
+        raise
+    return module
+
 
 class PluginRegistry:
     """
     Central registry for all Niamoto plugins.
     Handles registration and retrieval of plugins by type.
+
+    Plugins registered with ``register_lazy_plugin`` are stored as
+    ``LazyPlugin`` placeholders; their module is imported, and the placeholder
+    replaced by the plugin class, the first time the plugin is retrieved.
     """
 
     # Store plugins by type and name
-    _plugins: Dict[PluginType, Dict[str, Type[Plugin]]] = {
+    _plugins: Dict[PluginType, Dict[str, Union[Type[Plugin], LazyPlugin]]] = {
         plugin_type: {} for plugin_type in PluginType
     }
 
@@ -70,8 +128,8 @@ class PluginRegistry:
                 existing_plugin = cls._plugins[actual_type][name]
 
                 # Compare by class name and module path since reloaded modules create new class objects
-                existing_id = f"{existing_plugin.__module__}.{existing_plugin.__name__}"
-                new_id = f"{plugin_class.__module__}.{plugin_class.__name__}"
+                existing_id = _plugin_id(existing_plugin)
+                new_id = _plugin_id(plugin_class)
 
                 if existing_id == new_id:
                     # Same plugin class by import path. Module reloads create a fresh
@@ -111,6 +169,80 @@ class PluginRegistry:
                 },
             )
 
+    @classmethod
+    def register_lazy_plugin(
+        cls,
+        name: str,
+        plugin_type: PluginType,
+        module_name: str,
+        path: Path,
+        class_name: str,
+    ) -> None:
+        """
+        Register a plugin without importing its module.
+        Args:
+            name: Unique identifier for the plugin
+            plugin_type: Type of plugin
+            module_name: Name the plugin module is imported under
+            path: File of the plugin module
+            class_name: Name of the plugin class in the module
+        Raises:
+            PluginRegistrationError: If another class is registered under the name
+        """
+        placeholder = LazyPlugin(name, plugin_type, module_name, path, class_name)
+        existing_plugin = cls._plugins[plugin_type].get(name)
+        if existing_plugin is None:
+            cls._plugins[plugin_type][name] = placeholder
+            return
+        if _plugin_id(existing_plugin) != placeholder.plugin_id:
+            raise PluginRegistrationError(
+                f"Plugin {name} already registered for type {plugin_type.value} with different class",
+                details={
+                    "plugin": name,
+                    "type": plugin_type.value,
+                    "existing_class": _plugin_id(existing_plugin),
+                    "new_class": placeholder.plugin_id,
+                },
+            )
+
+    @classmethod
+    def _load_lazy_plugin(cls, placeholder: LazyPlugin) -> Type[Plugin]:
+        """Import the module of a lazy plugin and register its class."""
+        plugins = cls._plugins[placeholder.plugin_type]
+        with _LAZY_IMPORT_LOCK:
+            current = plugins.get(placeholder.name)
+            if current is not placeholder and current is not None:
+                if isinstance(current, LazyPlugin):
+                    return cls._load_lazy_plugin(current)
+                return current
+            try:
+                module = _import_plugin_module(
+                    placeholder.module_name, placeholder.path
+                )
+                plugin_class = getattr(module, placeholder.class_name)
+            except Exception as e:
+                if plugins.get(placeholder.name) is placeholder:
+                    del plugins[placeholder.name]
+                logger.error(
+                    f"Failed to import plugin {placeholder.name} from "
+                    f"{placeholder.path}: {str(e)}"
+                )
+                raise PluginNotFoundError(
+                    f"Plugin {placeholder.name} could not be imported for type "
+                    f"{placeholder.plugin_type.value}",
+                    details={
+                        "plugin": placeholder.name,
+                        "type": placeholder.plugin_type.value,
+                        "module": placeholder.module_name,
+                        "error": str(e),
+                    },
+                )
+
+            # Decorated classes replaced their placeholder while the module ran
+            if plugins.get(placeholder.name, placeholder) is placeholder:
+                plugins[placeholder.name] = plugin_class
+            return plugins[placeholder.name]
+
     @classmethod
     def get_plugin(cls, name: str, plugin_type: PluginType) -> Type[Plugin]:
         """
@@ -124,7 +256,7 @@ class PluginRegistry:
             PluginNotFoundError: If plugin not found
         """
         try:
-            return cls._plugins[plugin_type][name]
+            plugin = cls._plugins[plugin_type][name]
         except KeyError:
             raise PluginNotFoundError(
                 f"Plugin {name} not found for type {plugin_type.value}",
@@ -134,16 +266,26 @@ class PluginRegistry:
                     "available": list(cls._plugins[plugin_type].keys()),
                 },
             )
+        if isinstance(plugin, LazyPlugin):
+            return cls._load_lazy_plugin(plugin)
+        return plugin
 
     @classmethod
     def get_plugins_by_type(cls, plugin_type: PluginType) -> Dict[str, Type[Plugin]]:
         """
-        Get all plugins of a specific type.
+        Get all plugins of a specific type, importing the lazy ones.
         Args:
             plugin_type: Type of plugins to retrieve
         Returns:
             Dictionary of plugin name to plugin class
         """
+        for plugin in list(cls._plugins[plugin_type].values()):
+            if isinstance(plugin, LazyPlugin):
+                try:
+                    cls._load_lazy_plugin(plugin)
+                except PluginNotFoundError:
+                    # Logged and dropped from the registry by _load_lazy_plugin
+                    continue
         return cls._plugins[plugin_type].copy()
 
     @classmethod
@@ -1,42 +1,112 @@
 """
 Transformer plugins for Niamoto.
+
+Transformer classes are imported on first access, so importing one
+transformer module does not import every other transformer (and their
+plotting and geospatial dependencies).
 """
 
-from .aggregation.binary_counter import BinaryCounter
-from .aggregation.database_aggregator import DatabaseAggregatorPlugin
-from .aggregation.field_aggregator import FieldAggregator
-from .aggregation.statistical_summary import StatisticalSummary
-from .aggregation.top_ranking import TopRanking
-from .analysis.boolean_comparison import BooleanComparison
-from .analysis.scatter_analysis import ScatterAnalysis
-from .chains.transform_chain import TransformChain
-from .class_objects.binary_aggregator import ClassObjectBinaryAggregator
-from .class_objects.categories_extractor import ClassObjectCategoriesExtractor
-from .class_objects.categories_mapper import ClassObjectCategoriesMapper
-from .class_objects.field_aggregator import ClassObjectFieldAggregator
-from .class_objects.series_by_axis_extractor import ClassObjectSeriesByAxisExtractor
-from .class_objects.series_extractor import ClassObjectSeriesExtractor
-from .class_objects.series_matrix_extractor import ClassObjectSeriesMatrixExtractor
-from .class_objects.series_ratio_aggregator import ClassObjectSeriesRatioAggregator
-from .distribution.binned_distribution import BinnedDistribution
-from .distribution.categorical_distribution import CategoricalDistribution
-from .distribution.time_series_analysis import TimeSeriesAnalysis
-from .extraction.direct_attribute import DirectAttribute
-from .extraction.geospatial_extractor import GeospatialExtractor
-from .formats.niamoto_to_dwc_occurrence import NiamotoDwCTransformer
-from .geospatial.raster_stats import RasterStats
-from .geospatial.shape_processor import ShapeProcessor
-from .geospatial.vector_overlay import VectorOverlay
+import importlib
+from typing import Any
+
+# Public name -> (submodule, class name)
+_EXPORTS = {
+    "BinaryCounter": (".aggregation.binary_counter", "BinaryCounter"),
+    "DatabaseAggregatorPlugin": (
+        ".aggregation.database_aggregator",
+        "DatabaseAggregatorPlugin",
+    ),
+    "FieldAggregator": (".aggregation.field_aggregator", "FieldAggregator"),
+    "StatisticalSummary": (".aggregation.statistical_summary", "StatisticalSummary"),
+    "TopRanking": (".aggregation.top_ranking", "TopRanking"),
+    "BooleanComparison": (".analysis.boolean_comparison", "BooleanComparison"),
+    "ScatterAnalysis": (".analysis.scatter_analysis", "ScatterAnalysis"),
+    "TransformChain": (".chains.transform_chain", "TransformChain"),
+    "ClassObjectBinaryAggregator": (
+        ".class_objects.binary_aggregator",
+        "ClassObjectBinaryAggregator",
+    ),
+    "ClassObjectCategoriesExtractor": (
+        ".class_objects.categories_extractor",
+        "ClassObjectCategoriesExtractor",
+    ),
+    "ClassObjectCategoriesMapper": (
+        ".class_objects.categories_mapper",
+        "ClassObjectCategoriesMapper",
+    ),
+    "ClassObjectFieldAggregator": (
+        ".class_objects.field_aggregator",
+        "ClassObjectFieldAggregator",
+    ),
+    "ClassObjectSeriesByAxisExtractor": (
+        ".class_objects.series_by_axis_extractor",
+        "ClassObjectSeriesByAxisExtractor",
+    ),
+    "ClassObjectSeriesExtractor": (
+        ".class_objects.series_extractor",
+        "ClassObjectSeriesExtractor",
+    ),
+    "ClassObjectSeriesMatrixExtractor": (
+        ".class_objects.series_matrix_extractor",
+        "ClassObjectSeriesMatrixExtractor",
+    ),
+    "ClassObjectSeriesRatioAggregator": (
+        ".class_objects.series_ratio_aggregator",
+        "ClassObjectSeriesRatioAggregator",
+    ),
+    "BinnedDistribution": (".distribution.binned_distribution", "BinnedDistribution"),
+    "CategoricalDistribution": (
+        ".distribution.categorical_distribution",
+        "CategoricalDistribution",
+    ),
+    "TimeSeriesAnalysis": (".distribution.time_series_analysis", "TimeSeriesAnalysis"),
+    "DirectAttribute": (".extraction.direct_attribute", "DirectAttribute"),
+    "GeospatialExtractor": (".extraction.geospatial_extractor", "GeospatialExtractor"),
+    "NiamotoDwCTransformer": (
+        ".formats.niamoto_to_dwc_occurrence",
+        "NiamotoDwCTransformer",
+    ),
+    "RasterStats": (".geospatial.raster_stats", "RasterStats"),
+    "ShapeProcessor": (".geospatial.shape_processor", "ShapeProcessor"),
+    "VectorOverlay": (".geospatial.vector_overlay", "VectorOverlay"),
+    "DatabaseAggregator": (
+        ".aggregation.database_aggregator",
+        "DatabaseAggregatorPlugin",
+    ),
+    "BinaryAggregator": (
+        ".class_objects.binary_aggregator",
+        "ClassObjectBinaryAggregator",
+    ),
+    "CategoriesExtractor": (
+        ".class_objects.categories_extractor",
+        "ClassObjectCategoriesExtractor",
+    ),
+    "CategoriesMapper": (
+        ".class_objects.categories_mapper",
+        "ClassObjectCategoriesMapper",
+    ),
+    "SeriesByAxisExtractor": (
+        ".class_objects.series_by_axis_extractor",
+        "ClassObjectSeriesByAxisExtractor",
+    ),
+    "SeriesExtractor": (
+        ".class_objects.series_extractor",
+        "ClassObjectSeriesExtractor",
+    ),
+    "SeriesMatrixExtractor": (
+        ".class_objects.series_matrix_extractor",
+        "ClassObjectSeriesMatrixExtractor",
+    ),
+    "SeriesRatioAggregator": (
+        ".class_objects.series_ratio_aggregator",
+        "ClassObjectSeriesRatioAggregator",
+    ),
+    "NiamotoToDwcOccurrenceTransformer": (
+        ".formats.niamoto_to_dwc_occurrence",
+        "NiamotoDwCTransformer",
+    ),
+}
 
-DatabaseAggregator = DatabaseAggregatorPlugin
-BinaryAggregator = ClassObjectBinaryAggregator
-CategoriesExtractor = ClassObjectCategoriesExtractor
-CategoriesMapper = ClassObjectCategoriesMapper
-SeriesByAxisExtractor = ClassObjectSeriesByAxisExtractor
-SeriesExtractor = ClassObjectSeriesExtractor
-SeriesMatrixExtractor = ClassObjectSeriesMatrixExtractor
-SeriesRatioAggregator = ClassObjectSeriesRatioAggregator
-NiamotoToDwcOccurrenceTransformer = NiamotoDwCTransformer
 
 # List of all available transformers
 __all__ = [
@@ -74,3 +144,17 @@ __all__ = [
     # Format conversion transformers
     "NiamotoToDwcOccurrenceTransformer",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attribute = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
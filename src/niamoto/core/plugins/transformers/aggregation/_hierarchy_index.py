@@ -0,0 +1,152 @@
+"""Array index of a hierarchy table for rank-level aggregations.
+
+A ``HierarchyIndex`` holds every node of a hierarchy (taxonomy, plots,
+shapes) as NumPy arrays, with parent pointers stored as row positions. For a
+set of target ranks it computes, once, the nearest ancestor-or-self of every
+node at one of those ranks. Aggregating an occurrence column by rank then is
+a lookup of each value's row, a ``take`` of its ancestor and a ``bincount``,
+without any query per entity.
+
+Indexes are built from a single scan of the table and shared by the plugins
+of a process through ``get_hierarchy_index``, keyed by the entity registry
+version so a re-import rebuilds them.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from niamoto.common.lru_cache import LRUCache
+
+_INDEX_CACHE_MAX_ENTRIES = 8
+_INDEX_CACHE: LRUCache[Hashable, "HierarchyIndex"] = LRUCache(
+    max_entries=_INDEX_CACHE_MAX_ENTRIES
+)
+
+
+@dataclass
+class HierarchyIndex:
+    """Nodes of a hierarchy table with parent positions and rank lookups."""
+
+    ids: pd.Index
+    names: np.ndarray
+    ranks: np.ndarray
+    parents: np.ndarray
+    _rank_ancestors: Dict[FrozenSet[str], np.ndarray] = field(
+        default_factory=dict, repr=False
+    )
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame) -> "HierarchyIndex":
+        """Build the index from ``id, name, rank, parent`` columns, in that order."""
+        ids = pd.Index(frame.iloc[:, 0])
+        parents = _lookup(ids, frame.iloc[:, 3])
+        return cls(
+            ids=ids,
+            names=frame.iloc[:, 1].to_numpy(dtype=object),
+            ranks=frame.iloc[:, 2].to_numpy(dtype=object),
+            parents=parents.astype(np.int64),
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def positions(self, values: Iterable[Any]) -> np.ndarray:
+        """Return the row of each value, -1 for values not in the hierarchy.
+
+        Values are converted to the type of the ids first, as the database
+        did when comparing them: '3' and 3.0 both find the node 3.
+        """
+        return _lookup(self.ids, values)
+
+    def rank_ancestors(self, target_ranks: Iterable[str]) -> np.ndarray:
+        """Return, for every node, the row of its nearest ancestor-or-self at
+        one of ``target_ranks``, or -1 when there is none."""
+        key = frozenset(target_ranks)
+        ancestors = self._rank_ancestors.get(key)
+        if ancestors is not None:
+            return ancestors
+
+        is_target = np.isin(self.ranks, list(key))
+        ancestors = np.where(is_target, np.arange(len(self)), -1)
+        pending = np.flatnonzero(~is_target)
+        current = self.parents[pending]
+        # One step up the tree per pass; the pass limit guards against cycles
+        for _ in range(len(self)):
+            alive = current >= 0
+            pending, current = pending[alive], current[alive]
+            if not len(pending):
+                break
+            found = is_target[current]
+            ancestors[pending[found]] = current[found]
+            pending, current = pending[~found], self.parents[current[~found]]
+
+        self._rank_ancestors[key] = ancestors
+        return ancestors
+
+    def count_by_rank(
+        self, values: pd.Series, target_ranks: Iterable[str]
+    ) -> Tuple[list, list]:
+        """Count ``values`` by the name of their ancestor at ``target_ranks``.
+
+        Returns names and counts sorted by decreasing count; ties keep the
+        order in which the names first appear in ``values``.
+        """
+        positions = self.positions(values.dropna())
+        positions = positions[positions >= 0]
+        ancestors = self.rank_ancestors(target_ranks)[positions]
+        ancestors = ancestors[ancestors >= 0]
+        if not len(ancestors):
+            return [], []
+
+        name_codes, names = pd.factorize(self.names[ancestors], use_na_sentinel=False)
+        counts = np.bincount(name_codes)
+        order = np.lexsort((np.arange(len(counts)), -counts))
+        return names[order].tolist(), counts[order].tolist()
+
+
+def _lookup(ids: pd.Index, values: Iterable[Any]) -> np.ndarray:
+    """Return the position of each value in ``ids``, -1 when missing."""
+    values = pd.Index(values)
+    if values.dtype != ids.dtype:
+        values = _as_id_type(values, ids)
+    return ids.get_indexer(values)
+
+
+def _as_id_type(values: pd.Index, ids: pd.Index) -> pd.Index:
+    """Convert lookup values to numbers or text, like the hierarchy ids."""
+    if pd.api.types.is_numeric_dtype(ids.dtype):
+        return pd.Index(pd.to_numeric(values, errors="coerce"))
+    return pd.Index(
+        [None if pd.isna(value) else _id_text(value) for value in values],
+        dtype=object,
+    )
+
+
+def _id_text(value: Any) -> str:
+    """Return the text of an id, without the decimal part of whole floats."""
+    if isinstance(value, (float, np.floating)) and float(value).is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def get_hierarchy_index(cache_key: Optional[Hashable], load: Any) -> HierarchyIndex:
+    """Return the index cached under ``cache_key``, building it with ``load()``.
+
+    ``load`` returns the frame given to ``HierarchyIndex.from_frame``. A None
+    key builds an index that is not shared.
+    """
+    if cache_key is None:
+        return HierarchyIndex.from_frame(load())
+    return _INDEX_CACHE.get_or_build(
+        cache_key, lambda: HierarchyIndex.from_frame(load())
+    )
+
+
+def clear_hierarchy_index_cache() -> None:
+    """Drop every cached hierarchy index."""
+    _INDEX_CACHE.clear()
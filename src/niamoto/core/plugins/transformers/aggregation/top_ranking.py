@@ -10,6 +10,10 @@ import pandas as pd
 
 from niamoto.core.plugins.models import PluginConfig, BasePluginParams
 from niamoto.core.plugins.base import TransformerPlugin, PluginType, register
+from niamoto.core.plugins.transformers.aggregation._hierarchy_index import (
+    HierarchyIndex,
+    get_hierarchy_index,
+)
 
 _SQL_IDENTIFIER_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
 
@@ -250,6 +254,7 @@ class TopRanking(TransformerPlugin):
         super().__init__(db, registry)
         # Use resolve_entity_table from parent Plugin class if registry available
         # This replaces the old _resolve_table_name method
+        self._hierarchy_indexes: Dict[tuple, HierarchyIndex] = {}
 
     def _resolve_table_name(self, logical_name: str) -> str:
         """Resolve logical table name to actual table name via entity registry.
@@ -384,52 +389,14 @@ class TopRanking(TransformerPlugin):
         self, field_data: pd.Series, params: TopRankingParams
     ) -> Dict[str, Any]:
         """Process ranking with hierarchical navigation."""
-        # Get unique IDs
-        unique_ids = set(field_data.dropna().unique())
-        if not unique_ids:
+        if field_data.dropna().empty:
             return {"tops": [], "counts": []}
 
-        # Get hierarchy configuration and resolve table name
-        hierarchy_table = self._resolve_table_name(params.hierarchy_table)
-        cols = params.hierarchy_columns
-        id_col = cols.id
-        name_col = cols.name
-        rank_col = cols.rank
-        parent_col = cols.parent_id
-
-        # Build hierarchy dictionary
-        hierarchy_dict = self._build_hierarchy_dict(
-            unique_ids, hierarchy_table, id_col, name_col, rank_col, parent_col
-        )
+        # Find each item's ancestor at a target rank in the cached index
+        index = self._get_hierarchy_index(params)
+        tops, counts = index.count_by_rank(field_data, params.target_ranks)
 
-        # Count items by target rank
-        target_ranks = params.target_ranks
-        item_counts = {}
-
-        for item_id in field_data.dropna():
-            if item_id in hierarchy_dict:
-                # Navigate hierarchy to find target rank
-                current_id = item_id
-                while current_id is not None:
-                    current_item = hierarchy_dict.get(current_id)
-                    if not current_item:
-                        break
-
-                    if current_item[rank_col] in target_ranks:
-                        item_name = current_item[name_col]
-                        item_counts[item_name] = item_counts.get(item_name, 0) + 1
-                        break
-
-                    current_id = current_item.get(parent_col)
-
-        # Sort and get top N
-        sorted_items = sorted(item_counts.items(), key=lambda x: x[1], reverse=True)
-        top_items = sorted_items[: params.count]
-
-        tops = [item[0] for item in top_items]
-        counts = [item[1] for item in top_items]
-
-        return {"tops": tops, "counts": counts}
+        return {"tops": tops[: params.count], "counts": counts[: params.count]}
 
     def _process_join_ranking(
         self, field_data: pd.Series, params: TopRankingParams
@@ -564,82 +531,34 @@ class TopRanking(TransformerPlugin):
 
         return {"tops": tops, "counts": counts}
 
-    def _build_hierarchy_dict(
-        self,
-        ids: set,
-        table: str,
-        id_col: str,
-        name_col: str,
-        rank_col: str,
-        parent_col: str,
-    ) -> Dict[int, Dict[str, Any]]:
-        """Build hierarchy dictionary from database."""
-        hierarchy_dict = {}
-        quoted_table = _quote_identifier(table)
-        quoted_id_col = _quote_identifier(id_col)
-        quoted_name_col = _quote_identifier(name_col)
-        quoted_rank_col = _quote_identifier(rank_col)
-        quoted_parent_col = _quote_identifier(parent_col)
-
-        # Query initial items
-        ids_str = ",".join(str(int(id)) for id in ids)
-        query = f"""
-            SELECT {quoted_id_col}, {quoted_name_col}, {quoted_rank_col}, {quoted_parent_col}
-            FROM {quoted_table}
-            WHERE {quoted_id_col} IN ({ids_str})
-        """
-
-        result = self.db.execute_select(query)
-        if not result:
-            return hierarchy_dict
+    def _get_hierarchy_index(self, params: TopRankingParams) -> HierarchyIndex:
+        """Return the index of the hierarchy table, loading it on first use.
 
-        # Build initial dictionary
-        for row in result.fetchall():
-            hierarchy_dict[row[0]] = {
-                id_col: row[0],
-                name_col: row[1],
-                rank_col: row[2],
-                parent_col: row[3],
-            }
-
-        # Query parents iteratively
-        parent_ids = {
-            item[parent_col]
-            for item in hierarchy_dict.values()
-            if item.get(parent_col) is not None
-        }
+        The whole table is read once; the index is then shared by every
+        entity of the transform run, and across runs while the entity
+        registry is unchanged.
+        """
+        table = self._resolve_table_name(params.hierarchy_table)
+        cols = params.hierarchy_columns
+        columns = (cols.id, cols.name, cols.rank, cols.parent_id)
+        key = (table, columns)
 
-        while parent_ids:
-            parent_ids_str = ",".join(str(id) for id in parent_ids)
-            query = f"""
-                SELECT {quoted_id_col}, {quoted_name_col}, {quoted_rank_col}, {quoted_parent_col}
-                FROM {quoted_table}
-                WHERE {quoted_id_col} IN ({parent_ids_str})
-            """
+        index = self._hierarchy_indexes.get(key)
+        if index is not None:
+            return index
 
+        def load() -> pd.DataFrame:
+            select_list = ", ".join(_quote_identifier(col) for col in columns)
+            query = f"SELECT {select_list} FROM {_quote_identifier(table)}"
             result = self.db.execute_select(query)
-            if not result:
-                break
-
-            # Add parents to dictionary
-            for row in result.fetchall():
-                parent_id = row[0]
-                hierarchy_dict[parent_id] = {
-                    id_col: parent_id,
-                    name_col: row[1],
-                    rank_col: row[2],
-                    parent_col: row[3],
-                }
-
-            # Get next level of parents
-            parent_ids = {
-                item[parent_col]
-                for item in hierarchy_dict.values()
-                if item.get(parent_col) is not None
-                and item[parent_col] not in hierarchy_dict
-            }
-
-        return hierarchy_dict
+            rows = result.fetchall() if result else []
+            return pd.DataFrame(list(rows), columns=list(columns))
+
+        token = getattr(self.registry, "cache_token", None)
+        shared_key = (token, key) if isinstance(token, tuple) else None
+        index = get_hierarchy_index(shared_key, load)
+        self._hierarchy_indexes[key] = index
+        return index
 
     def _get_aggregate_sql(
         self,
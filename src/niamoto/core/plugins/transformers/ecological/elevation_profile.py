@@ -19,6 +19,7 @@ from shapely.geometry import Polygon, MultiPolygon
 from niamoto.core.plugins.models import PluginConfig
 from niamoto.core.plugins.base import TransformerPlugin, PluginType, register
 from niamoto.common.exceptions import DataTransformError
+from niamoto.core.plugins.transformers.geospatial.layer_cache import read_layer
 
 
 class ElevationProfileConfig(PluginConfig):
@@ -282,8 +283,8 @@ class ElevationProfile(TransformerPlugin):
                 base_dir = self._get_base_directory()
                 forest_path = os.path.join(base_dir, forest_path)
 
-            # Load the forest layer
-            forest_gdf = gpd.read_file(forest_path, engine="pyogrio")
+            # Load the forest layer in the CRS of the main geometry
+            forest_gdf = read_layer(forest_path, crs=crs)
 
             if forest_gdf.empty:
                 return {
@@ -291,10 +292,6 @@ class ElevationProfile(TransformerPlugin):
                     "forest_percentage": [0] * (len(bin_edges) - 1),
                 }
 
-            # Ensure the CRS matches
-            if crs != forest_gdf.crs:
-                forest_gdf = forest_gdf.to_crs(crs)
-
             # Clip the forest to the main geometry
             forest_in_area = gpd.clip(
                 forest_gdf, gpd.GeoDataFrame(geometry=[main_geom], crs=crs)
@@ -9,13 +9,16 @@ import pandas as pd
 import geopandas as gpd
 import numpy as np
 import os
-import rasterio
-from rasterio.mask import mask
 import rasterio.features
 
 from niamoto.core.plugins.models import PluginConfig, BasePluginParams
 from niamoto.core.plugins.base import TransformerPlugin, PluginType, register
 from niamoto.common.exceptions import DataTransformError
+from niamoto.core.plugins.transformers.geospatial.layer_cache import read_layer
+from niamoto.core.plugins.transformers.geospatial.raster_access import (
+    open_raster,
+    read_window,
+)
 
 
 class ForestElevationParams(BasePluginParams):
@@ -201,52 +204,43 @@ class ForestElevationAnalysis(TransformerPlugin):
 
             # Open the DEM
             try:
-                with rasterio.open(dem_path) as src:
-                    raster_crs = getattr(src, "crs", data.crs)
-                    raster_geom = main_geom
-                    if (
-                        data.crs is not None
-                        and raster_crs is not None
-                        and data.crs != raster_crs
-                    ):
-                        raster_geom = (
-                            gpd.GeoSeries([main_geom], crs=data.crs)
-                            .to_crs(raster_crs)
-                            .iloc[0]
-                        )
-
-                    # Mask the DEM with the geometry
-                    masked, mask_transform = mask(
-                        src,
-                        [raster_geom],
-                        crop=True,
-                        nodata=params.nodata,
+                # Pooled handle: the DEM stays open for the next entities
+                src = open_raster(dem_path)
+                raster_crs = getattr(src, "crs", data.crs)
+                raster_geom = main_geom
+                if (
+                    data.crs is not None
+                    and raster_crs is not None
+                    and data.crs != raster_crs
+                ):
+                    raster_geom = (
+                        gpd.GeoSeries([main_geom], crs=data.crs)
+                        .to_crs(raster_crs)
+                        .iloc[0]
                     )
 
-                    # Get the elevation data (first band)
-                    elevation_data = masked[0]
+                # Read the first band over the geometry window only
+                window = read_window(dem_path, [raster_geom], band=1)
+                elevation_data = window.filled(params.nodata)
+                mask_transform = window.transform
 
-                    # Filter out nodata values
-                    nodata = params.nodata
-                    valid_mask = elevation_data != nodata
+                # Filter out nodata values
+                nodata = params.nodata
+                valid_mask = elevation_data != nodata
 
-                    if np.sum(valid_mask) == 0:
-                        return self._empty_results(elevation_bins, params.forest_types)
+                if np.sum(valid_mask) == 0:
+                    return self._empty_results(elevation_bins, params.forest_types)
             except Exception as e:
                 self.logger.error(f"Error opening the DEM: {str(e)}")
                 return self._empty_results(elevation_bins, params.forest_types)
 
             # Load the forest types layer
             try:
-                forest_gdf = gpd.read_file(forest_types_path, engine="pyogrio")
+                forest_crs = raster_crs or data.crs
+                forest_gdf = read_layer(forest_types_path, crs=forest_crs)
 
                 if forest_gdf.empty:
                     return self._empty_results(elevation_bins, params.forest_types)
-
-                # Ensure the CRS matches
-                forest_crs = raster_crs or data.crs
-                if forest_crs != forest_gdf.crs:
-                    forest_gdf = forest_gdf.to_crs(forest_crs)
             except Exception as e:
                 self.logger.error(f"Error loading the forest types layer: {str(e)}")
                 return self._empty_results(elevation_bins, params.forest_types)
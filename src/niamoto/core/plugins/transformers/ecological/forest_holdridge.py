@@ -18,6 +18,7 @@ import rasterio.features
 from niamoto.core.plugins.models import PluginConfig, BasePluginParams
 from niamoto.core.plugins.base import TransformerPlugin, PluginType, register
 from niamoto.common.exceptions import DataTransformError
+from niamoto.core.plugins.transformers.geospatial.layer_cache import read_layer
 
 
 class ForestHoldridgeParams(BasePluginParams):
@@ -202,19 +203,15 @@ class ForestHoldridgeAnalysis(TransformerPlugin):
                         "non_forest": {"dry": 0.0, "humid": 0.0, "very_humid": 0.0},
                     }
 
-                # Load the forest layer
-                forest_gdf = gpd.read_file(forest_path, engine="pyogrio")
+                # Load the forest layer in the CRS of the raster
+                forest_crs = raster_crs or data.crs
+                forest_gdf = read_layer(forest_path, crs=forest_crs)
 
                 if forest_gdf.empty:
                     raise DataTransformError(
                         f"No data found in the forest layer: {forest_path}"
                     )
 
-                # Ensure the CRS matches
-                forest_crs = raster_crs or data.crs
-                if forest_crs != forest_gdf.crs:
-                    forest_gdf = forest_gdf.to_crs(forest_crs)
-
                 # Clip the forest to the main geometry
                 forest_in_area = gpd.clip(
                     forest_gdf, gpd.GeoDataFrame(geometry=[raster_geom], crs=forest_crs)
@@ -14,6 +14,7 @@ from shapely.geometry import Polygon, MultiPolygon
 from niamoto.core.plugins.models import PluginConfig, BasePluginParams
 from niamoto.core.plugins.base import TransformerPlugin, PluginType, register
 from niamoto.common.exceptions import DataTransformError
+from niamoto.core.plugins.transformers.geospatial.layer_cache import read_layer
 
 
 class FragmentationParams(BasePluginParams):
@@ -213,16 +214,12 @@ class FragmentationAnalysis(TransformerPlugin):
                 base_dir = self._get_base_directory()
                 forest_path = os.path.join(base_dir, forest_path)
 
-            # Load the forest layer
-            forest_gdf = gpd.read_file(forest_path, engine="pyogrio")
+            # Load the forest layer in the CRS of the main geometry
+            forest_gdf = read_layer(forest_path, crs=data.crs)
 
             if forest_gdf.empty:
                 return self._empty_results(params.metrics, area_unit)
 
-            # Ensure the CRS matches
-            if data.crs != forest_gdf.crs:
-                forest_gdf = forest_gdf.to_crs(data.crs)
-
             # Clip the forest to the main geometry
             try:
                 forest_in_area = gpd.clip(
@@ -13,6 +13,7 @@ import os
 from niamoto.core.plugins.models import PluginConfig, BasePluginParams
 from niamoto.core.plugins.base import TransformerPlugin, PluginType, register
 from niamoto.common.exceptions import DataTransformError
+from niamoto.core.plugins.transformers.geospatial.layer_cache import read_layer
 
 
 class LayerConfig(BasePluginParams):
@@ -215,17 +216,13 @@ class LandUseAnalysis(TransformerPlugin):
                     layer_path = os.path.join(base_dir, layer_path)
 
                 try:
-                    # Load the layer
-                    layer_gdf = gpd.read_file(layer_path, engine="pyogrio")
+                    # Load the layer in the CRS of the main geometry
+                    layer_gdf = read_layer(layer_path, crs=data.crs)
 
                     if layer_gdf.empty:
                         self._add_empty_results(layer_categories, categories, areas)
                         continue
 
-                    # Ensure the CRS matches
-                    if data.crs != layer_gdf.crs:
-                        layer_gdf = layer_gdf.to_crs(data.crs)
-
                     # Clip the layer to the main geometry
                     try:
                         layer_in_area = gpd.clip(
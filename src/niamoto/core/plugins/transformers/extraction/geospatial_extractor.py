@@ -19,6 +19,7 @@ from niamoto.core.plugins.base import TransformerPlugin, PluginType, register
 from niamoto.common.config import Config
 from niamoto.common.exceptions import DatabaseQueryError
 from niamoto.core.imports.registry import EntityRegistry
+from niamoto.core.plugins.transformers.geospatial.layer_cache import read_layer
 from niamoto.core.plugins.transformers.extraction.sql_identifiers import (
     quote_validated_column,
     quote_validated_table,
@@ -517,7 +518,7 @@ class GeospatialExtractor(TransformerPlugin):
         if connector_type in {"file", "duckdb_csv", "csv"}:
             df = pd.read_csv(file_path)
         elif connector_type == "vector":
-            df = gpd.read_file(file_path, engine="pyogrio")
+            df = read_layer(file_path)
         else:
             raise ValueError(f"Unsupported connector type: {connector_type}")
 
@@ -12,7 +12,30 @@ Available transformers:
 - niamoto_to_humboldt_event: Convert Niamoto data to Humboldt/Event terms
 """
 
-from .niamoto_to_humboldt_event import NiamotoHumboldtEventTransformer
-from .niamoto_to_dwc_occurrence import NiamotoDwCTransformer
+import importlib
+from typing import Any
+
+# Public name -> (submodule, class name)
+_EXPORTS = {
+    "NiamotoHumboldtEventTransformer": (
+        ".niamoto_to_humboldt_event",
+        "NiamotoHumboldtEventTransformer",
+    ),
+    "NiamotoDwCTransformer": (".niamoto_to_dwc_occurrence", "NiamotoDwCTransformer"),
+}
 
 __all__ = ["NiamotoDwCTransformer", "NiamotoHumboldtEventTransformer"]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attribute = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,211 @@
+"""
+Process-wide cache of vector layers read by geospatial transformers.
+
+Transformers such as ``vector_overlay``, ``land_use`` or ``fragmentation``
+run once per entity but always read the same layer files. The cache keeps
+each layer, reprojected and with its spatial index built, so that a layer is
+read and indexed once per run instead of once per entity.
+
+Cached GeoDataFrames are shared between callers and must be treated as
+read-only: copy them before modifying them in place.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from typing import Any, Callable, Hashable, Optional
+
+import geopandas as gpd
+import shapely
+
+from niamoto.common.lru_cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+# Memory budget of the shared cache, overridable with NIAMOTO_LAYER_CACHE_MB.
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# Approximate size of one coordinate pair plus geometry overhead, used to
+# account for geometries that pandas reports as a single pointer.
+_BYTES_PER_COORDINATE = 16
+
+
+def _estimate_nbytes(gdf: gpd.GeoDataFrame) -> int:
+    """Return an approximate in-memory size of a GeoDataFrame."""
+
+    size = int(gdf.memory_usage(deep=True, index=True).sum())
+    if gdf.geometry.name in gdf.columns and len(gdf):
+        coordinates = shapely.get_num_coordinates(gdf.geometry.values)
+        size += int(coordinates.sum()) * _BYTES_PER_COORDINATE
+    return size
+
+
+def _crs_key(crs: Any) -> Optional[str]:
+    """Return a hashable representation of a CRS."""
+
+    if crs is None:
+        return None
+    to_string = getattr(crs, "to_string", None)
+    return to_string() if callable(to_string) else str(crs)
+
+
+class GeoLayerCache:
+    """LRU cache of vector layers bounded by an approximate memory budget.
+
+    Entries are keyed by ``(resolved path, mtime, CRS, where filter)``, so
+    a layer modified on disk is read again. Files that cannot be stat'ed are
+    read without being cached.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self._entries: LRUCache[Hashable, gpd.GeoDataFrame] = LRUCache(
+            max_weight=max_bytes, weigh=_estimate_nbytes
+        )
+        self._lock = threading.RLock()
+
+    @property
+    def max_bytes(self) -> int:
+        """Memory budget of the cache, in bytes."""
+        return self._entries.max_weight
+
+    @max_bytes.setter
+    def max_bytes(self, value: int) -> None:
+        self._entries.max_weight = value
+
+    @property
+    def size(self) -> int:
+        """Approximate number of bytes held by the cache."""
+        return self._entries.weight
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop every cached layer."""
+        self._entries.clear()
+
+    def get_layer(
+        self,
+        path: str,
+        crs: Any = None,
+        where: Optional[str] = None,
+        where_filter: Optional[
+            Callable[[gpd.GeoDataFrame, str], gpd.GeoDataFrame]
+        ] = None,
+    ) -> gpd.GeoDataFrame:
+        """Return a layer, optionally filtered and reprojected to ``crs``.
+
+        Args:
+            path: Path of the vector file, as given to ``gpd.read_file``
+            crs: Target CRS. The layer is returned in its own CRS when None
+            where: Optional attribute filter expression
+            where_filter: Function applying ``where`` to the layer. Defaults
+                to ``GeoDataFrame.eval`` with the python engine
+
+        Returns:
+            The cached GeoDataFrame, with its spatial index built
+        """
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return self._load(path, crs, where, where_filter)
+
+        source_key = (os.path.realpath(path), stat.st_mtime_ns, where)
+        key = source_key + (_crs_key(crs),)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                return cached
+
+            if crs is None:
+                gdf = self._load(path, None, where, where_filter)
+            else:
+                # Reproject from the cached native layer rather than re-reading
+                base = self._entries.get(source_key + (None,))
+                if base is None:
+                    base = self._load(path, None, where, where_filter)
+                    self._store(source_key + (None,), base)
+                gdf = self._reproject(base, crs)
+                if gdf is base:
+                    return base
+
+            self._store(key, gdf)
+            return gdf
+
+    def _store(self, key: Hashable, gdf: gpd.GeoDataFrame) -> None:
+        if not self._entries.put(key, gdf):
+            logger.debug("Layer too large for the layer cache, not cached")
+
+    def _load(
+        self,
+        path: str,
+        crs: Any,
+        where: Optional[str],
+        where_filter: Optional[Callable[[gpd.GeoDataFrame, str], gpd.GeoDataFrame]],
+    ) -> gpd.GeoDataFrame:
+        gdf = gpd.read_file(path, engine="pyogrio")
+        if where:
+            if where_filter is not None:
+                gdf = where_filter(gdf, where)
+            else:
+                gdf = gdf[gdf.eval(where, engine="python")]
+        if crs is not None:
+            return self._reproject(gdf, crs)
+        self._build_index(gdf)
+        return gdf
+
+    def _reproject(self, gdf: gpd.GeoDataFrame, crs: Any) -> gpd.GeoDataFrame:
+        if gdf.crs != crs and not gdf.empty:
+            gdf = gdf.to_crs(crs)
+        self._build_index(gdf)
+        return gdf
+
+    @staticmethod
+    def _build_index(gdf: gpd.GeoDataFrame) -> None:
+        """Build the STRtree spatial index used by clip/overlay operations."""
+        if not gdf.empty and gdf.geometry.name in gdf.columns:
+            gdf.sindex
+
+
+def _default_max_bytes() -> int:
+    configured = os.environ.get("NIAMOTO_LAYER_CACHE_MB")
+    if configured:
+        try:
+            return max(0, int(float(configured) * 1024 * 1024))
+        except ValueError:
+            logger.warning(
+                "Invalid NIAMOTO_LAYER_CACHE_MB value %r, using the default",
+                configured,
+            )
+    return DEFAULT_MAX_BYTES
+
+
+_layer_cache: Optional[GeoLayerCache] = None
+_layer_cache_lock = threading.Lock()
+
+
+def get_layer_cache() -> GeoLayerCache:
+    """Return the layer cache shared by every transformer of the process."""
+
+    global _layer_cache
+    if _layer_cache is None:
+        with _layer_cache_lock:
+            if _layer_cache is None:
+                _layer_cache = GeoLayerCache(_default_max_bytes())
+    return _layer_cache
+
+
+def read_layer(
+    path: str,
+    crs: Any = None,
+    where: Optional[str] = None,
+    where_filter: Optional[Callable[[gpd.GeoDataFrame, str], gpd.GeoDataFrame]] = None,
+) -> gpd.GeoDataFrame:
+    """Read a vector layer through the shared layer cache."""
+
+    return get_layer_cache().get_layer(
+        path, crs=crs, where=where, where_filter=where_filter
+    )
@@ -0,0 +1,301 @@
+"""
+Pooled, windowed access to raster datasets used by geospatial transformers.
+
+Transformers such as ``raster_stats`` or ``forest_elevation`` run once per
+entity against the same rasters. Opening the dataset each time pays the GDAL
+open and header parsing cost, and ``rasterio.mask.mask`` reads every band of
+the cropped area. This module keeps dataset handles open per worker (process
+and thread) and reads a single band over the bounding window of a geometry,
+optionally at a coarser resolution so that GDAL can serve it from overviews.
+
+``zonal_values`` extracts the pixels of many geometries in one pass over the
+raster rows they cover.
+"""
+
+from __future__ import annotations
+
+import atexit
+import math
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence
+
+import numpy as np
+import rasterio
+from affine import Affine
+from rasterio.enums import Resampling
+from rasterio.errors import WindowError
+from rasterio.features import geometry_mask, geometry_window
+from rasterio.windows import Window
+
+# Maximum number of datasets kept open by one worker.
+DEFAULT_MAX_HANDLES = 16
+
+# Pixels read at once by zonal_values (about 32 MB of float64).
+_ZONAL_CHUNK_PIXELS = 4 * 1024 * 1024
+
+
+class RasterHandlePool:
+    """Keep raster datasets open, per process and per thread.
+
+    rasterio datasets are not safe to share between threads or across a fork,
+    so each thread of each process gets its own handles. Handles are keyed by
+    resolved path and modification time, so a raster rewritten on disk is
+    opened again, and the least recently used handles are closed beyond
+    ``max_handles``.
+    """
+
+    def __init__(self, max_handles: int = DEFAULT_MAX_HANDLES):
+        self.max_handles = max_handles
+        self._local = threading.local()
+
+    def _handles(self) -> "OrderedDict[tuple, Any]":
+        pid = os.getpid()
+        if getattr(self._local, "pid", None) != pid:
+            # Handles inherited through fork belong to the parent process
+            self._local.pid = pid
+            self._local.handles = OrderedDict()
+        return self._local.handles
+
+    def get(self, path: str):
+        """Return an open dataset for ``path``."""
+
+        handles = self._handles()
+        try:
+            key = (os.path.realpath(path), os.stat(path).st_mtime_ns)
+        except OSError:
+            # GDAL virtual paths (/vsicurl/...) or missing files
+            key = (path, None)
+        dataset = handles.get(key)
+        if dataset is not None and not dataset.closed:
+            handles.move_to_end(key)
+            return dataset
+
+        dataset = rasterio.open(path)
+        handles[key] = dataset
+        while len(handles) > self.max_handles:
+            _, evicted = handles.popitem(last=False)
+            evicted.close()
+        return dataset
+
+    def close(self) -> None:
+        """Close the handles opened by the current thread."""
+
+        handles = self._handles()
+        while handles:
+            _, dataset = handles.popitem()
+            dataset.close()
+
+
+_raster_pool = RasterHandlePool()
+# Close handles before GDAL is torn down at interpreter exit
+atexit.register(_raster_pool.close)
+
+
+def get_raster_pool() -> RasterHandlePool:
+    """Return the raster handle pool shared by every transformer."""
+    return _raster_pool
+
+
+def open_raster(path: str):
+    """Return a pooled dataset for ``path``. Do not close it."""
+    return _raster_pool.get(path)
+
+
+@dataclass
+class RasterWindow:
+    """One band of a raster read over the bounding window of geometries."""
+
+    data: np.ndarray
+    inside: np.ndarray
+    transform: Affine
+    nodata: Optional[float]
+
+    def valid_values(self) -> np.ndarray:
+        """Return the pixels inside the geometries that are not nodata."""
+        return _valid(self.data[self.inside], self.nodata)
+
+    def filled(self, fill_value: Optional[float] = None) -> np.ndarray:
+        """Return the data with pixels outside the geometries set to ``fill_value``.
+
+        This mirrors the array returned by ``rasterio.mask.mask(crop=True)``.
+        """
+        fill_value = self.nodata if fill_value is None else fill_value
+        if fill_value is None:
+            fill_value = 0
+        return np.where(self.inside, self.data, fill_value).astype(
+            self.data.dtype, copy=False
+        )
+
+
+def _valid(values: np.ndarray, nodata: Optional[float]) -> np.ndarray:
+    if nodata is not None and not (isinstance(nodata, float) and math.isnan(nodata)):
+        values = values[values != nodata]
+    if np.issubdtype(values.dtype, np.floating):
+        values = values[~np.isnan(values)]
+    return values
+
+
+def _check_band(dataset, band: int) -> None:
+    if band < 1 or band > dataset.count:
+        raise ValueError(f"Invalid band: {band}. The raster has {dataset.count} bands.")
+
+
+def read_window(
+    path: str,
+    geometries: Sequence[Any],
+    band: int = 1,
+    nodata: Optional[float] = None,
+    resolution: Optional[float] = None,
+    all_touched: bool = False,
+) -> RasterWindow:
+    """Read one band over the bounding window of ``geometries``.
+
+    Args:
+        path: Path of the raster
+        geometries: Shapely geometries, in the raster CRS
+        band: 1-based band index
+        nodata: No-data value. Defaults to the raster nodata
+        resolution: Target pixel size in raster units. When coarser than the
+            native resolution the window is read decimated, which GDAL serves
+            from overviews when the raster has them
+        all_touched: Include every pixel touched by the geometries
+
+    Returns:
+        The window data, the mask of pixels inside the geometries and the
+        window transform
+
+    Raises:
+        ValueError: If the band is invalid or the geometries do not overlap
+            the raster
+    """
+
+    dataset = open_raster(path)
+    _check_band(dataset, band)
+    try:
+        window = geometry_window(dataset, geometries)
+    except WindowError:
+        raise ValueError("Input shapes do not overlap raster.")
+
+    transform = dataset.window_transform(window)
+    height, width = int(window.height), int(window.width)
+    out_shape = None
+    if resolution:
+        native = min(abs(dataset.res[0]), abs(dataset.res[1]))
+        if resolution > native:
+            out_height = max(1, math.ceil(height * abs(dataset.res[1]) / resolution))
+            out_width = max(1, math.ceil(width * abs(dataset.res[0]) / resolution))
+            if (out_height, out_width) != (height, width):
+                out_shape = (out_height, out_width)
+                transform = transform * Affine.scale(
+                    width / out_width, height / out_height
+                )
+                height, width = out_shape
+
+    data = dataset.read(
+        band, window=window, out_shape=out_shape, resampling=Resampling.nearest
+    )
+    inside = geometry_mask(
+        geometries,
+        out_shape=(height, width),
+        transform=transform,
+        invert=True,
+        all_touched=all_touched,
+    )
+    return RasterWindow(
+        data=data,
+        inside=inside,
+        transform=transform,
+        nodata=dataset.nodata if nodata is None else nodata,
+    )
+
+
+def zonal_values(
+    path: str,
+    geometries: Sequence[Any],
+    band: int = 1,
+    nodata: Optional[float] = None,
+    all_touched: bool = False,
+) -> List[np.ndarray]:
+    """Return the valid pixels of each geometry, in one pass over the raster.
+
+    Rows covered by at least one geometry are read once, in chunks aligned on
+    the raster blocks, and each chunk is masked with the geometries crossing
+    it. Geometries outside the raster get an empty array.
+
+    Args:
+        path: Path of the raster
+        geometries: Shapely geometries, in the raster CRS
+        band: 1-based band index
+        nodata: No-data value. Defaults to the raster nodata
+        all_touched: Include every pixel touched by the geometries
+
+    Returns:
+        One array of valid values per geometry, in input order
+    """
+
+    dataset = open_raster(path)
+    _check_band(dataset, band)
+    if nodata is None:
+        nodata = dataset.nodata
+
+    windows: List[Optional[Window]] = []
+    for geometry in geometries:
+        try:
+            windows.append(geometry_window(dataset, [geometry]))
+        except (WindowError, ValueError):
+            windows.append(None)
+
+    values: List[List[np.ndarray]] = [[] for _ in geometries]
+    covered = [w for w in windows if w is not None]
+    if not covered:
+        return [np.empty(0, dtype=dataset.dtypes[band - 1]) for _ in geometries]
+
+    row_start = np.array([w.row_off if w else 0 for w in windows])
+    row_stop = np.array([w.row_off + w.height if w else 0 for w in windows])
+    col_start = min(int(w.col_off) for w in covered)
+    col_stop = max(int(w.col_off + w.width) for w in covered)
+    width = col_stop - col_start
+
+    block_height = dataset.block_shapes[band - 1][0]
+    chunk_rows = max(block_height, _ZONAL_CHUNK_PIXELS // max(width, 1))
+    chunk_rows -= chunk_rows % block_height
+    first_row = int(min(w.row_off for w in covered))
+    first_row -= first_row % block_height
+    last_row = int(max(w.row_off + w.height for w in covered))
+
+    for chunk_start in range(first_row, last_row, chunk_rows):
+        chunk_stop = min(chunk_start + chunk_rows, last_row)
+        hits = np.nonzero((row_start < chunk_stop) & (row_stop > chunk_start))[0]
+        if not len(hits):
+            continue
+
+        chunk = Window(col_start, chunk_start, width, chunk_stop - chunk_start)
+        data = dataset.read(band, window=chunk)
+        for index in hits:
+            window = windows[index]
+            top = max(int(window.row_off), chunk_start) - chunk_start
+            bottom = min(int(window.row_off + window.height), chunk_stop) - chunk_start
+            left = int(window.col_off) - col_start
+            right = left + int(window.width)
+            sub_window = Window(
+                col_start + left, chunk_start + top, right - left, bottom - top
+            )
+            inside = geometry_mask(
+                [geometries[index]],
+                out_shape=(bottom - top, right - left),
+                transform=dataset.window_transform(sub_window),
+                invert=True,
+                all_touched=all_touched,
+            )
+            selected = _valid(data[top:bottom, left:right][inside], nodata)
+            if len(selected):
+                values[index].append(selected)
+
+    dtype = dataset.dtypes[band - 1]
+    return [
+        np.concatenate(chunks) if chunks else np.empty(0, dtype=dtype)
+        for chunks in values
+    ]
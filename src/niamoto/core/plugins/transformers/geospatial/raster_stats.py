@@ -12,10 +12,13 @@ import numpy as np
 import os
 import logging
 import rasterio
-from rasterio.mask import mask
 
 from niamoto.core.plugins.models import PluginConfig, BasePluginParams
 from niamoto.core.plugins.base import TransformerPlugin, PluginType, register
+from niamoto.core.plugins.transformers.geospatial.raster_access import (
+    open_raster,
+    read_window,
+)
 from niamoto.common.exceptions import DataTransformError
 
 
@@ -102,6 +105,16 @@ class RasterStatsParams(BasePluginParams):
         json_schema_extra={"ui:widget": "number"},
     )
 
+    resolution: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description=(
+            "Pixel size (in raster units) to compute statistics at. Coarser "
+            "than the raster, it reads from overviews when available"
+        ),
+        json_schema_extra={"ui:widget": "number"},
+    )
+
     scale_factor: float = Field(
         default=1.0,
         description="Scale factor to apply to values",
@@ -272,44 +285,27 @@ class RasterStats(TransformerPlugin):
             Array of valid raster values
         """
         try:
-            with rasterio.open(raster_path) as src:
-                # Check the band
-                band = params["band"] - 1  # Convert to 0-based index
-                if band < 0 or band >= src.count:
-                    raise DataTransformError(
-                        f"Invalid band: {params['band']}. The raster has {src.count} bands.",
-                        details={"bands_available": src.count},
-                    )
-
-                nodata = params.get("nodata")
-                if nodata is None:
-                    nodata = src.nodata
-
-                # Mask the raster with the geometry
-                masked, mask_transform = mask(src, [geometry], crop=True, nodata=nodata)
-
-                # Get the raster data (specified band)
-                band_data = masked[band]
-
-                # Filter out nodata values
-                if nodata is not None:
-                    valid_data = band_data[band_data != nodata]
-                else:
-                    valid_data = band_data[~np.isnan(band_data)]
-
-                if len(valid_data) == 0:
-                    raise DataTransformError(
-                        "No valid data found in the raster for this shape",
-                        details={"raster_path": raster_path},
-                    )
-
-                # Apply scale factor and offset
-                scale_factor = params.get("scale_factor", 1.0)
-                offset = params.get("offset", 0.0)
-                if scale_factor != 1.0 or offset != 0.0:
-                    valid_data = valid_data * scale_factor + offset
-
-                return valid_data
+            # Pooled handle: the dataset stays open for the next entities
+            src = open_raster(raster_path)
+            self._check_band(src, params)
+
+            # Read only the requested band over the geometry window
+            window = read_window(
+                raster_path,
+                [geometry],
+                band=params["band"],
+                nodata=params.get("nodata"),
+                resolution=params.get("resolution"),
+            )
+            valid_data = window.valid_values()
+
+            if len(valid_data) == 0:
+                raise DataTransformError(
+                    "No valid data found in the raster for this shape",
+                    details={"raster_path": raster_path},
+                )
+
+            return self._apply_scaling(valid_data, params)
 
         except rasterio.errors.RasterioError as e:
             raise DataTransformError(
@@ -317,6 +313,22 @@ class RasterStats(TransformerPlugin):
                 details={"raster_path": raster_path},
             )
 
+    def _check_band(self, src, params: Dict[str, Any]) -> None:
+        """Raise if the configured band does not exist in the raster."""
+        if params["band"] < 1 or params["band"] > src.count:
+            raise DataTransformError(
+                f"Invalid band: {params['band']}. The raster has {src.count} bands.",
+                details={"bands_available": src.count},
+            )
+
+    def _apply_scaling(self, data: np.ndarray, params: Dict[str, Any]) -> np.ndarray:
+        """Apply the configured scale factor and offset."""
+        scale_factor = params.get("scale_factor", 1.0)
+        offset = params.get("offset", 0.0)
+        if scale_factor != 1.0 or offset != 0.0:
+            data = data * scale_factor + offset
+        return data
+
     def _calculate_statistics(
         self, data: np.ndarray, geometry, params: Dict[str, Any], geometry_crs=None
     ) -> Dict[str, Any]:
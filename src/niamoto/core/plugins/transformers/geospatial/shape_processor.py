@@ -14,6 +14,7 @@ import topojson as tp
 from niamoto.core.plugins.models import PluginConfig, BasePluginParams
 from niamoto.core.plugins.base import TransformerPlugin, PluginType, register
 from niamoto.common.database import Database
+from niamoto.core.plugins.transformers.geospatial.layer_cache import read_layer
 
 from shapely.ops import transform
 import pyproj
@@ -468,10 +469,13 @@ class ShapeProcessor(TransformerPlugin):
                 if not os.path.exists(layer_path):
                     raise ValueError(f"Geopackage not found: {layer_path}")
 
-            layer_gdf = gpd.read_file(layer_path, engine="pyogrio")
+            layer_gdf = read_layer(layer_path)
 
             if layer_config.get("clip", True):
                 layer_gdf = gpd.clip(layer_gdf, shape_gdf)
+            else:
+                # The cached layer is shared, simplify a private copy
+                layer_gdf = layer_gdf.copy()
 
             if layer_config.get("simplify", True):
                 layer_gdf.geometry = layer_gdf.geometry.apply(
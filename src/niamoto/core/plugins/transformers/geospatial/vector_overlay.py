@@ -23,6 +23,7 @@ from shapely.ops import unary_union
 from niamoto.core.plugins.models import PluginConfig, BasePluginParams
 from niamoto.core.plugins.base import TransformerPlugin, PluginType, register
 from niamoto.common.exceptions import DataTransformError
+from niamoto.core.plugins.transformers.geospatial.layer_cache import read_layer
 
 
 class VectorOverlayParams(BasePluginParams):
@@ -208,8 +209,8 @@ class VectorOverlay(TransformerPlugin):
                     main_gdf, params.get("area_unit", "ha")
                 )
 
-            # 3. Load the overlay layer
-            overlay_gdf = self._load_overlay_layer(params)
+            # 3. Load the overlay layer, reprojected to the main layer CRS
+            overlay_gdf = self._load_overlay_layer(params, crs=main_gdf.crs)
 
             # Ensure the CRS matches
             if main_gdf.crs != overlay_gdf.crs:
@@ -435,15 +436,18 @@ class VectorOverlay(TransformerPlugin):
             # On error, return the original GeoDataFrame
             return gdf
 
-    def _load_overlay_layer(self, params: Dict[str, Any]) -> gpd.GeoDataFrame:
+    def _load_overlay_layer(
+        self, params: Dict[str, Any], crs: Any = None
+    ) -> gpd.GeoDataFrame:
         """
-        Loads the overlay layer.
+        Loads the overlay layer through the shared layer cache.
 
         Args:
             params: Configuration parameters
+            crs: Optional CRS to reproject the layer to
 
         Returns:
-            GeoDataFrame of the overlay layer
+            GeoDataFrame of the overlay layer (shared, do not modify in place)
         """
         overlay_path = params.get("overlay_path")
         if not overlay_path:
@@ -455,17 +459,17 @@ class VectorOverlay(TransformerPlugin):
             # Resolve the path
             resolved_path = self._resolve_path(overlay_path)
 
-            # Load the layer
-            overlay_gdf = gpd.read_file(resolved_path, engine="pyogrio")
+            # Load the layer, applying a WHERE filter if specified
+            overlay_gdf = read_layer(
+                resolved_path,
+                crs=crs,
+                where=params.get("where"),
+                where_filter=self._apply_where_filter,
+            )
             self.logger.debug(
                 f"Loaded layer with {len(overlay_gdf)} entities, CRS: {overlay_gdf.crs}"
             )
 
-            # Apply a WHERE filter if specified
-            where_clause = params.get("where")
-            if where_clause:
-                overlay_gdf = self._apply_where_filter(overlay_gdf, where_clause)
-
             return overlay_gdf
 
         except Exception as e:
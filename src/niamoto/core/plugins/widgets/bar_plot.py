@@ -474,6 +474,8 @@ class BarPlotParams(BasePluginParams):
 class BarPlotWidget(WidgetPlugin):
     """Widget to display a bar plot using Plotly."""
 
+    reads_database = False
+
     param_schema = BarPlotParams  # Correct name for validation
 
     # Pattern matching: Declare compatible input data structures
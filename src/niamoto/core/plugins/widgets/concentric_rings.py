@@ -89,6 +89,8 @@ class ConcentricRingsParams(BasePluginParams):
 class ConcentricRingsWidget(WidgetPlugin):
     """Widget to display concentric rings for forest cover data."""
 
+    reads_database = False
+
     param_schema = ConcentricRingsParams
 
     def get_dependencies(self) -> set:
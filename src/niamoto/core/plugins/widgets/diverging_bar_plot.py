@@ -111,6 +111,8 @@ class DivergingBarPlotParams(BasePluginParams):
 class DivergingBarPlotWidget(WidgetPlugin):
     """Widget to display a diverging bar plot (horizontal or vertical) using Plotly."""
 
+    reads_database = False
+
     param_schema = DivergingBarPlotParams
 
     def get_dependencies(self) -> Set[str]:
@@ -158,6 +158,8 @@ class DonutChartParams(BasePluginParams):
 class DonutChartWidget(WidgetPlugin):
     """Widget to display a donut chart using Plotly."""
 
+    reads_database = False
+
     param_schema = DonutChartParams
 
     # Pattern matching: Declare compatible input data structures
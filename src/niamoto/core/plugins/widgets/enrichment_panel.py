@@ -108,6 +108,8 @@ class EnrichmentPanelParams(BasePluginParams):
 class EnrichmentPanelWidget(WidgetPlugin):
     """Render a compact, sectioned view of enriched reference metadata."""
 
+    reads_database = False
+
     param_schema = EnrichmentPanelParams
     compatible_structures = [
         {
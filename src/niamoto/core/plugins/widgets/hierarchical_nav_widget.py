@@ -126,6 +126,8 @@ class HierarchicalNavWidgetParams(BasePluginParams):
 class HierarchicalNavWidget(WidgetPlugin):
     """Interactive hierarchical navigation tree widget."""
 
+    reads_database = False
+
     param_schema = HierarchicalNavWidgetParams
 
     def get_dependencies(self) -> List[str]:
@@ -150,6 +150,8 @@ class InfoGridParams(BasePluginParams):
 class InfoGridWidget(WidgetPlugin):
     """Displays a grid of key information items (KPIs, stats, labels)."""
 
+    reads_database = False
+
     param_schema = InfoGridParams
 
     # Pattern matching: Declare compatible input data structures
@@ -245,6 +245,8 @@ class InteractiveMapParams(BasePluginParams):
 class InteractiveMapWidget(WidgetPlugin):
     """Widget to display an interactive map using Plotly Express."""
 
+    reads_database = False
+
     param_schema = InteractiveMapParams
 
     # Pattern matching: Declare compatible input data structures
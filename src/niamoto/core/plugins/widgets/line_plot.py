@@ -125,6 +125,8 @@ class LinePlotParams(BasePluginParams):
 class LinePlotWidget(WidgetPlugin):
     """Widget to display a line plot using Plotly."""
 
+    reads_database = False
+
     param_schema = LinePlotParams
 
     def get_dependencies(self) -> Set[str]:
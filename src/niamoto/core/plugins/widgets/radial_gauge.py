@@ -171,6 +171,8 @@ class RadialGaugeParams(BasePluginParams):
 class RadialGaugeWidget(WidgetPlugin):
     """Widget to display a radial gauge using Plotly."""
 
+    reads_database = False
+
     param_schema = RadialGaugeParams
 
     # Pattern matching: Declare compatible input data structures
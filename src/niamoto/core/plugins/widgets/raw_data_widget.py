@@ -67,6 +67,8 @@ class RawDataWidgetParams(BasePluginParams):
 class RawDataWidget(WidgetPlugin):
     """Widget to display raw data in an HTML table."""
 
+    reads_database = False
+
     param_schema = RawDataWidgetParams
 
     def get_dependencies(self) -> Set[str]:
@@ -129,6 +129,8 @@ class ScatterPlotParams(BasePluginParams):
 class ScatterPlotWidget(WidgetPlugin):
     """Widget to display a scatter plot using Plotly Express."""
 
+    reads_database = False
+
     param_schema = ScatterPlotParams
 
     # Pattern matching: Declare compatible input data structures
@@ -136,6 +136,8 @@ class StackedAreaPlotParams(BasePluginParams):
 class StackedAreaPlotWidget(WidgetPlugin):
     """Widget to display a stacked area chart using Plotly."""
 
+    reads_database = False
+
     param_schema = StackedAreaPlotParams
 
     def get_dependencies(self) -> Set[str]:
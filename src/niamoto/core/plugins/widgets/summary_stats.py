@@ -64,6 +64,8 @@ class SummaryStatsParams(BasePluginParams):
 class SummaryStatsWidget(WidgetPlugin):
     """Widget to display summary statistics of numeric columns in a DataFrame."""
 
+    reads_database = False
+
     param_schema = SummaryStatsParams
 
     def get_dependencies(self) -> Set[str]:
@@ -108,6 +108,8 @@ class SunburstChartWidgetParams(BasePluginParams):
 class SunburstChartWidget(WidgetPlugin):
     """Widget to display a sunburst chart using Plotly."""
 
+    reads_database = False
+
     param_schema = SunburstChartWidgetParams
 
     def get_dependencies(self) -> set:
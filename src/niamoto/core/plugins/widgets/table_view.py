@@ -130,6 +130,8 @@ class TableViewParams(BasePluginParams):
 class TableViewWidget(WidgetPlugin):
     """Widget to display a pandas DataFrame as an HTML table."""
 
+    reads_database = False
+
     param_schema = TableViewParams
 
     def get_dependencies(self) -> Set[str]:
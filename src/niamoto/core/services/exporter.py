@@ -8,6 +8,7 @@ loads the necessary exporter and widget plugins, retrieves transformed data,
 and orchestrates the execution of export plugins to generate output files.
 """
 
+import inspect
 import logging
 from datetime import datetime
 from typing import Optional, Dict, Any
@@ -128,10 +129,19 @@ class ExporterService:
         self,
         target_name: Optional[str] = None,
         group_filter: Optional[str] = None,
+        workers: int = 1,
+        incremental: bool = False,
     ) -> Dict[str, Dict[str, Any]]:
         """
         Executes the specified export target or all enabled targets.
 
+        Args:
+            target_name: Only run this target
+            group_filter: Only export this group
+            workers: Worker processes used by exporters that support them
+            incremental: Only rewrite the pages whose inputs changed, for
+                exporters that support it
+
         Returns:
             Dict mapping target names to their export results.
         """
@@ -213,6 +223,22 @@ class ExporterService:
                     "repository": self.db,
                     "group_filter": group_filter,
                 }
+                # Optional features are only passed to exporters accepting them
+                export_params = inspect.signature(exporter_instance.export).parameters
+                if workers > 1:
+                    if "workers" in export_params:
+                        export_kwargs["workers"] = workers
+                    else:
+                        logger.info(
+                            f"Exporter '{target.exporter}' runs in a single process"
+                        )
+                if incremental:
+                    if "incremental" in export_params:
+                        export_kwargs["incremental"] = True
+                    else:
+                        logger.info(
+                            f"Exporter '{target.exporter}' always runs a full export"
+                        )
 
                 exporter_instance.export(**export_kwargs)
 
@@ -227,6 +253,9 @@ class ExporterService:
                             "output_path": stats.get("output_path"),
                         }
                     )
+                    for key in ("pages_rendered", "pages_skipped", "pages_removed"):
+                        if key in stats:
+                            target_result[key] = stats[key]
 
                 if target_result.get("errors", 0) > 0:
                     target_result["status"] = "error"
@@ -0,0 +1,203 @@
+"""Fingerprints of transform inputs used by incremental transforms."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Mapping
+
+import numpy as np
+import pandas as pd
+
+from niamoto.common.database import Database
+from niamoto.common.exceptions import DatabaseQueryError
+
+
+def hash_widget_config(widget_config: Mapping[str, Any]) -> str:
+    """Return a stable hash of one widget configuration."""
+
+    payload = json.dumps(widget_config, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def entity_key(group_id: Any) -> str:
+    """Return the key of an entity in stored fingerprints.
+
+    Group ids are integers or text depending on the group, so fingerprints
+    are stored and looked up by the text form of the id.
+    """
+
+    return str(group_id)
+
+
+def _hash_frame_rows(frame: pd.DataFrame) -> np.ndarray:
+    """Return one uint64 hash per row of ``frame``."""
+
+    try:
+        return pd.util.hash_pandas_object(frame, index=False).to_numpy()
+    except TypeError:
+        # Unhashable cells (lists, dicts, geometries): hash their text form.
+        return pd.util.hash_pandas_object(frame.astype(str), index=False).to_numpy()
+
+
+def hash_group_data(group_data: Mapping[str, Any]) -> str:
+    """Return a content hash of the data loaded for one entity.
+
+    Row hashes are sorted before being combined, so the hash does not depend
+    on the order in which a loader returns rows.
+    """
+
+    digest = hashlib.sha256()
+    for source_name in sorted(group_data, key=str):
+        value = group_data[source_name]
+        digest.update(str(source_name).encode("utf-8"))
+        if isinstance(value, pd.DataFrame):
+            schema = [(str(col), str(dtype)) for col, dtype in value.dtypes.items()]
+            digest.update(json.dumps(schema).encode("utf-8"))
+            digest.update(np.sort(_hash_frame_rows(value)).tobytes())
+        else:
+            digest.update(repr(value).encode("utf-8"))
+    return digest.hexdigest()
+
+
+@dataclass
+class EntityFingerprint:
+    """Inputs a stored entity row was computed from."""
+
+    input_hash: str
+    widgets: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class IncrementalTransformPlan:
+    """Decide which widgets of an entity need recomputing.
+
+    ``previous`` holds the fingerprints of the last successful run, keyed by
+    the text form of the entity ids, and ``widget_hashes`` the hashes of the
+    current widget configurations.
+    """
+
+    widget_hashes: Dict[str, str]
+    previous: Dict[str, EntityFingerprint] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self.previous = {
+            entity_key(group_id): fingerprint
+            for group_id, fingerprint in self.previous.items()
+        }
+
+    def subset(self, group_ids: Iterable[Any]) -> "IncrementalTransformPlan":
+        """Return a plan restricted to ``group_ids`` (sent to worker processes)."""
+
+        keys = (entity_key(group_id) for group_id in group_ids)
+        return IncrementalTransformPlan(
+            widget_hashes=self.widget_hashes,
+            previous={key: self.previous[key] for key in keys if key in self.previous},
+        )
+
+    def stale_widgets(self, group_id: Any, input_hash: str) -> List[str]:
+        """Return the widgets of ``group_id`` whose stored result is out of date."""
+
+        previous = self.previous.get(entity_key(group_id))
+        if previous is None or previous.input_hash != input_hash:
+            return list(self.widget_hashes)
+        return [
+            widget_name
+            for widget_name, config_hash in self.widget_hashes.items()
+            if previous.widgets.get(widget_name) != config_hash
+        ]
+
+    def fingerprint(
+        self, input_hash: str, failed_widgets: Iterable[str] = ()
+    ) -> EntityFingerprint:
+        """Return the fingerprint to store for an entity processed now.
+
+        Failed widgets are left out so that the next run retries them.
+        """
+
+        failed = set(failed_widgets)
+        return EntityFingerprint(
+            input_hash=input_hash,
+            widgets={
+                widget_name: config_hash
+                for widget_name, config_hash in self.widget_hashes.items()
+                if widget_name not in failed
+            },
+        )
+
+
+class TransformFingerprintStore:
+    """Persist per-entity transform fingerprints in a sidecar table."""
+
+    FINGERPRINTS_TABLE = "niamoto_metadata_transform_fingerprints"
+
+    def __init__(self, db: Database) -> None:
+        self.db = db
+        self._ensure_tables()
+
+    def load(self, group_by: str) -> Dict[str, EntityFingerprint]:
+        """Return the stored fingerprints of every entity of a group, by key."""
+
+        sql = f"""
+            SELECT entity_id, input_hash, widgets
+            FROM {self.FINGERPRINTS_TABLE}
+            WHERE group_by = :group_by
+        """
+        try:
+            rows = self.db.execute_sql(sql, {"group_by": group_by}, fetch_all=True)
+        except DatabaseQueryError:
+            return {}
+
+        fingerprints: Dict[str, EntityFingerprint] = {}
+        for entity_id, input_hash, widgets in rows or []:
+            try:
+                widget_hashes = json.loads(widgets) if widgets else {}
+            except (json.JSONDecodeError, TypeError):
+                # A corrupted row only forces that entity to be recomputed.
+                widget_hashes = {}
+            fingerprints[entity_id] = EntityFingerprint(
+                input_hash=input_hash, widgets=widget_hashes
+            )
+        return fingerprints
+
+    def replace(
+        self, group_by: str, fingerprints: Mapping[Any, EntityFingerprint]
+    ) -> None:
+        """Replace the stored fingerprints of a group."""
+
+        self.db.execute_sql(
+            f"DELETE FROM {self.FINGERPRINTS_TABLE} WHERE group_by = :group_by",
+            {"group_by": group_by},
+        )
+        if not fingerprints:
+            return
+
+        frame = pd.DataFrame(
+            {
+                "group_by": group_by,
+                "entity_id": [entity_key(group_id) for group_id in fingerprints],
+                "input_hash": [fp.input_hash for fp in fingerprints.values()],
+                "widgets": [
+                    json.dumps(fp.widgets, sort_keys=True)
+                    for fp in fingerprints.values()
+                ],
+            }
+        )
+        frame.to_sql(
+            self.FINGERPRINTS_TABLE, self.db.engine, if_exists="append", index=False
+        )
+
+    def _ensure_tables(self) -> None:
+        create_fingerprints = f"""
+            CREATE TABLE IF NOT EXISTS {self.FINGERPRINTS_TABLE} (
+                group_by TEXT NOT NULL,
+                entity_id TEXT NOT NULL,
+                input_hash TEXT NOT NULL,
+                widgets TEXT NOT NULL,
+                PRIMARY KEY (group_by, entity_id)
+            )
+        """
+        if getattr(self.db, "read_only", False):
+            return
+        self.db.execute_sql(create_fingerprints)
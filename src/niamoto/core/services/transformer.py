@@ -1,8 +1,13 @@
 """Service for transforming data based on YAML configuration."""
 
-from typing import Dict, Any, List, Optional, Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import repeat
+from typing import Dict, Any, Iterator, List, Optional, Callable, Set, Tuple
 import logging
 import json
+import math
+import multiprocessing
 from pathlib import Path
 import re
 import numpy as np
@@ -26,9 +31,16 @@ from niamoto.common.utils import error_handler
 from niamoto.common.utils.emoji import emoji
 from niamoto.core.plugins.plugin_loader import PluginLoader
 from niamoto.core.plugins.registry import PluginRegistry
-from niamoto.core.plugins.base import PluginType
+from niamoto.core.plugins.base import LoaderPlugin, PluginType
 from niamoto.core.imports.registry import EntityRegistry
 from niamoto.common.transform_config_models import TransformGroupConfig
+from niamoto.core.services.transform_fingerprints import (
+    EntityFingerprint,
+    IncrementalTransformPlan,
+    TransformFingerprintStore,
+    hash_group_data,
+    hash_widget_config,
+)
 from niamoto.common.table_resolver import quote_identifier
 
 # Check if we're in CLI context for progress display
@@ -49,6 +61,61 @@ _SAFE_SQL_IDENTIFIER_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
 # Backward compatibility toggle expected by tests and legacy code
 CLI_CONTEXT = CLI_DETECTED
 
+# Number of entity chunks scheduled per worker process. Several small chunks
+# per worker keep the pool balanced when some entities (root taxa, large
+# plots) are much more expensive than others.
+_PARALLEL_CHUNKS_PER_WORKER = 4
+
+
+@dataclass
+class _WidgetExecution:
+    """Transformer instance and validation state of one widget during a run.
+
+    Built on the first entity of a widget, so later entities reuse the
+    plugin instance and skip the service's configuration check as long as
+    the set of available sources is one that was already validated. The
+    plugin's own ``transform`` still validates the config it receives: a
+    validated model costs a few microseconds, less than the deep copy a
+    shared one would need, since plugins may modify it.
+    """
+
+    widget_config: Dict[str, Any]
+    plugin_class: Any
+    transformer: Optional[Any]
+    validated_sources: Set[Tuple[str, ...]] = field(default_factory=set)
+
+
+# Per-process service used by transform worker processes.
+_worker_service: Optional["TransformerService"] = None
+
+
+def _init_transform_worker(db_path: str, config_dir: str) -> None:
+    """Initialize the transformer service owned by one worker process."""
+
+    global _worker_service
+    db = Database(db_path, read_only=True)
+    _worker_service = TransformerService.for_preview(db, config_dir)
+
+
+def _compute_entity_chunk(
+    group_config: Dict[str, Any],
+    group_ids: List[Any],
+    csv_file: Optional[str],
+    plan: Optional[IncrementalTransformPlan] = None,
+) -> List[Dict[str, Any]]:
+    """Compute widget results for a chunk of entities inside a worker process."""
+
+    if _worker_service is None:
+        raise ProcessError("Transform worker used before initialization")
+    return [
+        _worker_service._compute_entity_results(
+            group_config, group_id, csv_file, group_data=group_data, plan=plan
+        )
+        for group_id, group_data in _worker_service._iter_group_data(
+            group_config, csv_file, group_ids
+        )
+    ]
+
 
 class TransformerService:
     """Service for transforming data based on YAML configuration."""
@@ -77,6 +144,8 @@ class TransformerService:
         self.use_cli_integration = bool(enable_cli_integration)
         self._table_buffers: Dict[str, Dict[int, Dict[str, Any]]] = {}
         self._table_flush_modes: Dict[str, bool] = {}
+        self._widget_executions: Dict[Tuple[str, str], _WidgetExecution] = {}
+        self._source_table_hashes: Dict[str, Optional[str]] = {}
 
         # Initialize plugin loader and load plugins with cascade resolution
         self.plugin_loader = PluginLoader()
@@ -106,6 +175,8 @@ class TransformerService:
         svc.use_cli_integration = False
         svc._table_buffers: Dict[str, Dict[int, Dict[str, Any]]] = {}
         svc._table_flush_modes: Dict[str, bool] = {}
+        svc._widget_executions: Dict[Tuple[str, str], _WidgetExecution] = {}
+        svc._source_table_hashes: Dict[str, Optional[str]] = {}
 
         svc.plugin_loader = PluginLoader()
         svc.plugin_loader.load_plugins_with_cascade(Path(config_dir).parent)
@@ -260,10 +331,12 @@ class TransformerService:
         if widget_config["plugin"] == "hierarchical_nav_widget":
             return None
 
-        transformer = PluginRegistry.get_plugin(
-            widget_config["plugin"], PluginType.TRANSFORMER
-        )(self.db, registry=self.entity_registry)
-        self._bind_plugin_runtime_config(transformer)
+        execution = self._get_widget_execution(
+            group_by_name, widget_name, widget_config
+        )
+        transformer = execution.transformer or self._create_transformer(
+            execution.plugin_class
+        )
         data_to_pass, available_sources = self._resolve_widget_input(
             group_by_name, group_data, widget_config, group_id
         )
@@ -271,24 +344,84 @@ class TransformerService:
             widget_config, group_id, available_sources
         )
 
-        self._validate_plugin_configuration(
-            transformer, config, widget_config["plugin"]
-        )
+        # Only the group_id changes between entities of a widget, so the
+        # configuration is validated once per set of available sources
+        sources_key = tuple(available_sources)
+        if sources_key not in execution.validated_sources:
+            self._validate_plugin_configuration(
+                transformer, config, widget_config["plugin"]
+            )
+            execution.validated_sources.add(sources_key)
         return transformer.transform(data_to_pass, config)
 
+    def _get_widget_execution(
+        self, group_by_name: str, widget_name: str, widget_config: Dict[str, Any]
+    ) -> _WidgetExecution:
+        """Return the execution state of a widget, built on first use.
+
+        The state is rebuilt when the widget configuration object changes,
+        e.g. between preview requests.
+        """
+        key = (group_by_name, widget_name)
+        execution = self._widget_executions.get(key)
+        if execution is None or execution.widget_config is not widget_config:
+            plugin_class = PluginRegistry.get_plugin(
+                widget_config["plugin"], PluginType.TRANSFORMER
+            )
+            execution = _WidgetExecution(
+                widget_config=widget_config,
+                plugin_class=plugin_class,
+                transformer=(
+                    self._create_transformer(plugin_class)
+                    if getattr(plugin_class, "reentrant", True)
+                    else None
+                ),
+            )
+            self._widget_executions[key] = execution
+        return execution
+
+    def _create_transformer(self, plugin_class: Any) -> Any:
+        """Instantiate a transformer plugin bound to the project config."""
+        transformer = plugin_class(self.db, registry=self.entity_registry)
+        self._bind_plugin_runtime_config(transformer)
+        return transformer
+
     def _compute_entity_results(
         self,
         group_config: Dict[str, Any],
         group_id: Any,
         csv_file: Optional[str] = None,
+        group_data: Optional[Dict[str, pd.DataFrame]] = None,
+        plan: Optional[IncrementalTransformPlan] = None,
     ) -> Dict[str, Any]:
-        """Compute all widget results for one entity without writing to the DB."""
+        """Compute all widget results for one entity without writing to the DB.
+
+        ``group_data`` can be supplied when the caller already loaded the
+        entity's sources, e.g. from the ``_iter_group_data`` stream. With an
+        incremental ``plan``, only the widgets whose inputs or configuration
+        changed are computed, and recomputed widgets without a result are
+        reported as ``None`` so that their stored value is cleared.
+        """
 
         widgets_config = group_config.get("widgets_data", {})
         group_by_name = group_config.get("group_by", "unknown")
-        group_data = self._get_group_data(group_config, csv_file, group_id)
+        if group_data is None:
+            group_data = self._get_group_data(group_config, csv_file, group_id)
+
+        input_hash = None
+        if plan is not None:
+            input_hash = self._fingerprint_group_data(
+                group_by_name, group_data, widgets_config, group_id
+            )
+            stale_widgets = set(plan.stale_widgets(group_id, input_hash))
+            widgets_config = {
+                name: config
+                for name, config in widgets_config.items()
+                if name in stale_widgets
+            }
 
         widget_results: Dict[str, Any] = {}
+        failed_widgets: List[str] = []
         warnings: List[str] = []
 
         for widget_name, widget_config in widgets_config.items():
@@ -298,6 +431,8 @@ class TransformerService:
                 )
                 if widget_result:
                     widget_results[widget_name] = widget_result
+                elif plan is not None:
+                    widget_results[widget_name] = None
             except Exception as exc:
                 error_msg = (
                     f"Error processing widget '{widget_name}' for "
@@ -305,13 +440,66 @@ class TransformerService:
                 )
                 if "No data found" not in str(exc):
                     warnings.append(error_msg)
+                    failed_widgets.append(widget_name)
+                if plan is not None:
+                    widget_results[widget_name] = None
 
         return {
             "group_id": group_id,
             "results": widget_results,
             "warnings": warnings,
+            "input_hash": input_hash,
+            "failed_widgets": failed_widgets,
         }
 
+    def _fingerprint_group_data(
+        self,
+        group_by_name: str,
+        group_data: Any,
+        widgets_config: Dict[str, Any],
+        group_id: Any,
+    ) -> str:
+        """Hash the inputs of one entity, including sources requested by widgets.
+
+        The group sources loaded for the entity are hashed row by row. Widget
+        sources outside them (the grouping entity, additional tables) are
+        covered by a hash of their whole table, computed once per run rather
+        than loaded for every entity: a change to such a table recomputes the
+        widgets of every entity.
+        """
+
+        if not isinstance(group_data, dict):
+            return hash_group_data({"data": group_data})
+
+        inputs = dict(group_data)
+        for widget_config in widgets_config.values():
+            if widget_config.get("plugin") == "hierarchical_nav_widget":
+                continue
+            source = widget_config.get("source") or widget_config.get(
+                "params", {}
+            ).get("source")
+            if source and source not in group_data:
+                inputs[f"table:{source}"] = self._hash_source_table(source)
+        return hash_group_data(inputs)
+
+    def _hash_source_table(self, source_name: str) -> Optional[str]:
+        """Return the content hash of a whole source table, once per run.
+
+        A table that fails to load hashes to None; the widget reports the
+        error when it runs.
+        """
+
+        if source_name not in self._source_table_hashes:
+            try:
+                table = self._load_additional_source(source_name)
+                self._source_table_hashes[source_name] = hash_group_data(
+                    {source_name: table}
+                )
+            except Exception as exc:
+                logger.debug("Source '%s' not fingerprinted: %s", source_name, exc)
+                self._source_table_hashes[source_name] = None
+        return self._source_table_hashes[source_name]
+
     def _record_transform_warning(
         self, error_msg: str, progress_manager: Any | None = None
     ) -> None:
@@ -348,7 +536,10 @@ class TransformerService:
         )
 
         generated = 0
-        for widget_name in widget_results:
+        for widget_name, widget_result in widget_results.items():
+            if widget_result is None:
+                # Cleared by an incremental run, not a generated widget
+                continue
             if widget_name not in group_results["widgets"]:
                 group_results["widgets"][widget_name] = 0
             group_results["widgets"][widget_name] += 1
@@ -363,6 +554,8 @@ class TransformerService:
         csv_file: Optional[str] = None,
         recreate_table: bool = True,
         progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        workers: int = 1,
+        incremental: bool = False,
     ) -> Dict[str, Any]:
         """
         Transform data according to the configuration.
@@ -371,6 +564,14 @@ class TransformerService:
             group_by: Optional filter by group
             csv_file: Optional CSV file to use instead of the database
             recreate_table: Indicates whether to recreate the results table
+            progress_callback: Optional callback receiving per-widget progress
+            workers: Number of worker processes used to compute entities.
+                ``1`` keeps the sequential in-process execution.
+            incremental: Only recompute entities whose loaded data or widget
+                configuration changed since the last incremental run, and
+                upsert their rows into the existing tables. A group is
+                rebuilt when its table is missing or its widget list changed.
+                ``recreate_table`` is ignored in this mode.
 
         Returns:
             Dict[str, Any]: Results of the transformation with metrics data
@@ -381,6 +582,8 @@ class TransformerService:
         """
         self._table_buffers = {}
         self._table_flush_modes = {}
+        self._widget_executions = {}
+        self._source_table_hashes = {}
         # Initialize metrics collection
         if self.use_cli_integration and OperationMetrics:
             self.transform_metrics = OperationMetrics("transform")
@@ -398,12 +601,23 @@ class TransformerService:
                 progress_manager = ProgressManager(self.console)
                 with progress_manager.progress_context() as pm:
                     results = self._process_configs_with_progress(
-                        configs, csv_file, recreate_table, pm, progress_callback
+                        configs,
+                        csv_file,
+                        recreate_table,
+                        pm,
+                        progress_callback,
+                        workers=workers,
+                        incremental=incremental,
                     )
             else:
                 # Fallback to simple processing without progress bars
                 results = self._process_configs_simple(
-                    configs, csv_file, recreate_table, progress_callback
+                    configs,
+                    csv_file,
+                    recreate_table,
+                    progress_callback,
+                    workers=workers,
+                    incremental=incremental,
                 )
             transform_succeeded = True
         except Exception as e:
@@ -434,6 +648,8 @@ class TransformerService:
         recreate_table,
         progress_manager,
         progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        workers: int = 1,
+        incremental: bool = False,
     ):
         """Process configurations with progress display using ProgressManager only."""
         results = {}
@@ -463,8 +679,13 @@ class TransformerService:
                 task_name, f"Processing {group_by_name} data", total=total_ops
             )
 
-            # Create or update the table
-            self._create_group_table(group_by_name, widgets_config, recreate_table)
+            # Decide what an incremental run must recompute, then create or
+            # update the table
+            plan, group_recreate = self._prepare_incremental_group(
+                group_by_name, widgets_config, group_ids, recreate_table, incremental
+            )
+            self._create_group_table(group_by_name, widgets_config, group_recreate)
+            fingerprints: Dict[Any, EntityFingerprint] = {}
 
             # Initialize metrics for this group
             if self.transform_metrics:
@@ -482,64 +703,111 @@ class TransformerService:
                 "total_items": len(group_ids),
                 "widgets": {},
                 "start_time": progress_manager._start_time,
+                "unchanged_items": 0,
             }
 
             # Process each group
-            for group_id in group_ids:
-                # Retrieve group data
-                group_data = self._get_group_data(group_config, csv_file, group_id)
-
-                # Process each widget
-                for widget_name, widget_config in widgets_config.items():
-                    # Update description for current item being processed
+            if plan is not None or self._should_run_parallel(
+                workers, group_config, group_ids
+            ):
+                for entity_result in self._iter_entity_results(
+                    group_config, group_ids, csv_file, workers, plan
+                ):
+                    group_id = entity_result["group_id"]
+                    if plan is not None:
+                        fingerprints[group_id] = plan.fingerprint(
+                            entity_result["input_hash"],
+                            entity_result["failed_widgets"],
+                        )
+                        if not entity_result["results"]:
+                            results[group_by_name]["unchanged_items"] += 1
                     progress_manager.update_task(
                         task_name,
                         advance=0,
                         description=f"[green] Processing {group_by_name} {group_id}",
                     )
-
-                    try:
-                        widget_results = self._execute_widget_transform(
-                            group_by_name,
-                            group_data,
-                            group_id,
-                            widget_name,
-                            widget_config,
+                    widgets_generated += self._apply_entity_results(
+                        group_by_name, entity_result, results[group_by_name]
+                    )
+                    for error_msg in entity_result["warnings"]:
+                        self._record_transform_warning(error_msg, progress_manager)
+
+                    for widget_name in widgets_config:
+                        progress_manager.update_task(task_name, advance=1)
+                        if progress_callback:
+                            progress_callback(
+                                {
+                                    "group": group_by_name,
+                                    "widget": widget_name,
+                                    "item_label": id_name_map.get(
+                                        group_id, str(group_id)
+                                    ),
+                                    "processed": None,
+                                    "total": None,
+                                }
+                            )
+            else:
+                # Stream group data for every entity of the group
+                for group_id, group_data in self._iter_group_data(
+                    group_config, csv_file, group_ids
+                ):
+                    # Process each widget
+                    for widget_name, widget_config in widgets_config.items():
+                        # Update description for current item being processed
+                        progress_manager.update_task(
+                            task_name,
+                            advance=0,
+                            description=f"[green] Processing {group_by_name} {group_id}",
                         )
 
-                        # Save the results
-                        if widget_results:
-                            self._save_widget_results(
-                                group_by=group_by_name,
-                                group_id=group_id,
-                                results={widget_name: widget_results},
+                        try:
+                            widget_results = self._execute_widget_transform(
+                                group_by_name,
+                                group_data,
+                                group_id,
+                                widget_name,
+                                widget_config,
                             )
-                            widgets_generated += 1
-
-                            # Track widget results
-                            if widget_name not in results[group_by_name]["widgets"]:
-                                results[group_by_name]["widgets"][widget_name] = 0
-                            results[group_by_name]["widgets"][widget_name] += 1
-                    except Exception as e:
-                        # Log the error but continue processing other widgets
-                        error_msg = f"Error processing widget '{widget_name}' for {group_by_name} {group_id}: {str(e)}"
-                        # Only display in progress manager if it's not an expected empty data case
-                        if "No data found" not in str(e):
-                            self._record_transform_warning(error_msg, progress_manager)
-
-                    # Update progress
-                    progress_manager.update_task(task_name, advance=1)
-                    if progress_callback:
-                        progress_callback(
-                            {
-                                "group": group_by_name,
-                                "widget": widget_name,
-                                "item_label": id_name_map.get(group_id, str(group_id)),
-                                "processed": None,
-                                "total": None,
-                            }
-                        )
-            self._flush_group_table(group_by_name, recreate_table)
+
+                            # Save the results
+                            if widget_results:
+                                self._save_widget_results(
+                                    group_by=group_by_name,
+                                    group_id=group_id,
+                                    results={widget_name: widget_results},
+                                )
+                                widgets_generated += 1
+
+                                # Track widget results
+                                if widget_name not in results[group_by_name]["widgets"]:
+                                    results[group_by_name]["widgets"][widget_name] = 0
+                                results[group_by_name]["widgets"][widget_name] += 1
+                        except Exception as e:
+                            # Log the error but continue processing other widgets
+                            error_msg = f"Error processing widget '{widget_name}' for {group_by_name} {group_id}: {str(e)}"
+                            # Only display in progress manager if it's not an expected empty data case
+                            if "No data found" not in str(e):
+                                self._record_transform_warning(
+                                    error_msg, progress_manager
+                                )
+
+                        # Update progress
+                        progress_manager.update_task(task_name, advance=1)
+                        if progress_callback:
+                            progress_callback(
+                                {
+                                    "group": group_by_name,
+                                    "widget": widget_name,
+                                    "item_label": id_name_map.get(
+                                        group_id, str(group_id)
+                                    ),
+                                    "processed": None,
+                                    "total": None,
+                                }
+                            )
+            self._flush_group_table(group_by_name, group_recreate)
+            if plan is not None:
+                TransformFingerprintStore(self.db).replace(group_by_name, fingerprints)
 
             # Update final widget count for this group
             if self.transform_metrics:
@@ -565,6 +833,8 @@ class TransformerService:
         csv_file,
         recreate_table,
         progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        workers: int = 1,
+        incremental: bool = False,
     ):
         """Process configurations without progress display (fallback)."""
         results = {}
@@ -595,8 +865,13 @@ class TransformerService:
             if progress_callback:
                 id_name_map_simple = self._load_group_names(group_config, group_ids)
 
-            # Create or update the table
-            self._create_group_table(group_by_name, widgets_config, recreate_table)
+            # Decide what an incremental run must recompute, then create or
+            # update the table
+            plan, group_recreate = self._prepare_incremental_group(
+                group_by_name, widgets_config, group_ids, recreate_table, incremental
+            )
+            self._create_group_table(group_by_name, widgets_config, group_recreate)
+            fingerprints: Dict[Any, EntityFingerprint] = {}
 
             # Initialize results for this group
             widgets_generated = 0
@@ -604,58 +879,96 @@ class TransformerService:
                 "total_items": len(group_ids),
                 "widgets": {},
                 "start_time": start_time,
+                "unchanged_items": 0,
             }
 
             # Process each group
-            for group_id in group_ids:
-                # Retrieve group data
-                group_data = self._get_group_data(group_config, csv_file, group_id)
-
-                # Process each widget
-                for widget_name, widget_config in widgets_config.items():
-                    try:
-                        widget_results = self._execute_widget_transform(
-                            group_by_name,
-                            group_data,
-                            group_id,
-                            widget_name,
-                            widget_config,
+            if plan is not None or self._should_run_parallel(
+                workers, group_config, group_ids
+            ):
+                for entity_result in self._iter_entity_results(
+                    group_config, group_ids, csv_file, workers, plan
+                ):
+                    group_id = entity_result["group_id"]
+                    if plan is not None:
+                        fingerprints[group_id] = plan.fingerprint(
+                            entity_result["input_hash"],
+                            entity_result["failed_widgets"],
                         )
+                        if not entity_result["results"]:
+                            results[group_by_name]["unchanged_items"] += 1
+                    widgets_generated += self._apply_entity_results(
+                        group_by_name, entity_result, results[group_by_name]
+                    )
+                    for error_msg in entity_result["warnings"]:
+                        self._record_transform_warning(error_msg)
+
+                    for widget_name in widgets_config:
+                        processed_ops += 1
+                        if progress_callback and total_ops:
+                            progress_callback(
+                                {
+                                    "group": group_by_name,
+                                    "widget": widget_name,
+                                    "item_label": id_name_map_simple.get(
+                                        group_id, str(group_id)
+                                    ),
+                                    "processed": processed_ops,
+                                    "total": total_ops,
+                                }
+                            )
+            else:
+                # Stream group data for every entity of the group
+                for group_id, group_data in self._iter_group_data(
+                    group_config, csv_file, group_ids
+                ):
+                    # Process each widget
+                    for widget_name, widget_config in widgets_config.items():
+                        try:
+                            widget_results = self._execute_widget_transform(
+                                group_by_name,
+                                group_data,
+                                group_id,
+                                widget_name,
+                                widget_config,
+                            )
 
-                        # Save the results
-                        if widget_results:
-                            self._save_widget_results(
-                                group_by=group_by_name,
-                                group_id=group_id,
-                                results={widget_name: widget_results},
+                            # Save the results
+                            if widget_results:
+                                self._save_widget_results(
+                                    group_by=group_by_name,
+                                    group_id=group_id,
+                                    results={widget_name: widget_results},
+                                )
+                                widgets_generated += 1
+
+                                # Track widget results
+                                if widget_name not in results[group_by_name]["widgets"]:
+                                    results[group_by_name]["widgets"][widget_name] = 0
+                                results[group_by_name]["widgets"][widget_name] += 1
+                        except Exception as e:
+                            # Log the error but continue processing other widgets
+                            error_msg = f"Error processing widget '{widget_name}' for {group_by_name} {group_id}: {str(e)}"
+                            # Only log if it's not an expected empty data case
+                            if "No data found" not in str(e):
+                                self._record_transform_warning(error_msg)
+
+                        processed_ops += 1
+                        if progress_callback and total_ops:
+                            progress_callback(
+                                {
+                                    "group": group_by_name,
+                                    "widget": widget_name,
+                                    "item_label": id_name_map_simple.get(
+                                        group_id, str(group_id)
+                                    ),
+                                    "processed": processed_ops,
+                                    "total": total_ops,
+                                }
                             )
-                            widgets_generated += 1
-
-                            # Track widget results
-                            if widget_name not in results[group_by_name]["widgets"]:
-                                results[group_by_name]["widgets"][widget_name] = 0
-                            results[group_by_name]["widgets"][widget_name] += 1
-                    except Exception as e:
-                        # Log the error but continue processing other widgets
-                        error_msg = f"Error processing widget '{widget_name}' for {group_by_name} {group_id}: {str(e)}"
-                        # Only log if it's not an expected empty data case
-                        if "No data found" not in str(e):
-                            self._record_transform_warning(error_msg)
-
-                    processed_ops += 1
-                    if progress_callback and total_ops:
-                        progress_callback(
-                            {
-                                "group": group_by_name,
-                                "widget": widget_name,
-                                "item_label": id_name_map_simple.get(
-                                    group_id, str(group_id)
-                                ),
-                                "processed": processed_ops,
-                                "total": total_ops,
-                            }
-                        )
-            self._flush_group_table(group_by_name, recreate_table)
+            self._flush_group_table(group_by_name, group_recreate)
+            if plan is not None:
+                TransformFingerprintStore(self.db).replace(group_by_name, fingerprints)
 
             # Update results with final metrics
             results[group_by_name]["widgets_generated"] = widgets_generated
@@ -663,6 +976,152 @@ class TransformerService:
 
         return results
 
+    def _should_run_parallel(
+        self, workers: int, group_config: Dict[str, Any], group_ids: List[Any]
+    ) -> bool:
+        """Return whether entities of a group should be computed in worker processes."""
+
+        if workers <= 1 or len(group_ids) < 2:
+            return False
+        if not isinstance(getattr(self.config, "config_dir", None), (str, Path)):
+            logger.debug(
+                "Parallel transform disabled for '%s': no config directory to "
+                "share with worker processes",
+                group_config.get("group_by", "unknown"),
+            )
+            return False
+        return True
+
+    def _prepare_incremental_group(
+        self,
+        group_by_name: str,
+        widgets_config: Dict[str, Any],
+        group_ids: List[Any],
+        recreate_table: bool,
+        incremental: bool,
+    ) -> tuple[Optional[IncrementalTransformPlan], bool]:
+        """Return the incremental plan of a group and whether to recreate its table.
+
+        Incremental runs upsert into the existing table, except when the table
+        is missing, its widget columns no longer match the configuration, or
+        no fingerprints were stored yet: the group is then rebuilt from
+        scratch. Rows of entities that no longer exist are deleted.
+        """
+
+        if not incremental:
+            return None, recreate_table
+
+        plan = IncrementalTransformPlan(
+            widget_hashes={
+                widget_name: hash_widget_config(widget_config)
+                for widget_name, widget_config in widgets_config.items()
+            }
+        )
+        if not self.db.has_table(group_by_name):
+            return plan, True
+
+        id_column = f"{group_by_name}_id"
+        stored_widgets = set(self.db.get_table_columns(group_by_name)) - {id_column}
+        if stored_widgets != set(widgets_config):
+            logger.info(
+                "Widgets of '%s' changed since the last run, rebuilding the table",
+                group_by_name,
+            )
+            return plan, True
+
+        plan.previous = TransformFingerprintStore(self.db).load(group_by_name)
+        if not plan.previous:
+            return plan, True
+
+        staging_table = f"{group_by_name}__ids_staging"
+        quoted_staging_table = self._quote_sql_identifier(staging_table)
+        quoted_id_column = self._quote_sql_identifier(id_column)
+        self._write_dataframe_to_table(
+            pd.DataFrame({id_column: list(group_ids)}), staging_table
+        )
+        try:
+            self.db.execute_sql(f"""
+                DELETE FROM {self._quote_sql_identifier(group_by_name)}
+                WHERE {quoted_id_column} NOT IN (
+                    SELECT {quoted_id_column} FROM {quoted_staging_table}
+                )
+            """)
+        finally:
+            self.db.execute_sql(f"DROP TABLE IF EXISTS {quoted_staging_table}")
+        return plan, False
+
+    def _iter_entity_results(
+        self,
+        group_config: Dict[str, Any],
+        group_ids: List[Any],
+        csv_file: Optional[str],
+        workers: int,
+        plan: Optional[IncrementalTransformPlan] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield computed entity results in id order, in-process or in a pool."""
+
+        if self._should_run_parallel(workers, group_config, group_ids):
+            yield from self._iter_parallel_entity_results(
+                group_config, group_ids, csv_file, workers, plan
+            )
+            return
+
+        for group_id, group_data in self._iter_group_data(
+            group_config, csv_file, group_ids
+        ):
+            yield self._compute_entity_results(
+                group_config, group_id, csv_file, group_data=group_data, plan=plan
+            )
+
+    def _iter_parallel_entity_results(
+        self,
+        group_config: Dict[str, Any],
+        group_ids: List[Any],
+        csv_file: Optional[str],
+        workers: int,
+        plan: Optional[IncrementalTransformPlan] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Compute entity results in a process pool and yield them in id order.
+
+        Each worker owns a read-only database connection and its own plugin
+        instances, and runs ``_compute_entity_results`` on a chunk of group
+        ids. Chunks are consumed in submission order so the caller persists
+        results and reports progress and warnings exactly as the sequential
+        loop does. Results are only buffered while the pool runs. The parent
+        closes its DuckDB connection before starting the pool, because DuckDB
+        only allows several processes on the same file when none of them
+        holds it open for writing; it reconnects when it flushes the results.
+        """
+
+        chunk_size = max(
+            1, math.ceil(len(group_ids) / (workers * _PARALLEL_CHUNKS_PER_WORKER))
+        )
+        chunks = [
+            group_ids[start : start + chunk_size]
+            for start in range(0, len(group_ids), chunk_size)
+        ]
+
+        reuse_connections = getattr(self.db, "_reuse_connections", False)
+        self.db.release_file_lock()
+        try:
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(chunks)),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_transform_worker,
+                initargs=(self.db.db_path, str(self.config.config_dir)),
+            ) as executor:
+                for chunk_results in executor.map(
+                    _compute_entity_chunk,
+                    repeat(group_config),
+                    chunks,
+                    repeat(csv_file),
+                    [plan.subset(chunk) if plan else None for chunk in chunks],
+                ):
+                    yield from chunk_results
+        finally:
+            if reuse_connections:
+                self.db.enable_connection_reuse()
+
     def _filter_configs(self, group_by: Optional[str]) -> List[Dict[str, Any]]:
         """Filter configurations by exact group_by match."""
         if not self.transforms_config:
@@ -1013,15 +1472,10 @@ class TransformerService:
                 self.db.engine
             ).dialect.identifier_preparer.quote(table_name)
 
-            # Load entire table as DataFrame using fetch_all
-            # We use fetch_all which properly manages session lifecycle
+            # Load entire table as DataFrame from the columnar result,
+            # without building a dict per row
             sql_query = f"SELECT * FROM {quoted_table_name}"
-            rows = self.db.fetch_all(sql_query)
-
-            # Convert list of dicts to DataFrame
-            df = pd.DataFrame(rows)
-
-            return df
+            return self.db.fetch_df(sql_query)
 
         except Exception as e:
             raise DataTransformError(
@@ -1051,41 +1505,89 @@ class TransformerService:
 
         # Process each source
         for source_config in sources:
-            source_name = source_config["name"]
-            relation_config = source_config["relation"]
-            plugin_name = relation_config.get("plugin")
-
-            try:
-                plugin_class = PluginRegistry.get_plugin(plugin_name, PluginType.LOADER)
-                loader = plugin_class(self.db, registry=self.entity_registry)
-                self._bind_plugin_runtime_config(loader)
-            except Exception as e:
-                raise DataTransformError(
-                    f"Failed to get loader for source '{source_name}'",
-                    details={"error": str(e)},
-                ) from e
-
-            # Load data for this source
-            # Resolve table names through entity registry before passing to loader
-            resolved_data = self._resolve_table_name(source_config["data"])
-            resolved_grouping = self._resolve_table_name(source_config["grouping"])
-
-            # Pass both logical and resolved names to allow plugins to use either
-            data_sources[source_name] = loader.load_data(
-                group_id,
-                {
-                    "data": resolved_data,
-                    "grouping": resolved_grouping,
-                    "logical_data": source_config["data"],
-                    "logical_grouping": source_config[
-                        "grouping"
-                    ],  # Keep original logical name
-                    **source_config["relation"],
-                },
+            loader = self._build_source_loader(source_config)
+            data_sources[source_config["name"]] = loader.load_data(
+                group_id, self._build_loader_config(source_config)
             )
 
         return data_sources
 
+    def _iter_group_data(
+        self,
+        group_config: Dict[str, Any],
+        csv_file: Optional[str],
+        group_ids: List[Any],
+    ) -> Iterator[tuple[Any, Dict[str, pd.DataFrame]]]:
+        """Yield ``(group_id, group_data)`` for all entities of a group.
+
+        Each source loader streams its partitions through
+        ``LoaderPlugin.load_partitions`` so that loaders able to read every
+        entity in one scan do so, instead of running one query per entity.
+        CSV inputs and non-plugin loaders keep the per-entity
+        ``_get_group_data`` path.
+        """
+        sources = group_config.get("sources", [])
+        loaders = [] if csv_file else [self._build_source_loader(s) for s in sources]
+
+        if not loaders or not all(
+            isinstance(loader, LoaderPlugin) for loader in loaders
+        ):
+            for group_id in group_ids:
+                yield group_id, self._get_group_data(group_config, csv_file, group_id)
+            return
+
+        streams = [
+            loader.load_partitions(group_ids, self._build_loader_config(source))
+            for loader, source in zip(loaders, sources)
+        ]
+        for group_id in group_ids:
+            group_data: Dict[str, pd.DataFrame] = {}
+            for source, stream in zip(sources, streams):
+                partition = next(stream, None)
+                if partition is None or partition[0] != group_id:
+                    raise DataTransformError(
+                        f"Loader for source '{source['name']}' did not return "
+                        "partitions in group order",
+                        details={
+                            "expected": group_id,
+                            "received": partition[0] if partition else None,
+                        },
+                    )
+                group_data[source["name"]] = partition[1]
+            yield group_id, group_data
+
+    def _build_source_loader(self, source_config: Dict[str, Any]) -> Any:
+        """Instantiate the loader plugin configured for one source."""
+
+        source_name = source_config["name"]
+        plugin_name = source_config["relation"].get("plugin")
+        try:
+            plugin_class = PluginRegistry.get_plugin(plugin_name, PluginType.LOADER)
+            loader = plugin_class(self.db, registry=self.entity_registry)
+            self._bind_plugin_runtime_config(loader)
+        except Exception as e:
+            raise DataTransformError(
+                f"Failed to get loader for source '{source_name}'",
+                details={"error": str(e)},
+            ) from e
+        return loader
+
+    def _build_loader_config(self, source_config: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the configuration mapping passed to a source loader."""
+
+        # Resolve table names through entity registry before passing to loader
+        resolved_data = self._resolve_table_name(source_config["data"])
+        resolved_grouping = self._resolve_table_name(source_config["grouping"])
+
+        # Pass both logical and resolved names to allow plugins to use either
+        return {
+            "data": resolved_data,
+            "grouping": resolved_grouping,
+            "logical_data": source_config["data"],
+            "logical_grouping": source_config["grouping"],  # Keep original logical name
+            **source_config["relation"],
+        }
+
     def _persist_transform_source_schemas(self, configs: List[Dict[str, Any]]) -> None:
         """Persist observed schemas for file-based transform sources."""
 
@@ -1266,8 +1768,6 @@ class TransformerService:
         self._table_flush_modes.pop(group_by, None)
 
         id_column = f"{group_by}_id"
-        quoted_table = self._quote_sql_identifier(group_by)
-        quoted_id_column = self._quote_sql_identifier(id_column)
         rows: List[Dict[str, Any]] = []
         for entity_id, values in buffer.items():
             row = {id_column: entity_id}
@@ -1288,6 +1788,26 @@ class TransformerService:
             df.to_sql(group_by, self.db.engine, if_exists="append", index=False)
             return
 
+        # An upsert overwrites every column it carries. Incremental runs only
+        # recompute some widgets per entity, so rows are upserted in batches
+        # that share the same set of widget columns.
+        batches: Dict[tuple, List[Any]] = {}
+        for entity_id, values in buffer.items():
+            batches.setdefault(tuple(values), []).append(entity_id)
+        if len(batches) == 1:
+            self._upsert_group_rows(group_by, df)
+            return
+        for columns, entity_ids in batches.items():
+            batch = df.loc[df[id_column].isin(entity_ids), [id_column, *columns]]
+            self._upsert_group_rows(group_by, batch)
+
+    def _upsert_group_rows(self, group_by: str, df: pd.DataFrame) -> None:
+        """Upsert rows into a group table through a staging table."""
+        id_column = f"{group_by}_id"
+        quoted_table = self._quote_sql_identifier(group_by)
+        quoted_id_column = self._quote_sql_identifier(id_column)
+        ordered_columns = list(df.columns)
+
         staging_table = f"{group_by}__staging"
         quoted_staging_table = self._quote_sql_identifier(staging_table)
         self._write_dataframe_to_table(df, staging_table)
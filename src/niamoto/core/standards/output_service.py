@@ -9,12 +9,12 @@ import os
 import re
 import shutil
 import tempfile
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import date, datetime, timezone
 from decimal import Decimal
 from pathlib import Path
-from typing import Any, Iterable, cast
-
-from sqlalchemy import text
+from typing import Any, Callable, Iterable, Iterator, Sequence, cast
 
 from niamoto.common.database import Database
 from niamoto.common.table_resolver import resolve_entity_table
@@ -99,23 +99,37 @@ class StandardProfileOutputService:
             else None,
             draft=draft,
         )
-        source_records = (
-            records if records is not None else self._iter_records(record_source)
+        compiled = (
+            self._compile_source_mappings(profile, record_source)
+            if records is None
+            else None
         )
-        mapped_records = self._iter_mapped_records(profile, source_records)
-
-        if output.type == "api_json":
-            files, output_path, records_count = self._write_api_json(
-                profile, output, mapped_records, metadata
-            )
-        elif output.type == "dwc_archive":
-            files, output_path, records_count = self._write_dwc_archive(
-                profile, output, mapped_records
+        if compiled is not None and compiled.complete and output.type != "dwc_archive":
+            files, output_path, records_count = self._copy_compiled_output(
+                profile, output, record_source, compiled, metadata
             )
         else:
-            files, output_path, records_count = self._write_standard_files(
-                profile, output, mapped_records, metadata
-            )
+            if records is not None:
+                mapped_records = self._iter_mapped_records(profile, records)
+            elif compiled is not None:
+                mapped_records = self._iter_compiled_records(record_source, compiled)
+            else:
+                mapped_records = self._iter_mapped_records(
+                    profile, self._iter_records(record_source)
+                )
+
+            if output.type == "api_json":
+                files, output_path, records_count = self._write_api_json(
+                    profile, output, mapped_records, metadata
+                )
+            elif output.type == "dwc_archive":
+                files, output_path, records_count = self._write_dwc_archive(
+                    profile, output, mapped_records
+                )
+            else:
+                files, output_path, records_count = self._write_standard_files(
+                    profile, output, mapped_records, metadata
+                )
         metadata["records_count"] = records_count
 
         warnings = [
@@ -360,6 +374,21 @@ class StandardProfileOutputService:
         limit: int | None = None,
         batch_size: int = 1000,
     ) -> Iterable[dict[str, Any]]:
+        with self._source_database(source) as (database, table_name):
+            limit_clause = ""
+            if limit is not None:
+                safe_limit = max(1, int(limit))
+                limit_clause = f" LIMIT {safe_limit}"
+            yield from database.iter_records(
+                f"SELECT * FROM {_quote_sql_identifier(table_name)}{limit_clause}",
+                batch_size=batch_size,
+            )
+
+    @contextmanager
+    def _source_database(
+        self, source: StandardProfileSource
+    ) -> Iterator[tuple[Database, str]]:
+        """Open the project database read-only and resolve the source table."""
         if self.db_path is None or not self.db_path.exists():
             raise ValueError(
                 f"Cannot load source '{source.type}:{source.name}': project database was not found"
@@ -372,23 +401,75 @@ class StandardProfileOutputService:
                 raise ValueError(
                     f"Cannot load source '{source.type}:{source.name}': no imported table was found"
                 )
-            escaped_table = table_name.replace('"', '""')
-            limit_clause = ""
-            if limit is not None:
-                safe_limit = max(1, int(limit))
-                limit_clause = f" LIMIT {safe_limit}"
-            with database.connection() as connection:
-                result = connection.execute(
-                    text(f'SELECT * FROM "{escaped_table}"{limit_clause}')
-                )
-                columns = list(result.keys())
-                while rows := result.fetchmany(batch_size):
-                    for row in rows:
-                        yield dict(zip(columns, row))
+            yield database, table_name
         finally:
             database.close_db_session()
             database.engine.dispose()
 
+    def _compile_source_mappings(
+        self,
+        profile: StandardProfileConfig,
+        source: StandardProfileSource,
+    ) -> _CompiledMappings | None:
+        """Compile the profile mappings against the columns of the source table.
+
+        Returns None when the records have to be mapped in Python, for
+        example when the project database is not a DuckDB file.
+        """
+        if self.db_path is None or not self.db_path.exists():
+            return None
+        with self._source_database(source) as (database, table_name):
+            if not database.is_duckdb:
+                return None
+            column_types = {
+                column["name"]: str(column["type"])
+                for column in database.get_table_schema(table_name)
+            }
+        return _compile_mappings(profile, table_name, column_types)
+
+    def _iter_compiled_records(
+        self,
+        source: StandardProfileSource,
+        compiled: _CompiledMappings,
+    ) -> Iterable[dict[str, Any]]:
+        """Stream mapped records, resolving only the fallback terms in Python."""
+        with self._source_database(source) as (database, _table_name):
+            records = database.iter_records(compiled.source_select_sql())
+            for index, record in enumerate(records, start=1):
+                yield compiled.map_record(record, index=index)
+
+    def _copy_compiled_output(
+        self,
+        profile: StandardProfileConfig,
+        output: StandardProfileOutput,
+        source: StandardProfileSource,
+        compiled: _CompiledMappings,
+        metadata: dict[str, Any],
+    ) -> tuple[list[Path], Path, int]:
+        """Write an output whose mappings all compiled with DuckDB ``COPY``."""
+        with self._source_database(source) as (database, _table_name):
+            if output.type == "api_json":
+                terms = list(profile.mappings)
+                return self._write_api_json(
+                    profile,
+                    output,
+                    (),
+                    metadata,
+                    write_records=lambda path: _copy_json_records(
+                        database, compiled.select_sql(terms), path
+                    ),
+                )
+
+            return self._write_standard_files(
+                profile,
+                output,
+                (),
+                metadata,
+                write_records=lambda path, terms: _copy_csv_records(
+                    database, compiled.select_sql(terms, as_text=True), path
+                ),
+            )
+
     def _resolve_source_table(
         self,
         database: Database,
@@ -498,6 +579,8 @@ class StandardProfileOutputService:
         output: StandardProfileOutput,
         records: Iterable[dict[str, Any]],
         metadata: dict[str, Any],
+        *,
+        write_records: Callable[[Path], int] | None = None,
     ) -> tuple[list[Path], Path, int]:
         output_dir = self._resolve_output_dir(output, profile)
         output_dir.mkdir(parents=True, exist_ok=True)
@@ -505,19 +588,11 @@ class StandardProfileOutputService:
         output_path = output_dir / f"{profile_filename}.json"
         records_tmp_path = output_path.with_name(f".{output_path.stem}.records.tmp")
         output_tmp_path = output_path.with_name(f".{output_path.name}.tmp")
-        records_count = 0
         try:
-            with records_tmp_path.open("w", encoding="utf-8") as handle:
-                handle.write("[")
-                for record in records:
-                    if records_count > 0:
-                        handle.write(",")
-                    handle.write("\n  ")
-                    json.dump(record, handle, ensure_ascii=False, default=str)
-                    records_count += 1
-                if records_count > 0:
-                    handle.write("\n")
-                handle.write("]")
+            if write_records is not None:
+                records_count = write_records(records_tmp_path)
+            else:
+                records_count = _dump_json_records(records, records_tmp_path)
 
             metadata["records_count"] = records_count
             with output_tmp_path.open("w", encoding="utf-8") as handle:
@@ -589,6 +664,8 @@ class StandardProfileOutputService:
         output: StandardProfileOutput,
         records: Iterable[dict[str, Any]],
         metadata: dict[str, Any],
+        *,
+        write_records: Callable[[Path, list[str]], int] | None = None,
     ) -> tuple[list[Path], Path, int]:
         if profile.standard != "humboldt_event":
             raise ValueError(
@@ -603,17 +680,24 @@ class StandardProfileOutputService:
         event_tmp_path = event_path.with_name(f".{event_path.name}.tmp")
         records_count = 0
         try:
-            with event_tmp_path.open("w", encoding="utf-8", newline="") as handle:
-                writer = csv.DictWriter(handle, fieldnames=terms, extrasaction="ignore")
-                writer.writeheader()
-                for record in records:
-                    records_count += 1
-                    writer.writerow(
-                        {
-                            term: "" if record.get(term) is None else record.get(term)
-                            for term in terms
-                        }
+            if write_records is not None:
+                records_count = write_records(event_tmp_path, terms)
+            else:
+                with event_tmp_path.open("w", encoding="utf-8", newline="") as handle:
+                    writer = csv.DictWriter(
+                        handle, fieldnames=terms, extrasaction="ignore"
                     )
+                    writer.writeheader()
+                    for record in records:
+                        records_count += 1
+                        writer.writerow(
+                            {
+                                term: ""
+                                if record.get(term) is None
+                                else record.get(term)
+                                for term in terms
+                            }
+                        )
             os.replace(event_tmp_path, event_path)
         finally:
             if event_tmp_path.exists():
@@ -652,6 +736,271 @@ class StandardProfileOutputService:
         return resolved
 
 
+# Column types whose values DuckDB writes to JSON and CSV exactly as the
+# Python writers do; other columns keep their terms on the Python path.
+_SQL_SCALAR_TYPES = frozenset(
+    {
+        "VARCHAR",
+        "BOOLEAN",
+        "TINYINT",
+        "SMALLINT",
+        "INTEGER",
+        "BIGINT",
+        "UTINYINT",
+        "USMALLINT",
+        "UINTEGER",
+        "UBIGINT",
+        "DOUBLE",
+        "DATE",
+    }
+)
+_INT64_RANGE = range(-(2**63), 2**63)
+
+
+@dataclass(frozen=True)
+class _CompiledTerm:
+    """SQL expression computing one mapped term, with its DuckDB type."""
+
+    expression: str
+    sql_type: str
+
+    def as_text(self) -> str:
+        """Render the value as ``csv`` writes it; NULL stands for empty cells."""
+        if self.sql_type == "BOOLEAN":
+            return (
+                f"CASE WHEN {self.expression} THEN 'True' "
+                f"WHEN NOT {self.expression} THEN 'False' END"
+            )
+        return f"NULLIF(CAST({self.expression} AS VARCHAR), '')"
+
+
+@dataclass(frozen=True)
+class _CompiledMappings:
+    """Profile mappings compiled to a projection of the source table.
+
+    Terms in ``fallback`` (generators other than constants and dates, nested
+    paths, non-scalar columns) are resolved in Python from the source row.
+    """
+
+    table_name: str
+    mappings: dict[str, Any]
+    terms: dict[str, _CompiledTerm]
+    fallback: dict[str, Any]
+
+    @property
+    def complete(self) -> bool:
+        return not self.fallback
+
+    def select_sql(self, terms: Sequence[str], *, as_text: bool = False) -> str:
+        columns = ", ".join(
+            f"{term_sql.as_text() if as_text else term_sql.expression} "
+            f"AS {_quote_sql_identifier(term)}"
+            for term, term_sql in ((term, self.terms[term]) for term in terms)
+        )
+        return _escape_bind_markers(
+            f"SELECT {columns} FROM {_quote_sql_identifier(self.table_name)}"
+        )
+
+    def source_select_sql(self) -> str:
+        """Select the compiled terms under private aliases, then every column."""
+        columns = [
+            f"{term_sql.expression} AS {_quote_sql_identifier(_term_alias(position))}"
+            for position, term_sql in enumerate(self.terms.values())
+        ]
+        return _escape_bind_markers(
+            f"SELECT {', '.join([*columns, '*'])} "
+            f"FROM {_quote_sql_identifier(self.table_name)}"
+        )
+
+    def map_record(self, record: dict[str, Any], *, index: int) -> dict[str, Any]:
+        aliases = {
+            term: _term_alias(position) for position, term in enumerate(self.terms)
+        }
+        return {
+            term: record.get(aliases[term])
+            if term in aliases
+            else _resolve_mapping_value(record, mapping, index=index)
+            for term, mapping in self.mappings.items()
+        }
+
+
+def _compile_mappings(
+    profile: StandardProfileConfig,
+    table_name: str,
+    column_types: dict[str, str],
+) -> _CompiledMappings | None:
+    """Compile source references, constants and dates to SQL expressions.
+
+    Humboldt/Event records are mapped by the transformer plugin, so those
+    profiles only compile when every term does.
+    """
+    if not profile.mappings:
+        return None
+
+    strict = profile.standard == "humboldt_event"
+    terms: dict[str, _CompiledTerm] = {}
+    fallback: dict[str, Any] = {}
+    for term, mapping in profile.mappings.items():
+        compiled = _compile_mapping(mapping, column_types, strict=strict)
+        if compiled is not None:
+            terms[term] = compiled
+        elif strict:
+            return None
+        else:
+            fallback[term] = mapping
+    return _CompiledMappings(
+        table_name=table_name,
+        mappings=dict(profile.mappings),
+        terms=terms,
+        fallback=fallback,
+    )
+
+
+def _compile_mapping(
+    mapping: Any,
+    column_types: dict[str, str],
+    *,
+    strict: bool,
+) -> _CompiledTerm | None:
+    if isinstance(mapping, str):
+        return _compile_source_reference(mapping, column_types)
+    if not isinstance(mapping, dict):
+        return None
+
+    source = mapping.get("source")
+    generator = mapping.get("generator")
+    if strict and bool(source) == bool(generator):
+        return None
+    if source:
+        return _compile_source_reference(str(source), column_types)
+
+    params = mapping.get("params") or {}
+    if not isinstance(params, dict):
+        return None
+    if generator == "constant":
+        return _compile_literal(params.get("value"))
+    if generator == "current_date":
+        return _compile_literal(date.today().isoformat())
+    return None
+
+
+def _compile_source_reference(
+    source: str,
+    column_types: dict[str, str],
+) -> _CompiledTerm | None:
+    path = _normalize_source_path(source)
+    if "." in path:
+        return None
+    if path not in column_types:
+        return _CompiledTerm("NULL", "NULL")
+
+    sql_type = column_types[path].upper()
+    if sql_type not in _SQL_SCALAR_TYPES:
+        return None
+    expression = _quote_sql_identifier(path)
+    if sql_type == "DOUBLE":
+        # Source rows carry NaN as None
+        expression = f"NULLIF({expression}, CAST('NaN' AS DOUBLE))"
+    return _CompiledTerm(expression, sql_type)
+
+
+def _compile_literal(value: Any) -> _CompiledTerm | None:
+    if value is None:
+        return _CompiledTerm("NULL", "NULL")
+    if isinstance(value, bool):
+        return _CompiledTerm("TRUE" if value else "FALSE", "BOOLEAN")
+    if isinstance(value, int):
+        if value not in _INT64_RANGE:
+            return None
+        return _CompiledTerm(f"CAST({value} AS BIGINT)", "BIGINT")
+    if isinstance(value, float):
+        if not math.isfinite(value):
+            return None
+        return _CompiledTerm(f"CAST('{value!r}' AS DOUBLE)", "DOUBLE")
+    if isinstance(value, str):
+        return _CompiledTerm(_quote_sql_string(value), "VARCHAR")
+    return None
+
+
+def _term_alias(position: int) -> str:
+    return f"__niamoto_term_{position}"
+
+
+def _quote_sql_identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _quote_sql_string(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _escape_bind_markers(sql: str) -> str:
+    """Keep colons in literals from being read as bind parameters."""
+    return sql.replace(":", "\\:")
+
+
+def _dump_json_records(records: Iterable[dict[str, Any]], path: Path) -> int:
+    records_count = 0
+    with path.open("w", encoding="utf-8") as handle:
+        handle.write("[")
+        for record in records:
+            if records_count > 0:
+                handle.write(",")
+            handle.write("\n  ")
+            json.dump(record, handle, ensure_ascii=False, default=str)
+            records_count += 1
+        if records_count > 0:
+            handle.write("\n")
+        handle.write("]")
+    return records_count
+
+
+def _copy_json_records(database: Database, query: str, path: Path) -> int:
+    """Write the rows of ``query`` as the JSON records array at ``path``.
+
+    DuckDB writes one object per line; the lines are then laid out as
+    ``_dump_json_records`` does.
+    """
+    lines_path = path.with_name(f"{path.name}.ndjson")
+    try:
+        _copy_query(database, query, lines_path, "FORMAT JSON")
+        records_count = 0
+        with (
+            lines_path.open("r", encoding="utf-8") as lines,
+            path.open("w", encoding="utf-8") as handle,
+        ):
+            handle.write("[")
+            for line in lines:
+                if records_count > 0:
+                    handle.write(",")
+                handle.write("\n  ")
+                handle.write(line.rstrip("\n"))
+                records_count += 1
+            if records_count > 0:
+                handle.write("\n")
+            handle.write("]")
+        return records_count
+    finally:
+        if lines_path.exists():
+            lines_path.unlink()
+
+
+def _copy_csv_records(database: Database, query: str, path: Path) -> int:
+    return _copy_query(
+        database, query, path, "FORMAT CSV, HEADER, DELIMITER ',', NEW_LINE '\r\n'"
+    )
+
+
+def _copy_query(database: Database, query: str, path: Path, options: str) -> int:
+    """Run ``COPY (query) TO path`` and return the number of rows written."""
+    target = _escape_bind_markers(_quote_sql_string(str(path)))
+    row = database.execute_sql(
+        f"COPY ({query}) TO {target} ({options})",
+        fetch=True,
+    )
+    return int(row[0]) if row is not None else 0
+
+
 def _resolve_mapping_value(
     record: dict[str, Any],
     mapping: Any,
@@ -10,6 +10,7 @@ from sqlalchemy import inspect, text
 
 from ..utils.database import open_database
 from ..context import get_working_directory
+from ..services.column_profiler import get_table_profile
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -438,50 +439,20 @@ def get_table_stats(table_name: str):
 
     try:
         with open_database(db_path, read_only=True) as db:
-            preparer = db.engine.dialect.identifier_preparer
-
             if table_name not in db.get_table_names():
                 raise HTTPException(
                     status_code=404, detail=f"Table '{table_name}' not found"
                 )
 
-            quoted_table = preparer.quote(table_name)
-
-            with db.engine.connect() as conn:
-                result = conn.execute(text(f"SELECT COUNT(*) FROM {quoted_table}"))
-                row_count = result.scalar() or 0
-
-                columns = db.get_columns(table_name)
-                column_count = len(columns)
-
-                null_counts = {}
-                unique_counts = {}
-                data_types = {}
-
-                for col in columns:
-                    col_name = col["name"]
-                    data_types[col_name] = str(col.get("type", "UNKNOWN"))
-                    quoted_col = preparer.quote(col_name)
-
-                    result = conn.execute(
-                        text(
-                            f"SELECT COUNT(*) FROM {quoted_table} WHERE {quoted_col} IS NULL"
-                        )
-                    )
-                    null_counts[col_name] = result.scalar() or 0
-
-                    result = conn.execute(
-                        text(f"SELECT COUNT(DISTINCT {quoted_col}) FROM {quoted_table}")
-                    )
-                    unique_counts[col_name] = result.scalar() or 0
+            profile = get_table_profile(db, db_path, table_name)
 
         return TableStats(
             table_name=table_name,
-            row_count=row_count,
-            column_count=column_count,
-            null_counts=null_counts,
-            unique_counts=unique_counts,
-            data_types=data_types,
+            row_count=profile.row_count,
+            column_count=len(profile.columns),
+            null_counts={col.name: col.null_count for col in profile.columns},
+            unique_counts={col.name: col.distinct_count for col in profile.columns},
+            data_types={col.name: col.type for col in profile.columns},
         )
 
     except HTTPException:
@@ -31,6 +31,7 @@ from niamoto.common.hierarchy_context import (
 from ..utils.database import open_database
 from ..context import get_working_directory
 from .database import get_database_path
+from ..services.column_profiler import get_table_profile
 from ..services.map_renderer import MapConfig, MapRenderer, MapStyle
 from ..services.preview_utils import error_html, wrap_html_response
 
@@ -178,6 +179,27 @@ class EntityCompleteness(BaseModel):
     overall_completeness: float
 
 
+class ColumnProfileInfo(BaseModel):
+    """Profile of a column: nulls, distinct values, range and top values."""
+
+    column: str
+    type: str
+    null_count: int
+    non_null_count: int
+    distinct_count: int  # approximate on DuckDB
+    min_value: Any = None
+    max_value: Any = None
+    top_values: List[Any] = Field(default_factory=list)
+
+
+class EntityProfile(BaseModel):
+    """Profile of every column of an entity."""
+
+    entity: str
+    row_count: int
+    columns: List[ColumnProfileInfo]
+
+
 class SpatialStats(BaseModel):
     """Spatial distribution statistics."""
 
@@ -2231,59 +2253,30 @@ def get_completeness(entity: str):
 
     try:
         with open_database(db_path, read_only=True) as db:
-            preparer = db.engine.dialect.identifier_preparer
-
             if entity not in db.get_table_names():
                 raise HTTPException(
                     status_code=404, detail=f"Entity '{entity}' not found"
                 )
 
-            quoted_table = preparer.quote(entity)
-
-            # Get total count
-            with db.engine.connect() as conn:
-                result = conn.execute(text(f"SELECT COUNT(*) FROM {quoted_table}"))
-                total_count = result.scalar() or 0
-
-            columns_info = db.get_columns(entity)
+            profile = get_table_profile(db, db_path, entity)
+            total_count = profile.row_count
             column_stats = []
 
-            with db.engine.connect() as conn:
-                for col in columns_info:
-                    col_name = col["name"]
-                    col_type = str(col.get("type", "UNKNOWN"))
-                    quoted_col = preparer.quote(col_name)
-
-                    # Null count
-                    result = conn.execute(
-                        text(
-                            f"SELECT COUNT(*) FROM {quoted_table} WHERE {quoted_col} IS NULL"
-                        )
-                    )
-                    null_count = result.scalar() or 0
-                    non_null_count = total_count - null_count
-
-                    # Unique count
-                    result = conn.execute(
-                        text(f"SELECT COUNT(DISTINCT {quoted_col}) FROM {quoted_table}")
-                    )
-                    unique_count = result.scalar() or 0
-
-                    completeness = (
-                        non_null_count / total_count if total_count > 0 else 1.0
-                    )
-
-                    column_stats.append(
-                        ColumnCompleteness(
-                            column=col_name,
-                            type=col_type,
-                            total_count=total_count,
-                            null_count=null_count,
-                            non_null_count=non_null_count,
-                            completeness=completeness,
-                            unique_count=unique_count,
-                        )
+            for col in profile.columns:
+                non_null_count = col.non_null_count(total_count)
+                completeness = non_null_count / total_count if total_count > 0 else 1.0
+
+                column_stats.append(
+                    ColumnCompleteness(
+                        column=col.name,
+                        type=col.type,
+                        total_count=total_count,
+                        null_count=col.null_count,
+                        non_null_count=non_null_count,
+                        completeness=completeness,
+                        unique_count=col.distinct_count,
                     )
+                )
 
             overall = (
                 sum(c.completeness for c in column_stats) / len(column_stats)
@@ -2302,6 +2295,53 @@ def get_completeness(entity: str):
         raise HTTPException(status_code=500, detail="Error getting completeness")
 
 
+@router.get("/profile/{entity}", response_model=EntityProfile)
+def get_entity_profile(entity: str):
+    """
+    Get the profile of every column of an entity.
+
+    Returns null counts, approximate distinct counts, min/max and the most
+    frequent values, computed in a single pass over the table and cached
+    until the database changes.
+    """
+    db_path = get_database_path()
+    if not db_path:
+        raise HTTPException(status_code=404, detail="Database not found")
+
+    try:
+        with open_database(db_path, read_only=True) as db:
+            if entity not in db.get_table_names():
+                raise HTTPException(
+                    status_code=404, detail=f"Entity '{entity}' not found"
+                )
+
+            profile = get_table_profile(db, db_path, entity)
+
+        return EntityProfile(
+            entity=entity,
+            row_count=profile.row_count,
+            columns=[
+                ColumnProfileInfo(
+                    column=col.name,
+                    type=col.type,
+                    null_count=col.null_count,
+                    non_null_count=col.non_null_count(profile.row_count),
+                    distinct_count=col.distinct_count,
+                    min_value=col.min_value,
+                    max_value=col.max_value,
+                    top_values=list(col.top_values),
+                )
+                for col in profile.columns
+            ],
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Error profiling entity %s: %s", entity, e)
+        raise HTTPException(status_code=500, detail="Error profiling entity")
+
+
 @router.get("/hierarchy/{reference_name}", response_model=HierarchyInspection)
 async def get_hierarchy_inspection(
     reference_name: str,
@@ -0,0 +1,183 @@
+"""Single-query column profiles for the import dashboard and database explorer.
+
+A profile holds, for every column of a table, its null count, an
+approximate distinct count, min/max and most frequent values. All of them
+are computed by one aggregate query, so profiling a table scans it once
+whatever its number of columns.
+
+Profiles are cached per database file and table, keyed by the modification
+time and size of the database (and of its DuckDB write-ahead log), so a
+table is profiled again only after the database changed.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from sqlalchemy import text
+
+from niamoto.common.database import Database
+from niamoto.common.duckdb_connections import database_file_fingerprint
+from niamoto.common.lru_cache import LRUCache
+from niamoto.common.table_resolver import quote_identifier
+
+DEFAULT_TOP_K = 5
+_PROFILE_CACHE_MAX_ENTRIES = 64
+
+# Types for which min/max and top values are meaningless or unsupported
+_UNORDERED_TYPE_MARKERS = (
+    "BLOB",
+    "BYTEA",
+    "BINARY",
+    "GEOMETRY",
+    "STRUCT",
+    "MAP",
+    "UNION",
+    "LIST",
+    "[]",
+    "NULL",
+)
+
+
+@dataclass(frozen=True)
+class ColumnProfile:
+    """Aggregates of one column."""
+
+    name: str
+    type: str
+    null_count: int
+    distinct_count: int
+    min_value: Any = None
+    max_value: Any = None
+    top_values: tuple[Any, ...] = ()
+
+    def non_null_count(self, row_count: int) -> int:
+        return row_count - self.null_count
+
+
+@dataclass(frozen=True)
+class TableProfile:
+    """Aggregates of every column of a table."""
+
+    table_name: str
+    row_count: int
+    columns: tuple[ColumnProfile, ...]
+
+
+@dataclass(frozen=True)
+class _ProfileCacheKey:
+    db_path: str
+    table_name: str
+    top_k: int
+    fingerprint: tuple[int, ...]
+
+
+_PROFILE_CACHE: LRUCache[_ProfileCacheKey, TableProfile] = LRUCache(
+    max_entries=_PROFILE_CACHE_MAX_ENTRIES
+)
+
+
+def _is_ordered_type(type_name: str) -> bool:
+    upper = type_name.upper()
+    return not any(marker in upper for marker in _UNORDERED_TYPE_MARKERS)
+
+
+def profile_table(
+    db: Database, table_name: str, top_k: int = DEFAULT_TOP_K
+) -> TableProfile:
+    """Profile every column of ``table_name`` with a single aggregate query.
+
+    On DuckDB, distinct counts use ``approx_count_distinct`` and the most
+    frequent values ``approx_top_k``. Other backends get exact distinct
+    counts and no top values.
+    """
+    columns_info = db.get_columns(table_name)
+    quoted_table = quote_identifier(db, table_name)
+    is_duckdb = getattr(db, "is_duckdb", False)
+
+    select_parts = ["COUNT(*)"]
+    layout: list[tuple[str, str, bool]] = []
+    for col in columns_info:
+        col_name = col["name"]
+        col_type = str(col.get("type", "UNKNOWN"))
+        quoted_col = quote_identifier(db, col_name)
+        ordered = _is_ordered_type(col_type)
+
+        select_parts.append(f"COUNT({quoted_col})")
+        if is_duckdb:
+            select_parts.append(f"approx_count_distinct({quoted_col})")
+        else:
+            select_parts.append(f"COUNT(DISTINCT {quoted_col})")
+        if ordered:
+            select_parts.append(f"MIN({quoted_col})")
+            select_parts.append(f"MAX({quoted_col})")
+            if is_duckdb and top_k > 0:
+                select_parts.append(f"approx_top_k({quoted_col}, {int(top_k)})")
+        layout.append((col_name, col_type, ordered))
+
+    sql = f"SELECT {', '.join(select_parts)} FROM {quoted_table}"
+    with db.engine.connect() as conn:
+        row = conn.execute(text(sql)).fetchone()
+
+    values = iter(row)
+    row_count = int(next(values) or 0)
+    columns = []
+    for col_name, col_type, ordered in layout:
+        non_null_count = int(next(values) or 0)
+        # HyperLogLog estimates may exceed the number of values
+        distinct_count = min(int(next(values) or 0), non_null_count)
+        min_value = max_value = None
+        top_values: tuple[Any, ...] = ()
+        if ordered:
+            min_value = next(values)
+            max_value = next(values)
+            if is_duckdb and top_k > 0:
+                top_values = tuple(
+                    value for value in (next(values) or []) if value is not None
+                )
+        columns.append(
+            ColumnProfile(
+                name=col_name,
+                type=col_type,
+                null_count=row_count - non_null_count,
+                distinct_count=distinct_count,
+                min_value=min_value,
+                max_value=max_value,
+                top_values=top_values,
+            )
+        )
+
+    return TableProfile(
+        table_name=table_name, row_count=row_count, columns=tuple(columns)
+    )
+
+
+def get_table_profile(
+    db: Database,
+    db_path: Path,
+    table_name: str,
+    top_k: int = DEFAULT_TOP_K,
+) -> TableProfile:
+    """Return the profile of ``table_name``, from the cache when still valid."""
+    cache_key = _ProfileCacheKey(
+        db_path=str(Path(db_path).resolve()),
+        table_name=table_name,
+        top_k=top_k,
+        fingerprint=database_file_fingerprint(Path(db_path)),
+    )
+    return _PROFILE_CACHE.get_or_build(
+        cache_key, lambda: profile_table(db, table_name, top_k=top_k)
+    )
+
+
+def clear_profile_cache(db_path: Optional[Path] = None) -> None:
+    """Drop cached profiles, for one database or all of them."""
+    if db_path is None:
+        _PROFILE_CACHE.clear()
+        return
+    resolved = str(Path(db_path).resolve())
+    for key in _PROFILE_CACHE.keys():
+        if key.db_path == resolved:
+            _PROFILE_CACHE.pop(key)
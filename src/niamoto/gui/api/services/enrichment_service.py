@@ -5,23 +5,30 @@ from __future__ import annotations
 import asyncio
 from contextvars import ContextVar
 import csv
+import itertools
 import json
 import logging
 import re
+import sqlite3
+import threading
+import time
 import uuid
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
 from urllib.parse import urlparse
 
 import yaml
 from pydantic import BaseModel, Field
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 
 from niamoto.common.database import Database
 from niamoto.common.table_resolver import quote_identifier, resolve_entity_table
-from niamoto.gui.api.context import get_working_directory
+from niamoto.gui.api.context import (
+    get_optional_working_directory,
+    get_working_directory,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -74,6 +81,12 @@ BHL_API_ENDPOINT = "https://www.biodiversitylibrary.org/api3"
 INAT_TAXA_ENDPOINT = "https://api.inaturalist.org/v1/taxa"
 OPEN_METEO_ELEVATION_ENDPOINT = "https://api.open-meteo.com/v1/elevation"
 GEONAMES_SUBDIVISION_ENDPOINT = "https://secure.geonames.org/countrySubdivisionJSON"
+# Requests a source may have in flight during a job; rate_limit still applies
+DEFAULT_SOURCE_CONCURRENCY = 2
+# extra_data updates buffered by a job before they are written together
+ENRICHMENT_FLUSH_BATCH_SIZE = 100
+ENRICHMENT_FLUSH_INTERVAL = 5.0
+ENRICHMENT_STAGING_TABLE = "_niamoto_enrichment_staging"
 
 
 class EnrichmentSourceConfig(BaseModel):
@@ -113,6 +126,7 @@ class EnrichmentSourceConfig(BaseModel):
     geometry_field: Optional[str] = None
     response_mapping: Dict[str, str] = Field(default_factory=dict)
     rate_limit: float = 1.0
+    concurrency: int = Field(default=DEFAULT_SOURCE_CONCURRENCY, ge=1)
     cache_results: bool = True
     auth_method: Optional[str] = None
     auth_params: Dict[str, Any] = Field(default_factory=dict)
@@ -163,6 +177,7 @@ class EnrichmentSourceConfig(BaseModel):
                 "include_nearby_places": self.include_nearby_places,
                 "geometry_field": self.geometry_field,
                 "rate_limit": self.rate_limit,
+                "concurrency": self.concurrency,
                 "cache_results": self.cache_results,
                 "response_mapping": self.response_mapping or {},
                 "chained_endpoints": self.chained_endpoints or [],
@@ -289,7 +304,12 @@ _job_work_dir_context: ContextVar[Optional[Path]] = ContextVar(
     "enrichment_job_work_dir",
     default=None,
 )
-_MISSING_EXTRA_DATA_ROW = object()
+_job_writer_context: ContextVar[Optional["_EnrichmentWriter"]] = ContextVar(
+    "enrichment_job_writer",
+    default=None,
+)
+# Marks a job step whose row was not loaded by ``load_data_batch``
+_NOT_LOADED = object()
 
 
 def _resolve_work_dir() -> Optional[Path]:
@@ -654,6 +674,9 @@ def _normalize_source_entries(raw_enrichment: Any) -> List[EnrichmentSourceConfi
                     else config.get("response_mapping") or {}
                 ),
                 rate_limit=float(config.get("rate_limit", 1.0)),
+                concurrency=max(
+                    1, int(config.get("concurrency") or DEFAULT_SOURCE_CONCURRENCY)
+                ),
                 cache_results=bool(config.get("cache_results", True)),
                 auth_method=(
                     "none"
@@ -1506,50 +1529,52 @@ def _load_reference_row(
         return None
 
 
-def _load_current_extra_data_for_update(
-    connection: Any,
-    quoted_table_name: str,
-    quoted_id_field: str,
-    entity_id: Any,
-) -> Any:
-    """Read the latest extra_data value immediately before an enrichment update."""
-
-    row = connection.execute(
-        text(
-            f"SELECT extra_data FROM {quoted_table_name} "
-            f"WHERE {quoted_id_field} = :entity_id LIMIT 1"
-        ),
-        {"entity_id": entity_id},
-    ).fetchone()
-    if row is None:
-        return _MISSING_EXTRA_DATA_ROW
-
-    if hasattr(row, "_mapping"):
-        return row._mapping.get("extra_data")
-    if isinstance(row, dict):
-        return row.get("extra_data")
-    return row[0]
-
-
-def _save_source_enrichment_to_db(
-    reference_name: str,
-    entity_id: Any,
-    source: EnrichmentSourceConfig,
-    source_data: Dict[str, Any],
-    existing_extra_data: Any,
-) -> Optional[Dict[str, Any]]:
-    """Persist one source payload into the entity extra_data column."""
-
-    work_dir = _resolve_work_dir()
-    if not work_dir:
-        return None
-
-    db_path = work_dir / "db" / "niamoto.duckdb"
-    table_name = _get_reference_table_name(reference_name)
-    if not db_path.exists() or not table_name:
-        return None
+class _EnrichmentWriter:
+    """Write-behind buffer for the extra_data updates of an enrichment job.
+
+    The writer resolves the reference table, its id field and its columns
+    once, and opens the database only while a batch is written, so other
+    processes can open the file between flushes. Updates are queued per entity
+    as merge operations and flushed in batches: each flush reads the current
+    extra_data of the queued entities, applies their operations, loads the
+    results into a staging table and applies them with a single
+    ``UPDATE ... FROM``, all in one transaction. Operations leave the buffer
+    only once their flush committed, so a crash loses at most the last
+    batch, which a resumed job enriches again.
+    """
+
+    def __init__(
+        self,
+        reference_name: str,
+        work_dir: Optional[Path],
+        *,
+        batch_size: int = ENRICHMENT_FLUSH_BATCH_SIZE,
+        flush_interval: float = ENRICHMENT_FLUSH_INTERVAL,
+    ) -> None:
+        self.reference_name = reference_name
+        self.work_dir = work_dir
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._lock = threading.RLock()
+        self._pending: Dict[Any, List[Callable[[Any], Dict[str, Any]]]] = {}
+        self._pending_count = 0
+        self._last_flush = time.monotonic()
+        self._db_path: Optional[Path] = None
+        self._target: Optional[tuple[str, str]] = None
+        self._opened = False
+
+    def _open(self) -> bool:
+        """Resolve the target table once."""
+        if self._opened:
+            return self._target is not None
+        self._opened = True
+        if not self.work_dir:
+            return False
+        db_path = self.work_dir / "db" / "niamoto.duckdb"
+        table_name = _get_reference_table_name(self.reference_name)
+        if not db_path.exists() or not table_name:
+            return False
 
-    try:
         import pandas as pd
 
         db = Database(str(db_path))
@@ -1558,35 +1583,184 @@ def _save_source_enrichment_to_db(
             table_columns = pd.read_sql(
                 text(f"SELECT * FROM {quoted_table_name} LIMIT 0"), db.engine
             ).columns.tolist()
-            id_field = _reference_id_field(reference_name, table_columns)
-            quoted_id_field = quote_identifier(db, id_field)
-            with db.engine.connect() as connection:
-                current_extra_data = _load_current_extra_data_for_update(
-                    connection,
-                    quoted_table_name,
-                    quoted_id_field,
-                    entity_id,
-                )
-                if current_extra_data is _MISSING_EXTRA_DATA_ROW:
-                    return None
+            id_field = _reference_id_field(self.reference_name, table_columns)
+            self._target = (quoted_table_name, quote_identifier(db, id_field))
+        finally:
+            db.close()
+        self._db_path = db_path
+        return True
+
+    def queue(self, entity_id: Any, operation: Callable[[Any], Dict[str, Any]]) -> bool:
+        """Queue ``operation`` on the extra_data of ``entity_id``.
+
+        Returns False when the reference table cannot be written.
+        """
+        with self._lock:
+            if not self._open():
+                return False
+            self._pending.setdefault(entity_id, []).append(operation)
+            self._pending_count += 1
+            return True
+
+    def should_flush(self) -> bool:
+        with self._lock:
+            return self._pending_count >= self.batch_size or (
+                self._pending_count > 0
+                and time.monotonic() - self._last_flush >= self.flush_interval
+            )
+
+    def flush(self) -> Dict[Any, Optional[Dict[str, Any]]]:
+        """Write the queued operations; return the stored extra_data per entity.
+
+        Entities missing from the table are left out of the result.
+        """
+        with self._lock:
+            if not self._pending or self._db_path is None or self._target is None:
+                return {}
+            batch = {
+                entity_id: list(operations)
+                for entity_id, operations in self._pending.items()
+            }
+            stored = self._write_batch(batch)
+            for entity_id, operations in batch.items():
+                remaining = self._pending[entity_id][len(operations) :]
+                if remaining:
+                    self._pending[entity_id] = remaining
+                else:
+                    del self._pending[entity_id]
+                self._pending_count -= len(operations)
+            self._last_flush = time.monotonic()
+            return stored
+
+    def _write_batch(
+        self, batch: Dict[Any, List[Callable[[Any], Dict[str, Any]]]]
+    ) -> Dict[Any, Optional[Dict[str, Any]]]:
+        quoted_table_name, quoted_id_field = self._target
+        stored: Dict[Any, Optional[Dict[str, Any]]] = {}
+
+        db = Database(str(self._db_path))
+        try:
+            staging = quote_identifier(db, ENRICHMENT_STAGING_TABLE)
+            with db.engine.begin() as connection:
+                current_rows = connection.execute(
+                    text(
+                        f"SELECT {quoted_id_field}, extra_data FROM {quoted_table_name} "
+                        f"WHERE {quoted_id_field} IN :entity_ids"
+                    ).bindparams(bindparam("entity_ids", expanding=True)),
+                    {"entity_ids": list(batch)},
+                ).fetchall()
+                current = {str(row[0]): row[1] for row in current_rows}
+
+                updates = []
+                for entity_id, operations in batch.items():
+                    key = str(entity_id)
+                    if key not in current:
+                        logger.warning(
+                            "Skipping enrichment update for missing '%s' entity %s",
+                            self.reference_name,
+                            entity_id,
+                        )
+                        continue
+                    extra_data = current[key]
+                    for operation in operations:
+                        extra_data = operation(extra_data)
+                    stored[entity_id] = extra_data
+                    updates.append(
+                        {
+                            "entity_id": entity_id,
+                            "extra_data": json.dumps(extra_data)
+                            if extra_data
+                            else None,
+                        }
+                    )
+                if not updates:
+                    return stored
 
-                merged = _replace_source_enrichment_data(
-                    current_extra_data, source, source_data
+                connection.execute(text(f"DROP TABLE IF EXISTS {staging}"))
+                connection.execute(
+                    text(
+                        f"CREATE TEMP TABLE {staging} AS "
+                        f"SELECT {quoted_id_field} AS entity_id, extra_data "
+                        f"FROM {quoted_table_name} LIMIT 0"
+                    )
+                )
+                connection.execute(
+                    text(f"INSERT INTO {staging} VALUES (:entity_id, :extra_data)"),
+                    updates,
                 )
                 connection.execute(
                     text(
-                        f"UPDATE {quoted_table_name} "
-                        f"SET extra_data = :extra_data WHERE {quoted_id_field} = :entity_id"
-                    ),
-                    {
-                        "extra_data": json.dumps(merged),
-                        "entity_id": entity_id,
-                    },
+                        f"UPDATE {quoted_table_name} SET extra_data = staged.extra_data "
+                        f"FROM {staging} AS staged "
+                        f"WHERE {quoted_table_name}.{quoted_id_field} = staged.entity_id"
+                    )
                 )
-                connection.commit()
-            return merged
+                connection.execute(text(f"DROP TABLE {staging}"))
         finally:
-            db.close_db_session()
+            db.close()
+        return stored
+
+    def close(self) -> None:
+        """Flush what is left."""
+        self.flush()
+
+
+def _write_source_enrichment(
+    reference_name: str,
+    entity_id: Any,
+    operation: Callable[[Any], Dict[str, Any]],
+    existing_extra_data: Any,
+) -> Optional[Dict[str, Any]]:
+    """Apply ``operation`` to the extra_data of one entity.
+
+    Inside an enrichment job the update goes to the job's write-behind
+    buffer and the result is computed from the job's copy of the row.
+    Otherwise it is written at once and merged with the stored value.
+    """
+
+    writer = _job_writer_context.get()
+    if writer is not None:
+        if not writer.queue(entity_id, operation):
+            return None
+        if writer.should_flush():
+            try:
+                writer.flush()
+            except Exception as exc:
+                # Kept in the buffer for the next flush
+                logger.warning(
+                    "Error flushing enrichment updates for '%s': %s",
+                    reference_name,
+                    exc,
+                )
+        return operation(existing_extra_data)
+
+    writer = _EnrichmentWriter(reference_name, _resolve_work_dir())
+    try:
+        if not writer.queue(entity_id, operation):
+            return None
+        return writer.flush().get(entity_id)
+    finally:
+        writer.close()
+
+
+def _save_source_enrichment_to_db(
+    reference_name: str,
+    entity_id: Any,
+    source: EnrichmentSourceConfig,
+    source_data: Dict[str, Any],
+    existing_extra_data: Any,
+) -> Optional[Dict[str, Any]]:
+    """Persist one source payload into the entity extra_data column."""
+
+    try:
+        return _write_source_enrichment(
+            reference_name,
+            entity_id,
+            lambda extra_data: _replace_source_enrichment_data(
+                extra_data, source, source_data
+            ),
+            existing_extra_data,
+        )
     except Exception as exc:
         logger.warning(
             "Error saving enrichment for '%s' entity %s source %s: %s",
@@ -1606,56 +1780,15 @@ def _delete_source_enrichment_from_db(
 ) -> Optional[Dict[str, Any]]:
     """Delete one source payload from the entity extra_data column."""
 
-    work_dir = _resolve_work_dir()
-    if not work_dir:
-        return None
-
-    db_path = work_dir / "db" / "niamoto.duckdb"
-    table_name = _get_reference_table_name(reference_name)
-    if not db_path.exists() or not table_name:
-        return None
-
     try:
-        import pandas as pd
-
-        db = Database(str(db_path))
-        try:
-            quoted_table_name = quote_identifier(db, table_name)
-            table_columns = pd.read_sql(
-                text(f"SELECT * FROM {quoted_table_name} LIMIT 0"), db.engine
-            ).columns.tolist()
-            id_field = _reference_id_field(reference_name, table_columns)
-            quoted_id_field = quote_identifier(db, id_field)
-            with db.engine.connect() as connection:
-                current_extra_data = _load_current_extra_data_for_update(
-                    connection,
-                    quoted_table_name,
-                    quoted_id_field,
-                    entity_id,
-                )
-                if current_extra_data is _MISSING_EXTRA_DATA_ROW:
-                    return None
-
-                updated = _delete_source_enrichment_data(
-                    current_extra_data,
-                    source_id,
-                    allow_legacy_payload=True,
-                )
-                serialized = json.dumps(updated) if updated else None
-                connection.execute(
-                    text(
-                        f"UPDATE {quoted_table_name} "
-                        f"SET extra_data = :extra_data WHERE {quoted_id_field} = :entity_id"
-                    ),
-                    {
-                        "extra_data": serialized,
-                        "entity_id": entity_id,
-                    },
-                )
-                connection.commit()
-            return updated
-        finally:
-            db.close_db_session()
+        return _write_source_enrichment(
+            reference_name,
+            entity_id,
+            lambda extra_data: _delete_source_enrichment_data(
+                extra_data, source_id, allow_legacy_payload=True
+            ),
+            existing_extra_data,
+        )
     except Exception as exc:
         logger.warning(
             "Error deleting enrichment for '%s' entity %s source %s: %s",
@@ -1784,6 +1917,35 @@ def get_default_enrichment_stats() -> EnrichmentStatsResponse:
     return get_reference_enrichment_stats(config.reference_name)
 
 
+def _project_http_cache():
+    """Return the API response cache of the job or selected project, if any."""
+
+    work_dir = _job_work_dir_context.get() or get_optional_working_directory()
+    if work_dir is None:
+        return None
+
+    from niamoto.core.plugins.loaders._http_cache import get_http_cache
+
+    try:
+        return get_http_cache(work_dir)
+    except (OSError, sqlite3.Error) as exc:
+        logger.warning("API response cache unavailable in %s: %s", work_dir, exc)
+        return None
+
+
+def _enricher_batch_size(enricher: Any) -> int:
+    """Return the rows an enricher takes per batch call, or 1."""
+
+    if not callable(getattr(enricher, "load_data_batch", None)) and not callable(
+        getattr(enricher, "prepare_batch", None)
+    ):
+        return 1
+    try:
+        return max(1, int(getattr(enricher, "batch_size", 1)))
+    except (TypeError, ValueError):
+        return 1
+
+
 def _build_enricher(plugin_name: str):
     """Instantiate the plugin matching a source configuration."""
 
@@ -1792,7 +1954,7 @@ def _build_enricher(plugin_name: str):
             ApiTaxonomyEnricher,
         )
 
-        return ApiTaxonomyEnricher()
+        return ApiTaxonomyEnricher(http_cache=_project_http_cache())
 
     if plugin_name == "api_elevation_enricher":
         try:
@@ -1824,7 +1986,7 @@ def _build_enricher(plugin_name: str):
 
     from niamoto.core.plugins.loaders.api_taxonomy_enricher import ApiTaxonomyEnricher
 
-    return ApiTaxonomyEnricher()
+    return ApiTaxonomyEnricher(http_cache=_project_http_cache())
 
 
 def _build_plugin_config(
@@ -2221,6 +2383,37 @@ def _mark_job_cancelled(job_id: str) -> None:
     _current_job.updated_at = datetime.now().isoformat()
 
 
+class _TokenBucket:
+    """Async limiter letting at most ``rate`` requests start per second.
+
+    The bucket holds up to ``capacity`` tokens and refills continuously, so
+    the time spent in a request counts towards the delay before the next one.
+    A non-positive rate disables the limit.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._tokens = 1
+                self._updated = time.monotonic()
+            self._tokens -= 1
+
+
 async def _run_enrichment_job(
     job_id: str,
     reference_name: str,
@@ -2236,6 +2429,8 @@ async def _run_enrichment_job(
     resolved_work_dir = work_dir or _resolve_work_dir()
     project_path = _project_path_string(resolved_work_dir)
     context_token = _job_work_dir_context.set(resolved_work_dir)
+    writer = _EnrichmentWriter(reference_name, resolved_work_dir)
+    writer_token = _job_writer_context.set(writer)
 
     try:
         rows = await asyncio.to_thread(_load_reference_rows, reference_name)
@@ -2336,19 +2531,35 @@ async def _run_enrichment_job(
                 for source in sources
             }
         )
-        enrichers: Dict[str, Any] = {}
+        persist_lock = asyncio.Lock()
 
-        for row, source in pending_steps:
-            if _current_job is None or _current_job.id != job_id:
-                return
+        async def flush_writes() -> None:
+            """Write the buffered extra_data updates to the database."""
+            async with persist_lock:
+                await asyncio.to_thread(writer.flush)
 
-            if _job_cancel_flag:
-                _mark_job_cancelled(job_id)
-                return
+        def show_source(source: EnrichmentSourceConfig) -> None:
+            """Expose the progress of ``source`` as the current one."""
+            _current_job.current_source_id = source.id
+            _current_job.current_source_label = source.label
+            _current_job.current_source_total = source_totals[source.id]
+            _current_job.current_source_processed = source_completed[source.id]
+            _current_job.current_source_already_completed = source_initial_completed[
+                source.id
+            ]
+            _current_job.current_source_pending_total = source_pending_totals[source.id]
+            _current_job.current_source_pending_processed = source_pending_processed[
+                source.id
+            ]
+            _current_job.updated_at = datetime.now().isoformat()
+
+        async def wait_while_paused() -> bool:
+            """Block while the job is paused; False when the worker must stop."""
+            nonlocal consecutive_network_errors
 
             while True:
                 if not _is_active_job(job_id):
-                    return
+                    return False
                 if not (
                     _job_pause_flag or _current_job.status == JobStatus.PAUSED_OFFLINE
                 ):
@@ -2356,44 +2567,51 @@ async def _run_enrichment_job(
                 if _current_job.status != JobStatus.PAUSED_OFFLINE:
                     _current_job.status = JobStatus.PAUSED
                 if _job_cancel_flag:
-                    _mark_job_cancelled(job_id)
-                    return
+                    return False
+                # Paused jobs keep no progress in memory only
+                await flush_writes()
                 await asyncio.sleep(0.5)
 
             if _current_job.status in (JobStatus.PAUSED, JobStatus.PAUSED_OFFLINE):
                 _current_job.status = JobStatus.RUNNING
                 _current_job.error = None
                 consecutive_network_errors = 0
+            return True
+
+        def get_enricher(source: EnrichmentSourceConfig, enricher_key: Any) -> Any:
+            if enricher_key not in enrichers:
+                enrichers[enricher_key] = _build_enricher(source.plugin)
+            return enrichers[enricher_key]
+
+        async def process_step(
+            row: Dict[str, Any],
+            source: EnrichmentSourceConfig,
+            enricher_key: Any,
+            loaded: Any = _NOT_LOADED,
+        ) -> bool:
+            """Enrich one row from one source; False when the worker must stop.
+
+            ``loaded`` is the row's result from ``load_data_batch``, if any.
+            """
+            nonlocal consecutive_network_errors
 
             entity_name = _entity_name_for_row(row, source)
             _current_job.current_entity = entity_name
-            _current_job.current_source_id = source.id
-            _current_job.current_source_label = source.label
-            _current_job.current_source_total = source_totals[source.id]
-            _current_job.current_source_processed = source_completed[source.id]
-            _current_job.current_source_already_completed = source_initial_completed[
-                source.id
-            ]
-            _current_job.current_source_pending_total = source_pending_totals[source.id]
-            _current_job.current_source_pending_processed = source_pending_processed[
-                source.id
-            ]
-            _current_job.updated_at = datetime.now().isoformat()
+            show_source(source)
 
             try:
-                if source.id not in enrichers:
-                    enrichers[source.id] = _build_enricher(source.plugin)
-
-                result = await asyncio.to_thread(
-                    enrichers[source.id].load_data,
-                    row,
-                    _build_plugin_config(source),
-                )
-                if _current_job is None or _current_job.id != job_id:
-                    return
-                if _job_cancel_flag:
-                    _mark_job_cancelled(job_id)
-                    return
+                if loaded is _NOT_LOADED:
+                    result = await asyncio.to_thread(
+                        get_enricher(source, enricher_key).load_data,
+                        row,
+                        _build_plugin_config(source),
+                    )
+                elif isinstance(loaded, Exception):
+                    raise loaded
+                else:
+                    result = loaded
+                if not _is_active_job(job_id) or _job_cancel_flag:
+                    return False
 
                 source_data = (
                     result.get("api_enrichment", {}) if isinstance(result, dict) else {}
@@ -2406,37 +2624,34 @@ async def _run_enrichment_job(
                         raise RuntimeError(
                             f"Missing entity id for '{entity_name}' while saving enrichment data"
                         )
-                    merged_extra_data = await asyncio.to_thread(
-                        _save_source_enrichment_to_db,
-                        reference_name,
-                        entity_id,
-                        source,
-                        source_data,
-                        row.get("extra_data"),
-                    )
-                    if _current_job is None or _current_job.id != job_id:
-                        return
-                    if _job_cancel_flag:
-                        _mark_job_cancelled(job_id)
-                        return
+                    # Sources share rows: one read-merge-write at a time
+                    async with persist_lock:
+                        merged_extra_data = await asyncio.to_thread(
+                            _save_source_enrichment_to_db,
+                            reference_name,
+                            entity_id,
+                            source,
+                            source_data,
+                            row.get("extra_data"),
+                        )
+                    if not _is_active_job(job_id) or _job_cancel_flag:
+                        return False
                     if merged_extra_data is None:
                         raise RuntimeError(
                             f"Failed to persist enrichment data for source '{source.label}'"
                         )
                     row["extra_data"] = merged_extra_data
                 elif strategy == JobStrategy.RESET and entity_id is not None:
-                    updated_extra_data = await asyncio.to_thread(
-                        _delete_source_enrichment_from_db,
-                        reference_name,
-                        entity_id,
-                        source.id,
-                        row.get("extra_data"),
-                    )
-                    if _current_job is None or _current_job.id != job_id:
-                        return
-                    if _job_cancel_flag:
-                        _mark_job_cancelled(job_id)
-                        return
+                    async with persist_lock:
+                        updated_extra_data = await asyncio.to_thread(
+                            _delete_source_enrichment_from_db,
+                            reference_name,
+                            entity_id,
+                            source.id,
+                            row.get("extra_data"),
+                        )
+                    if not _is_active_job(job_id) or _job_cancel_flag:
+                        return False
                     if updated_extra_data is None:
                         raise RuntimeError(
                             f"Failed to clear enrichment data for source '{source.label}'"
@@ -2467,11 +2682,8 @@ async def _run_enrichment_job(
                     _current_job.empty += 1
                 consecutive_network_errors = 0
             except network_error_types as exc:
-                if _current_job is None or _current_job.id != job_id:
-                    return
-                if _job_cancel_flag:
-                    _mark_job_cancelled(job_id)
-                    return
+                if not _is_active_job(job_id) or _job_cancel_flag:
+                    return False
                 consecutive_network_errors += 1
                 _job_results.append(
                     EnrichmentResult(
@@ -2496,11 +2708,8 @@ async def _run_enrichment_job(
                     )
                     _current_job.updated_at = datetime.now().isoformat()
             except Exception as exc:
-                if _current_job is None or _current_job.id != job_id:
-                    return
-                if _job_cancel_flag:
-                    _mark_job_cancelled(job_id)
-                    return
+                if not _is_active_job(job_id) or _job_cancel_flag:
+                    return False
                 _job_results.append(
                     EnrichmentResult(
                         project_path=project_path,
@@ -2520,22 +2729,114 @@ async def _run_enrichment_job(
             _current_job.processed += 1
             _current_job.pending_processed += 1
             source_pending_processed[source.id] += 1
-            _current_job.current_source_processed = source_completed[source.id]
-            _current_job.current_source_pending_processed = source_pending_processed[
-                source.id
-            ]
-            _current_job.updated_at = datetime.now().isoformat()
+            show_source(source)
+            return True
+
+        async def source_worker(
+            source: EnrichmentSourceConfig,
+            source_rows: Iterator[Dict[str, Any]],
+            limiter: _TokenBucket,
+            worker_index: int,
+        ) -> None:
+            """Take the next pending rows of ``source`` until none is left.
+
+            Enrichers with ``load_data_batch`` get ``batch_size`` rows per
+            call, which takes a single rate limit token. Enrichers with
+            ``prepare_batch`` only send the batch's shared request that way,
+            then load each row as its own step, so that pause, cancel and
+            progress act between rows.
+            """
+            enricher_key = (source.id, worker_index)
+            try:
+                enricher = get_enricher(source, enricher_key)
+                batch_size = _enricher_batch_size(enricher)
+                prepare_batch = getattr(enricher, "prepare_batch", None)
+            except Exception:
+                # Reported for each row by process_step
+                batch_size = 1
+                prepare_batch = None
+
+            async def wait_for_turn() -> bool:
+                """Wait for a request token; False when the worker must stop."""
+                if not await wait_while_paused():
+                    return False
+                await limiter.acquire()
+                return _is_active_job(job_id) and not _job_cancel_flag
 
-            sleep_seconds = 0.0
-            if source.rate_limit > 0:
-                sleep_seconds = max(0.0, 1.0 / source.rate_limit)
-            if sleep_seconds:
-                await asyncio.sleep(sleep_seconds)
-            if not _is_active_job(job_id):
-                return
-            if _job_cancel_flag:
-                _mark_job_cancelled(job_id)
-                return
+            while True:
+                batch = list(itertools.islice(source_rows, batch_size))
+                if not batch:
+                    return
+                if not await wait_for_turn():
+                    return
+
+                results = [_NOT_LOADED] * len(batch)
+                if batch_size > 1 and callable(prepare_batch):
+                    try:
+                        await asyncio.to_thread(
+                            prepare_batch, batch, _build_plugin_config(source)
+                        )
+                    except Exception as exc:
+                        # Rows are then loaded without the shared answers
+                        logger.warning(
+                            "Batch preparation failed for source '%s': %s",
+                            source.label,
+                            exc,
+                        )
+                    for row in batch:
+                        if not await wait_for_turn():
+                            return
+                        if not await process_step(row, source, enricher_key):
+                            return
+                    continue
+                if batch_size > 1:
+                    try:
+                        results = await asyncio.to_thread(
+                            enrichers[enricher_key].load_data_batch,
+                            batch,
+                            _build_plugin_config(source),
+                        )
+                    except Exception as exc:
+                        results = [exc] * len(batch)
+                    if len(results) != len(batch):
+                        results = [
+                            RuntimeError(
+                                f"Source '{source.label}' returned "
+                                f"{len(results)} results for {len(batch)} rows"
+                            )
+                        ] * len(batch)
+                for row, loaded in zip(batch, results):
+                    if not await process_step(row, source, enricher_key, loaded):
+                        return
+
+        # Sources run side by side, each with its own workers sharing the
+        # source's pending rows and request rate
+        enrichers: Dict[Any, Any] = {}
+        steps_by_source: Dict[str, List[Dict[str, Any]]] = {
+            source.id: [] for source in sources
+        }
+        for row, source in pending_steps:
+            steps_by_source[source.id].append(row)
+        workers = []
+        for source in sources:
+            if not steps_by_source[source.id]:
+                continue
+            source_rows = iter(steps_by_source[source.id])
+            limiter = _TokenBucket(source.rate_limit)
+            workers.extend(
+                asyncio.create_task(
+                    source_worker(source, source_rows, limiter, worker_index)
+                )
+                for worker_index in range(
+                    min(source.concurrency, len(steps_by_source[source.id]))
+                )
+            )
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+        await flush_writes()
 
         if not _is_active_job(job_id):
             return
@@ -2558,6 +2859,13 @@ async def _run_enrichment_job(
         _current_job.error = str(exc)
         _current_job.updated_at = datetime.now().isoformat()
     finally:
+        try:
+            await asyncio.to_thread(writer.close)
+        except Exception as exc:
+            logger.warning(
+                "Error writing enrichment updates for '%s': %s", reference_name, exc
+            )
+        _job_writer_context.reset(writer_token)
         _job_work_dir_context.reset(context_token)
 
 
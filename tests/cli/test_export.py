@@ -68,7 +68,7 @@ def test_export_pages_no_group(mock_config, mock_path, mock_exporter):
     )
     # Check run_export is called instead of export_data
     mock_exporter.return_value.run_export.assert_called_once_with(
-        target_name="web_pages", group_filter=None
+        target_name="web_pages", group_filter=None, workers=1, incremental=False
     )
 
 
@@ -90,7 +90,29 @@ def test_export_pages_with_group(mock_config, mock_path, mock_exporter):
     )
     # Check run_export is called with the right group
     mock_exporter.return_value.run_export.assert_called_once_with(
-        target_name="web_pages", group_filter="taxon"
+        target_name="web_pages", group_filter="taxon", workers=1, incremental=False
+    )
+
+
+def test_export_with_workers(mock_config, mock_path, mock_exporter):
+    """Test that --workers is forwarded to the exporter service."""
+    runner = CliRunner()
+    result = runner.invoke(export_command, ["--target", "web_pages", "--workers", "4"])
+
+    assert result.exit_code == 0
+    mock_exporter.return_value.run_export.assert_called_once_with(
+        target_name="web_pages", group_filter=None, workers=4, incremental=False
+    )
+
+
+def test_export_incremental(mock_config, mock_path, mock_exporter):
+    """Test that --incremental is forwarded to the exporter service."""
+    runner = CliRunner()
+    result = runner.invoke(export_command, ["--incremental"])
+
+    assert result.exit_code == 0
+    mock_exporter.return_value.run_export.assert_called_once_with(
+        target_name=None, group_filter=None, workers=1, incremental=True
     )
 
 
@@ -131,7 +153,7 @@ def test_export_pages_missing_config(mock_config, mock_path, mock_exporter):
         db_path="/mock/db/path", config=mock_config_instance
     )
     mock_exporter.return_value.run_export.assert_called_once_with(
-        target_name="web_pages", group_filter=None
+        target_name="web_pages", group_filter=None, workers=1, incremental=False
     )
     assert "Database not found" not in result.output
 
@@ -193,7 +215,7 @@ def test_export_default_command(mock_config, mock_path, mock_exporter):
     )
     # Check run_export is called instead of export_data
     mock_exporter.return_value.run_export.assert_called_once_with(
-        target_name=None, group_filter=None
+        target_name=None, group_filter=None, workers=1, incremental=False
     )
 
 
@@ -24,6 +24,9 @@ def create_mock_registry(plugins_dict=None):
 
     mock_registry = Mock()
     mock_registry._plugins = registry_plugins
+    mock_registry.get_plugins_by_type = lambda plugin_type: dict(
+        registry_plugins[plugin_type]
+    )
     return mock_registry
 
 
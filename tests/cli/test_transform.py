@@ -97,6 +97,8 @@ def test_successful_group_transform(runner):
                     group_by="taxon",
                     csv_file=None,
                     recreate_table=True,
+                    workers=1,
+                    incremental=False,
                 )
 
 
@@ -119,6 +121,8 @@ def test_successful_all_transform(runner):
                 group_by=None,
                 csv_file=None,
                 recreate_table=True,
+                workers=1,
+                incremental=False,
             )
 
 
@@ -183,6 +187,8 @@ def test_transform_with_csv(runner):
                     group_by="taxon",
                     csv_file="data.csv",
                     recreate_table=True,
+                    workers=1,
+                    incremental=False,
                 )
 
 
@@ -289,6 +295,8 @@ def test_transform_with_verbose(runner):
                 group_by=None,
                 csv_file=None,
                 recreate_table=True,
+                workers=1,
+                incremental=False,
             )
 
 
@@ -334,6 +342,8 @@ def test_run_command_explicit(runner):
                 group_by="taxon",
                 csv_file=None,
                 recreate_table=True,
+                workers=1,
+                incremental=False,
             )
 
 
@@ -384,3 +394,56 @@ def test_check_with_config_error(runner):
         assert result.exit_code == 0
         assert "Error reading configuration" in result.output
         assert "Error in configuration" in result.output
+
+
+def test_transform_passes_workers_option(runner):
+    """The --workers option is forwarded to the transformer service."""
+    with mock.patch("niamoto.cli.commands.transform.Config") as mock_config:
+        mock_config.return_value.database_path = "test.db"
+
+        with mock.patch(
+            "niamoto.cli.commands.transform.TransformerService"
+        ) as mock_service:
+            mock_service_instance = mock_service.return_value
+            mock_service_instance.transform_data.return_value = None
+
+            result = runner.invoke(transform_commands, ["--workers", "4"])
+
+            assert result.exit_code == 0
+            mock_service_instance.transform_data.assert_called_once_with(
+                group_by=None,
+                csv_file=None,
+                recreate_table=True,
+                workers=4,
+                incremental=False,
+            )
+
+
+def test_transform_rejects_invalid_workers(runner):
+    """A worker count below one is rejected by the CLI."""
+    result = runner.invoke(transform_commands, ["--workers", "0"])
+
+    assert result.exit_code != 0
+
+
+def test_transform_passes_incremental_option(runner):
+    """The --incremental flag is forwarded to the transformer service."""
+    with mock.patch("niamoto.cli.commands.transform.Config") as mock_config:
+        mock_config.return_value.database_path = "test.db"
+
+        with mock.patch(
+            "niamoto.cli.commands.transform.TransformerService"
+        ) as mock_service:
+            mock_service_instance = mock_service.return_value
+            mock_service_instance.transform_data.return_value = None
+
+            result = runner.invoke(transform_commands, ["--incremental"])
+
+            assert result.exit_code == 0
+            mock_service_instance.transform_data.assert_called_once_with(
+                group_by=None,
+                csv_file=None,
+                recreate_table=True,
+                workers=1,
+                incremental=True,
+            )
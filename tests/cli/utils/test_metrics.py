@@ -255,6 +255,25 @@ class TestMetricsCollector:
         assert metrics.metrics["successful_targets"] == 1  # Only website succeeded
         assert metrics.metrics["targets_count"] == 2
 
+    def test_create_export_metrics_reports_incremental_pages(self):
+        """Unchanged and removed pages of incremental exports are reported."""
+        export_results = {
+            "website": {
+                "files_generated": 3,
+                "errors": 0,
+                "pages_skipped": 120,
+                "pages_removed": 2,
+            }
+        }
+
+        metrics = MetricsCollector.create_export_metrics(export_results)
+        lines = MetricsFormatter.format_export_metrics(metrics)
+
+        assert metrics.metrics["website_unchanged"] == 120
+        assert metrics.metrics["website_removed"] == 2
+        website_line = next(line for line in lines if "website:" in line)
+        assert "3 files generated, 120 unchanged, 2 removed" in website_line
+
     def test_create_export_metrics_simple_completion(self):
         """Test creating export metrics with simple completion status."""
         export_results = {"target1": "completed", "target2": True}
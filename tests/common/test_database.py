@@ -816,3 +816,98 @@ def test_execute_query_error_handling(test_database: Any) -> None:
     """Test execute_query error handling."""
     with pytest.raises(DatabaseQueryError):
         test_database.execute_query("SELECT * FROM nonexistent")
+
+
+def _create_typed_table(db: Database) -> None:
+    db.execute_sql(
+        """
+        CREATE TABLE typed (
+            id INTEGER,
+            count INTEGER,
+            label VARCHAR,
+            extra JSON,
+            observed DATE,
+            tags INTEGER[],
+            flag BOOLEAN
+        )
+        """
+    )
+    db.execute_sql(
+        """
+        INSERT INTO typed VALUES
+            (1, 5, 'a', json_object('k', 1), DATE '2020-01-02', [1, 2], true),
+            (2, NULL, NULL, NULL, NULL, NULL, NULL)
+        """
+    )
+
+
+def test_fetch_df_matches_read_sql(duckdb_database: Any) -> None:
+    """Test fetch_df builds the same DataFrame as pd.read_sql."""
+    import pandas as pd
+
+    _create_typed_table(duckdb_database)
+    query = "SELECT * FROM typed WHERE id >= :min_id ORDER BY id"
+
+    frame = duckdb_database.fetch_df(query, {"min_id": 1})
+    with duckdb_database.connection() as connection:
+        expected = pd.read_sql(text(query), connection, params={"min_id": 1})
+
+    pd.testing.assert_frame_equal(frame, expected, check_dtype=False)
+    assert frame["count"].dtype == expected["count"].dtype
+    assert frame.loc[0, "extra"] == {"k": 1}
+    assert frame.loc[0, "tags"] == [1, 2]
+    assert frame.loc[1, "observed"] is None
+
+
+def test_fetch_df_sqlite(test_database: Any) -> None:
+    """Test fetch_df falls back to pd.read_sql on other backends."""
+    test_database.execute_sql("CREATE TABLE test (id INTEGER, name TEXT)")
+    test_database.execute_sql("INSERT INTO test VALUES (1, 'alice')")
+
+    frame = test_database.fetch_df(
+        "SELECT * FROM test WHERE id = :id", params={"id": 1}
+    )
+    assert frame.to_dict("records") == [{"id": 1, "name": "alice"}]
+
+
+def test_fetch_df_error_handling(duckdb_database: Any) -> None:
+    """Test fetch_df raises DatabaseQueryError for invalid queries."""
+    with pytest.raises(DatabaseQueryError):
+        duckdb_database.fetch_df("SELECT * FROM nonexistent_table")
+
+
+def test_iter_records_matches_fetch_all(duckdb_database: Any) -> None:
+    """Test iter_records yields the same dictionaries as fetch_all."""
+    _create_typed_table(duckdb_database)
+    duckdb_database.execute_sql(
+        "INSERT INTO typed SELECT range + 10, range, NULL, NULL, NULL, NULL, NULL "
+        "FROM range(5000)"
+    )
+    query = "SELECT * FROM typed ORDER BY id"
+
+    records = list(duckdb_database.iter_records(query, batch_size=2048))
+
+    assert len(records) == 5002
+    assert records == [dict(row) for row in duckdb_database.fetch_all(query)]
+    assert records[1]["count"] is None
+    assert isinstance(records[0]["count"], int)
+
+
+def test_fetch_arrow_requires_pyarrow(duckdb_database: Any, monkeypatch) -> None:
+    """Test Arrow results raise a clear error when pyarrow is missing."""
+    import builtins
+
+    from niamoto.common.exceptions import DatabaseError
+
+    real_import = builtins.__import__
+
+    def fake_import(name, *args, **kwargs):
+        if name == "pyarrow":
+            raise ImportError("No module named 'pyarrow'")
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "__import__", fake_import)
+    with pytest.raises(DatabaseError, match="pyarrow is required"):
+        duckdb_database.fetch_arrow("SELECT 1")
+    with pytest.raises(DatabaseError, match="pyarrow is required"):
+        next(duckdb_database.iter_record_batches("SELECT 1"))
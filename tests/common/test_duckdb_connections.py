@@ -0,0 +1,166 @@
+"""Tests for the process-wide DuckDB connection manager."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import threading
+
+import duckdb
+
+from niamoto.common.database import Database
+from niamoto.common.duckdb_connections import (
+    get_duckdb_manager,
+    normalize_duckdb_path,
+)
+
+
+def test_wrappers_share_one_native_connection(tmp_path) -> None:
+    db_path = str(tmp_path / "shared.duckdb")
+    manager = get_duckdb_manager()
+    opened = manager.connections_opened
+
+    db = Database(db_path, optimize=False)
+    other = Database(db_path, optimize=False)
+    try:
+        db.execute_sql("CREATE TABLE items (id INTEGER)")
+        db.execute_sql("INSERT INTO items VALUES (1), (2)")
+        for _ in range(5):
+            assert other.execute_sql("SELECT COUNT(*) FROM items", fetch=True)[0] == 2
+    finally:
+        other.close()
+        db.close()
+
+    assert manager.connections_opened - opened == 1
+
+
+def test_threads_get_their_own_cursor(tmp_path) -> None:
+    db_path = str(tmp_path / "threads.duckdb")
+    db = Database(db_path, optimize=False)
+    db.execute_sql("CREATE TABLE items AS SELECT range AS id FROM range(1000)")
+    results = []
+
+    def count() -> None:
+        results.append(db.fetch_one("SELECT COUNT(*) AS n FROM items")["n"])
+
+    try:
+        threads = [threading.Thread(target=count) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        db.close()
+
+    assert results == [1000] * 8
+
+
+def test_last_release_closes_the_file(tmp_path) -> None:
+    db_path = str(tmp_path / "released.duckdb")
+    db = Database(db_path, optimize=False)
+    db.execute_sql("CREATE TABLE items (id INTEGER)")
+    db.close()
+
+    assert get_duckdb_manager().active_modes(db_path) == {True: 0, False: 0}
+    # A different configuration can only be opened once the file is closed
+    connection = duckdb.connect(db_path, read_only=True)
+    connection.close()
+
+
+def test_writer_reopens_a_read_only_connection(tmp_path) -> None:
+    db_path = str(tmp_path / "upgrade.duckdb")
+    setup = duckdb.connect(db_path)
+    setup.execute("CREATE TABLE items (id INTEGER)")
+    setup.close()
+
+    reader = Database(db_path, read_only=True, optimize=False)
+    writer = None
+    try:
+        assert reader.execute_sql("SELECT COUNT(*) FROM items", fetch=True)[0] == 0
+
+        writer = Database(db_path, optimize=False)
+        writer.execute_sql("INSERT INTO items VALUES (1)")
+
+        assert reader.execute_sql("SELECT COUNT(*) FROM items", fetch=True)[0] == 1
+    finally:
+        if writer is not None:
+            writer.close()
+        reader.close()
+
+
+def _count_in_child_process(db_path: str) -> subprocess.CompletedProcess:
+    script = (
+        "import sys\n"
+        "from niamoto.common.database import Database\n"
+        "db = Database(sys.argv[1], read_only=True, optimize=False)\n"
+        "print(db.execute_sql('SELECT COUNT(*) FROM items', fetch=True)[0])\n"
+    )
+    return subprocess.run(
+        [sys.executable, "-c", script, db_path],
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+
+def test_released_file_lock_lets_a_child_process_read(tmp_path) -> None:
+    db_path = str(tmp_path / "pool.duckdb")
+    db = Database(db_path, optimize=False)
+    other = Database(db_path, optimize=False)
+    try:
+        db.execute_sql("CREATE TABLE items AS SELECT range AS id FROM range(3)")
+        assert other.execute_sql("SELECT COUNT(*) FROM items", fetch=True)[0] == 3
+
+        db.release_file_lock()
+        child = _count_in_child_process(db_path)
+        assert child.returncode == 0, child.stderr
+        assert child.stdout.strip() == "3"
+
+        # Both wrappers reconnect on their next query
+        db.execute_sql("INSERT INTO items VALUES (3)")
+        assert other.execute_sql("SELECT COUNT(*) FROM items", fetch=True)[0] == 4
+    finally:
+        other.close()
+        db.close()
+
+
+def test_last_session_end_lets_a_child_process_read(tmp_path) -> None:
+    db_path = str(tmp_path / "session.duckdb")
+    db = Database(db_path, optimize=False)
+    other = Database(db_path, optimize=False)
+    try:
+        db.execute_sql("CREATE TABLE items AS SELECT range AS id FROM range(2)")
+        assert other.execute_sql("SELECT COUNT(*) FROM items", fetch=True)[0] == 2
+
+        db.close_db_session()
+        # ``other`` still has a session, so the file stays open
+        assert (
+            get_duckdb_manager()._databases[normalize_duckdb_path(db_path)].connection
+            is not None
+        )
+
+        other.close_db_session()
+        child = _count_in_child_process(db_path)
+        assert child.returncode == 0, child.stderr
+        assert child.stdout.strip() == "2"
+    finally:
+        other.close()
+        db.close()
+
+
+def test_read_only_access_shares_the_file_with_a_child_process(tmp_path) -> None:
+    db_path = str(tmp_path / "shared_lock.duckdb")
+    db = Database(db_path, optimize=False)
+    try:
+        db.execute_sql("CREATE TABLE items AS SELECT range AS id FROM range(4)")
+        with db.read_only_access():
+            assert db.execute_sql("SELECT COUNT(*) FROM items", fetch=True)[0] == 4
+            child = _count_in_child_process(db_path)
+            assert child.returncode == 0, child.stderr
+            assert child.stdout.strip() == "4"
+            assert db.execute_sql("SELECT COUNT(*) FROM items", fetch=True)[0] == 4
+
+        db.execute_sql("INSERT INTO items VALUES (4)")
+        assert db.execute_sql("SELECT COUNT(*) FROM items", fetch=True)[0] == 5
+    finally:
+        db.close()
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from niamoto.common.lru_cache import LRUCache
+
+
+def test_evicts_least_recently_used_entry_past_max_entries() -> None:
+    cache: LRUCache[str, int] = LRUCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+
+    cache.put("c", 3)
+
+    assert cache.keys() == ["a", "c"]
+    assert cache.get("b") is None
+
+
+def test_evicts_oldest_entries_past_max_weight() -> None:
+    cache: LRUCache[str, str] = LRUCache(max_weight=5, weigh=len)
+    cache.put("a", "xx")
+    cache.put("b", "yy")
+    cache.put("c", "zzz")
+
+    assert cache.keys() == ["b", "c"]
+    assert cache.weight == 5
+
+
+def test_rejects_a_value_heavier_than_the_cache() -> None:
+    cache: LRUCache[str, str] = LRUCache(max_weight=3, weigh=len)
+    cache.put("a", "x")
+
+    assert cache.put("b", "xxxx") is False
+    assert cache.keys() == ["a"]
+    assert cache.weight == 1
+
+
+def test_replacing_a_key_updates_the_weight() -> None:
+    cache: LRUCache[str, str] = LRUCache(max_weight=10, weigh=len)
+    cache.put("a", "xxxx")
+    cache.put("a", "xx")
+
+    assert len(cache) == 1
+    assert cache.weight == 2
+    assert cache.pop("a") == "xx"
+    assert cache.weight == 0
+
+
+def test_get_or_build_only_builds_missing_values() -> None:
+    cache: LRUCache[str, int] = LRUCache(max_entries=4)
+    calls = []
+
+    def build() -> int:
+        calls.append(1)
+        return 42
+
+    assert cache.get_or_build("a", build) == 42
+    assert cache.get_or_build("a", build) == 42
+    assert len(calls) == 1
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.get_or_build("a", build) == 42
+    assert len(calls) == 2
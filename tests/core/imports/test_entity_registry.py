@@ -7,7 +7,11 @@ import pytest
 
 from niamoto.common.database import Database
 from niamoto.common.exceptions import DatabaseQueryError
-from niamoto.core.imports.registry import EntityKind, EntityRegistry
+from niamoto.core.imports.registry import (
+    EntityKind,
+    EntityRegistry,
+    clear_registry_cache,
+)
 
 
 @pytest.fixture()
@@ -160,3 +164,113 @@ def test_invalid_entity_kind(registry: EntityRegistry):
         registry.get("bad_kind_entity")
 
     assert "Invalid entity kind value" in str(exc_info.value)
+
+
+@pytest.fixture()
+def file_db(tmp_path) -> Database:
+    db = Database(str(tmp_path / "registry.duckdb"))
+    try:
+        yield db
+    finally:
+        clear_registry_cache()
+        db.close_db_session()
+        db.engine.dispose()
+
+
+def test_lookups_are_cached_across_registries(file_db: Database, monkeypatch):
+    EntityRegistry(file_db).register_entity(
+        name="species",
+        kind=EntityKind.REFERENCE,
+        table_name="entity_species",
+        config={"schema": {"id": "species_id"}},
+    )
+    EntityRegistry(file_db).get("species")
+
+    statements = []
+    original_execute_sql = file_db.execute_sql
+
+    def recording_execute_sql(sql, *args, **kwargs):
+        statements.append(sql)
+        return original_execute_sql(sql, *args, **kwargs)
+
+    monkeypatch.setattr(file_db, "execute_sql", recording_execute_sql)
+
+    registry = EntityRegistry(file_db)
+    metadata = registry.get("species")
+    metadata.config["schema"]["id"] = "changed"
+
+    assert statements == []
+    assert registry.get("species").config["schema"]["id"] == "species_id"
+
+
+def test_register_and_remove_bump_the_version(file_db: Database):
+    registry = EntityRegistry(file_db)
+    other = EntityRegistry(file_db)
+    initial = registry.version
+
+    with pytest.raises(DatabaseQueryError):
+        other.get("plots")
+    assert other.list_entities() == []
+
+    registry.register_entity(
+        name="plots", kind=EntityKind.REFERENCE, table_name="entity_plots", config={}
+    )
+    assert registry.version == other.version == initial + 1
+    assert other.get("plots").table_name == "entity_plots"
+    assert [entity.name for entity in other.list_entities()] == ["plots"]
+
+    registry.remove("plots")
+    assert other.version == initial + 2
+    with pytest.raises(DatabaseQueryError):
+        other.get("plots")
+
+
+def test_changes_to_the_database_file_drop_the_cache(file_db: Database):
+    registry = EntityRegistry(file_db)
+    with pytest.raises(DatabaseQueryError):
+        registry.get("plots")
+    version = registry.version
+
+    # Written outside the registry, as another process would
+    file_db.execute_sql(
+        f"""
+        INSERT INTO {registry.ENTITIES_TABLE} (name, kind, table_name, config)
+        VALUES ('plots', 'reference', 'entity_plots', '{{}}')
+        """
+    )
+
+    assert registry.get("plots").table_name == "entity_plots"
+    assert registry.version > version
+
+
+def test_recreated_database_file_gets_the_metadata_table_again(tmp_path):
+    db_path = tmp_path / "registry.duckdb"
+    db = Database(str(db_path))
+    try:
+        EntityRegistry(db)
+        db.release_file_lock()
+        db_path.unlink()
+        db_path.with_name(db_path.name + ".wal").unlink(missing_ok=True)
+
+        registry = EntityRegistry(db)
+        assert registry.list_entities() == []
+        registry.register_entity(
+            name="plots",
+            kind=EntityKind.REFERENCE,
+            table_name="entity_plots",
+            config={},
+        )
+        assert registry.get("plots").table_name == "entity_plots"
+    finally:
+        clear_registry_cache()
+        db.close_db_session()
+        db.engine.dispose()
+
+
+def test_clear_registry_cache_bumps_the_version(file_db: Database):
+    registry = EntityRegistry(file_db)
+    version = registry.version
+
+    clear_registry_cache(file_db.db_path)
+
+    assert registry.version > version
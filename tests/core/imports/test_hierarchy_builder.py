@@ -340,3 +340,35 @@ def test_non_numeric_external_ids_raise_clear_validation_error(duckdb_database):
         "ngoila003",
         "ngoila004",
     }
+
+
+def test_add_nested_sets_numbers_forest_in_row_order():
+    """Roots and children are visited in row order; orphans get no bounds."""
+    df = pd.DataFrame(
+        {
+            "id": [1, 2, 10, 11, 20, 99],
+            "parent_id": pd.array([None, None, 1, 1, 2, 42], dtype="Int64"),
+        }
+    )
+
+    result = HierarchyBuilder(db=None).add_nested_sets(df)
+
+    assert result["lft"].tolist() == [1, 7, 2, 4, 8, pd.NA]
+    assert result["rght"].tolist() == [6, 10, 3, 5, 9, pd.NA]
+    assert str(result["lft"].dtype) == "Int64"
+
+
+def test_add_nested_sets_handles_hierarchies_deeper_than_recursion_limit():
+    """Deep chains are numbered without recursion."""
+    depth = 5000
+    df = pd.DataFrame(
+        {
+            "id": range(depth),
+            "parent_id": pd.array([None, *range(depth - 1)], dtype="Int64"),
+        }
+    )
+
+    result = HierarchyBuilder(db=None).add_nested_sets(df)
+
+    assert result["lft"].tolist() == list(range(1, depth + 1))
+    assert result["rght"].tolist() == list(range(2 * depth, depth, -1))
@@ -1,10 +1,16 @@
 """Tests for the GitHub Pages deployer."""
 
 import asyncio
+import base64
+import hashlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
 from pathlib import Path
 import shutil
 import subprocess
 import tempfile
+import threading
+from urllib.parse import urlsplit
 
 import httpx
 import pytest
@@ -40,6 +46,146 @@ class _FakeGitHubResponse:
             raise httpx.HTTPStatusError("GitHub API error", request, response)
 
 
+def _sha1(data: bytes) -> str:
+    return hashlib.sha1(data).hexdigest()
+
+
+class FakeGitHubApi:
+    """Git Data API stand-in on localhost keeping blobs, trees and branches."""
+
+    def __init__(self):
+        self.blobs: dict[str, bytes] = {}
+        self.trees: dict[str, dict[str, tuple[str, str]]] = {}
+        self.commits: dict[str, dict] = {}
+        self.refs: dict[str, str] = {}
+        self.blob_posts = 0
+        self.tree_payloads: list[dict] = []
+        self.lock = threading.Lock()
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _send(self, status, payload=None):
+                body = json.dumps(payload or {}).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _body(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                return json.loads(self.rfile.read(length) or b"{}")
+
+            def do_GET(self):
+                with api.lock:
+                    self._send(*api.get(urlsplit(self.path).path))
+
+            def do_POST(self):
+                with api.lock:
+                    self._send(*api.post(urlsplit(self.path).path, self._body()))
+
+            def do_PATCH(self):
+                payload = self._body()
+                with api.lock:
+                    branch = self.path.rsplit("/refs/heads/", 1)[1]
+                    api.refs[branch] = payload["sha"]
+                    self._send(200, {"object": {"sha": payload["sha"]}})
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_port}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def get(self, path):
+        _, _, _, _, *rest = path.split("/")
+        if rest == []:
+            return 200, {"size": 1, "default_branch": "main"}
+        if rest[:3] == ["git", "refs", "heads"]:
+            branch = "/".join(rest[3:])
+            if branch not in self.refs:
+                return 404, {"message": "Not Found"}
+            return 200, {"object": {"sha": self.refs[branch]}}
+        if rest[:2] == ["git", "commits"] and rest[2] in self.commits:
+            return 200, {"tree": {"sha": self.commits[rest[2]]["tree"]}}
+        if rest[:2] == ["git", "trees"] and rest[2] in self.trees:
+            entries = [
+                {"path": entry_path, "mode": mode, "type": "blob", "sha": sha}
+                for entry_path, (sha, mode) in sorted(self.trees[rest[2]].items())
+            ]
+            return 200, {"sha": rest[2], "tree": entries, "truncated": False}
+        return 404, {"message": "Not Found"}
+
+    def post(self, path, payload):
+        kind = path.rsplit("/", 1)[1]
+        if kind == "blobs":
+            self.blob_posts += 1
+            if payload["encoding"] == "base64":
+                content = base64.b64decode(payload["content"])
+            else:
+                content = payload["content"].encode("utf-8")
+            return 201, {"sha": self.store_blob(content)}
+        if kind == "trees":
+            self.tree_payloads.append(payload)
+            files = dict(self.trees.get(payload.get("base_tree"), {}))
+            for entry in payload["tree"]:
+                if entry["sha"] is None:
+                    files.pop(entry["path"], None)
+                else:
+                    files[entry["path"]] = (entry["sha"], entry["mode"])
+            return 201, {"sha": self.store_tree(files)}
+        if kind == "commits":
+            sha = _sha1(json.dumps(payload, sort_keys=True).encode())
+            self.commits[sha] = payload
+            return 201, {"sha": sha}
+        if kind == "refs":
+            self.refs[payload["ref"].removeprefix("refs/heads/")] = payload["sha"]
+            return 201, {}
+        return 404, {"message": "Not Found"}
+
+    def store_blob(self, content: bytes) -> str:
+        sha = _sha1(b"blob %d\0" % len(content) + content)
+        self.blobs[sha] = content
+        return sha
+
+    def store_tree(self, files: dict[str, tuple[str, str]]) -> str:
+        sha = _sha1(json.dumps(sorted(files.items())).encode())
+        self.trees[sha] = files
+        return sha
+
+    def seed_branch(self, branch: str, files: dict[str, bytes]) -> None:
+        with self.lock:
+            tree_sha = self.store_tree(
+                {
+                    path: (self.store_blob(content), "100644")
+                    for path, content in {**files, ".nojekyll": b""}.items()
+                }
+            )
+            commit = {"tree": tree_sha, "parents": [], "message": "seed"}
+            self.commits[tree_sha] = commit
+            self.refs[branch] = tree_sha
+
+    def branch_files(self, branch: str) -> dict[str, bytes]:
+        tree = self.trees[self.commits[self.refs[branch]]["tree"]]
+        return {path: self.blobs[sha] for path, (sha, _mode) in tree.items()}
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def fake_github(monkeypatch):
+    api = FakeGitHubApi()
+    monkeypatch.setattr("niamoto.core.plugins.deployers.github.BASE_URL", api.url)
+    monkeypatch.setattr(
+        "niamoto.core.plugins.deployers.github.GITHUB_API_WRITE_DELAY_SECONDS", 0
+    )
+    yield api
+    api.close()
+
+
 def _run_git(git_binary: str, *args: str, cwd: Path | None = None) -> str:
     result = subprocess.run(
         [git_binary, *args],
@@ -124,39 +270,57 @@ def test_github_deployer_pushes_exports_with_local_git(monkeypatch):
         )
 
 
-def test_github_deployer_blocks_large_api_fallback_without_git(monkeypatch):
-    with tempfile.TemporaryDirectory() as temp_dir:
-        exports_dir = Path(temp_dir) / "exports"
-        exports_dir.mkdir(parents=True, exist_ok=True)
+def test_github_deployer_blocks_large_api_fallback_without_git(
+    monkeypatch, tmp_path, fake_github
+):
+    exports_dir = tmp_path / "exports"
+    exports_dir.mkdir()
+    for index in range(GITHUB_API_SAFE_FILE_LIMIT + 1):
+        (exports_dir / f"page-{index}.html").write_text(f"{index}", encoding="utf-8")
 
-        for index in range(GITHUB_API_SAFE_FILE_LIMIT + 1):
-            (exports_dir / f"page-{index}.html").write_text("ok", encoding="utf-8")
+    monkeypatch.setattr(
+        "niamoto.core.plugins.deployers.github.CredentialService.get",
+        lambda platform, key: "github_pat_test",
+    )
+    monkeypatch.setattr(
+        "niamoto.core.plugins.deployers.github.shutil.which", lambda name: None
+    )
+    monkeypatch.setattr(
+        GitHubDeployer,
+        "_get_repository_default_branch",
+        staticmethod(lambda owner, repo, token: _async_default_branch("main")),
+    )
 
-        monkeypatch.setattr(
-            "niamoto.core.plugins.deployers.github.CredentialService.get",
-            lambda platform, key: "github_pat_test",
-        )
-        monkeypatch.setattr(
-            "niamoto.core.plugins.deployers.github.shutil.which", lambda name: None
-        )
-        monkeypatch.setattr(
-            GitHubDeployer,
-            "_get_repository_default_branch",
-            staticmethod(lambda owner, repo, token: _async_default_branch("main")),
-        )
+    deployer = GitHubDeployer()
+    config = DeployConfig(
+        platform="github",
+        exports_dir=exports_dir,
+        project_name="niamoto-test",
+        extra={"repo": "arsis-dev/niamoto-test"},
+    )
 
-        deployer = GitHubDeployer()
-        config = DeployConfig(
-            platform="github",
-            exports_dir=exports_dir,
-            project_name="niamoto-test",
-            extra={"repo": "arsis-dev/niamoto-test"},
-        )
+    lines = asyncio.run(_collect_lines(deployer.deploy(config)))
 
-        lines = asyncio.run(_collect_lines(deployer.deploy(config)))
+    assert any("GitHub API fallback uploads at most" in line for line in lines)
+    assert any(line.strip() == "data: DONE" for line in lines)
+    # Only the initial .nojekyll blob of the new branch was created
+    assert fake_github.blob_posts == 1
+
+    # Once the pages are on the branch, redeploys only upload what changed
+    fake_github.seed_branch(
+        "gh-pages",
+        {
+            f"page-{index}.html": f"{index}".encode()
+            for index in range(GITHUB_API_SAFE_FILE_LIMIT + 1)
+        },
+    )
+    (exports_dir / "page-0.html").write_text("changed", encoding="utf-8")
+
+    lines = asyncio.run(_collect_lines(deployer.deploy(config)))
 
-        assert any("Git is not available on this system" in line for line in lines)
-        assert any(line.strip() == "data: DONE" for line in lines)
+    assert any("SUCCESS: Deployed to GitHub Pages" in line for line in lines)
+    assert fake_github.blob_posts == 2
+    assert fake_github.branch_files("gh-pages")["page-0.html"] == b"changed"
 
 
 def test_github_deployer_refuses_dangerous_deploy_branch(monkeypatch, tmp_path):
@@ -476,3 +640,103 @@ def test_github_deployer_unpublish_reports_network_errors(monkeypatch, tmp_path)
 
     assert any("ERROR: GitHub API request failed" in line for line in lines)
     assert lines[-1].strip() == "data: DONE"
+
+
+def test_github_deployer_api_fallback_uploads_only_changed_files(tmp_path, fake_github):
+    exports_dir = tmp_path / "exports"
+    (exports_dir / "fr").mkdir(parents=True)
+    (exports_dir / "index.html").write_text("<h1>Hello</h1>", encoding="utf-8")
+    (exports_dir / "fr" / "a.html").write_text("a", encoding="utf-8")
+    (exports_dir / "fr" / "b.html").write_text("b", encoding="utf-8")
+    (exports_dir / "copy.html").write_text("a", encoding="utf-8")
+
+    deployer = GitHubDeployer()
+    config = DeployConfig(
+        platform="github",
+        exports_dir=exports_dir,
+        project_name="niamoto-test",
+        extra={"repo": "arsis-dev/niamoto-test", "branch": "gh-pages"},
+    )
+
+    def deploy():
+        return asyncio.run(
+            _collect_lines(
+                deployer._deploy_with_api(
+                    config=config,
+                    owner="arsis-dev",
+                    repo="niamoto-test",
+                    branch="gh-pages",
+                    token="github_pat_test",
+                    file_paths=GitHubDeployer._collect_export_files(exports_dir),
+                )
+            )
+        )
+
+    lines = deploy()
+
+    assert any("SUCCESS: Deployed to GitHub Pages" in line for line in lines)
+    # Empty .nojekyll blob from the branch creation, then three distinct contents
+    assert fake_github.blob_posts == 4
+    assert fake_github.branch_files("gh-pages") == {
+        ".nojekyll": b"",
+        "copy.html": b"a",
+        "fr/a.html": b"a",
+        "fr/b.html": b"b",
+        "index.html": b"<h1>Hello</h1>",
+    }
+
+    (exports_dir / "fr" / "b.html").write_text("b2", encoding="utf-8")
+    (exports_dir / "copy.html").unlink()
+    lines = deploy()
+
+    assert fake_github.blob_posts == 5
+    tree_payload = fake_github.tree_payloads[-1]
+    assert tree_payload["base_tree"]
+    assert sorted(
+        (entry["path"], entry["sha"] is None) for entry in tree_payload["tree"]
+    ) == [("copy.html", True), ("fr/b.html", False)]
+    assert fake_github.branch_files("gh-pages") == {
+        ".nojekyll": b"",
+        "fr/a.html": b"a",
+        "fr/b.html": b"b2",
+        "index.html": b"<h1>Hello</h1>",
+    }
+
+    commits = len(fake_github.commits)
+    lines = deploy()
+
+    assert any("GitHub Pages already up to date" in line for line in lines)
+    assert fake_github.blob_posts == 5
+    assert len(fake_github.commits) == commits
+
+
+def test_github_deployer_blob_uploads_share_one_rate_limit(monkeypatch):
+    delay = 0.05
+    monkeypatch.setattr(
+        "niamoto.core.plugins.deployers.github.GITHUB_API_WRITE_DELAY_SECONDS", delay
+    )
+    started: list[float] = []
+
+    async def fake_create_blob(client, owner, repo, rel_path, abs_path):
+        started.append(asyncio.get_running_loop().time())
+        # Slower than the rate limit, so uploads overlap
+        await asyncio.sleep(delay * 3)
+        return rel_path, None
+
+    monkeypatch.setattr(GitHubDeployer, "_create_blob", staticmethod(fake_create_blob))
+    missing = {f"page{i}": (f"page{i}", None) for i in range(6)}
+    uploaded: dict[str, str] = {}
+
+    asyncio.run(
+        _collect_lines(
+            GitHubDeployer()._upload_missing_blobs(
+                None, "arsis-dev", "niamoto-test", missing, uploaded
+            )
+        )
+    )
+
+    assert uploaded == {sha: sha for sha in missing}
+    gaps = [later - earlier for earlier, later in zip(started, started[1:])]
+    assert min(gaps) >= delay * 0.9
+    # Concurrent workers overlap uploads instead of waiting for each other
+    assert started[-1] - started[0] < delay * 3 * len(missing)
@@ -1,14 +1,24 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import io
+import json
+import threading
 import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from urllib.parse import unquote, urlsplit
 
 import httpx
+import pytest
 
 from niamoto.core.plugins.deployers.models import DeployConfig
-from niamoto.core.plugins.deployers.netlify import NetlifyDeployer
+from niamoto.core.plugins.deployers.netlify import (
+    UPLOAD_CHUNK_SIZE,
+    NetlifyDeployer,
+    _iter_file,
+)
 
 
 async def _collect_lines(generator):
@@ -61,6 +71,101 @@ class _FailingClient:
         raise httpx.ConnectError("network down")
 
 
+class FakeNetlifyApi:
+    """Digest deploy API stand-in on localhost remembering uploaded files."""
+
+    def __init__(self, accept_digests=True):
+        self.accept_digests = accept_digests
+        self.stored: set[str] = set()
+        self.deploys: dict[str, dict] = {}
+        self.uploads: list[str] = []
+        self.zip_posts = 0
+        self.lock = threading.Lock()
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _send(self, status, payload):
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _body(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                return self.rfile.read(length)
+
+            def do_POST(self):
+                body = self._body()
+                with api.lock:
+                    if self.headers.get("Content-Type") == "application/zip":
+                        api.zip_posts += 1
+                        self._send(201, {"id": "zip-deploy"})
+                        return
+                    if not api.accept_digests:
+                        self._send(422, {"message": "digest deploys disabled"})
+                        return
+                    files = json.loads(body)["files"]
+                    deploy_id = f"deploy-{len(api.deploys) + 1}"
+                    api.deploys[deploy_id] = files
+                    required = sorted(set(files.values()) - api.stored)
+                    self._send(200, {"id": deploy_id, "required": required})
+
+            def do_PUT(self):
+                body = self._body()
+                # /api/v1/deploys/{deploy_id}/files/{path}
+                parts = urlsplit(self.path).path.split("/", 6)
+                deploy_id, path = parts[4], "/" + unquote(parts[6])
+                with api.lock:
+                    digest = hashlib.sha1(body).hexdigest()
+                    if api.deploys[deploy_id].get(path) != digest:
+                        self._send(422, {"message": "digest mismatch"})
+                        return
+                    api.stored.add(digest)
+                    api.uploads.append(path)
+                    self._send(200, {"id": digest})
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_port}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def fake_netlify(monkeypatch):
+    api = FakeNetlifyApi()
+    monkeypatch.setattr("niamoto.core.plugins.deployers.netlify.BASE_URL", api.url)
+    monkeypatch.setattr(
+        "niamoto.core.plugins.deployers.netlify.CredentialService.get",
+        lambda *_args, **_kwargs: "netlify-token",
+    )
+
+    async def fake_poll(*_args, **_kwargs):
+        return {"state": "ready", "ssl_url": "https://niamoto-test.netlify.app"}
+
+    monkeypatch.setattr(NetlifyDeployer, "_poll_deploy", staticmethod(fake_poll))
+    yield api
+    api.close()
+
+
+def _netlify_config(exports_dir: Path) -> DeployConfig:
+    return DeployConfig(
+        platform="netlify",
+        exports_dir=exports_dir,
+        project_name="niamoto-test",
+        extra={"site_id": "site-123"},
+    )
+
+
 def test_netlify_create_zip_preserves_relative_paths(tmp_path: Path) -> None:
     exports_dir = tmp_path / "exports"
     (exports_dir / "fr").mkdir(parents=True)
@@ -108,7 +213,7 @@ def test_netlify_deployer_reports_live_url(monkeypatch, tmp_path: Path) -> None:
         platform="netlify",
         exports_dir=exports_dir,
         project_name="niamoto-test",
-        extra={"site_id": "site-123"},
+        extra={"site_id": "site-123", "deploy_mode": "zip"},
     )
 
     lines = asyncio.run(_collect_lines(deployer.deploy(config)))
@@ -128,6 +233,84 @@ def test_netlify_deployer_reports_live_url(monkeypatch, tmp_path: Path) -> None:
         assert archive.read("index.html") == b"hello"
 
 
+def test_netlify_digest_deploy_uploads_only_required_files(
+    tmp_path: Path, fake_netlify
+) -> None:
+    exports_dir = tmp_path / "exports"
+    (exports_dir / "fr taxons").mkdir(parents=True)
+    (exports_dir / "index.html").write_text("hello", encoding="utf-8")
+    (exports_dir / "copy.html").write_text("hello", encoding="utf-8")
+    (exports_dir / "fr taxons" / "42.html").write_text("taxon", encoding="utf-8")
+    deployer = NetlifyDeployer()
+
+    lines = asyncio.run(_collect_lines(deployer.deploy(_netlify_config(exports_dir))))
+
+    assert any("SUCCESS: Deployment is live!" in line for line in lines)
+    assert fake_netlify.deploys["deploy-1"] == {
+        "/copy.html": hashlib.sha1(b"hello").hexdigest(),
+        "/fr taxons/42.html": hashlib.sha1(b"taxon").hexdigest(),
+        "/index.html": hashlib.sha1(b"hello").hexdigest(),
+    }
+    # Identical files are uploaded once
+    assert sorted(fake_netlify.uploads) == ["/copy.html", "/fr taxons/42.html"]
+
+    fake_netlify.uploads.clear()
+    (exports_dir / "index.html").write_text("changed", encoding="utf-8")
+    lines = asyncio.run(_collect_lines(deployer.deploy(_netlify_config(exports_dir))))
+
+    assert any("Deploy created: deploy-2" in line for line in lines)
+    assert any("SUCCESS: Deployment is live!" in line for line in lines)
+    assert fake_netlify.uploads == ["/index.html"]
+    assert fake_netlify.zip_posts == 0
+
+
+def test_netlify_upload_chunks_are_read_off_the_event_loop(
+    monkeypatch, tmp_path: Path
+) -> None:
+    payload = bytes(range(256)) * (UPLOAD_CHUNK_SIZE // 128 + 1)
+    path = tmp_path / "big.bin"
+    path.write_bytes(payload)
+    reader_threads = set()
+
+    class _RecordingFile(io.FileIO):
+        def read(self, size=-1):
+            reader_threads.add(threading.get_ident())
+            return super().read(size)
+
+    monkeypatch.setattr(
+        "niamoto.core.plugins.deployers.netlify.open",
+        lambda file, mode: _RecordingFile(file, "rb"),
+        raising=False,
+    )
+
+    async def read_chunks():
+        chunks = [chunk async for chunk in _iter_file(str(path))]
+        return chunks, threading.get_ident()
+
+    chunks, loop_thread = asyncio.run(read_chunks())
+
+    assert b"".join(chunks) == payload
+    assert len(chunks) == 3
+    assert reader_threads and loop_thread not in reader_threads
+
+
+def test_netlify_digest_deploy_falls_back_to_zip(tmp_path: Path, fake_netlify) -> None:
+    exports_dir = tmp_path / "exports"
+    exports_dir.mkdir()
+    (exports_dir / "index.html").write_text("hello", encoding="utf-8")
+    fake_netlify.accept_digests = False
+
+    lines = asyncio.run(
+        _collect_lines(NetlifyDeployer().deploy(_netlify_config(exports_dir)))
+    )
+
+    assert any("falling back to ZIP upload" in line for line in lines)
+    assert any("Deploy created: zip-deploy" in line for line in lines)
+    assert any("SUCCESS: Deployment is live!" in line for line in lines)
+    assert fake_netlify.zip_posts == 1
+    assert fake_netlify.uploads == []
+
+
 def test_netlify_deployer_rejects_missing_exports_before_http(
     monkeypatch, tmp_path: Path
 ) -> None:
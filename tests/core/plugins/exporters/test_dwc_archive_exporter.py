@@ -650,11 +650,11 @@ class TestApplyTransformer:
             assert result == []
 
 
-class TestCollectOccurrences:
-    """Test collecting occurrences from groups."""
+class TestIterOccurrences:
+    """Test streaming occurrences from groups."""
 
-    def test_collect_occurrences_single_group(self, exporter):
-        """Test collecting occurrences from single group."""
+    def test_iter_occurrences_single_group(self, exporter):
+        """Test streaming occurrences from single group."""
         mock_db = MagicMock()
         groups = [{"group_by": "taxon", "transformer_plugin": "test_transformer"}]
 
@@ -670,15 +670,14 @@ class TestCollectOccurrences:
                 "_apply_transformer",
                 return_value=[{"occurrenceID": "occ1"}],
             ):
-                occurrences, terms = exporter._collect_occurrences(groups, mock_db)
+                occurrences = list(exporter._iter_occurrences(groups, mock_db))
 
-                assert len(occurrences) == 1
-                assert "occurrenceID" in terms
+                assert occurrences == [{"occurrenceID": "occ1"}]
                 assert exporter.stats["total_taxa"] == 1
                 assert exporter.stats["total_occurrences"] == 1
 
-    def test_collect_occurrences_multiple_groups(self, exporter):
-        """Test collecting occurrences from multiple groups."""
+    def test_iter_occurrences_multiple_groups(self, exporter):
+        """Test streaming occurrences from multiple groups."""
         mock_db = MagicMock()
         groups = [
             {"group_by": "taxon"},
@@ -693,26 +692,42 @@ class TestCollectOccurrences:
                 "_apply_transformer",
                 return_value=[{"occurrenceID": "occ1", "scientificName": "Species"}],
             ):
-                occurrences, terms = exporter._collect_occurrences(groups, mock_db)
+                occurrences = list(exporter._iter_occurrences(groups, mock_db))
 
                 # 2 groups × 2 items each = 4 occurrences
                 assert len(occurrences) == 4
-                assert "occurrenceID" in terms
-                assert "scientificName" in terms
+                assert exporter.stats["total_taxa"] == 4
 
-    def test_collect_occurrences_empty_group(self, exporter):
-        """Test collecting when group has no data."""
+    def test_iter_occurrences_is_lazy(self, exporter):
+        """Test that items are transformed only as occurrences are consumed."""
+        mock_db = MagicMock()
+        groups = [{"group_by": "taxon"}]
+
+        with patch.object(
+            exporter, "_fetch_group_data", return_value=[{"id": 1}, {"id": 2}]
+        ):
+            with patch.object(
+                exporter,
+                "_apply_transformer",
+                return_value=[{"occurrenceID": "occ1"}],
+            ) as apply_transformer:
+                occurrences = exporter._iter_occurrences(groups, mock_db)
+                next(occurrences)
+
+                assert apply_transformer.call_count == 1
+
+    def test_iter_occurrences_empty_group(self, exporter):
+        """Test streaming when group has no data."""
         mock_db = MagicMock()
         groups = [{"group_by": "empty_table"}]
 
         with patch.object(exporter, "_fetch_group_data", return_value=[]):
-            occurrences, terms = exporter._collect_occurrences(groups, mock_db)
+            occurrences = list(exporter._iter_occurrences(groups, mock_db))
 
-            assert len(occurrences) == 0
-            assert len(terms) == 0
+            assert occurrences == []
 
-    def test_collect_occurrences_handles_object_config(self, exporter):
-        """Test collecting with object-based group config."""
+    def test_iter_occurrences_handles_object_config(self, exporter):
+        """Test streaming with object-based group config."""
         mock_db = MagicMock()
         mock_group = MagicMock()
         mock_group.group_by = "taxon"
@@ -721,13 +736,57 @@ class TestCollectOccurrences:
             with patch.object(
                 exporter, "_apply_transformer", return_value=[{"occurrenceID": "occ1"}]
             ):
-                occurrences, terms = exporter._collect_occurrences(
-                    [mock_group], mock_db
-                )
+                occurrences = list(exporter._iter_occurrences([mock_group], mock_db))
 
                 assert len(occurrences) == 1
 
 
+class TestResolveDwcTerms:
+    """Test resolving the archive columns before writing records."""
+
+    def test_terms_from_dwc_mapping(self, exporter):
+        """Test that mapped groups need no pass over the data."""
+        groups = [
+            {
+                "group_by": "taxon",
+                "transformer_plugin": "niamoto_to_dwc_occurrence",
+                "transformer_params": {
+                    "mapping": {"occurrenceID": "@source.id", "basisOfRecord": "X"}
+                },
+            }
+        ]
+
+        with patch.object(exporter, "_fetch_group_data") as fetch_group_data:
+            terms = exporter._resolve_dwc_terms(groups, MagicMock())
+
+        assert terms == {"occurrenceID", "basisOfRecord"}
+        fetch_group_data.assert_not_called()
+
+    def test_terms_from_nested_params_mapping(self, exporter):
+        """Test mappings nested under a params key."""
+        group = {
+            "group_by": "taxon",
+            "transformer_plugin": "niamoto_to_dwc_occurrence",
+            "transformer_params": {"params": {"mapping": {"eventDate": "@x"}}},
+        }
+
+        assert exporter._mapping_terms(group) == {"eventDate"}
+
+    def test_terms_scanned_for_other_transformers(self, exporter):
+        """Test that other transformers are run once to collect their terms."""
+        groups = [{"group_by": "taxon", "transformer_plugin": "custom"}]
+
+        with patch.object(exporter, "_fetch_group_data", return_value=[{"id": 1}]):
+            with patch.object(
+                exporter,
+                "_apply_transformer",
+                return_value=[{"occurrenceID": "occ1", "eventDate": "2024"}],
+            ):
+                terms = exporter._resolve_dwc_terms(groups, MagicMock())
+
+        assert terms == {"occurrenceID", "eventDate"}
+
+
 class TestGenerateArchive:
     """Test complete archive generation."""
 
@@ -785,6 +844,27 @@ class TestGenerateArchive:
             with zipfile.ZipFile(output_dir / "dwc-archive.zip", "r") as zf:
                 assert "occurrence.csv.gz" in zf.namelist()
 
+    def test_generate_archive_streams_records(self, exporter, sample_occurrences):
+        """Test that records from a generator reach both the CSV and the archive."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir)
+            params = DwcArchiveExporterParams(output_dir=str(output_dir))
+            terms = {"occurrenceID", "scientificName"}
+
+            count = exporter._generate_archive(
+                (occurrence for occurrence in sample_occurrences),
+                terms,
+                output_dir,
+                params,
+            )
+
+            assert count == 2
+            assert exporter.stats["total_occurrences"] == 2
+            csv_content = (output_dir / "occurrence.csv").read_bytes()
+            with zipfile.ZipFile(output_dir / "dwc-archive.zip", "r") as zf:
+                assert zf.read("occurrence.csv") == csv_content
+            assert b"occ2\tSpecies B" in csv_content
+
 
 class TestExportMethod:
     """Test the main export() method."""
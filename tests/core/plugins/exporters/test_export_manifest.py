@@ -0,0 +1,94 @@
+"""Tests for the export manifest used by incremental exports."""
+
+from jinja2 import DictLoader, Environment
+
+from niamoto.core.plugins.exporters.export_manifest import (
+    MANIFEST_FILENAME,
+    ExportManifest,
+    hash_database_file,
+    hash_templates,
+)
+
+
+def _write(path, text="x"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+
+def test_unchanged_pages_are_current_after_a_reload(tmp_path):
+    page = _write(tmp_path / "taxon" / "1.html")
+    manifest = ExportManifest.load(tmp_path)
+    manifest.record("taxon", page, "hash-1")
+    manifest.save()
+
+    reloaded = ExportManifest.load(tmp_path)
+
+    assert reloaded.is_current("taxon", page, "hash-1")
+    assert not reloaded.is_current("taxon", page, "hash-2")
+    page.unlink()
+    assert not reloaded.is_current("taxon", page, "hash-1")
+
+
+def test_remove_stale_deletes_pages_not_produced_again(tmp_path):
+    kept = _write(tmp_path / "taxon" / "1.html")
+    stale = _write(tmp_path / "taxon" / "2.html")
+    dropped_group = _write(tmp_path / "plot" / "1.html")
+    previous_run = ExportManifest(tmp_path)
+    previous_run.record("taxon", kept, "a")
+    previous_run.record("taxon", stale, "b")
+    previous_run.record("plot", dropped_group, "c")
+    previous_run.save()
+
+    manifest = ExportManifest.load(tmp_path)
+    manifest.begin_section("taxon")
+    manifest.record("taxon", kept, "a")
+
+    assert manifest.remove_stale() == 2
+    assert kept.exists()
+    assert not stale.exists()
+    assert not dropped_group.exists()
+
+
+def test_filtered_runs_keep_other_sections(tmp_path):
+    other = _write(tmp_path / "plot" / "1.html")
+    manifest = ExportManifest(tmp_path, {"plot": {"plot/1.html": "c"}})
+    manifest.begin_section("taxon")
+
+    assert manifest.remove_stale(keep_unvisited=True) == 0
+    assert other.exists()
+    assert manifest.current["plot"] == {"plot/1.html": "c"}
+
+
+def test_entries_outside_the_export_are_never_deleted(tmp_path):
+    outside = _write(tmp_path / "outside.txt")
+    export_dir = tmp_path / "export"
+    manifest = ExportManifest(export_dir, {"taxon": {"../outside.txt": "a"}})
+
+    assert manifest.remove_stale() == 0
+    assert outside.exists()
+
+
+def test_unreadable_manifest_is_ignored(tmp_path):
+    (tmp_path / MANIFEST_FILENAME).write_text("{not json")
+
+    assert ExportManifest.load(tmp_path).previous == {}
+
+
+def test_template_hash_covers_every_template():
+    base = {"detail.html": "{% extends 'layout.html' %}", "layout.html": "v1"}
+    changed_layout = dict(base, **{"layout.html": "v2"})
+
+    assert hash_templates(Environment(loader=DictLoader(base))) != hash_templates(
+        Environment(loader=DictLoader(changed_layout))
+    )
+
+
+def test_database_hash_follows_writes_to_the_file_and_its_wal(tmp_path):
+    db_path = _write(tmp_path / "niamoto.duckdb", "data")
+    first = hash_database_file(db_path)
+
+    assert hash_database_file(str(db_path)) == first
+    _write(tmp_path / "niamoto.duckdb.wal", "pending")
+    assert hash_database_file(db_path) != first
+    assert hash_database_file(None) == ""
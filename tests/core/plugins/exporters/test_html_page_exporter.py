@@ -7,6 +7,8 @@ from pathlib import Path
 from typing import List
 from unittest.mock import Mock, MagicMock, patch
 
+import pandas as pd
+
 from niamoto.core.plugins.exporters.html_page_exporter import (
     HtmlPageExporter,
     _ensure_safe_html_output_dir_for_clear,
@@ -79,6 +81,11 @@ class TestHtmlPageExporter(NiamotoTestCase):
             "lft",
             "rght",
         ]
+        # Index data is read as a DataFrame; build it from the rows the
+        # tests configure on fetch_all
+        self.mock_db.fetch_df.side_effect = lambda query, params=None: pd.DataFrame(
+            list(self.mock_db.fetch_all(query, params) or [])
+        )
 
         # Create test templates
         self._create_test_templates()
@@ -676,6 +683,12 @@ class TestHtmlPageExporter(NiamotoTestCase):
             if "taxon_ref" in query:
                 # Navigation data
                 return [{"taxon_id": 1, "name": "Species 1", "rank": "species"}]
+            elif query.startswith("SELECT *"):
+                # Detail data
+                return [
+                    {"taxon_id": 1, "name": "Species 1", "data": '{"test": "value"}'},
+                    {"taxon_id": 2, "name": "Species 2", "data": '{"test": "value2"}'},
+                ]
             else:
                 # Index data
                 return [
@@ -684,10 +697,6 @@ class TestHtmlPageExporter(NiamotoTestCase):
                 ]
 
         self.mock_db.fetch_all.side_effect = fetch_all_side_effect
-        self.mock_db.fetch_one.side_effect = [
-            {"taxon_id": 1, "name": "Species 1", "data": '{"test": "value"}'},
-            {"taxon_id": 2, "name": "Species 2", "data": '{"test": "value2"}'},
-        ]
 
         exporter = HtmlPageExporter(self.mock_db)
 
@@ -756,15 +765,18 @@ class TestHtmlPageExporter(NiamotoTestCase):
         def fetch_all_side_effect(query, *args, **kwargs):
             if "taxon_ref" in query:
                 return []  # No navigation data
+            elif query.startswith("SELECT *"):
+                return [
+                    {
+                        "taxon_id": 1,
+                        "name": "Species 1",
+                        "chart_data": '[{"x": 1, "y": 2}]',
+                    }
+                ]
             else:
                 return [{"taxon_id": 1, "name": "Species 1"}]
 
         self.mock_db.fetch_all.side_effect = fetch_all_side_effect
-        self.mock_db.fetch_one.return_value = {
-            "taxon_id": 1,
-            "name": "Species 1",
-            "chart_data": '[{"x": 1, "y": 2}]',
-        }
 
         exporter = HtmlPageExporter(self.mock_db)
 
@@ -837,7 +849,6 @@ class TestHtmlPageExporter(NiamotoTestCase):
                 return []
 
         self.mock_db.fetch_all.side_effect = fetch_all_side_effect
-        self.mock_db.fetch_one.return_value = {"plot_id": 1, "name": "Plot 1"}
 
         groups = [
             GroupConfigWeb(
@@ -885,14 +896,21 @@ class TestHtmlPageExporter(NiamotoTestCase):
         # Test successful fetch
         exporter = HtmlPageExporter(self.mock_db)
         self.mock_db.get_table_columns.return_value = ["taxon_id", "name", "rank"]
-        self.mock_db.fetch_all.return_value = [
-            {"taxon_id": 1, "name": "Species A"},
-            {"taxon_id": 2, "name": "Species B"},
-        ]
+        self.mock_db.fetch_df.side_effect = None
+        self.mock_db.fetch_df.return_value = pd.DataFrame(
+            {"taxon_id": [1, 2], "name": ["Species A", None]}
+        )
 
         result = exporter._get_group_index_data(self.mock_db, "taxon", "taxon_id")
-        self.assertEqual(len(result), 2)
-        self.assertEqual(result[0]["name"], "Species A")
+        self.assertEqual(
+            result,
+            [
+                {"taxon_id": 1, "name": "Species A"},
+                {"taxon_id": 2, "name": None},
+            ],
+        )
+        query = self.mock_db.fetch_df.call_args.args[0]
+        self.assertIn('WHERE "taxon_id" IS NOT NULL', query)
 
         # Test missing table columns
         exporter = HtmlPageExporter(self.mock_db)
@@ -909,37 +927,406 @@ class TestHtmlPageExporter(NiamotoTestCase):
         # Test database error
         exporter = HtmlPageExporter(self.mock_db)
         self.mock_db.get_table_columns.return_value = ["taxon_id", "name"]
-        self.mock_db.fetch_all.side_effect = Exception("DB Error")
+        self.mock_db.fetch_df.side_effect = Exception("DB Error")
         result = exporter._get_group_index_data(self.mock_db, "taxon", "taxon_id")
         self.assertIsNone(result)
 
-    def test_get_item_detail_data(self):
-        """Test _get_item_detail_data method."""
+    def test_iter_item_detail_batches_paginates_by_id(self):
+        """Detail rows are streamed with one keyset query per chunk."""
+        db_path = Path(self.test_dir) / "detail.duckdb"
+        db = Database(str(db_path))
+        try:
+            db.execute_sql(
+                "CREATE TABLE taxons (taxons_id BIGINT, name TEXT, chart TEXT)"
+            )
+            db.execute_sql(
+                "INSERT INTO taxons VALUES "
+                "(3, 'C', '[1]'), (1, 'A', '{\"x\": 1}'), (5, 'E', NULL), "
+                "(2, 'B', '[]'), (4, 'D', '[2]'), (NULL, 'orphan', NULL)"
+            )
+            exporter = HtmlPageExporter(db)
+
+            batches = list(
+                exporter._iter_item_detail_batches(
+                    db, "taxons", "taxons_id", batch_size=2
+                )
+            )
+
+            self.assertEqual(
+                [[row["taxons_id"] for row in batch] for batch in batches],
+                [[1, 2], [3, 4], [5]],
+            )
+            decoded = exporter._decode_widget_sources(batches[0], {"chart"})
+            self.assertEqual(decoded, [{"chart": {"x": 1}}, {"chart": []}])
+        finally:
+            db.close()
+
+    def test_detail_pages_use_batched_rows(self):
+        """Detail pages are rendered from chunked rows, not per-item queries."""
+        self.mock_db.has_table.return_value = True
+        self.mock_db.get_table_columns.return_value = ["taxon_id", "name", "chart"]
+
+        def fetch_all_side_effect(query, *args, **kwargs):
+            if "taxon_ref" in query:
+                return []
+            if query.startswith("SELECT *"):
+                return [
+                    {"taxon_id": 1, "name": "Species 1", "chart": '{"v": 1}'},
+                    {"taxon_id": 3, "name": "Not indexed", "chart": '{"v": 3}'},
+                ]
+            return [
+                {"taxon_id": 1, "name": "Species 1"},
+                {"taxon_id": 2, "name": "Missing detail"},
+            ]
+
+        self.mock_db.fetch_all.side_effect = fetch_all_side_effect
+
+        from niamoto.core.plugins.registry import PluginRegistry
+        from niamoto.core.plugins.base import PluginType
+
+        PluginRegistry.register_plugin(
+            "batched_widget", MockWidgetPlugin, PluginType.WIDGET
+        )
         exporter = HtmlPageExporter(self.mock_db)
+        groups = [
+            GroupConfigWeb(
+                group_by="taxon",
+                output_pattern="{group_by}/{id}.html",
+                index_output_pattern="{group_by}/index.html",
+                widgets=[
+                    WidgetConfig(plugin="batched_widget", data_source="chart"),
+                ],
+            )
+        ]
+        from jinja2 import Environment, FileSystemLoader
 
-        # Test successful fetch
-        self.mock_db.fetch_one.return_value = {
-            "taxon_id": 1,
-            "name": "Species A",
-            "data": '{"key": "value"}',
-        }
+        jinja_env = Environment(loader=FileSystemLoader(str(self.template_dir)))
+        params = HtmlExporterParams(
+            output_dir=str(self.output_dir), template_dir=str(self.template_dir)
+        )
 
-        result = exporter._get_item_detail_data(self.mock_db, "taxon", "taxon_id", 1)
-        self.assertEqual(result["taxon_id"], 1)
-        self.assertEqual(result["name"], "Species A")
-        self.mock_db.fetch_one.assert_called_with(
-            'SELECT * FROM "taxon" WHERE "taxon_id" = :item_id', {"item_id": 1}
+        exporter._process_groups(
+            groups, jinja_env, params, self.output_dir, self.mock_db
         )
 
-        # Test not found
-        self.mock_db.fetch_one.return_value = None
-        result = exporter._get_item_detail_data(self.mock_db, "taxon", "taxon_id", 999)
-        self.assertIsNone(result)
+        self.mock_db.fetch_one.assert_not_called()
+        detail = self.output_dir / "taxon" / "1.html"
+        self.assertIn("Widget rendered with data: {'v': 1}", detail.read_text())
+        self.assertFalse((self.output_dir / "taxon" / "2.html").exists())
+        self.assertFalse((self.output_dir / "taxon" / "3.html").exists())
 
-        # Test database error
-        self.mock_db.fetch_one.side_effect = Exception("DB Error")
-        result = exporter._get_item_detail_data(self.mock_db, "taxon", "taxon_id", 1)
-        self.assertIsNone(result)
+    def test_incremental_run_skips_unchanged_detail_pages(self):
+        """Only changed pages are rendered again and removed items are deleted."""
+        from jinja2 import Environment, FileSystemLoader
+
+        from niamoto.core.plugins.base import PluginType
+        from niamoto.core.plugins.exporters.export_manifest import ExportManifest
+        from niamoto.core.plugins.registry import PluginRegistry
+
+        self.mock_db.has_table.return_value = True
+        self.mock_db.get_table_columns.return_value = ["taxon_id", "name", "chart"]
+        PluginRegistry.register_plugin(
+            "manifest_widget", MockWidgetPlugin, PluginType.WIDGET
+        )
+        groups = [
+            GroupConfigWeb(
+                group_by="taxon",
+                output_pattern="{group_by}/{id}.html",
+                index_output_pattern="{group_by}/index.html",
+                widgets=[WidgetConfig(plugin="manifest_widget", data_source="chart")],
+            )
+        ]
+        jinja_env = Environment(loader=FileSystemLoader(str(self.template_dir)))
+        params = HtmlExporterParams(
+            output_dir=str(self.output_dir), template_dir=str(self.template_dir)
+        )
+
+        def run(rows, incremental):
+            def fetch_all_side_effect(query, *args, **kwargs):
+                if "taxon_ref" in query:
+                    return []
+                return rows
+
+            self.mock_db.fetch_all.side_effect = fetch_all_side_effect
+            exporter = HtmlPageExporter(self.mock_db)
+            exporter._manifest = ExportManifest.load(self.output_dir)
+            exporter._incremental = incremental
+            exporter._process_groups(
+                groups, jinja_env, params, self.output_dir, self.mock_db
+            )
+            exporter.stats["pages_removed"] = exporter._manifest.remove_stale()
+            exporter._manifest.save()
+            return exporter.stats
+
+        first = run(
+            [
+                {"taxon_id": 1, "name": "Species 1", "chart": '{"v": 1}'},
+                {"taxon_id": 2, "name": "Species 2", "chart": '{"v": 2}'},
+                {"taxon_id": 3, "name": "Species 3", "chart": '{"v": 3}'},
+            ],
+            incremental=False,
+        )
+        second = run(
+            [
+                {"taxon_id": 1, "name": "Species 1", "chart": '{"v": 1}'},
+                {"taxon_id": 2, "name": "Species 2", "chart": '{"v": 20}'},
+            ],
+            incremental=True,
+        )
+
+        self.assertEqual(first["pages_rendered"], 3)
+        self.assertEqual(second["pages_rendered"], 1)
+        self.assertEqual(second["pages_skipped"], 1)
+        self.assertEqual(second["pages_removed"], 1)
+        self.assertIn(
+            "Widget rendered with data: {'v': 20}",
+            (self.output_dir / "taxon" / "2.html").read_text(),
+        )
+        self.assertFalse((self.output_dir / "taxon" / "3.html").exists())
+
+    def test_incremental_run_keeps_pages_that_fail_to_render(self):
+        """A failed render leaves the page of the previous run published."""
+        from jinja2 import Environment, FileSystemLoader
+
+        from niamoto.core.plugins.base import PluginType
+        from niamoto.core.plugins.exporters.export_manifest import ExportManifest
+        from niamoto.core.plugins.registry import PluginRegistry
+
+        self.mock_db.has_table.return_value = True
+        self.mock_db.get_table_columns.return_value = ["taxon_id", "name", "chart"]
+        PluginRegistry.register_plugin(
+            "manifest_widget", MockWidgetPlugin, PluginType.WIDGET
+        )
+        groups = [
+            GroupConfigWeb(
+                group_by="taxon",
+                output_pattern="{group_by}/{id}.html",
+                index_output_pattern="{group_by}/index.html",
+                widgets=[WidgetConfig(plugin="manifest_widget", data_source="chart")],
+            )
+        ]
+        jinja_env = Environment(loader=FileSystemLoader(str(self.template_dir)))
+        params = HtmlExporterParams(
+            output_dir=str(self.output_dir), template_dir=str(self.template_dir)
+        )
+
+        def run(chart, failure=None):
+            rows = [
+                {"taxon_id": 1, "name": "Species 1", "chart": chart},
+                {"taxon_id": 2, "name": "Species 2", "chart": chart},
+            ]
+            self.mock_db.fetch_all.side_effect = lambda query, *args, **kwargs: (
+                [] if "taxon_ref" in query else rows
+            )
+            exporter = HtmlPageExporter(self.mock_db)
+            exporter._manifest = ExportManifest.load(self.output_dir)
+            exporter._incremental = True
+            if failure is not None:
+                failure(exporter)
+            exporter._process_groups(
+                groups, jinja_env, params, self.output_dir, self.mock_db
+            )
+            exporter.stats["pages_removed"] = exporter._manifest.remove_stale()
+            exporter._manifest.save()
+            return exporter.stats
+
+        def fail_item_2(exporter):
+            render_widgets = exporter._render_widgets_for_item
+
+            def failing_render(**kwargs):
+                if kwargs["item_id"] == 2:
+                    raise RuntimeError("transient widget error")
+                return render_widgets(**kwargs)
+
+            exporter._render_widgets_for_item = failing_render
+
+        def fail_group(exporter):
+            def failing_batches(*args, **kwargs):
+                raise RuntimeError("detail table unavailable")
+
+            exporter._iter_item_detail_batches = failing_batches
+
+        run('{"v": 1}')
+        item_failed = run('{"v": 2}', failure=fail_item_2)
+        group_failed = run('{"v": 3}', failure=fail_group)
+
+        self.assertEqual(item_failed["errors_count"], 1)
+        self.assertEqual(item_failed["pages_removed"], 0)
+        self.assertEqual(group_failed["pages_removed"], 0)
+        page_1 = (self.output_dir / "taxon" / "1.html").read_text()
+        page_2 = (self.output_dir / "taxon" / "2.html").read_text()
+        self.assertIn("Widget rendered with data: {'v': 2}", page_1)
+        self.assertIn("Widget rendered with data: {'v': 1}", page_2)
+        # Once the error is gone, the kept page is rendered again
+        self.assertEqual(run('{"v": 4}')["pages_rendered"], 2)
+
+    def test_incremental_run_renders_database_readers_after_a_write(self):
+        """Pages of widgets that may query the database follow its fingerprint."""
+        from jinja2 import Environment, FileSystemLoader
+
+        from niamoto.core.plugins.base import PluginType
+        from niamoto.core.plugins.exporters.export_manifest import ExportManifest
+        from niamoto.core.plugins.registry import PluginRegistry
+
+        class DataOnlyWidgetPlugin(MockWidgetPlugin):
+            reads_database = False
+
+        self.mock_db.has_table.return_value = True
+        self.mock_db.get_table_columns.return_value = ["taxon_id", "name", "chart"]
+        self.mock_db.fetch_all.side_effect = lambda query, *args, **kwargs: (
+            []
+            if "taxon_ref" in query
+            else [{"taxon_id": 1, "name": "Species 1", "chart": '{"v": 1}'}]
+        )
+        PluginRegistry.register_plugin(
+            "reader_widget", MockWidgetPlugin, PluginType.WIDGET
+        )
+        PluginRegistry.register_plugin(
+            "data_widget", DataOnlyWidgetPlugin, PluginType.WIDGET
+        )
+        jinja_env = Environment(loader=FileSystemLoader(str(self.template_dir)))
+        params = HtmlExporterParams(
+            output_dir=str(self.output_dir), template_dir=str(self.template_dir)
+        )
+
+        def run(plugin, database_hash):
+            exporter = HtmlPageExporter(self.mock_db)
+            exporter._manifest = ExportManifest.load(self.output_dir)
+            exporter._incremental = True
+            exporter._database_hash = database_hash
+            groups = [
+                GroupConfigWeb(
+                    group_by="taxon",
+                    output_pattern="{group_by}/{id}.html",
+                    index_output_pattern="{group_by}/index.html",
+                    widgets=[WidgetConfig(plugin=plugin, data_source="chart")],
+                )
+            ]
+            exporter._process_groups(
+                groups, jinja_env, params, self.output_dir, self.mock_db
+            )
+            exporter._manifest.save()
+            return exporter.stats
+
+        for plugin, rendered_after_write in (("reader_widget", 1), ("data_widget", 0)):
+            run(plugin, "before")
+            self.assertEqual(run(plugin, "before")["pages_rendered"], 0)
+            self.assertEqual(
+                run(plugin, "after")["pages_rendered"], rendered_after_write
+            )
+
+    def test_detail_pages_rendered_through_worker_pool(self):
+        """Detail page chunks are sent to the pool and their stats aggregated."""
+        from concurrent.futures import Future
+
+        from jinja2 import Environment, FileSystemLoader
+
+        from niamoto.core.plugins import exporters
+        from niamoto.core.plugins.base import PluginType
+        from niamoto.core.plugins.registry import PluginRegistry
+
+        self.mock_db.has_table.return_value = True
+        self.mock_db.get_table_columns.return_value = ["taxon_id", "name", "chart"]
+
+        def fetch_all_side_effect(query, *args, **kwargs):
+            if "taxon_ref" in query:
+                return []
+            if query.startswith("SELECT *"):
+                return [
+                    {"taxon_id": i, "name": f"Species {i}", "chart": f'{{"v": {i}}}'}
+                    for i in range(1, 6)
+                ]
+            return [{"taxon_id": i, "name": f"Species {i}"} for i in range(1, 6)]
+
+        self.mock_db.fetch_all.side_effect = fetch_all_side_effect
+        PluginRegistry.register_plugin(
+            "pooled_widget", MockWidgetPlugin, PluginType.WIDGET
+        )
+
+        class InlinePool:
+            """Run submitted chunks in the test process."""
+
+            def __init__(self):
+                self.calls = []
+
+            def submit(self, fn, *args):
+                self.calls.append(args)
+                future = Future()
+                future.set_result(fn(*args))
+                return future
+
+        jinja_env = Environment(loader=FileSystemLoader(str(self.template_dir)))
+        pool = InlinePool()
+        exporter = HtmlPageExporter(self.mock_db)
+        exporter._detail_pool_workers = 1
+        groups = [
+            GroupConfigWeb(
+                group_by="taxon",
+                output_pattern="{group_by}/{id}.html",
+                index_output_pattern="{group_by}/index.html",
+                widgets=[WidgetConfig(plugin="pooled_widget", data_source="chart")],
+            )
+        ]
+        params = HtmlExporterParams(
+            output_dir=str(self.output_dir), template_dir=str(self.template_dir)
+        )
+
+        with (
+            patch.object(exporters.html_page_exporter, "_DETAIL_CHUNK_SIZE", 2),
+            patch.object(
+                exporters.html_page_exporter,
+                "_worker_exporter",
+                HtmlPageExporter(self.mock_db),
+            ),
+            patch.object(exporters.html_page_exporter, "_worker_jinja_env", jinja_env),
+        ):
+            exporter._process_groups(
+                groups,
+                jinja_env,
+                params,
+                self.output_dir,
+                self.mock_db,
+                detail_pool=pool,
+            )
+
+        self.assertEqual([len(items) for _, items in pool.calls], [2, 2, 1])
+        self.assertEqual(exporter.stats["errors_count"], 0)
+        for item_id in range(1, 6):
+            self.assertTrue((self.output_dir / "taxon" / f"{item_id}.html").exists())
+        self.assertIn(
+            "Widget rendered with data: {'v': 5}",
+            (self.output_dir / "taxon" / "5.html").read_text(),
+        )
+
+    def test_detail_pages_rendered_by_real_worker_processes(self):
+        """Spawned workers open the database while the parent reads it."""
+        db_path = Path(self.test_dir) / "niamoto.duckdb"
+        db = Database(str(db_path), optimize=False)
+        try:
+            db.execute_sql(
+                "CREATE TABLE plots AS "
+                "SELECT range AS plots_id, 'Plot ' || range AS name "
+                "FROM range(1, 6)"
+            )
+            self.target_config.groups = [
+                GroupConfigWeb(
+                    group_by="plots",
+                    template="_group_detail.html",
+                    output_pattern="plots/{id}.html",
+                    index_output_pattern="plots/index.html",
+                    widgets=[],
+                )
+            ]
+
+            HtmlPageExporter(db).export(self.target_config, db, workers=2)
+
+            for item_id in range(1, 6):
+                page = self.output_dir / "plots" / f"{item_id}.html"
+                self.assertIn(f"<h1>Plot {item_id}</h1>", page.read_text())
+            # The parent writes again once the pool is shut down
+            db.execute_sql("CREATE TABLE after_export AS SELECT 1 AS id")
+        finally:
+            db.close()
 
     def test_generate_navigation_js(self):
         """Test _generate_navigation_js method."""
@@ -1502,7 +1889,6 @@ class TestHtmlPageExporter(NiamotoTestCase):
                 return [{"taxon_id": 1, "name": "Species 1"}]
 
         self.mock_db.fetch_all.side_effect = fetch_all_side_effect
-        self.mock_db.fetch_one.return_value = {"taxon_id": 1, "name": "Species 1"}
 
         exporter = HtmlPageExporter(self.mock_db)
 
@@ -513,6 +513,83 @@ def test_process_group_resolves_default_table_inside_fetcher(tmp_path):
     exporter._fetch_group_data.assert_called_once_with(repository, None, "plots")
 
 
+def test_incremental_export_rewrites_only_changed_detail_files(tmp_path):
+    target_config = MagicMock()
+    target_config.name = "api"
+    target_config.params = {
+        "output_dir": str(tmp_path),
+        "detail_output_pattern": "{group}/{id}.json",
+        "index_output_pattern": "all_{group}.json",
+        "metadata": {"generate": False},
+    }
+    target_config.groups = [
+        GroupConfig(
+            group_by="taxon",
+            detail=DetailConfig(pass_through=True),
+            index=IndexConfig(fields=[{"id": "id"}]),
+        )
+    ]
+
+    def run(rows, incremental):
+        exporter = JsonApiExporter(Mock())
+        with patch.object(exporter, "_fetch_group_data", return_value=rows):
+            exporter.export(target_config, Mock(), incremental=incremental)
+        return exporter.stats
+
+    run(
+        [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}, {"id": 3, "name": "c"}],
+        incremental=False,
+    )
+    unchanged_mtime = (tmp_path / "taxon" / "1.json").stat().st_mtime_ns
+    stats = run([{"id": 1, "name": "a"}, {"id": 2, "name": "B"}], incremental=True)
+
+    assert stats["pages_rendered"] == 1
+    assert stats["pages_skipped"] == 1
+    assert stats["pages_removed"] == 1
+    assert (tmp_path / "taxon" / "1.json").stat().st_mtime_ns == unchanged_mtime
+    assert json.loads((tmp_path / "taxon" / "2.json").read_text())["name"] == "B"
+    assert not (tmp_path / "taxon" / "3.json").exists()
+    index = json.loads((tmp_path / "all_taxon.json").read_text())
+    assert len(index["taxon"]) == 2
+
+
+def test_incremental_export_keeps_detail_files_that_fail(tmp_path):
+    target_config = MagicMock()
+    target_config.name = "api"
+    target_config.params = {
+        "output_dir": str(tmp_path),
+        "detail_output_pattern": "{group}/{id}.json",
+        "metadata": {"generate": False},
+    }
+    target_config.groups = [
+        GroupConfig(group_by="taxon", detail=DetailConfig(pass_through=False))
+    ]
+
+    def run(rows, fail_id=None):
+        exporter = JsonApiExporter(Mock())
+        map_detail_data = DataMapper.map_detail_data
+
+        def failing_map(mapper, item):
+            if item["id"] == fail_id:
+                raise ValueError("transient mapping error")
+            return map_detail_data(mapper, item)
+
+        with (
+            patch.object(exporter, "_fetch_group_data", return_value=rows),
+            patch.object(DataMapper, "map_detail_data", failing_map),
+        ):
+            exporter.export(target_config, Mock(), incremental=True)
+        return exporter.stats
+
+    run([{"id": 1, "name": "a"}, {"id": 2, "name": "b"}])
+    stats = run([{"id": 1, "name": "A"}, {"id": 2, "name": "B"}], fail_id=2)
+
+    assert stats["pages_rendered"] == 1
+    assert stats["pages_removed"] == 0
+    assert (tmp_path / "taxon" / "2.json").exists()
+    assert run([{"id": 1, "name": "A"}, {"id": 2, "name": "B"}])["pages_rendered"] == 1
+
+
 def test_fetch_group_data_uses_first_existing_default_table():
     exporter = JsonApiExporter(Mock())
     repository = Mock()
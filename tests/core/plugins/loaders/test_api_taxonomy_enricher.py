@@ -864,6 +864,68 @@ def test_resolve_name_with_verifier_uses_profile_default_source(
     )
 
 
+def test_load_data_batch_verifies_names_in_one_request(
+    enricher: ApiTaxonomyEnricher,
+    requests_mock: requests_mock.Mocker,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Batches should resolve every name with a single verifier request."""
+
+    enricher._cache.clear()
+    requests_mock.post(
+        "https://resolver.globalnames.org/api/v1/verifications",
+        json={
+            "names": [
+                {
+                    "name": name,
+                    "bestResult": {
+                        "currentCanonicalSimple": name.split(" (")[0],
+                        "sortScore": 9.4,
+                    },
+                }
+                for name in ("Alpha beta (L.) DC.", "Gamma delta")
+            ]
+        },
+    )
+    queries = []
+
+    def fake_gbif_rich_data(**kwargs):
+        queries.append((kwargs["query_value"], kwargs["name_resolution"]["status"]))
+        return {**kwargs["taxon_data"], "api_enrichment": {}}
+
+    monkeypatch.setattr(enricher, "_load_gbif_rich_data", fake_gbif_rich_data)
+    config = {
+        "plugin": "api_taxonomy_enricher",
+        "params": {
+            "api_url": "https://api.gbif.org/v2/species/match",
+            "profile": "gbif_rich",
+            "use_name_verifier": True,
+            "response_mapping": {},
+            "rate_limit": 0,
+        },
+    }
+    rows = [
+        {"id": 1, "full_name": "Alpha beta (L.) DC."},
+        {"id": 2, "full_name": "Gamma delta"},
+        {"id": 3, "full_name": "Alpha beta (L.) DC."},
+    ]
+
+    results = enricher.load_data_batch(rows, config)
+
+    assert [result["id"] for result in results] == [1, 2, 3]
+    assert requests_mock.call_count == 1
+    assert requests_mock.request_history[0].json() == {
+        "nameStrings": ["Alpha beta (L.) DC.", "Gamma delta"],
+        "dataSources": [11],
+    }
+    assert queries == [
+        ("Alpha beta", "resolved"),
+        ("Gamma delta", "resolved"),
+        ("Alpha beta", "resolved"),
+    ]
+    assert enricher._name_verifications == {}
+
+
 def test_load_data_gbif_rich_uses_name_verifier_result(
     enricher: ApiTaxonomyEnricher, monkeypatch: pytest.MonkeyPatch
 ):
@@ -0,0 +1,182 @@
+"""Tests for the persistent API response cache, against a local fake API."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import pytest
+import requests
+
+from niamoto.core.plugins.loaders._http_cache import (
+    HttpResponseCache,
+    request_namespace,
+)
+from niamoto.core.plugins.loaders.api_taxonomy_enricher import ApiTaxonomyEnricher
+
+
+class FakeApi:
+    """JSON API on localhost answering conditional requests with ETags."""
+
+    def __init__(self):
+        self.bodies = {}
+        self.requests = []
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = urlsplit(self.path).path
+                api.requests.append((self.path, dict(self.headers)))
+                if path not in api.bodies:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                body = json.dumps(api.bodies[path]).encode("utf-8")
+                etag = f'"{hash(body) & 0xFFFFFFFF:x}"'
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("ETag", etag)
+                self.send_header("Last-Modified", "Mon, 05 Oct 2026 10:00:00 GMT")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def fake_api():
+    api = FakeApi()
+    yield api
+    api.close()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = HttpResponseCache(tmp_path / ".niamoto" / "http_cache.sqlite")
+    yield cache
+    cache.close()
+
+
+def test_fresh_entries_survive_a_reopen_without_requests(tmp_path, cache, fake_api):
+    fake_api.bodies["/species"] = {"key": 1, "name": "Alpha"}
+
+    first = cache.get_json(f"{fake_api.url}/species", {"q": "Alpha"})
+    reopened = HttpResponseCache(cache.path)
+    try:
+        second = reopened.get_json(f"{fake_api.url}/species", {"q": "Alpha"})
+    finally:
+        reopened.close()
+
+    assert first == second == {"key": 1, "name": "Alpha"}
+    assert len(fake_api.requests) == 1
+
+
+def test_expired_entries_are_revalidated_with_their_etag(tmp_path, fake_api):
+    cache = HttpResponseCache(tmp_path / "http_cache.sqlite", ttl=0)
+    fake_api.bodies["/species"] = {"key": 1}
+    try:
+        cache.get_json(f"{fake_api.url}/species")
+        assert cache.get_json(f"{fake_api.url}/species") == {"key": 1}
+
+        fake_api.bodies["/species"] = {"key": 2}
+        assert cache.get_json(f"{fake_api.url}/species") == {"key": 2}
+    finally:
+        cache.close()
+
+    headers = [request_headers for _, request_headers in fake_api.requests]
+    assert "If-None-Match" not in headers[0]
+    assert headers[1]["If-None-Match"]
+    assert headers[1]["If-Modified-Since"] == "Mon, 05 Oct 2026 10:00:00 GMT"
+    assert len(headers) == 3
+
+
+def test_failed_requests_are_not_cached(cache, fake_api):
+    with pytest.raises(requests.HTTPError):
+        cache.get_json(f"{fake_api.url}/missing")
+    fake_api.bodies["/missing"] = {"key": 3}
+
+    assert cache.get_json(f"{fake_api.url}/missing") == {"key": 3}
+    assert cache.total_size() > 0
+
+
+def test_eviction_drops_least_recently_used_entries(tmp_path):
+    cache = HttpResponseCache(tmp_path / "http_cache.sqlite", max_bytes=250)
+    try:
+        cache.put("api", "a", {"value": "a" * 90})
+        time.sleep(0.01)
+        cache.put("api", "b", {"value": "b" * 90})
+        time.sleep(0.01)
+        cache.get("api", "a")
+        time.sleep(0.01)
+        cache.put("api", "c", {"value": "c" * 90})
+
+        assert cache.get("api", "a") is not None
+        assert cache.get("api", "b") is None
+        assert cache.get("api", "c") is not None
+        assert cache.total_size() <= 250
+    finally:
+        cache.close()
+
+
+def test_namespaces_have_their_own_ttl_and_can_be_cleared(tmp_path):
+    cache = HttpResponseCache(
+        tmp_path / "http_cache.sqlite", namespace_ttls={"api.gbif.org": 0}
+    )
+    try:
+        cache.put("api.gbif.org", "key", {"source": "gbif"})
+        cache.put("services.tropicos.org", "key", {"source": "tropicos"})
+
+        assert not cache.get("api.gbif.org", "key").is_fresh
+        assert cache.get("services.tropicos.org", "key").is_fresh
+
+        cache.clear("api.gbif.org")
+        assert cache.get("api.gbif.org", "key") is None
+        assert cache.get("services.tropicos.org", "key").body == {"source": "tropicos"}
+    finally:
+        cache.close()
+
+    assert request_namespace("https://API.gbif.org/v1/species") == "api.gbif.org"
+
+
+def test_enricher_reuses_cached_responses_across_instances(cache, fake_api):
+    fake_api.bodies["/search"] = {"id": 42, "details": {"rank": "species"}}
+    config = {
+        "plugin": "api_taxonomy_enricher",
+        "params": {
+            "api_url": f"{fake_api.url}/search",
+            "query_field": "full_name",
+            "response_mapping": {"api_id": "id", "rank": "details.rank"},
+            "rate_limit": 0,
+        },
+    }
+    taxon = {"id": 1, "full_name": "Alpha beta"}
+
+    results = []
+    for _ in range(2):
+        ApiTaxonomyEnricher._cache.clear()
+        results.append(ApiTaxonomyEnricher(http_cache=cache).load_data(taxon, config))
+
+    assert results[0]["api_enrichment"] == {"api_id": 42, "rank": "species"}
+    assert results[1] == results[0]
+    assert len(fake_api.requests) == 1
+
+    # Previews that disable caching always query the API
+    config["params"]["cache_results"] = False
+    ApiTaxonomyEnricher(http_cache=cache).load_data(taxon, config)
+    assert len(fake_api.requests) == 2
@@ -0,0 +1,107 @@
+"""Tests for the pooled HTTP client shared by the API enrichers."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from niamoto.core.plugins.loaders._http_client import (
+    EnricherHttpClient,
+    close_http_client,
+    get_http_client,
+)
+
+
+class FakeServer:
+    """Local server recording concurrency, failing the first ``failures`` calls."""
+
+    def __init__(self, failures=0, delay=0.0):
+        self.failures = failures
+        self.delay = delay
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                with server.lock:
+                    server.calls += 1
+                    server.active += 1
+                    server.max_active = max(server.max_active, server.active)
+                    failing = server.calls <= server.failures
+                time.sleep(server.delay)
+                with server.lock:
+                    server.active -= 1
+                body = b'{"ok": true}'
+                self.send_response(503 if failing else 200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Set-Cookie", "session=abc; Path=/")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_port}/api"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def make_server():
+    servers = []
+
+    def make(**kwargs):
+        servers.append(FakeServer(**kwargs))
+        return servers[-1]
+
+    yield make
+    for server in servers:
+        server.close()
+
+
+def test_requests_to_a_host_are_limited(make_server):
+    server = make_server(delay=0.1)
+    client = EnricherHttpClient(max_per_host=2)
+
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        statuses = list(
+            pool.map(lambda _: client.get(server.url).status_code, range(6))
+        )
+
+    assert statuses == [200] * 6
+    assert server.max_active == 2
+    client.close()
+
+
+def test_server_errors_are_retried_with_backoff(make_server):
+    server = make_server(failures=2)
+    client = EnricherHttpClient(backoff_factor=0.01)
+
+    response = client.get(server.url, timeout=5)
+
+    assert response.status_code == 200
+    assert response.json() == {"ok": True}
+    assert server.calls == 3
+    # Cookies set by servers are not kept for the next requests
+    assert len(client.session.cookies) == 0
+    client.close()
+
+
+def test_shared_client_is_reused_until_closed():
+    first = get_http_client()
+    assert get_http_client() is first
+
+    close_http_client()
+    assert get_http_client() is not first
@@ -13,7 +13,7 @@ def _normalized_sql(statement) -> str:
 
 
 def _assert_hierarchy_query(
-    read_sql_mock: Mock,
+    fetch_df_mock: Mock,
     *,
     data_table: str,
     grouping_table: str,
@@ -23,12 +23,12 @@ def _assert_hierarchy_query(
     right_field: str,
     bounds: tuple[int, int],
 ) -> None:
-    query = _normalized_sql(read_sql_mock.call_args.args[0])
+    query = _normalized_sql(fetch_df_mock.call_args.args[0])
     assert f'FROM "{data_table}" m' in query
     assert f'JOIN "{grouping_table}" ref ON m."{key_field}" = ref."{ref_key}"' in query
     assert f'WHERE ref."{left_field}" >= :left' in query
     assert f'AND ref."{right_field}" <= :right' in query
-    assert read_sql_mock.call_args.kwargs["params"] == {
+    assert fetch_df_mock.call_args.args[1] == {
         "left": bounds[0],
         "right": bounds[1],
     }
@@ -159,9 +159,7 @@ class TestConfigValidation:
 class TestLoadDataWithRegistry:
     """Test load_data method uses EntityRegistry for table resolution."""
 
-    def test_load_data_resolves_table_names(
-        self, loader, mock_db, mock_registry, monkeypatch
-    ):
+    def test_load_data_resolves_table_names(self, loader, mock_db, mock_registry):
         """Test that load_data resolves entity names via registry."""
         # Setup test data
         config = {
@@ -182,10 +180,9 @@ class TestLoadDataWithRegistry:
 
         mock_db.connection.return_value = mock_conn
 
-        # Mock pandas read_sql to avoid actual DB query
+        # Mock the DataFrame query to avoid actual DB query
         mock_df = pd.DataFrame({"id": [1, 2], "name": ["test1", "test2"]})
-        read_sql_mock = Mock(return_value=mock_df)
-        monkeypatch.setattr("pandas.read_sql", read_sql_mock)
+        mock_db.fetch_df.return_value = mock_df
 
         # Execute load_data
         result = loader.load_data(group_id=1, config=config)
@@ -199,7 +196,7 @@ class TestLoadDataWithRegistry:
         assert isinstance(result, pd.DataFrame)
         assert len(result) == 2
         _assert_hierarchy_query(
-            read_sql_mock,
+            mock_db.fetch_df,
             data_table="entity_occurrences",
             grouping_table="entity_taxons",
             key_field="taxon_id",
@@ -209,7 +206,7 @@ class TestLoadDataWithRegistry:
             bounds=(1, 10),
         )
 
-    def test_load_data_with_custom_entity_names(self, loader, mock_db, monkeypatch):
+    def test_load_data_with_custom_entity_names(self, loader, mock_db):
         """Test load_data works with custom entity names like 'flora', 'observations'."""
         # Setup custom entity registry
         custom_registry = Mock(spec=EntityRegistry)
@@ -250,8 +247,7 @@ class TestLoadDataWithRegistry:
         mock_db.connection.return_value = mock_conn
 
         mock_df = pd.DataFrame({"id": [10, 20]})
-        read_sql_mock = Mock(return_value=mock_df)
-        monkeypatch.setattr("pandas.read_sql", read_sql_mock)
+        mock_db.fetch_df.return_value = mock_df
 
         # Execute
         result = custom_loader.load_data(group_id=5, config=config)
@@ -262,7 +258,7 @@ class TestLoadDataWithRegistry:
 
         assert isinstance(result, pd.DataFrame)
         _assert_hierarchy_query(
-            read_sql_mock,
+            mock_db.fetch_df,
             data_table="entity_observations",
             grouping_table="entity_flora",
             key_field="flora_id",
@@ -276,9 +272,7 @@ class TestLoadDataWithRegistry:
 class TestBackwardCompatibility:
     """Test backward compatibility with configs using physical table names."""
 
-    def test_load_data_with_physical_table_names(
-        self, loader, mock_db, mock_registry, monkeypatch
-    ):
+    def test_load_data_with_physical_table_names(self, loader, mock_db, mock_registry):
         """Test that configs with physical table names still work (fallback)."""
         # Simulate config using physical table names directly
         config = {
@@ -302,8 +296,7 @@ class TestBackwardCompatibility:
         mock_db.connection.return_value = mock_conn
 
         mock_df = pd.DataFrame({"id": [100]})
-        read_sql_mock = Mock(return_value=mock_df)
-        monkeypatch.setattr("pandas.read_sql", read_sql_mock)
+        mock_db.fetch_df.return_value = mock_df
 
         # Should not raise exception, should fallback to physical names
         result = loader.load_data(group_id=1, config=config)
@@ -312,7 +305,7 @@ class TestBackwardCompatibility:
         # Registry was attempted but failed (fallback worked)
         assert mock_registry.get.called
         _assert_hierarchy_query(
-            read_sql_mock,
+            mock_db.fetch_df,
             data_table="some_physical_table",
             grouping_table="another_physical_table",
             key_field="taxon_id",
@@ -0,0 +1,177 @@
+"""Tests for bulk partitioned loading (``LoaderPlugin.load_partitions``)."""
+
+import shutil
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from niamoto.common.database import Database
+from niamoto.core.imports.registry import EntityKind, EntityRegistry
+from niamoto.core.plugins.base import LoaderPlugin
+from niamoto.core.plugins.loaders import direct_reference
+from niamoto.core.plugins.loaders._partitions import iter_sorted_partitions
+from niamoto.core.plugins.loaders.direct_reference import DirectReferenceLoader
+from niamoto.core.plugins.loaders.nested_set import NestedSetLoader
+
+
+@pytest.fixture
+def temp_db():
+    temp_dir = tempfile.mkdtemp()
+    db = Database(str(Path(temp_dir) / "test.duckdb"))
+    yield db
+    db.close()
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+@pytest.fixture
+def populated_db(temp_db):
+    # 1 Plantae [1, 10]
+    #   2 Fabaceae [2, 5]
+    #     3 Acacia [3, 4]
+    #   4 Myrtaceae [6, 9]
+    #     5 Syzygium [7, 8]
+    # 6 Orphan (no occurrences) [11, 12]
+    temp_db.execute_sql(
+        "CREATE TABLE taxons (id INTEGER, taxon_id INTEGER, lft INTEGER, "
+        "rght INTEGER, parent_id INTEGER, name TEXT)"
+    )
+    temp_db.execute_sql(
+        "INSERT INTO taxons VALUES "
+        "(1, 101, 1, 10, NULL, 'Plantae'), (2, 102, 2, 5, 1, 'Fabaceae'), "
+        "(3, 103, 3, 4, 2, 'Acacia'), (4, 104, 6, 9, 1, 'Myrtaceae'), "
+        "(5, 105, 7, 8, 4, 'Syzygium'), (6, 106, 11, 12, NULL, 'Orphan')"
+    )
+    temp_db.execute_sql(
+        "CREATE TABLE occurrences (id INTEGER, taxon_ref_id INTEGER, "
+        "plot_id INTEGER, dbh DOUBLE)"
+    )
+    temp_db.execute_sql(
+        "INSERT INTO occurrences VALUES "
+        "(1, 103, 1, 10.0), (2, 103, 2, 12.5), (3, 102, 1, 30.0), "
+        "(4, 105, 2, 22.0), (5, 104, 3, 18.0), (6, 101, 3, 5.0), "
+        "(7, 105, 1, 40.0)"
+    )
+    temp_db.execute_sql("CREATE TABLE plots (id INTEGER, name TEXT)")
+    temp_db.execute_sql("INSERT INTO plots VALUES (1, 'A'), (2, 'B'), (3, 'C')")
+    return temp_db
+
+
+def _sorted(frame: pd.DataFrame) -> pd.DataFrame:
+    return frame.sort_values("id").reset_index(drop=True)
+
+
+def test_iter_sorted_partitions_slices_inclusive_ranges():
+    frame = pd.DataFrame({"value": ["a", "b", "c", "d"]})
+    keys = pd.Series([1, 2, 2, 5]).to_numpy()
+
+    partitions = dict(
+        iter_sorted_partitions(
+            frame, keys, [("x", 2, 2), ("y", 1, 5), ("z", 3, 4), ("w", None, None)]
+        )
+    )
+
+    assert partitions["x"]["value"].tolist() == ["b", "c"]
+    assert partitions["y"]["value"].tolist() == ["a", "b", "c", "d"]
+    assert partitions["z"].empty
+    assert list(partitions["w"].columns) == ["value"]
+
+
+def test_default_load_partitions_falls_back_to_load_data():
+    class _Loader(LoaderPlugin):
+        def load_data(self, group_id, config):
+            return pd.DataFrame({"group": [group_id]})
+
+    partitions = list(_Loader(db=None).load_partitions([3, 1], {}))
+
+    assert [group_id for group_id, _ in partitions] == [3, 1]
+    assert partitions[0][1]["group"].tolist() == [3]
+
+
+def test_nested_set_partitions_match_load_data(populated_db):
+    loader = NestedSetLoader(populated_db)
+    config = {
+        "data": "occurrences",
+        "grouping": "taxons",
+        "key": "taxon_ref_id",
+        "ref_key": "taxon_id",
+        "fields": {"left": "lft", "right": "rght", "parent": "parent_id"},
+    }
+    group_ids = [1, 2, 3, 4, 5, 6, 99]
+
+    partitions = list(loader.load_partitions(group_ids, config))
+
+    assert [group_id for group_id, _ in partitions] == group_ids
+    for group_id, frame in partitions:
+        expected = loader.load_data(group_id, config)
+        assert "_niamoto_partition_key" not in frame.columns
+        if expected.empty:
+            assert frame.empty
+            continue
+        pd.testing.assert_frame_equal(_sorted(frame), _sorted(expected))
+
+    by_id = dict(partitions)
+    assert sorted(by_id[1]["id"]) == [1, 2, 3, 4, 5, 6, 7]
+    assert sorted(by_id[2]["id"]) == [1, 2, 3]
+
+
+def test_nested_set_partitions_only_scan_requested_span(populated_db):
+    loader = NestedSetLoader(populated_db)
+    config = {
+        "data": "occurrences",
+        "grouping": "taxons",
+        "key": "taxon_ref_id",
+        "ref_key": "taxon_id",
+        "fields": {"left": "lft", "right": "rght", "parent": "parent_id"},
+    }
+
+    partitions = dict(loader.load_partitions([4, 5], config))
+
+    assert sorted(partitions[4]["id"]) == [4, 5, 7]
+    assert sorted(partitions[5]["id"]) == [4, 7]
+
+
+@pytest.mark.parametrize("ref_key", [None, "id"])
+def test_direct_reference_partitions_match_load_data(populated_db, ref_key):
+    EntityRegistry(populated_db).register_entity(
+        "plots", EntityKind.REFERENCE, "plots", {"schema": {"id_field": "id"}}
+    )
+    loader = DirectReferenceLoader(populated_db)
+    config = {"data": "occurrences", "grouping": "plots", "key": "plot_id"}
+    if ref_key:
+        config["ref_key"] = ref_key
+    group_ids = [1, 2, 3, 4]
+
+    partitions = list(loader.load_partitions(group_ids, config))
+
+    assert [group_id for group_id, _ in partitions] == group_ids
+    for group_id, frame in partitions:
+        expected = loader.load_data(group_id, config)
+        assert list(frame.columns) == list(expected.columns)
+        if expected.empty:
+            assert frame.empty
+            continue
+        pd.testing.assert_frame_equal(_sorted(frame), _sorted(expected))
+
+
+def test_direct_reference_partitions_only_scan_requested_range(
+    populated_db, monkeypatch
+):
+    scanned_keys = []
+    original_split = direct_reference.split_partition_key
+
+    def recording_split(frame):
+        frame, keys = original_split(frame)
+        scanned_keys.extend(keys.tolist())
+        return frame, keys
+
+    monkeypatch.setattr(direct_reference, "split_partition_key", recording_split)
+    loader = DirectReferenceLoader(populated_db)
+    config = {"data": "occurrences", "grouping": "plots", "key": "plot_id"}
+
+    partitions = dict(loader.load_partitions([2, 3], config))
+
+    assert sorted(scanned_keys) == [2, 2, 3, 3]
+    assert sorted(partitions[2]["id"]) == [2, 4]
+    assert sorted(partitions[3]["id"]) == [5, 6]
@@ -132,6 +132,62 @@ def test_api_elevation_enricher_loads_shape_summary(
     assert summary["sampling"]["sample_count"] == 9
 
 
+def test_api_elevation_enricher_batches_points_of_many_entities(
+    elevation_enricher: ApiElevationEnricher,
+    requests_mock: requests_mock.Mocker,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(
+        "niamoto.core.plugins.loaders.api_elevation_enricher.OPEN_METEO_MAX_POINTS", 4
+    )
+    rows = [
+        {"geometry": "POINT (166.45 -22.27)"},
+        {"name": "no geometry"},
+        {
+            "geometry": "POLYGON ((166.4 -22.3, 166.5 -22.3, 166.5 -22.2, "
+            "166.4 -22.2, 166.4 -22.3))"
+        },
+        {"geometry": "POINT (166.5 -22.3)"},
+    ]
+    config = {
+        "plugin": "api_elevation_enricher",
+        "params": {
+            "api_url": "https://api.open-meteo.com/v1/elevation",
+            "profile": "openmeteo_elevation_v1",
+            "query_field": "geometry",
+            "sample_count": 4,
+            "sample_mode": "bbox_grid",
+            "rate_limit": 0,
+            "cache_results": False,
+        },
+    }
+
+    def elevations(request, context):
+        count = len(request.qs["latitude"][0].split(","))
+        start = sum(
+            len(previous.qs["latitude"][0].split(","))
+            for previous in requests_mock.request_history[:-1]
+        )
+        return {"elevation": [100 * (start + i + 1) for i in range(count)]}
+
+    requests_mock.get("https://api.open-meteo.com/v1/elevation", json=elevations)
+
+    results = elevation_enricher.load_data_batch(rows, config)
+
+    # 1 + 4 + 1 points in two requests of at most 4 points
+    assert requests_mock.call_count == 2
+    assert results[0]["api_enrichment"]["elevation"]["value_m"] == 100
+    assert isinstance(results[1], ValueError)
+    shape = results[2]["api_enrichment"]
+    assert shape["elevation_summary"]["min_elevation_m"] == 200
+    assert shape["elevation_summary"]["max_elevation_m"] == 500
+    assert results[2]["api_response_raw"]["response"] == {
+        "elevation": [200, 300, 400, 500]
+    }
+    assert results[3]["api_enrichment"]["elevation"]["value_m"] == 600
+    assert results[3]["api_enrichment"]["provenance"]["mode"] == "point"
+
+
 def test_api_spatial_enricher_loads_point_summary(
     spatial_enricher: ApiSpatialEnricher,
     requests_mock: requests_mock.Mocker,
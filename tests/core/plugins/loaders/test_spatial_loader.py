@@ -0,0 +1,141 @@
+"""Tests for the spatial containment loader and its shape membership."""
+
+import pandas as pd
+import pytest
+from sqlalchemy import text
+
+from niamoto.common.database import Database
+from niamoto.core.imports.registry import EntityKind, EntityRegistry
+from niamoto.core.plugins.loaders._spatial_membership import (
+    SpatialMembership,
+    clear_spatial_membership_cache,
+)
+from niamoto.core.plugins.loaders.spatial import SpatialLoader
+
+CONFIG = {
+    "plugin": "spatial_containment",
+    "main": "occurrences",
+    "reference": {"name": "shapes"},
+    "params": {"key": "id", "geometry_field": "geom"},
+}
+
+
+def square(x0, y0, size):
+    x1, y1 = x0 + size, y0 + size
+    return f"POLYGON (({x0} {y0}, {x1} {y0}, {x1} {y1}, {x0} {y1}, {x0} {y0}))"
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    clear_spatial_membership_cache()
+    yield
+    clear_spatial_membership_cache()
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = Database(str(tmp_path / "spatial.duckdb"))
+    with database.engine.begin() as conn:
+        conn.execute(text("CREATE TABLE entity_shapes (id INTEGER, geom VARCHAR)"))
+        conn.execute(
+            text("INSERT INTO entity_shapes VALUES (:id, :geom)"),
+            [
+                {"id": 1, "geom": square(0, 0, 10)},
+                {"id": 2, "geom": square(5, 5, 10)},
+                {"id": 3, "geom": square(100, 100, 1)},
+            ],
+        )
+        conn.execute(text("CREATE TABLE entity_occurrences (id INTEGER, geom VARCHAR)"))
+        conn.execute(
+            text("INSERT INTO entity_occurrences VALUES (:id, :geom)"),
+            [
+                {"id": 10, "geom": "POINT (1 1)"},
+                {"id": 11, "geom": "POINT (7 7)"},
+                {"id": 12, "geom": "POINT (12 12)"},
+                {"id": 13, "geom": None},
+                {"id": 14, "geom": "POINT (50 50)"},
+                # On the boundary: not contained, as with ST_Contains
+                {"id": 15, "geom": "POINT (0 5)"},
+            ],
+        )
+    registry = EntityRegistry(database)
+    for name in ("shapes", "occurrences"):
+        registry.register_entity(
+            name,
+            EntityKind.DATASET,
+            f"entity_{name}",
+            {},
+        )
+    yield database
+    database.close_db_session()
+
+
+def test_membership_groups_contained_rows_by_shape():
+    membership = SpatialMembership.build(
+        [1, 2],
+        [square(0, 0, 10), None],
+        [5, 6, 7],
+        ["POINT (1 1)", "not wkt", "POINT (2 2)"],
+    )
+
+    assert membership.rows_of(1).tolist() == [5, 7]
+    assert membership.rows_of(2).tolist() == []
+    assert membership.rows_of(99).tolist() == []
+
+
+def test_load_data_returns_rows_inside_the_shape(db):
+    loader = SpatialLoader(db)
+
+    loaded = {
+        shape_id: loader.load_data(shape_id, CONFIG)["id"].tolist()
+        for shape_id in (1, 2, 3)
+    }
+
+    assert loaded == {1: [10, 11], 2: [11, 12], 3: []}
+    assert list(loader.load_data(3, CONFIG).columns) == ["id", "geom"]
+
+
+def test_load_partitions_matches_load_data(db):
+    loader = SpatialLoader(db)
+
+    partitions = list(loader.load_partitions([3, 2, 1], CONFIG))
+
+    assert [group_id for group_id, _ in partitions] == [3, 2, 1]
+    for group_id, frame in partitions:
+        # Empty SQL results carry no column types
+        pd.testing.assert_frame_equal(
+            frame, loader.load_data(group_id, CONFIG), check_dtype=not frame.empty
+        )
+
+
+def test_membership_is_shared_and_rebuilt_when_a_table_changes(db, monkeypatch):
+    builds = []
+    original_build = SpatialMembership.build.__func__
+
+    def counting_build(cls, *args, **kwargs):
+        builds.append(1)
+        return original_build(cls, *args, **kwargs)
+
+    monkeypatch.setattr(SpatialMembership, "build", classmethod(counting_build))
+
+    SpatialLoader(db).load_data(1, CONFIG)
+    SpatialLoader(db).load_data(1, CONFIG)
+    assert len(builds) == 1
+
+    with db.engine.begin() as conn:
+        conn.execute(text("INSERT INTO entity_occurrences VALUES (16, 'POINT (2 2)')"))
+
+    assert SpatialLoader(db).load_data(1, CONFIG)["id"].tolist() == [10, 11, 16]
+    assert len(builds) == 2
+
+
+def test_membership_is_rebuilt_when_a_row_moves(db):
+    SpatialLoader(db).load_data(1, CONFIG)
+
+    # Same row counts, different content
+    with db.engine.begin() as conn:
+        conn.execute(
+            text("UPDATE entity_occurrences SET geom = 'POINT (3 3)' WHERE id = 14")
+        )
+
+    assert SpatialLoader(db).load_data(1, CONFIG)["id"].tolist() == [10, 11, 14]
@@ -168,6 +168,33 @@ class TestStatsLoader(NiamotoTestCase):
         self.assertIn('m."plot_fk" = ref.id', query_string)
         self.assertNotIn('"stats_source"', query_string)
 
+    @patch("pandas.read_sql")
+    def test_load_partitions_only_reads_the_requested_id_range(self, mock_read_sql):
+        """Bulk loads should be bounded by the ids of the requested chunk."""
+        config = {
+            "plugin": "stats_loader",
+            "data": "stats_source",
+            "grouping": "ref_table",
+            "params": {"key": "plot_fk"},
+        }
+        self.loader.imports_config = {
+            "stats_source": {"type": "database", "table": "stats_table"}
+        }
+        mock_read_sql.return_value = pd.DataFrame(
+            {"_niamoto_partition_key": [4, 6], "value": [40, 60]}
+        )
+
+        partitions = dict(self.loader.load_partitions([6, 4, 5], config))
+
+        query_string = str(mock_read_sql.call_args.args[0])
+        self.assertIn("WHERE ref.id BETWEEN :low AND :high", query_string)
+        self.assertEqual(
+            mock_read_sql.call_args.kwargs["params"], {"low": 4, "high": 6}
+        )
+        self.assertEqual(partitions[4]["value"].tolist(), [40])
+        self.assertTrue(partitions[5].empty)
+        self.assertEqual(partitions[6]["value"].tolist(), [60])
+
     @patch("os.path.exists", return_value=True)
     @patch("pandas.read_csv")
     def test_load_data_csv_success_comma(self, mock_read_csv, mock_exists):
@@ -0,0 +1,124 @@
+"""Tests for the cached plugin manifest and lazy plugin registration."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+
+import pytest
+
+from niamoto.common.resource_paths import ResourceLocation, ResourcePaths
+from niamoto.core.plugins.base import PluginType
+from niamoto.core.plugins.exceptions import PluginNotFoundError
+from niamoto.core.plugins.plugin_loader import PluginLoader
+from niamoto.core.plugins.plugin_manifest import PLUGIN_MANIFEST_FILENAME
+from niamoto.core.plugins.registry import LazyPlugin, PluginRegistry
+
+MODULE_NAME = "plugins.manifest_temp"
+PLUGIN_SOURCE = (
+    "from pydantic import BaseModel\n"
+    "from niamoto.core.plugins.base import Plugin, PluginType, register\n"
+    "class ManifestTempConfig(BaseModel):\n"
+    "    source: str = ''\n"
+    "@register({name!r}, PluginType.TRANSFORMER)\n"
+    "class ManifestTemp(Plugin):\n"
+    "    type = PluginType.TRANSFORMER\n"
+    "    config_model = ManifestTempConfig\n"
+)
+
+
+@pytest.fixture
+def project_plugins(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        PluginLoader, "_get_module_name", lambda _self, _file, _is_core: MODULE_NAME
+    )
+    PluginRegistry.clear()
+    sys.modules.pop(MODULE_NAME, None)
+    plugins_dir = tmp_path / "plugins"
+    plugins_dir.mkdir()
+    (plugins_dir / "manifest_temp.py").write_text(
+        PLUGIN_SOURCE.format(name="manifest_temp"), encoding="utf-8"
+    )
+    yield ResourceLocation(ResourcePaths.SCOPE_PROJECT, plugins_dir, priority=100)
+    PluginRegistry.clear()
+    sys.modules.pop(MODULE_NAME, None)
+
+
+def _fresh_discovery(location):
+    PluginRegistry.clear()
+    sys.modules.pop(MODULE_NAME, None)
+    return PluginLoader()._discover_plugins_in_location(location)
+
+
+def test_unchanged_plugin_files_are_imported_on_first_use(project_plugins):
+    first = _fresh_discovery(project_plugins)
+    assert first["manifest_temp"].plugin_class is not None
+
+    manifest_path = project_plugins.path.parent / ".niamoto" / PLUGIN_MANIFEST_FILENAME
+    entry = json.loads(manifest_path.read_text(encoding="utf-8"))["files"][
+        str(project_plugins.path / "manifest_temp.py")
+    ]
+    assert entry["module"] == MODULE_NAME
+    assert entry["plugins"] == [
+        {
+            "name": "manifest_temp",
+            "type": "transformer",
+            "class": "ManifestTemp",
+            "config_model": f"{MODULE_NAME}:ManifestTempConfig",
+        }
+    ]
+
+    discovered = _fresh_discovery(project_plugins)
+
+    info = discovered["manifest_temp"]
+    assert info.plugin_class is None
+    assert info.plugin_type is PluginType.TRANSFORMER
+    assert MODULE_NAME not in sys.modules
+    assert PluginRegistry.has_plugin("manifest_temp", PluginType.TRANSFORMER)
+    assert "manifest_temp" in PluginRegistry.list_plugins()[PluginType.TRANSFORMER]
+
+    plugin_class = PluginRegistry.get_plugin("manifest_temp", PluginType.TRANSFORMER)
+
+    assert MODULE_NAME in sys.modules
+    assert plugin_class is sys.modules[MODULE_NAME].ManifestTemp
+    assert PluginRegistry.get_plugin("manifest_temp", PluginType.TRANSFORMER) is (
+        plugin_class
+    )
+
+
+def test_modified_plugin_files_are_executed_again(project_plugins):
+    _fresh_discovery(project_plugins)
+    plugin_file = project_plugins.path / "manifest_temp.py"
+    plugin_file.write_text(PLUGIN_SOURCE.format(name="renamed_temp"), encoding="utf-8")
+    stat = plugin_file.stat()
+    os.utime(plugin_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    discovered = _fresh_discovery(project_plugins)
+
+    assert set(discovered) == {"renamed_temp"}
+    assert discovered["renamed_temp"].plugin_class is not None
+    assert set(_fresh_discovery(project_plugins)) == {"renamed_temp"}
+
+
+def test_lazy_plugins_that_fail_to_import_are_dropped(tmp_path):
+    PluginRegistry.clear()
+    plugin_file = tmp_path / "broken_temp.py"
+    plugin_file.write_text("raise RuntimeError('boom')\n", encoding="utf-8")
+    PluginRegistry.register_lazy_plugin(
+        "broken_temp",
+        PluginType.WIDGET,
+        "plugins.broken_temp",
+        plugin_file,
+        "BrokenTemp",
+    )
+    assert isinstance(
+        PluginRegistry._plugins[PluginType.WIDGET]["broken_temp"], LazyPlugin
+    )
+
+    with pytest.raises(PluginNotFoundError):
+        PluginRegistry.get_plugin("broken_temp", PluginType.WIDGET)
+
+    assert PluginRegistry.get_plugins_by_type(PluginType.WIDGET) == {}
+    assert "plugins.broken_temp" not in sys.modules
+    PluginRegistry.clear()
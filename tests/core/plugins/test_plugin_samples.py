@@ -150,6 +150,9 @@ class TestSampleLoaders(unittest.TestCase):
 
     def test_spatial_loader(self):
         """Test the spatial loader plugin."""
+        from niamoto.core.plugins.loaders._spatial_membership import (
+            SpatialMembership,
+        )
         from niamoto.core.plugins.loaders.spatial import SpatialLoader
 
         config = {
@@ -170,8 +173,14 @@ class TestSampleLoaders(unittest.TestCase):
 
         loader = SpatialLoader(self.db)
         loader.validate_config(config)
+        membership = SpatialMembership.build(
+            [1], ["POLYGON((0 0, 0 3, 3 3, 3 0, 0 0))"], [0, 1], ["POINT(1 1)", None]
+        )
 
-        with patch("pandas.read_sql", return_value=mock_result) as mock_read_sql:
+        with (
+            patch.object(loader, "_get_membership", return_value=membership),
+            patch("pandas.read_sql", return_value=mock_result) as mock_read_sql,
+        ):
             result = loader.load_data(1, config)
             mock_read_sql.assert_called_once()
 
@@ -0,0 +1,91 @@
+"""Tests for the hierarchy index used by rank-level aggregations."""
+
+import pandas as pd
+import pytest
+
+from niamoto.core.plugins.transformers.aggregation._hierarchy_index import (
+    HierarchyIndex,
+    clear_hierarchy_index_cache,
+    get_hierarchy_index,
+)
+
+HIERARCHY = pd.DataFrame(
+    [
+        (1, "Family Foo", "family", None),
+        (10, "Genus Alpha", "genus", 1),
+        (11, "Genus Beta", "genus", 1),
+        (100, "Species A", "species", 10),
+        (101, "Species B", "species", 11),
+        (1000, "Infra A1", "infra", 100),
+        # Cycle without any node at a target rank
+        (5, "Loop 1", "clade", 6),
+        (6, "Loop 2", "clade", 5),
+    ],
+    columns=["id", "full_name", "rank_name", "parent_id"],
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    clear_hierarchy_index_cache()
+    yield
+    clear_hierarchy_index_cache()
+
+
+def test_rank_ancestors_finds_nearest_target_rank():
+    index = HierarchyIndex.from_frame(HIERARCHY)
+
+    ancestors = index.rank_ancestors(["genus", "family"])
+
+    names = [index.names[row] if row >= 0 else None for row in ancestors]
+    assert names == [
+        "Family Foo",
+        "Genus Alpha",
+        "Genus Beta",
+        "Genus Alpha",
+        "Genus Beta",
+        "Genus Alpha",
+        None,
+        None,
+    ]
+    assert index.rank_ancestors(["family", "genus"]) is ancestors
+
+
+def test_count_by_rank_skips_unknown_values_and_keeps_first_seen_ties():
+    index = HierarchyIndex.from_frame(HIERARCHY)
+    values = pd.Series([101, 1000, 999, None, 100, 101, 5])
+
+    tops, counts = index.count_by_rank(values, ["species"])
+
+    assert tops == ["Species B", "Species A"]
+    assert counts == [2, 2]
+
+
+def test_positions_convert_values_to_the_id_type():
+    index = HierarchyIndex.from_frame(HIERARCHY)
+    text_index = HierarchyIndex.from_frame(
+        HIERARCHY.assign(
+            id=HIERARCHY["id"].astype(str),
+            parent_id=HIERARCHY["parent_id"].map(
+                lambda parent: None if pd.isna(parent) else str(int(parent))
+            ),
+        )
+    )
+
+    assert index.positions(["10", 100.0, "x"]).tolist() == [1, 3, -1]
+    assert text_index.positions([10, 100.0, "1000"]).tolist() == [1, 3, 5]
+    assert text_index.parents.tolist() == index.parents.tolist()
+
+
+def test_get_hierarchy_index_shares_indexes_by_key():
+    loads = []
+
+    def load():
+        loads.append(1)
+        return HIERARCHY
+
+    first = get_hierarchy_index(("db", 1), load)
+    assert get_hierarchy_index(("db", 1), load) is first
+    assert get_hierarchy_index(("db", 2), load) is not first
+    assert get_hierarchy_index(None, load) is not first
+    assert len(loads) == 3
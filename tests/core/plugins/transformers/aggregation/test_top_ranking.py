@@ -43,6 +43,13 @@ MOCK_TAXON_REF = {
 }
 
 
+def mock_taxon_ref_select(query):
+    """Return every row of the taxon_ref table, whatever the query."""
+    mock_result = MagicMock()
+    mock_result.fetchall.return_value = list(MOCK_TAXON_REF.values())
+    return mock_result
+
+
 class TestTopRanking(unittest.TestCase):
     """Test suite for the TopRanking plugin."""
 
@@ -75,52 +82,7 @@ class TestTopRanking(unittest.TestCase):
             },
         }
 
-        # --- Mocking db.execute_select ---
-        # This mock needs to simulate multiple calls the plugin makes:
-        # 1. Get initial taxa based on IDs in SAMPLE_DATA (101, 102, 103, 201, 202)
-        # 2. Get parents of initial taxa (301, 302)
-        # 3. Get parents of those parents (401)
-
-        # We define the return values for each expected SELECT query
-        def mock_execute_select(query):
-            mock_result = MagicMock()
-            mock_cursor = MagicMock()
-            mock_result.cursor = mock_cursor
-
-            # Extract IDs from the 'WHERE id IN (...)' clause
-            try:
-                normalized_query = query.replace('"id"', "id")
-                ids_str = normalized_query.split("WHERE id IN (")[1].split(")")[0]
-                ids_queried = {int(id_str.strip()) for id_str in ids_str.split(",")}
-            except IndexError:
-                # If query format is unexpected, return empty
-                mock_cursor.description = []
-                mock_result.fetchall.return_value = []
-                return mock_result
-
-            # Simulate fetchall based on queried IDs
-            results_for_query = [
-                MOCK_TAXON_REF[id_] for id_ in ids_queried if id_ in MOCK_TAXON_REF
-            ]
-
-            if results_for_query:
-                # Simulate cursor description (important for DataFrame creation inside plugin)
-                mock_cursor.description = [
-                    ("id",),
-                    ("full_name",),
-                    ("rank_name",),
-                    ("parent_id",),
-                ]
-                mock_result.fetchall.return_value = results_for_query
-                return mock_result
-            else:
-                # Simulate no results found
-                mock_cursor.description = []
-                mock_result.fetchall.return_value = []
-                return mock_result
-
-        self.db_mock.execute_select.side_effect = mock_execute_select
-        # --- End Mocking ---
+        self.db_mock.execute_select.side_effect = mock_taxon_ref_select
 
         # Expected result:
         # Occurrences: 101 (x4), 102 (x2), 103 (x3), 201 (x2 -> maps to 101), 202 (x1 -> maps to 102)
@@ -137,17 +99,43 @@ class TestTopRanking(unittest.TestCase):
         self.assertIn(result_pairs[1], {("Species B", 3), ("Species C", 3)})
         self.assertEqual(len(result_pairs), 2)
 
-        # Verify db calls (optional but good practice)
-        # Check that execute_select was called multiple times
-        self.assertTrue(self.db_mock.execute_select.call_count >= 3)
-        # Example: Check the first call was for the initial IDs
-        first_call_args = self.db_mock.execute_select.call_args_list[0].args[0]
-        self.assertIn('WHERE "id" IN (', first_call_args)
-        self.assertIn("101", first_call_args)
-        self.assertIn("102", first_call_args)
-        self.assertIn("103", first_call_args)
-        self.assertIn("201", first_call_args)
-        self.assertIn("202", first_call_args)
+        # The whole hierarchy is read by a single query
+        self.db_mock.execute_select.assert_called_once()
+        query = self.db_mock.execute_select.call_args.args[0]
+        self.assertIn('SELECT "id", "full_name", "rank_name", "parent_id"', query)
+        self.assertIn('FROM "taxon_ref"', query)
+        self.assertNotIn("WHERE", query)
+
+    def test_hierarchy_index_is_reused_across_transforms(self):
+        """The hierarchy is loaded once for all the entities of a run."""
+        config = {
+            "plugin": "top_ranking",
+            "params": {
+                "source": "occurrences",
+                "field": "taxon_ref_id",
+                "mode": "hierarchical",
+                "hierarchy_table": "taxon_ref",
+                "target_ranks": ["species"],
+                "count": 3,
+            },
+        }
+        genus_config = {
+            **config,
+            "params": {**config["params"], "target_ranks": ["genus"]},
+        }
+        self.db_mock.execute_select.side_effect = mock_taxon_ref_select
+
+        first = self.plugin.transform(SAMPLE_DATA.iloc[:5].copy(), config)
+        second = self.plugin.transform(SAMPLE_DATA.iloc[5:].copy(), config)
+        genera = self.plugin.transform(SAMPLE_DATA.copy(), genus_config)
+
+        self.assertEqual(first["tops"], ["Species A", "Species B", "Species C"])
+        self.assertEqual(first["counts"], [2, 2, 1])
+        self.assertEqual(second["tops"], ["Species A", "Species C", "Species B"])
+        self.assertEqual(second["counts"], [3, 2, 1])
+        self.assertEqual(genera["tops"], ["Genus Alpha", "Genus Beta"])
+        self.assertEqual(genera["counts"], [8, 3])
+        self.db_mock.execute_select.assert_called_once()
 
     def test_transform_top_genus(self):
         """Test getting the top N genera."""
@@ -163,38 +151,7 @@ class TestTopRanking(unittest.TestCase):
             },
         }
 
-        # Same mock setup as test_transform_top_species
-        def mock_execute_select(query):
-            # Simplified mock logic from previous test
-            mock_result = MagicMock()
-            mock_cursor = MagicMock()
-            mock_result.cursor = mock_cursor
-            try:
-                normalized_query = query.replace('"id"', "id")
-                ids_str = normalized_query.split("WHERE id IN (")[1].split(")")[0]
-                ids_queried = {int(id_str.strip()) for id_str in ids_str.split(",")}
-            except IndexError:
-                mock_cursor.description = []
-                mock_result.fetchall.return_value = []
-                return mock_result
-            results_for_query = [
-                MOCK_TAXON_REF[id_] for id_ in ids_queried if id_ in MOCK_TAXON_REF
-            ]
-            if results_for_query:
-                mock_cursor.description = [
-                    ("id",),
-                    ("full_name",),
-                    ("rank_name",),
-                    ("parent_id",),
-                ]
-                mock_result.fetchall.return_value = results_for_query
-                return mock_result
-            else:
-                mock_cursor.description = []
-                mock_result.fetchall.return_value = []
-                return mock_result
-
-        self.db_mock.execute_select.side_effect = mock_execute_select
+        self.db_mock.execute_select.side_effect = mock_taxon_ref_select
 
         # Expected: Genus Alpha (8), Genus Beta (3). Top 1 is Genus Alpha.
         expected_tops = ["Genus Alpha"]
@@ -62,29 +62,25 @@ class TestTopRankingGeneric:
         }
 
         # Mock database responses
-        self.mock_db.execute_select.side_effect = [
-            # First query: get initial items
-            MagicMock(
-                fetchall=lambda: [
-                    (10, "Item A", "item", 100),
-                    (20, "Item B", "item", 100),
-                    (30, "Item C", "item", 200),
-                    (40, "Item D", "item", 200),
-                ]
-            ),
-            # Second query: get parents
-            MagicMock(
-                fetchall=lambda: [
-                    (100, "Category 1", "category", None),
-                    (200, "Category 2", "category", None),
-                ]
-            ),
-        ]
+        # Mock database response: the whole hierarchy table
+        self.mock_db.execute_select.return_value = MagicMock(
+            fetchall=lambda: [
+                (10, "Item A", "item", 100),
+                (20, "Item B", "item", 100),
+                (30, "Item C", "item", 200),
+                (40, "Item D", "item", 200),
+                (100, "Category 1", "category", None),
+                (200, "Category 2", "category", None),
+            ]
+        )
 
         result = self.plugin.transform(data, config)
 
         assert result["tops"] == ["Category 1", "Category 2"]
         assert result["counts"] == [4, 2]
+        query = self.mock_db.execute_select.call_args.args[0]
+        assert 'SELECT "item_id", "item_name", "item_rank", "parent_item_id"' in query
+        assert 'FROM "custom_hierarchy"' in query
 
     def test_join_mode(self):
         """Test join mode with custom configuration."""
@@ -141,31 +137,23 @@ class TestTopRankingGeneric:
             },
         }
 
-        # Mock database responses
-        self.mock_db.execute_select.side_effect = [
-            # First query
-            MagicMock(
-                fetchall=lambda: [
-                    (1, "Species A", "species", 10),
-                    (2, "Species B", "species", 10),
-                    (3, "Species C", "species", 20),
-                ]
-            ),
-            # Second query
-            MagicMock(
-                fetchall=lambda: [
-                    (10, "Family 1", "family", None),
-                    (20, "Family 2", "family", None),
-                ]
-            ),
-        ]
+        # Mock database response: the whole hierarchy table
+        self.mock_db.execute_select.return_value = MagicMock(
+            fetchall=lambda: [
+                (1, "Species A", "species", 10),
+                (2, "Species B", "species", 10),
+                (3, "Species C", "species", 20),
+                (10, "Family 1", "family", None),
+                (20, "Family 2", "family", None),
+            ]
+        )
 
         result = self.plugin.transform(data, config)
 
         # Should auto-detect hierarchical mode and use taxon_ref table
         assert result["tops"] == ["Family 1", "Family 2"]
         assert result["counts"] == [4, 1]
-        assert self.mock_db.execute_select.call_count == 2
+        assert self.mock_db.execute_select.call_count == 1
 
     def test_empty_data_returns_empty_result(self):
         """Test that empty data returns empty results."""
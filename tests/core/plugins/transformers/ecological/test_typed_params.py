@@ -5,6 +5,7 @@ from unittest.mock import MagicMock
 import geopandas as gpd
 import numpy as np
 import pytest
+from affine import Affine
 from shapely.geometry import Polygon
 
 from niamoto.core.plugins.transformers.ecological import forest_holdridge
@@ -15,6 +16,7 @@ from niamoto.core.plugins.transformers.ecological.forest_holdridge import (
     ForestHoldridgeAnalysis,
 )
 from niamoto.core.plugins.transformers.ecological.land_use import LandUseAnalysis
+from niamoto.core.plugins.transformers.geospatial.raster_access import RasterWindow
 
 
 @pytest.fixture
@@ -49,15 +51,13 @@ def test_forest_elevation_typed_params_drive_valid_data_path(
 ):
     opened_paths = {}
 
-    class FakeRaster:
-        def __enter__(self):
-            return self
-
-        def __exit__(self, exc_type, exc, tb):
-            return None
-
-    def fake_mask(src, geometries, crop, nodata):
-        return np.array([[[50, 150]]]), object()
+    def fake_read_window(path, geometries, band):
+        return RasterWindow(
+            data=np.array([[50, 150]]),
+            inside=np.ones((1, 2), dtype=bool),
+            transform=Affine.identity(),
+            nodata=None,
+        )
 
     forest_layer = gpd.GeoDataFrame(
         {"type": ["Core forest"]},
@@ -67,19 +67,19 @@ def test_forest_elevation_typed_params_drive_valid_data_path(
 
     def fake_open(path):
         opened_paths["dem"] = path
-        return FakeRaster()
+        return object()
 
     def fake_read_file(path, engine=None):
         opened_paths["forest"] = path
         return forest_layer
 
     monkeypatch.setattr(
-        "niamoto.core.plugins.transformers.ecological.forest_elevation.rasterio.open",
+        "niamoto.core.plugins.transformers.ecological.forest_elevation.open_raster",
         fake_open,
     )
     monkeypatch.setattr(
-        "niamoto.core.plugins.transformers.ecological.forest_elevation.mask",
-        fake_mask,
+        "niamoto.core.plugins.transformers.ecological.forest_elevation.read_window",
+        fake_read_window,
     )
     monkeypatch.setattr(
         "niamoto.core.plugins.transformers.ecological.forest_elevation.gpd.read_file",
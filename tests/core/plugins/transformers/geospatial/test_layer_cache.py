@@ -0,0 +1,115 @@
+"""Tests for the shared geospatial layer cache."""
+
+import os
+from unittest.mock import patch
+
+import geopandas as gpd
+import pytest
+from shapely.geometry import Polygon
+
+from niamoto.core.plugins.transformers.geospatial.layer_cache import (
+    GeoLayerCache,
+    get_layer_cache,
+    read_layer,
+)
+
+
+@pytest.fixture
+def layer_path(tmp_path):
+    """Write a small polygon layer to disk."""
+    gdf = gpd.GeoDataFrame(
+        {
+            "zone": ["protected", "buffer"],
+            "geometry": [
+                Polygon([(0, 0), (1, 0), (1, 1), (0, 1)]),
+                Polygon([(2, 2), (3, 2), (3, 3), (2, 3)]),
+            ],
+        },
+        crs="EPSG:4326",
+    )
+    path = tmp_path / "zones.gpkg"
+    gdf.to_file(path)
+    return str(path)
+
+
+def test_layer_is_read_once_and_indexed(layer_path):
+    cache = GeoLayerCache()
+
+    with patch(
+        "niamoto.core.plugins.transformers.geospatial.layer_cache.gpd.read_file",
+        wraps=gpd.read_file,
+    ) as read_file:
+        first = cache.get_layer(layer_path)
+        second = cache.get_layer(layer_path)
+
+    assert first is second
+    assert read_file.call_count == 1
+    assert first.has_sindex
+    assert cache.size > 0
+
+
+def test_reprojected_layers_reuse_the_native_read(layer_path):
+    cache = GeoLayerCache()
+
+    with patch(
+        "niamoto.core.plugins.transformers.geospatial.layer_cache.gpd.read_file",
+        wraps=gpd.read_file,
+    ) as read_file:
+        projected = cache.get_layer(layer_path, crs="EPSG:3857")
+        native = cache.get_layer(layer_path)
+        same_crs = cache.get_layer(layer_path, crs="EPSG:4326")
+
+    assert read_file.call_count == 1
+    assert projected.crs.to_epsg() == 3857
+    assert native.crs.to_epsg() == 4326
+    assert same_crs is native
+    assert len(cache) == 2
+
+
+def test_where_filter_is_part_of_the_key(layer_path):
+    cache = GeoLayerCache()
+
+    filtered = cache.get_layer(layer_path, where="zone == 'buffer'")
+    unfiltered = cache.get_layer(layer_path)
+
+    assert filtered["zone"].tolist() == ["buffer"]
+    assert len(unfiltered) == 2
+
+
+def test_modified_file_is_read_again(layer_path):
+    cache = GeoLayerCache()
+    first = cache.get_layer(layer_path)
+
+    stat = os.stat(layer_path)
+    os.utime(layer_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert cache.get_layer(layer_path) is not first
+
+
+def test_lru_eviction_respects_the_memory_budget(layer_path):
+    cache = GeoLayerCache()
+    cache.get_layer(layer_path)
+    entry_size = cache.size
+
+    cache.max_bytes = entry_size * 2
+    cache.get_layer(layer_path, where="zone == 'buffer'")
+    cache.get_layer(layer_path, where="zone == 'protected'")
+    cache.get_layer(layer_path)
+
+    assert cache.size <= cache.max_bytes
+    assert len(cache) == 2
+
+
+def test_missing_files_are_not_cached(tmp_path):
+    cache = GeoLayerCache()
+
+    with pytest.raises(Exception):
+        cache.get_layer(str(tmp_path / "missing.shp"))
+    assert len(cache) == 0
+
+
+def test_read_layer_uses_the_process_cache(layer_path):
+    get_layer_cache().clear()
+
+    assert read_layer(layer_path) is read_layer(layer_path)
+    get_layer_cache().clear()
@@ -0,0 +1,113 @@
+"""Tests for pooled, windowed raster access."""
+
+import os
+
+import numpy as np
+import pytest
+import rasterio
+from rasterio.mask import mask
+from rasterio.transform import from_bounds
+from shapely.geometry import Polygon, box
+
+from niamoto.core.plugins.transformers.geospatial.raster_access import (
+    RasterHandlePool,
+    get_raster_pool,
+    open_raster,
+    read_window,
+    zonal_values,
+)
+
+
+@pytest.fixture
+def dem_path(tmp_path):
+    """Write a 100x100 two-band raster with a nodata corner and overviews."""
+    path = str(tmp_path / "dem.tif")
+    elevation = np.arange(10000, dtype=np.float32).reshape(100, 100)
+    elevation[:10, :10] = -9999
+    with rasterio.open(
+        path,
+        "w",
+        driver="GTiff",
+        height=100,
+        width=100,
+        count=2,
+        dtype="float32",
+        crs="EPSG:3857",
+        transform=from_bounds(0, 0, 100, 100, 100, 100),
+        nodata=-9999,
+        tiled=True,
+        blockxsize=16,
+        blockysize=16,
+    ) as dst:
+        dst.write(elevation, 1)
+        dst.write(elevation * 2, 2)
+        dst.build_overviews([2, 4])
+    yield path
+    get_raster_pool().close()
+
+
+def _masked_values(path, geometry, band):
+    with rasterio.open(path) as src:
+        masked, _ = mask(src, [geometry], crop=True)
+        values = masked[band - 1]
+        return values[values != src.nodata]
+
+
+def test_read_window_matches_rasterio_mask(dem_path):
+    triangle = Polygon([(3.5, 3.5), (60.2, 12.7), (30.1, 77.3)])
+
+    window = read_window(dem_path, [triangle], band=2)
+
+    np.testing.assert_array_equal(
+        np.sort(window.valid_values()), np.sort(_masked_values(dem_path, triangle, 2))
+    )
+    assert window.filled().shape == window.data.shape
+
+
+def test_read_window_rejects_shapes_outside_the_raster(dem_path):
+    with pytest.raises(ValueError, match="do not overlap"):
+        read_window(dem_path, [box(500, 500, 600, 600)])
+
+
+def test_coarser_resolution_reads_a_decimated_window(dem_path):
+    window = read_window(dem_path, [box(20, 20, 60, 60)], resolution=4)
+
+    assert window.data.shape == (10, 10)
+    assert window.transform.a == pytest.approx(4)
+
+
+def test_pool_reuses_handles_and_reopens_modified_files(dem_path):
+    pool = RasterHandlePool(max_handles=1)
+
+    first = pool.get(dem_path)
+    assert pool.get(dem_path) is first
+
+    stat = os.stat(dem_path)
+    os.utime(dem_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    second = pool.get(dem_path)
+
+    assert second is not first
+    assert first.closed
+    pool.close()
+    assert second.closed
+
+
+def test_open_raster_uses_the_shared_pool(dem_path):
+    assert open_raster(dem_path) is open_raster(dem_path)
+
+
+def test_zonal_values_match_per_geometry_reads(dem_path):
+    geometries = [
+        box(0, 0, 30, 30),
+        Polygon([(3.5, 3.5), (60.2, 12.7), (30.1, 77.3)]),
+        box(40, 70, 95, 99),
+        box(500, 500, 600, 600),
+    ]
+
+    values = zonal_values(dem_path, geometries, band=1)
+
+    for geometry, result in zip(geometries[:3], values[:3]):
+        np.testing.assert_array_equal(
+            np.sort(result), np.sort(_masked_values(dem_path, geometry, 1))
+        )
+    assert len(values[3]) == 0
@@ -379,6 +379,42 @@ class TestExporterService(NiamotoTestCase):
         call_args = mock_plugin_instance.export.call_args
         self.assertNotIn("workers", call_args.kwargs)
 
+    @patch("niamoto.core.services.exporter.Database")
+    @patch("niamoto.core.services.exporter.PluginLoader")
+    @patch("niamoto.core.services.exporter.PluginRegistry")
+    def test_run_export_passes_optional_features_to_supporting_exporters(
+        self, mock_registry, mock_loader, mock_db
+    ):
+        """Workers and incremental only reach exporters whose export() accepts them."""
+        self.mock_config.get_exports_config.return_value = self.valid_export_config
+        calls = []
+
+        class ParallelExporter(ExporterPlugin):
+            def export(
+                self,
+                target_config,
+                repository,
+                group_filter=None,
+                workers=1,
+                incremental=False,
+            ):
+                calls.append((workers, incremental))
+
+        class SequentialExporter(ExporterPlugin):
+            def export(self, target_config, repository, group_filter=None):
+                calls.append(None)
+
+        mock_registry_instance = Mock()
+        mock_registry.return_value = mock_registry_instance
+        service = ExporterService(self.db_path, self.mock_config)
+
+        for plugin_class in (ParallelExporter, SequentialExporter):
+            mock_registry_instance.get_plugin.return_value = plugin_class
+            results = service.run_export(workers=4, incremental=True)
+            self.assertEqual(results["test_export"]["status"], "success")
+
+        self.assertEqual(calls, [(4, True), None])
+
     @patch("niamoto.core.services.exporter.Database")
     @patch("niamoto.core.services.exporter.PluginLoader")
     @patch("niamoto.core.services.exporter.PluginRegistry")
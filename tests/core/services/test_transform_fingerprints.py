@@ -0,0 +1,115 @@
+"""Tests for incremental transform fingerprints."""
+
+import shutil
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from niamoto.common.database import Database
+from niamoto.core.services.transform_fingerprints import (
+    EntityFingerprint,
+    IncrementalTransformPlan,
+    TransformFingerprintStore,
+    hash_group_data,
+    hash_widget_config,
+)
+
+
+@pytest.fixture
+def temp_db():
+    temp_dir = tempfile.mkdtemp()
+    db = Database(str(Path(temp_dir) / "test.duckdb"))
+    yield db
+    db.close()
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_hash_group_data_ignores_row_order():
+    frame = pd.DataFrame({"id": [1, 2, 3], "dbh": [10.0, 12.5, 30.0]})
+    shuffled = frame.iloc[[2, 0, 1]]
+
+    assert hash_group_data({"occurrences": frame}) == hash_group_data(
+        {"occurrences": shuffled}
+    )
+
+
+def test_hash_group_data_detects_value_and_schema_changes():
+    frame = pd.DataFrame({"id": [1, 2], "dbh": [10.0, 12.5]})
+    baseline = hash_group_data({"occurrences": frame})
+
+    changed = frame.assign(dbh=[10.0, 13.0])
+    renamed = frame.rename(columns={"dbh": "height"})
+
+    assert hash_group_data({"occurrences": changed}) != baseline
+    assert hash_group_data({"occurrences": renamed}) != baseline
+    assert hash_group_data({"plots": frame}) != baseline
+
+
+def test_hash_group_data_handles_unhashable_cells():
+    frame = pd.DataFrame({"id": [1], "tags": [["a", "b"]]})
+
+    assert hash_group_data({"occurrences": frame}) == hash_group_data(
+        {"occurrences": frame.copy()}
+    )
+
+
+def test_hash_widget_config_is_key_order_independent():
+    assert hash_widget_config(
+        {"plugin": "count", "params": {"a": 1, "b": 2}}
+    ) == hash_widget_config({"params": {"b": 2, "a": 1}, "plugin": "count"})
+
+
+def test_plan_recomputes_changed_inputs_and_changed_widgets():
+    plan = IncrementalTransformPlan(
+        widget_hashes={"count": "c1", "stats": "s2"},
+        previous={
+            1: EntityFingerprint("h1", {"count": "c1", "stats": "s1"}),
+            2: EntityFingerprint("h2", {"count": "c1", "stats": "s2"}),
+        },
+    )
+
+    assert plan.stale_widgets(1, "h1") == ["stats"]
+    assert plan.stale_widgets(2, "h2") == []
+    assert plan.stale_widgets(2, "changed") == ["count", "stats"]
+    assert plan.stale_widgets(3, "h3") == ["count", "stats"]
+    assert plan.subset([2, 3]).previous == {"2": plan.previous["2"]}
+
+
+def test_plan_fingerprint_drops_failed_widgets():
+    plan = IncrementalTransformPlan(widget_hashes={"count": "c1", "stats": "s1"})
+
+    fingerprint = plan.fingerprint("h1", failed_widgets=["stats"])
+
+    assert fingerprint == EntityFingerprint("h1", {"count": "c1"})
+    assert IncrementalTransformPlan(
+        widget_hashes=plan.widget_hashes, previous={1: fingerprint}
+    ).stale_widgets(1, "h1") == ["stats"]
+
+
+def test_store_round_trip_replaces_group_fingerprints(temp_db):
+    store = TransformFingerprintStore(temp_db)
+    store.replace(
+        "plots",
+        {
+            1: EntityFingerprint("h1", {"count": "c1"}),
+            2: EntityFingerprint("h2", {"count": "c1"}),
+        },
+    )
+    store.replace("taxons", {7: EntityFingerprint("t7", {})})
+
+    store.replace("plots", {2: EntityFingerprint("h2b", {"count": "c2"})})
+
+    assert store.load("plots") == {"2": EntityFingerprint("h2b", {"count": "c2"})}
+    assert store.load("taxons") == {"7": EntityFingerprint("t7", {})}
+    assert store.load("shapes") == {}
+
+
+def test_store_keeps_text_entity_ids(temp_db):
+    store = TransformFingerprintStore(temp_db)
+    store.replace("shapes", {"provinces_north": EntityFingerprint("h1", {})})
+
+    plan = IncrementalTransformPlan(widget_hashes={}, previous=store.load("shapes"))
+
+    assert plan.stale_widgets("provinces_north", "h1") == []
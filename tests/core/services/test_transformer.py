@@ -25,7 +25,13 @@ import numpy as np
 import json
 from datetime import datetime
 
+from niamoto.core.plugins.base import LoaderPlugin, PluginType
+from niamoto.core.services.transform_fingerprints import (
+    EntityFingerprint,
+    IncrementalTransformPlan,
+)
 from niamoto.core.services.transformer import TransformerService
+from niamoto.common.database import Database
 from niamoto.common.exceptions import DatabaseQueryError
 from niamoto.common.exceptions import (
     ConfigurationError,
@@ -454,6 +460,77 @@ class TestTransformerService:
             transformer_service.config
         )
 
+    @patch("niamoto.core.services.transformer.PluginRegistry")
+    def test_iter_group_data_streams_loader_partitions(
+        self, mock_registry, transformer_service
+    ):
+        """Test _iter_group_data zips per-source partition streams by group id."""
+
+        class _PartitionLoader(LoaderPlugin):
+            calls = []
+
+            def load_data(self, group_id, config):
+                raise AssertionError("load_data should not be called")
+
+            def load_partitions(self, group_ids, config):
+                _PartitionLoader.calls.append((list(group_ids), config["key"]))
+                for group_id in group_ids:
+                    yield group_id, pd.DataFrame({"gid": [group_id]})
+
+        mock_registry.get_plugin.return_value = _PartitionLoader
+        group_config = {
+            "sources": [
+                {
+                    "name": "occurrences",
+                    "data": "occurrences",
+                    "grouping": "plots",
+                    "relation": {"plugin": "direct_reference", "key": "plot_id"},
+                },
+                {
+                    "name": "stats",
+                    "data": "plot_stats",
+                    "grouping": "plots",
+                    "relation": {"plugin": "direct_reference", "key": "id_plot"},
+                },
+            ]
+        }
+
+        streamed = list(
+            transformer_service._iter_group_data(group_config, None, [1, 2])
+        )
+
+        assert [group_id for group_id, _ in streamed] == [1, 2]
+        assert streamed[1][1]["stats"]["gid"].tolist() == [2]
+        assert _PartitionLoader.calls == [([1, 2], "plot_id"), ([1, 2], "id_plot")]
+
+    @patch("niamoto.core.services.transformer.PluginRegistry")
+    def test_iter_group_data_rejects_out_of_order_partitions(
+        self, mock_registry, transformer_service
+    ):
+        """Test _iter_group_data fails loudly when a loader skips a group."""
+
+        class _SkippingLoader(LoaderPlugin):
+            def load_data(self, group_id, config):
+                return pd.DataFrame()
+
+            def load_partitions(self, group_ids, config):
+                yield group_ids[-1], pd.DataFrame()
+
+        mock_registry.get_plugin.return_value = _SkippingLoader
+        group_config = {
+            "sources": [
+                {
+                    "name": "occurrences",
+                    "data": "occurrences",
+                    "grouping": "plots",
+                    "relation": {"plugin": "direct_reference", "key": "plot_id"},
+                }
+            ]
+        }
+
+        with pytest.raises(DataTransformError):
+            list(transformer_service._iter_group_data(group_config, None, [1, 2]))
+
     @patch("niamoto.core.services.transformer.PluginRegistry")
     def test_get_group_data_multiple_sources(
         self, mock_registry, transformer_service, mock_db
@@ -805,8 +882,8 @@ class TestTransformerService:
         mock_transformer.transform.return_value = {"count": 5}
 
         with patch("niamoto.core.services.transformer.PluginRegistry") as mock_registry:
-            mock_registry.get_plugin.return_value = (
-                lambda db, registry=None: mock_transformer
+            mock_registry.get_plugin.return_value = lambda db, registry=None: (
+                mock_transformer
             )
 
             with patch.object(transformer_service, "_get_group_data") as mock_get_data:
@@ -828,6 +905,59 @@ class TestTransformerService:
         # Verify data was saved to DB (minimal integration check)
         assert mock_db.execute_sql.called, "Results should be saved to database"
 
+    @patch("niamoto.core.services.transformer.CLI_CONTEXT", False)
+    def test_transform_data_reuses_widget_plugins(self, transformer_service, mock_db):
+        """Each widget builds and validates its transformer once per run."""
+        mock_db.execute_sql.return_value = [(1,), (2,), (3,)]
+
+        created = []
+
+        class _CountingTransformer:
+            reentrant = True
+
+            def __init__(self, db, registry=None):
+                self.validations = 0
+                self.group_ids = []
+                created.append(self)
+
+            def validate_config(self, config):
+                self.validations += 1
+
+            def transform(self, data, config):
+                self.group_ids.append(config["group_id"])
+                return {"count": 1}
+
+        class _FreshTransformer(_CountingTransformer):
+            reentrant = False
+
+        transformer_class = _CountingTransformer
+
+        def get_plugin(name, plugin_type):
+            if plugin_type == PluginType.TRANSFORMER:
+                return transformer_class
+            return Mock()
+
+        with patch("niamoto.core.services.transformer.PluginRegistry") as mock_registry:
+            mock_registry.get_plugin.side_effect = get_plugin
+            with patch.object(transformer_service, "_get_group_data") as mock_get_data:
+                mock_get_data.return_value = pd.DataFrame({"id": [1]})
+                transformer_service.transform_data(group_by="plots")
+
+            # Two widgets, three entities: one instance and validation each
+            assert len(created) == 2
+            assert [t.validations for t in created] == [1, 1]
+            assert [t.group_ids for t in created] == [[1, 2, 3], [1, 2, 3]]
+
+            created.clear()
+            transformer_class = _FreshTransformer
+            with patch.object(transformer_service, "_get_group_data") as mock_get_data:
+                mock_get_data.return_value = pd.DataFrame({"id": [1]})
+                transformer_service.transform_data(group_by="plots")
+
+        # Non-reentrant plugins get a new instance for every entity
+        assert len(created) == 6
+        assert sum(t.validations for t in created) == 2
+
     @patch("niamoto.core.services.transformer.CLI_CONTEXT", True)
     @patch("niamoto.core.services.transformer.ProgressManager")
     @patch("niamoto.core.services.transformer.OperationMetrics")
@@ -856,8 +986,8 @@ class TestTransformerService:
         mock_transformer.transform.return_value = {"count": 5}
 
         with patch("niamoto.core.services.transformer.PluginRegistry") as mock_registry:
-            mock_registry.get_plugin.return_value = (
-                lambda db, registry=None: mock_transformer
+            mock_registry.get_plugin.return_value = lambda db, registry=None: (
+                mock_transformer
             )
 
             with patch.object(transformer_service, "_get_group_data") as mock_get_data:
@@ -886,8 +1016,8 @@ class TestTransformerService:
         mock_transformer.transform.side_effect = Exception("Widget error")
 
         with patch("niamoto.core.services.transformer.PluginRegistry") as mock_registry:
-            mock_registry.get_plugin.return_value = (
-                lambda db, registry=None: mock_transformer
+            mock_registry.get_plugin.return_value = lambda db, registry=None: (
+                mock_transformer
             )
 
             with patch.object(transformer_service, "_get_group_data") as mock_get_data:
@@ -954,8 +1084,8 @@ class TestTransformerService:
         mock_transformer.transform.return_value = {"count": 5}
 
         with patch("niamoto.core.services.transformer.PluginRegistry") as mock_registry:
-            mock_registry.get_plugin.return_value = (
-                lambda db, registry=None: mock_transformer
+            mock_registry.get_plugin.return_value = lambda db, registry=None: (
+                mock_transformer
             )
 
             with patch("pandas.read_csv") as mock_read_csv:
@@ -1026,6 +1156,397 @@ class TestTransformerService:
                 transformer_service._filter_configs(search_term)
 
 
+class _InlineExecutor:
+    """Stand-in for ProcessPoolExecutor that runs chunks in the current process."""
+
+    instances = []
+
+    def __init__(self, max_workers, mp_context=None, initializer=None, initargs=()):
+        self.max_workers = max_workers
+        self.initargs = initargs
+        self.submitted_chunks = []
+        _InlineExecutor.instances.append(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def map(self, fn, *iterables):
+        for args in zip(*iterables):
+            self.submitted_chunks.append(list(args[1]))
+            yield fn(*args)
+
+
+class TestTransformerServiceParallel:
+    """Tests for the process-pool execution mode of transform_data."""
+
+    @pytest.fixture
+    def parallel_service(self, transformer_service, mock_db):
+        transformer_service.config.config_dir = "/project/config"
+        transformer_service.use_cli_integration = False
+        mock_db.db_path = "/project/db/niamoto.duckdb"
+        mock_db.execute_sql.return_value = [(1,), (2,), (3,), (4,), (5,)]
+        _InlineExecutor.instances = []
+        with (
+            patch(
+                "niamoto.core.services.transformer.ProcessPoolExecutor",
+                _InlineExecutor,
+            ),
+            patch.object(
+                transformer_service,
+                "_iter_group_data",
+                side_effect=lambda config, csv, ids: ((gid, {}) for gid in ids),
+            ),
+            patch(
+                "niamoto.core.services.transformer._worker_service",
+                transformer_service,
+            ),
+        ):
+            yield transformer_service
+
+    def test_should_run_parallel_requires_workers_and_config_dir(
+        self, transformer_service
+    ):
+        transformer_service.config.config_dir = "/project/config"
+        assert transformer_service._should_run_parallel(4, {}, [1, 2])
+        assert not transformer_service._should_run_parallel(1, {}, [1, 2])
+        assert not transformer_service._should_run_parallel(4, {}, [1])
+
+        transformer_service.config.config_dir = None
+        assert not transformer_service._should_run_parallel(4, {}, [1, 2])
+
+    def test_parallel_results_are_applied_in_group_order(
+        self, parallel_service, mock_db
+    ):
+        def compute(group_config, group_id, csv_file=None, group_data=None, plan=None):
+            warnings = [f"warning {group_id}"] if group_id == 3 else []
+            return {
+                "group_id": group_id,
+                "results": {"species_count": {"value": group_id}},
+                "warnings": warnings,
+            }
+
+        progress_events = []
+        with (
+            patch.object(
+                parallel_service, "_compute_entity_results", side_effect=compute
+            ),
+            patch.object(parallel_service, "_load_group_names", return_value={}),
+            patch.object(parallel_service, "_flush_group_table") as mock_flush,
+            patch.object(parallel_service, "_record_transform_warning") as warn,
+        ):
+            result = parallel_service.transform_data(
+                group_by="plots",
+                progress_callback=progress_events.append,
+                workers=2,
+            )
+
+        executor = _InlineExecutor.instances[0]
+        assert executor.max_workers == 2
+        assert executor.initargs == (
+            "/project/db/niamoto.duckdb",
+            "/project/config",
+        )
+        assert [gid for chunk in executor.submitted_chunks for gid in chunk] == [
+            1,
+            2,
+            3,
+            4,
+            5,
+        ]
+
+        assert result["plots"]["widgets_generated"] == 5
+        assert result["plots"]["widgets"] == {"species_count": 5}
+        mock_flush.assert_any_call("plots", True)
+        warn.assert_called_once_with("warning 3")
+
+        processed = [event["processed"] for event in progress_events]
+        assert processed == list(range(1, 11))
+        assert [event["item_label"] for event in progress_events[::2]] == [
+            "1",
+            "2",
+            "3",
+            "4",
+            "5",
+        ]
+        mock_db.release_file_lock.assert_called_once()
+
+    def test_parallel_mode_buffers_results_for_flush(self, parallel_service):
+        def compute(group_config, group_id, csv_file=None, group_data=None, plan=None):
+            return {
+                "group_id": group_id,
+                "results": {"stats": {"mean": float(group_id)}},
+                "warnings": [],
+            }
+
+        with (
+            patch.object(
+                parallel_service, "_compute_entity_results", side_effect=compute
+            ),
+            patch.object(
+                parallel_service,
+                "_flush_group_table",
+                side_effect=lambda group_by, recreate: None,
+            ),
+        ):
+            parallel_service.transform_data(group_by="plots", workers=3)
+
+        buffered = parallel_service._table_buffers["plots"]
+        assert sorted(buffered) == [1, 2, 3, 4, 5]
+        assert json.loads(buffered[4]["stats"]) == {"mean": 4.0}
+
+    def test_spawned_pool_reads_the_database_opened_by_the_parent(self, tmp_path):
+        group_config = {
+            "group_by": "plots",
+            "sources": [
+                {
+                    "name": "occurrences",
+                    "data": "occurrences",
+                    "grouping": "plots",
+                    "relation": {"plugin": "direct_reference", "key": "plot_id"},
+                }
+            ],
+            "widgets_data": {
+                "height_stats": {
+                    "plugin": "statistical_summary",
+                    "params": {
+                        "source": "occurrences",
+                        "field": "height",
+                        "stats": ["max"],
+                    },
+                }
+            },
+        }
+        config_dir = tmp_path / "config"
+        config_dir.mkdir()
+        for name in ("config.yml", "import.yml", "export.yml"):
+            (config_dir / name).write_text("{}\n", encoding="utf-8")
+        # JSON is valid YAML
+        (config_dir / "transform.yml").write_text(
+            json.dumps([group_config]), encoding="utf-8"
+        )
+        db_path = tmp_path / "db" / "niamoto.duckdb"
+        db_path.parent.mkdir()
+        db = Database(str(db_path), optimize=False)
+        try:
+            db.execute_sql("CREATE TABLE plots AS SELECT range AS id FROM range(1, 5)")
+            db.execute_sql(
+                "CREATE TABLE occurrences AS "
+                "SELECT range AS id, range % 4 + 1 AS plot_id, range AS height "
+                "FROM range(20)"
+            )
+            service = TransformerService.for_preview(db, str(config_dir))
+
+            results = list(
+                service._iter_parallel_entity_results(
+                    group_config, [1, 2, 3, 4], None, workers=2
+                )
+            )
+
+            assert [result["group_id"] for result in results] == [1, 2, 3, 4]
+            maxima = [result["results"]["height_stats"]["max"] for result in results]
+            assert maxima == [16, 17, 18, 19]
+            # The parent reconnects for writing once the pool is done
+            db.execute_sql("CREATE TABLE after_pool AS SELECT 1 AS id")
+        finally:
+            db.close()
+
+
+class TestTransformerServiceIncremental:
+    """Tests for fingerprint-driven incremental transforms."""
+
+    @pytest.fixture
+    def plan(self):
+        return IncrementalTransformPlan(
+            widget_hashes={"species_count": "c1", "stats": "s2"},
+            previous={
+                1: EntityFingerprint("h1", {"species_count": "c1", "stats": "s1"})
+            },
+        )
+
+    def test_compute_entity_results_only_runs_stale_widgets(
+        self, transformer_service, mock_config, plan
+    ):
+        group_config = mock_config.get_transforms_config.return_value[0]
+
+        with (
+            patch.object(
+                transformer_service, "_fingerprint_group_data", return_value="h1"
+            ),
+            patch.object(
+                transformer_service,
+                "_execute_widget_transform",
+                return_value={"value": 1},
+            ) as execute,
+        ):
+            result = transformer_service._compute_entity_results(
+                group_config, 1, group_data={}, plan=plan
+            )
+
+        assert [call.args[3] for call in execute.call_args_list] == ["stats"]
+        assert result["results"] == {"stats": {"value": 1}}
+        assert result["input_hash"] == "h1"
+
+    def test_compute_entity_results_clears_recomputed_widgets_without_result(
+        self, transformer_service, mock_config, plan
+    ):
+        group_config = mock_config.get_transforms_config.return_value[0]
+
+        def execute(group_by, data, group_id, widget_name, widget_config):
+            if widget_name == "stats":
+                raise ValueError("boom")
+            return None
+
+        with (
+            patch.object(
+                transformer_service, "_fingerprint_group_data", return_value="new"
+            ),
+            patch.object(
+                transformer_service, "_execute_widget_transform", side_effect=execute
+            ),
+        ):
+            result = transformer_service._compute_entity_results(
+                group_config, 1, group_data={}, plan=plan
+            )
+
+        assert result["results"] == {"species_count": None, "stats": None}
+        assert result["failed_widgets"] == ["stats"]
+
+    def test_fingerprint_hashes_widget_tables_once_per_run(self, transformer_service):
+        widgets = {
+            "shape_info": {"plugin": "field_aggregator", "source": "shapes"},
+            "elevation": {"plugin": "stats", "params": {"source": "occurrences"}},
+        }
+        group_data = {"occurrences": pd.DataFrame({"id": [1, 2]})}
+        tables = {"shapes": pd.DataFrame({"id": [1], "name": ["North"]})}
+
+        with patch.object(
+            transformer_service,
+            "_load_additional_source",
+            side_effect=lambda name: tables[name],
+        ) as load:
+            first = transformer_service._fingerprint_group_data(
+                "shapes", group_data, widgets, 1
+            )
+            second = transformer_service._fingerprint_group_data(
+                "shapes", group_data, widgets, 2
+            )
+            tables["shapes"] = tables["shapes"].assign(name=["South"])
+            transformer_service._source_table_hashes = {}
+            changed = transformer_service._fingerprint_group_data(
+                "shapes", group_data, widgets, 1
+            )
+
+        assert first == second
+        assert changed != first
+        assert [call.args for call in load.call_args_list] == [
+            ("shapes",),
+            ("shapes",),
+        ]
+        assert set(group_data) == {"occurrences"}
+
+    def test_prepare_incremental_group_rebuilds_when_widgets_changed(
+        self, transformer_service, mock_db
+    ):
+        widgets = {"species_count": {"plugin": "count"}}
+        mock_db.has_table.return_value = True
+        mock_db.get_table_columns.return_value = ["plots_id", "old_widget"]
+
+        plan, recreate = transformer_service._prepare_incremental_group(
+            "plots", widgets, [1, 2], False, True
+        )
+
+        assert recreate is True
+        assert plan.previous == {}
+        assert set(plan.widget_hashes) == {"species_count"}
+        assert transformer_service._prepare_incremental_group(
+            "plots", widgets, [1, 2], False, False
+        ) == (None, False)
+
+    @patch("niamoto.core.services.transformer.TransformFingerprintStore")
+    def test_prepare_incremental_group_deletes_removed_entities(
+        self, mock_store, transformer_service, mock_db, mock_to_sql
+    ):
+        previous = {1: EntityFingerprint("h1", {})}
+        mock_store.return_value.load.return_value = previous
+        mock_db.has_table.return_value = True
+        mock_db.get_table_columns.return_value = ["plots_id", "species_count"]
+
+        plan, recreate = transformer_service._prepare_incremental_group(
+            "plots", {"species_count": {"plugin": "count"}}, [1, 2], True, True
+        )
+
+        assert recreate is False
+        assert plan.previous == previous
+        delete_sql = mock_db.execute_sql.call_args_list[0][0][0]
+        assert "DELETE FROM plots" in delete_sql
+        assert "NOT IN" in delete_sql
+
+    def test_flush_group_table_upserts_batches_per_column_set(
+        self, transformer_service, mock_db, mock_to_sql
+    ):
+        transformer_service._table_buffers = {
+            "plots": {1: {"stats": "a"}, 2: {"stats": "b", "species_count": "c"}}
+        }
+
+        transformer_service._flush_group_table("plots", recreate_table=False)
+
+        inserts = [
+            call[0][0]
+            for call in mock_db.execute_sql.call_args_list
+            if "INSERT INTO" in call[0][0]
+        ]
+        assert len(inserts) == 2
+        assert "species_count" not in inserts[0]
+        assert "species_count" in inserts[1]
+
+    @patch("niamoto.core.services.transformer.TransformFingerprintStore")
+    def test_transform_data_incremental_skips_unchanged_entities(
+        self, mock_store, transformer_service, mock_db, plan
+    ):
+        transformer_service.use_cli_integration = False
+        mock_db.execute_sql.return_value = [(1,), (2,)]
+
+        def compute(group_config, group_id, csv_file=None, group_data=None, plan=None):
+            return {
+                "group_id": group_id,
+                "results": {} if group_id == 1 else {"stats": {"mean": 1.0}},
+                "warnings": [],
+                "input_hash": f"h{group_id}",
+                "failed_widgets": [],
+            }
+
+        with (
+            patch.object(
+                transformer_service,
+                "_prepare_incremental_group",
+                return_value=(plan, False),
+            ),
+            patch.object(
+                transformer_service,
+                "_iter_group_data",
+                side_effect=lambda config, csv, ids: ((gid, {}) for gid in ids),
+            ),
+            patch.object(
+                transformer_service, "_compute_entity_results", side_effect=compute
+            ),
+            patch.object(transformer_service, "_flush_group_table") as mock_flush,
+        ):
+            result = transformer_service.transform_data(
+                group_by="plots", incremental=True
+            )
+
+        assert result["plots"]["unchanged_items"] == 1
+        assert result["plots"]["widgets_generated"] == 1
+        mock_flush.assert_any_call("plots", False)
+        group_by, fingerprints = mock_store.return_value.replace.call_args[0]
+        assert group_by == "plots"
+        assert sorted(fingerprints) == [1, 2]
+        assert fingerprints[2].input_hash == "h2"
+
+
 class TestTransformerServiceWorkflow:
     """Unit workflow tests for TransformerService.
 
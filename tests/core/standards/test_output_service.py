@@ -842,3 +842,167 @@ def test_humboldt_event_profile_writes_partial_standard_files(tmp_path):
     assert result.validation_status == "partial"
     assert event_path.exists()
     assert "eventID" in event_path.read_text(encoding="utf-8")
+
+
+def _write_occurrence_database(db_path) -> list[dict]:
+    connection = duckdb.connect(str(db_path))
+    try:
+        connection.execute(
+            """
+            CREATE TABLE occurrences (
+                id INTEGER,
+                scientific_name VARCHAR,
+                dbh DOUBLE,
+                event_date DATE,
+                is_dead BOOLEAN
+            )
+            """
+        )
+        connection.execute(
+            """
+            INSERT INTO occurrences VALUES
+                (1, 'Araucaria columnaris', 12.5, '2024-03-01', false),
+                (2, 'Pancheria "elegans", var.', 'NaN', NULL, true),
+                (3, '', NULL, '2023-11-30', NULL)
+            """
+        )
+        rows = connection.execute("SELECT * FROM occurrences").fetchall()
+        columns = [column[0] for column in connection.description]
+    finally:
+        connection.close()
+    return [
+        {
+            column: None if isinstance(value, float) and value != value else value
+            for column, value in zip(columns, row)
+        }
+        for row in rows
+    ]
+
+
+def test_compiled_mappings_copy_api_json_without_python_records(tmp_path, monkeypatch):
+    db_path = tmp_path / "niamoto.duckdb"
+    source_rows = _write_occurrence_database(db_path)
+    profile = StandardProfileConfig.model_validate(
+        {
+            "name": "dwc_occurrences",
+            "standard": "darwin_core_occurrence",
+            "target_grain": "occurrence",
+            "source": {"type": "dataset", "name": "occurrences"},
+            "mappings": {
+                "occurrenceID": "id",
+                "scientificName": {"source": "@source.scientific_name"},
+                "eventDate": {"source": "event_date"},
+                "dynamicProperties": {"source": "dbh"},
+                "reproductiveCondition": {"source": "is_dead"},
+                "basisOfRecord": {
+                    "generator": "constant",
+                    "params": {"value": "HumanObservation: plot"},
+                },
+                "individualCount": {"generator": "constant", "params": {"value": 1}},
+                "locality": {"source": "missing_column"},
+            },
+            "outputs": [{"type": "api_json"}],
+        }
+    )
+    service = StandardProfileOutputService(
+        tmp_path, db_path=db_path, import_config=_occurrence_import_config()
+    )
+    expected = service.execute_profile(
+        profile, output_type="api_json", records=source_rows
+    )
+    expected_records = json.loads(expected.files[0].read_text(encoding="utf-8"))[
+        "records"
+    ]
+
+    def fail_iter_records(_source):
+        raise AssertionError("compiled mappings should not stream Python records")
+
+    monkeypatch.setattr(service, "_iter_records", fail_iter_records)
+    result = service.execute_profile(profile, output_type="api_json")
+
+    payload = json.loads(result.files[0].read_text(encoding="utf-8"))
+    assert payload["metadata"]["records_count"] == 3
+    assert payload["records"] == expected_records
+    assert payload["records"][1]["dynamicProperties"] is None
+    assert payload["records"][0]["basisOfRecord"] == "HumanObservation: plot"
+
+
+def test_compiled_mappings_resolve_generator_terms_in_python(tmp_path):
+    db_path = tmp_path / "niamoto.duckdb"
+    _write_occurrence_database(db_path)
+    profile = StandardProfileConfig.model_validate(
+        {
+            "name": "dwc_occurrences",
+            "standard": "darwin_core_occurrence",
+            "target_grain": "occurrence",
+            "source": {"type": "dataset", "name": "occurrences"},
+            "mappings": {
+                "occurrenceID": {
+                    "generator": "unique_occurrence_id",
+                    "params": {"prefix": "occ-", "source": "scientific_name"},
+                },
+                "scientificName": {"source": "scientific_name"},
+            },
+            "outputs": [{"type": "api_json"}],
+        }
+    )
+    service = StandardProfileOutputService(
+        tmp_path, db_path=db_path, import_config=_occurrence_import_config()
+    )
+
+    result = service.execute_profile(profile, output_type="api_json")
+
+    payload = json.loads(result.files[0].read_text(encoding="utf-8"))
+    assert payload["records"] == [
+        {
+            "occurrenceID": "occ-Araucaria columnaris",
+            "scientificName": "Araucaria columnaris",
+        },
+        {
+            "occurrenceID": 'occ-Pancheria "elegans", var.',
+            "scientificName": 'Pancheria "elegans", var.',
+        },
+        {"occurrenceID": "occ-3", "scientificName": ""},
+    ]
+
+
+def test_compiled_humboldt_event_csv_matches_python_writer(tmp_path):
+    db_path = tmp_path / "niamoto.duckdb"
+    source_rows = _write_occurrence_database(db_path)
+    profile = StandardProfileConfig.model_validate(
+        {
+            "name": "plot_inventory",
+            "standard": "humboldt_event",
+            "target_grain": "event",
+            "source": {"type": "dataset", "name": "occurrences"},
+            "mappings": {
+                "eventID": {"source": "id"},
+                "locality": {"source": "scientific_name"},
+                "eventDate": {"source": "event_date"},
+                "sampleSizeValue": {"source": "dbh"},
+                "isAbsenceReported": {"source": "is_dead"},
+                "samplingProtocol": {
+                    "generator": "constant",
+                    "params": {"value": "plot"},
+                },
+            },
+            "outputs": [{"type": "standard_files"}],
+        }
+    )
+    service = StandardProfileOutputService(
+        tmp_path, db_path=db_path, import_config=_occurrence_import_config()
+    )
+    event_path = (
+        (tmp_path / "exports" / ".draft" / "profiles" / "plot_inventory")
+        / "standard_files"
+        / "event.csv"
+    )
+
+    service.execute_profile(
+        profile, output_type="standard_files", records=source_rows, draft=True
+    )
+    expected = event_path.read_bytes()
+    result = service.execute_profile(profile, output_type="standard_files", draft=True)
+
+    assert result.metadata["records_count"] == 3
+    assert event_path.read_bytes() == expected
@@ -626,6 +626,32 @@ def test_completeness_endpoint_reports_partial_column_completeness(
     assert payload["overall_completeness"] == pytest.approx(2 / 3)
 
 
+def test_profile_endpoint_reports_ranges_and_top_values(
+    gui_duckdb_client: TestClient,
+):
+    response = gui_duckdb_client.get("/api/stats/profile/dataset_occurrences")
+
+    assert response.status_code == 200, response.text
+    payload = response.json()
+
+    assert payload["entity"] == "dataset_occurrences"
+    assert payload["row_count"] == 3
+    columns = {column["column"]: column for column in payload["columns"]}
+    assert set(columns) == {"id", "taxon_id", "count", "locality"}
+    assert columns["taxon_id"]["distinct_count"] == 2
+    assert columns["id"]["min_value"] == 1
+    assert columns["id"]["max_value"] == 3
+    assert columns["taxon_id"]["top_values"]
+
+
+def test_profile_endpoint_returns_404_for_unknown_entity(
+    gui_duckdb_client: TestClient,
+):
+    response = gui_duckdb_client.get("/api/stats/profile/missing_table")
+
+    assert response.status_code == 404
+
+
 def test_completeness_endpoint_returns_404_for_unknown_entity(
     gui_duckdb_client: TestClient,
 ):
@@ -0,0 +1,118 @@
+"""Tests for single-query column profiling."""
+
+from pathlib import Path
+
+import duckdb
+import pytest
+
+from niamoto.common.database import Database
+from niamoto.gui.api.services import column_profiler
+from niamoto.gui.api.services.column_profiler import (
+    clear_profile_cache,
+    get_table_profile,
+    profile_table,
+)
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    path = tmp_path / "niamoto.duckdb"
+    conn = duckdb.connect(str(path))
+    try:
+        conn.execute(
+            """
+            CREATE TABLE occurrences (
+                id INTEGER,
+                family VARCHAR,
+                dbh DOUBLE,
+                tags VARCHAR[]
+            )
+            """
+        )
+        conn.execute(
+            """
+            INSERT INTO occurrences VALUES
+                (1, 'Myrtaceae', 10.5, ['a']),
+                (2, 'Myrtaceae', NULL, NULL),
+                (3, 'Sapotaceae', 42.0, ['b']),
+                (4, NULL, 7.25, ['a', 'b'])
+            """
+        )
+    finally:
+        conn.close()
+    yield path
+    clear_profile_cache()
+
+
+def test_profile_table_reports_every_column(db_path: Path):
+    db = Database(str(db_path), read_only=True)
+    try:
+        profile = profile_table(db, "occurrences")
+    finally:
+        db.close_db_session()
+        db.engine.dispose()
+
+    assert profile.row_count == 4
+    columns = {col.name: col for col in profile.columns}
+    assert [col.name for col in profile.columns] == ["id", "family", "dbh", "tags"]
+
+    assert columns["id"].null_count == 0
+    assert columns["id"].distinct_count == 4
+    assert (columns["id"].min_value, columns["id"].max_value) == (1, 4)
+
+    assert columns["family"].null_count == 1
+    assert columns["family"].non_null_count(profile.row_count) == 3
+    assert columns["family"].distinct_count == 2
+    assert columns["family"].top_values[0] == "Myrtaceae"
+
+    assert columns["dbh"].null_count == 1
+    assert columns["dbh"].max_value == 42.0
+
+    # Lists only get counts
+    assert columns["tags"].null_count == 1
+    assert columns["tags"].min_value is None
+    assert columns["tags"].top_values == ()
+
+
+def test_profile_table_runs_a_single_query(db_path: Path, monkeypatch):
+    db = Database(str(db_path), read_only=True)
+    statements = []
+    original_text = column_profiler.text
+
+    def recording_text(sql):
+        statements.append(sql)
+        return original_text(sql)
+
+    monkeypatch.setattr(column_profiler, "text", recording_text)
+    try:
+        profile_table(db, "occurrences")
+    finally:
+        db.close_db_session()
+        db.engine.dispose()
+
+    assert len(statements) == 1
+
+
+def test_get_table_profile_is_cached_until_the_database_changes(db_path: Path):
+    db = Database(str(db_path), read_only=True)
+    try:
+        first = get_table_profile(db, db_path, "occurrences")
+        assert get_table_profile(db, db_path, "occurrences") is first
+    finally:
+        db.close_db_session()
+        db.engine.dispose()
+
+    conn = duckdb.connect(str(db_path))
+    try:
+        conn.execute("INSERT INTO occurrences VALUES (5, 'Araucariaceae', 3.0, NULL)")
+    finally:
+        conn.close()
+
+    db = Database(str(db_path), read_only=True)
+    try:
+        refreshed = get_table_profile(db, db_path, "occurrences")
+    finally:
+        db.close_db_session()
+        db.engine.dispose()
+
+    assert refreshed.row_count == 5
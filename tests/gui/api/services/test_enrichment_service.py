@@ -4,6 +4,9 @@ from __future__ import annotations
 
 import asyncio
 import json
+import subprocess
+import sys
+import threading
 
 import duckdb
 import pytest
@@ -662,6 +665,244 @@ def test_save_source_enrichment_merges_with_current_database_extra_data(
     assert stored["api_enrichment"]["sources"]["gbif"]["data"] == {"usage_key": 987654}
 
 
+def _create_taxons_db(tmp_path, rows):
+    db_dir = tmp_path / "db"
+    db_dir.mkdir()
+    conn = duckdb.connect(str(db_dir / "niamoto.duckdb"))
+    try:
+        conn.execute("CREATE TABLE taxons (id INTEGER, extra_data JSON)")
+        for entity_id, extra_data in rows:
+            conn.execute(
+                "INSERT INTO taxons VALUES (?, ?)",
+                [entity_id, json.dumps(extra_data) if extra_data else None],
+            )
+    finally:
+        conn.close()
+    return db_dir / "niamoto.duckdb"
+
+
+def _stored_extra_data(db_path):
+    conn = duckdb.connect(str(db_path), read_only=True)
+    try:
+        rows = conn.execute(
+            "SELECT id, CAST(extra_data AS VARCHAR) FROM taxons ORDER BY id"
+        ).fetchall()
+    finally:
+        conn.close()
+    return {
+        entity_id: json.loads(value) if value else None for entity_id, value in rows
+    }
+
+
+def test_enrichment_writer_flushes_batches_in_one_update(monkeypatch, tmp_path):
+    """Buffered updates are merged with stored extra_data and written together."""
+
+    db_path = _create_taxons_db(
+        tmp_path,
+        [
+            (1, {"notes": {"concurrent": True}}),
+            (2, {"api_enrichment": {"sources": {"gbif": {"data": {"key": 1}}}}}),
+            (3, None),
+        ],
+    )
+    monkeypatch.setattr(
+        enrichment_service,
+        "_get_reference_table_name",
+        lambda _reference_name: "taxons",
+    )
+    gbif = enrichment_service.EnrichmentSourceConfig(id="gbif", label="GBIF")
+    endemia = enrichment_service.EnrichmentSourceConfig(id="endemia", label="Endemia")
+
+    writer = enrichment_service._EnrichmentWriter("taxons", tmp_path, batch_size=3)
+    try:
+        for entity_id, source in ((1, gbif), (1, endemia), (3, gbif), (99, gbif)):
+            assert writer.queue(
+                entity_id,
+                lambda extra_data, source=source: (
+                    enrichment_service._replace_source_enrichment_data(
+                        extra_data, source, {"id": source.id}
+                    )
+                ),
+            )
+        writer.queue(
+            2,
+            lambda extra_data: enrichment_service._delete_source_enrichment_data(
+                extra_data, "gbif"
+            ),
+        )
+        assert writer.should_flush()
+        stored = writer.flush()
+        assert not writer.should_flush()
+    finally:
+        writer.close()
+
+    assert set(stored) == {1, 2, 3}
+    persisted = _stored_extra_data(db_path)
+    assert persisted[1]["notes"] == {"concurrent": True}
+    assert set(persisted[1]["api_enrichment"]["sources"]) == {"gbif", "endemia"}
+    assert persisted[2] is None
+    assert persisted[3]["api_enrichment"]["sources"]["gbif"]["data"] == {"id": "gbif"}
+
+
+def test_enrichment_writer_keeps_updates_when_a_flush_fails(monkeypatch, tmp_path):
+    """A failed flush leaves its updates buffered for the next one."""
+
+    db_path = _create_taxons_db(tmp_path, [(1, None)])
+    monkeypatch.setattr(
+        enrichment_service,
+        "_get_reference_table_name",
+        lambda _reference_name: "taxons",
+    )
+    source = enrichment_service.EnrichmentSourceConfig(id="gbif", label="GBIF")
+    writer = enrichment_service._EnrichmentWriter("taxons", tmp_path, flush_interval=0)
+    writer.queue(
+        1,
+        lambda extra_data: enrichment_service._replace_source_enrichment_data(
+            extra_data, source, {"usage_key": 7}
+        ),
+    )
+
+    original_write_batch = writer._write_batch
+
+    def failing_write_batch(batch):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(writer, "_write_batch", failing_write_batch)
+    with pytest.raises(RuntimeError):
+        writer.flush()
+    assert writer.should_flush()
+
+    monkeypatch.setattr(writer, "_write_batch", original_write_batch)
+    writer.close()
+
+    stored = _stored_extra_data(db_path)[1]
+    assert stored["api_enrichment"]["sources"]["gbif"]["data"] == {"usage_key": 7}
+
+
+def test_enrichment_writer_releases_the_database_between_flushes(monkeypatch, tmp_path):
+    """Another process can open the database while the writer waits."""
+
+    db_path = _create_taxons_db(tmp_path, [(1, None), (2, None)])
+    monkeypatch.setattr(
+        enrichment_service,
+        "_get_reference_table_name",
+        lambda _reference_name: "taxons",
+    )
+    source = enrichment_service.EnrichmentSourceConfig(id="gbif", label="GBIF")
+    writer = enrichment_service._EnrichmentWriter("taxons", tmp_path)
+
+    def enrich(entity_id):
+        writer.queue(
+            entity_id,
+            lambda extra_data: enrichment_service._replace_source_enrichment_data(
+                extra_data, source, {"usage_key": entity_id}
+            ),
+        )
+
+    try:
+        enrich(1)
+        writer.flush()
+        child = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, duckdb\n"
+                "conn = duckdb.connect(sys.argv[1])\n"
+                "conn.execute('INSERT INTO taxons VALUES (3, NULL)')\n"
+                "conn.close()\n",
+                str(db_path),
+            ],
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+        assert child.returncode == 0, child.stderr
+        enrich(2)
+        enrich(3)
+    finally:
+        writer.close()
+
+    persisted = _stored_extra_data(db_path)
+    assert {
+        entity_id: extra_data["api_enrichment"]["sources"]["gbif"]["data"]
+        for entity_id, extra_data in persisted.items()
+    } == {entity_id: {"usage_key": entity_id} for entity_id in (1, 2, 3)}
+
+
+def test_run_enrichment_job_buffers_writes_in_batches(monkeypatch, tmp_path):
+    """A job writes its results in batches and persists every result."""
+
+    db_path = _create_taxons_db(tmp_path, [(entity_id, None) for entity_id in range(5)])
+    rows = [
+        {"id": entity_id, "full_name": f"Taxon {entity_id}", "extra_data": None}
+        for entity_id in range(5)
+    ]
+    source = enrichment_service.EnrichmentSourceConfig(
+        id="gbif",
+        label="GBIF",
+        enabled=True,
+        api_url="https://api.gbif.org/v1/species/match",
+        rate_limit=0,
+    )
+
+    class FakeEnricher:
+        def load_data(self, payload, config):
+            return {"api_enrichment": {"usage_key": payload["id"]}}
+
+    opened: list[str] = []
+    real_database = enrichment_service.Database
+
+    def counting_database(path, *args, **kwargs):
+        opened.append(path)
+        return real_database(path, *args, **kwargs)
+
+    monkeypatch.setattr(enrichment_service, "Database", counting_database)
+    monkeypatch.setattr(
+        enrichment_service, "_load_reference_rows", lambda _reference_name: rows
+    )
+    monkeypatch.setattr(
+        enrichment_service, "_build_enricher", lambda _plugin: FakeEnricher()
+    )
+    monkeypatch.setattr(
+        enrichment_service,
+        "_get_reference_table_name",
+        lambda _reference_name: "taxons",
+    )
+
+    now = "2026-04-21T20:00:00"
+    enrichment_service._current_job = enrichment_service.EnrichmentJob(
+        id="job-buffered-1",
+        reference_name="taxons",
+        mode=enrichment_service.JobMode.SINGLE,
+        status=enrichment_service.JobStatus.RUNNING,
+        started_at=now,
+        updated_at=now,
+        source_ids=[source.id],
+        source_id=source.id,
+    )
+
+    asyncio.run(
+        enrichment_service._run_enrichment_job(
+            "job-buffered-1",
+            "taxons",
+            [source],
+            enrichment_service.JobMode.SINGLE,
+            work_dir=tmp_path,
+        )
+    )
+
+    job = enrichment_service._current_job
+    assert job.status == enrichment_service.JobStatus.COMPLETED
+    assert job.successful == 5
+    # Once to resolve the reference table, once for the single batch
+    assert len(opened) == 2
+    persisted = _stored_extra_data(db_path)
+    assert {
+        entity_id: extra_data["api_enrichment"]["sources"]["gbif"]["data"]
+        for entity_id, extra_data in persisted.items()
+    } == {entity_id: {"usage_key": entity_id} for entity_id in range(5)}
+
+
 def test_delete_source_enrichment_data_keeps_other_sources():
     """Deleting one source must preserve other source payloads and extra_data keys."""
 
@@ -1540,7 +1781,7 @@ def test_assert_job_can_start_cancels_foreign_running_job(monkeypatch, tmp_path)
     )
 
 
-def test_run_enrichment_job_does_not_complete_replaced_job_after_rate_sleep(
+def test_run_enrichment_job_does_not_complete_replaced_job_after_rate_wait(
     monkeypatch,
 ):
     """A stale job should not update the job that replaced it after a rate delay."""
@@ -1551,11 +1792,17 @@ def test_run_enrichment_job_does_not_complete_replaced_job_after_rate_sleep(
         enabled=True,
         api_url="https://api.endemia.nc/v1/taxons",
         rate_limit=1,
+        concurrency=1,
     )
-    rows = [{"id": 1, "full_name": "Araucaria", "extra_data": None}]
+    rows = [
+        {"id": 1, "full_name": "Araucaria", "extra_data": None},
+        {"id": 2, "full_name": "Agathis", "extra_data": None},
+    ]
+    loaded: list[str] = []
 
     class FakeEnricher:
         def load_data(self, payload, config):
+            loaded.append(payload["full_name"])
             return {"api_enrichment": {"api_id": 42}}
 
     monkeypatch.setattr(
@@ -1583,7 +1830,8 @@ def test_run_enrichment_job_does_not_complete_replaced_job_after_rate_sleep(
     )
 
     async def replace_job_during_sleep(seconds):
-        assert seconds == 1.0
+        # The second request waits for the rate limit
+        assert 0 < seconds <= 1.0
         enrichment_service._current_job = replacement_job
 
     monkeypatch.setattr(enrichment_service.asyncio, "sleep", replace_job_during_sleep)
@@ -1609,6 +1857,261 @@ def test_run_enrichment_job_does_not_complete_replaced_job_after_rate_sleep(
 
     assert enrichment_service._current_job is replacement_job
     assert replacement_job.status == enrichment_service.JobStatus.RUNNING
+    assert loaded == ["Araucaria"]
+
+
+def test_run_enrichment_job_runs_sources_concurrently(monkeypatch):
+    """Independent sources should have requests in flight at the same time."""
+
+    sources = [
+        enrichment_service.EnrichmentSourceConfig(
+            id=source_id,
+            label=source_id.upper(),
+            enabled=True,
+            api_url=f"https://{source_id}.example/api",
+            rate_limit=0,
+            concurrency=1,
+        )
+        for source_id in ("gbif", "tropicos")
+    ]
+    rows = [
+        {"id": 1, "full_name": "Araucaria", "extra_data": None},
+        {"id": 2, "full_name": "Agathis", "extra_data": None},
+    ]
+    # Both sources must reach the barrier together for any request to return
+    barrier = threading.Barrier(2, timeout=5)
+    saved: list[tuple[int, str]] = []
+
+    class FakeEnricher:
+        def load_data(self, payload, config):
+            barrier.wait()
+            return {"api_enrichment": {"api_id": payload["id"]}}
+
+    def fake_save(reference_name, entity_id, source, source_data, existing_extra_data):
+        saved.append((entity_id, source.id))
+        return enrichment_service._replace_source_enrichment_data(
+            existing_extra_data, source, source_data
+        )
+
+    monkeypatch.setattr(
+        enrichment_service, "_load_reference_rows", lambda _reference_name: rows
+    )
+    monkeypatch.setattr(
+        enrichment_service, "_build_enricher", lambda _plugin: FakeEnricher()
+    )
+    monkeypatch.setattr(enrichment_service, "_save_source_enrichment_to_db", fake_save)
+
+    now = "2026-04-21T20:00:00"
+    enrichment_service._current_job = enrichment_service.EnrichmentJob(
+        id="job-concurrent-1",
+        reference_name="taxons",
+        mode=enrichment_service.JobMode.ALL,
+        status=enrichment_service.JobStatus.RUNNING,
+        started_at=now,
+        updated_at=now,
+        source_ids=[source.id for source in sources],
+    )
+
+    asyncio.run(
+        enrichment_service._run_enrichment_job(
+            "job-concurrent-1",
+            "taxons",
+            sources,
+            enrichment_service.JobMode.ALL,
+        )
+    )
+
+    job = enrichment_service._current_job
+    assert job.status == enrichment_service.JobStatus.COMPLETED
+    assert job.processed == job.pending_processed == job.successful == 4
+    assert job.failed == 0
+    assert sorted(saved) == [(1, "gbif"), (1, "tropicos"), (2, "gbif"), (2, "tropicos")]
+    # Both payloads end up in the shared row
+    for row in rows:
+        assert set(row["extra_data"]["api_enrichment"]["sources"]) == {
+            "gbif",
+            "tropicos",
+        }
+
+
+def test_run_enrichment_job_sends_batches_to_batch_enrichers(monkeypatch):
+    """Enrichers with load_data_batch get several rows per call."""
+
+    source = enrichment_service.EnrichmentSourceConfig(
+        id="elevation",
+        label="Elevation",
+        enabled=True,
+        api_url="https://elevation.example/api",
+        rate_limit=0,
+        concurrency=1,
+    )
+    rows = [
+        {"id": row_id, "full_name": f"Plot {row_id}", "extra_data": None}
+        for row_id in range(1, 6)
+    ]
+    batches: list[list[int]] = []
+    saved: list[int] = []
+
+    class FakeBatchEnricher:
+        batch_size = 3
+
+        def load_data(self, payload, config):
+            raise AssertionError("rows must be loaded in batches")
+
+        def load_data_batch(self, payloads, config):
+            batches.append([payload["id"] for payload in payloads])
+            return [
+                ValueError("no elevation")
+                if payload["id"] == 2
+                else {"api_enrichment": {"value_m": payload["id"] * 100}}
+                for payload in payloads
+            ]
+
+    def fake_save(reference_name, entity_id, source, source_data, existing_extra_data):
+        saved.append(entity_id)
+        return enrichment_service._replace_source_enrichment_data(
+            existing_extra_data, source, source_data
+        )
+
+    monkeypatch.setattr(
+        enrichment_service, "_load_reference_rows", lambda _reference_name: rows
+    )
+    monkeypatch.setattr(
+        enrichment_service, "_build_enricher", lambda _plugin: FakeBatchEnricher()
+    )
+    monkeypatch.setattr(enrichment_service, "_save_source_enrichment_to_db", fake_save)
+
+    now = "2026-04-21T20:00:00"
+    enrichment_service._current_job = enrichment_service.EnrichmentJob(
+        id="job-batch-1",
+        reference_name="plots",
+        mode=enrichment_service.JobMode.ALL,
+        status=enrichment_service.JobStatus.RUNNING,
+        started_at=now,
+        updated_at=now,
+        source_ids=[source.id],
+    )
+
+    asyncio.run(
+        enrichment_service._run_enrichment_job(
+            "job-batch-1",
+            "plots",
+            [source],
+            enrichment_service.JobMode.ALL,
+        )
+    )
+
+    job = enrichment_service._current_job
+    assert batches == [[1, 2, 3], [4, 5]]
+    assert job.status == enrichment_service.JobStatus.COMPLETED
+    assert job.processed == 5
+    assert job.successful == 4
+    assert job.failed == 1
+    assert saved == [1, 3, 4, 5]
+
+
+def test_run_enrichment_job_loads_prepared_batches_row_by_row(monkeypatch):
+    """Prepared batches share one request but cancel still acts between rows."""
+
+    source = enrichment_service.EnrichmentSourceConfig(
+        id="gbif",
+        label="GBIF",
+        enabled=True,
+        api_url="https://api.gbif.org/v2/species/match",
+        rate_limit=0,
+        concurrency=1,
+    )
+    rows = [
+        {"id": row_id, "full_name": f"Taxon {row_id}", "extra_data": None}
+        for row_id in range(1, 6)
+    ]
+    prepared: list[list[int]] = []
+    loaded: list[int] = []
+
+    class FakePreparingEnricher:
+        batch_size = 3
+
+        def prepare_batch(self, payloads, config):
+            prepared.append([payload["id"] for payload in payloads])
+
+        def load_data(self, payload, config):
+            loaded.append(payload["id"])
+            if payload["id"] == 2:
+                enrichment_service._job_cancel_flag = True
+            return {"api_enrichment": {"name": payload["full_name"]}}
+
+    monkeypatch.setattr(
+        enrichment_service, "_load_reference_rows", lambda _reference_name: rows
+    )
+    monkeypatch.setattr(
+        enrichment_service, "_build_enricher", lambda _plugin: FakePreparingEnricher()
+    )
+    monkeypatch.setattr(
+        enrichment_service,
+        "_save_source_enrichment_to_db",
+        lambda _ref, _id, src, data, existing: (
+            enrichment_service._replace_source_enrichment_data(existing, src, data)
+        ),
+    )
+
+    now = "2026-04-21T20:00:00"
+    enrichment_service._job_cancel_flag = False
+    enrichment_service._current_job = enrichment_service.EnrichmentJob(
+        id="job-prepared-1",
+        reference_name="taxons",
+        mode=enrichment_service.JobMode.ALL,
+        status=enrichment_service.JobStatus.RUNNING,
+        started_at=now,
+        updated_at=now,
+        source_ids=[source.id],
+    )
+
+    try:
+        asyncio.run(
+            enrichment_service._run_enrichment_job(
+                "job-prepared-1",
+                "taxons",
+                [source],
+                enrichment_service.JobMode.ALL,
+            )
+        )
+    finally:
+        enrichment_service._job_cancel_flag = False
+
+    assert prepared == [[1, 2, 3]]
+    assert loaded == [1, 2]
+    assert enrichment_service._current_job.processed == 1
+    assert enrichment_service._current_job.status == (
+        enrichment_service.JobStatus.CANCELLED
+    )
+
+
+def test_token_bucket_spaces_requests_by_rate(monkeypatch):
+    """Only the first request is free; later ones wait for a token."""
+
+    clock = {"now": 100.0}
+    waits: list[float] = []
+
+    async def fake_sleep(seconds):
+        waits.append(seconds)
+        clock["now"] += seconds
+
+    monkeypatch.setattr(enrichment_service.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(enrichment_service.asyncio, "sleep", fake_sleep)
+
+    async def run():
+        bucket = enrichment_service._TokenBucket(rate=4)
+        await bucket.acquire()
+        await bucket.acquire()
+        clock["now"] += 0.1
+        await bucket.acquire()
+        clock["now"] += 1.0
+        await bucket.acquire()
+        await enrichment_service._TokenBucket(rate=0).acquire()
+
+    asyncio.run(run())
+
+    assert waits == pytest.approx([0.25, 0.15])
 
 
 def test_run_enrichment_job_reset_reprocesses_rows_and_deletes_empty_results(